@@ -16,7 +16,7 @@ import io
 import re
 import json
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple, Set, Union
+from typing import Callable, Dict, List, Any, Optional, Tuple, Set, Union
 from datetime import datetime, date, timedelta
 from collections import defaultdict, deque
 from enum import Enum
@@ -197,12 +197,265 @@ class ExcelSheet:
         return None
 
 
+# 수식 토큰 패턴 (참조는 함수 이름/시트 이름과 구분되도록 앞뒤 문자 확인)
+FORMULA_TOKEN_PATTERN = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<string>"(?:[^"]|"")*")
+  | (?P<error>\#(?:NULL!|DIV/0!|VALUE!|REF!|NAME\?|NUM!|N/A))
+  | (?P<ref>(?:'(?:[^']|'')+'!|[A-Za-z0-9_.]+!)?
+        \$?[A-Za-z]{1,3}\$?\d+(?::\$?[A-Za-z]{1,3}\$?\d+)?)(?![A-Za-z0-9_.(!])
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<func>[A-Za-z_][A-Za-z0-9_.]*)(?=\s*\()
+  | (?P<name>[A-Za-z_][A-Za-z0-9_.]*)
+  | (?P<op><>|<=|>=|[-+*/^&=<>%])
+  | (?P<punct>[(),])
+""", re.VERBOSE)
+
+ERROR_LITERALS = {'#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!', '#N/A'}
+
+COMPARISON_OPS = {'=', '<>', '<', '>', '<=', '>='}
+
+
+class FormulaParser:
+    """
+    수식 토크나이저/파서
+    
+    수식 텍스트 → 토큰 → 셀 기준 상대 좌표(R1C1)로 정규화 → AST(튜플)
+    같은 상대 구조의 수식(아래로 채운 수식 등)은 정규화 결과가 같아 한 번만 컴파일된다.
+    
+    AST 노드:
+      ('const', 값) / ('ref', 참조) / ('range', 시작, 끝) / ('name', 이름)
+      ('call', 함수명, [인자]) / ('binop', 연산자, 왼쪽, 오른쪽)
+      ('neg', 식) / ('pct', 식)
+    참조: (시트 또는 None, 열 절대여부, 열 값, 행 절대여부, 행 값)
+      - 절대면 실제 열 번호/행 번호, 상대면 기준 셀로부터의 차이
+    """
+    
+    @staticmethod
+    def tokenize(formula: str) -> List[Tuple[str, str]]:
+        """수식 본문('=' 제외) → [(종류, 텍스트)]"""
+        tokens = []
+        pos = 0
+        while pos < len(formula):
+            match = FORMULA_TOKEN_PATTERN.match(formula, pos)
+            if not match:
+                raise SyntaxError(f"Unexpected character at {pos}: {formula[pos:pos + 10]!r}")
+            kind = match.lastgroup
+            if kind != 'ws':
+                tokens.append((kind, match.group(kind)))
+            pos = match.end()
+        return tokens
+    
+    @staticmethod
+    def split_reference(text: str) -> Tuple[Optional[str], str, Optional[str]]:
+        """참조 토큰 → (시트, 시작 셀, 끝 셀 또는 None)"""
+        sheet = None
+        if '!' in text:
+            sheet, text = text.rsplit('!', 1)
+            if sheet.startswith("'"):
+                sheet = sheet[1:-1].replace("''", "'")
+        start, _, end = text.partition(':')
+        return sheet, start.upper(), (end.upper() or None)
+    
+    @staticmethod
+    def _relative_ref(sheet: Optional[str], cell: str, base_row: int, base_col: int) -> Tuple:
+        ref = CellReference.parse(cell)
+        col = CellReference._column_to_number(ref.column)
+        return (
+            sheet,
+            ref.absolute_column, col if ref.absolute_column else col - base_col,
+            ref.absolute_row, ref.row if ref.absolute_row else ref.row - base_row,
+        )
+    
+    @classmethod
+    def normalize(cls, tokens: List[Tuple[str, str]], base_row: int, base_col: int) -> Tuple:
+        """참조 토큰을 기준 셀 상대 좌표로 변환 (컴파일 캐시 키)"""
+        normalized = []
+        for kind, text in tokens:
+            if kind == 'ref':
+                sheet, start, end = cls.split_reference(text)
+                start_ref = cls._relative_ref(sheet, start, base_row, base_col)
+                end_ref = cls._relative_ref(sheet, end, base_row, base_col) if end else None
+                normalized.append(('ref', (start_ref, end_ref)))
+            elif kind in ('func', 'name'):
+                normalized.append((kind, text.upper()))
+            else:
+                normalized.append((kind, text))
+        return tuple(normalized)
+    
+    def __init__(self, tokens: Tuple):
+        self.tokens = tokens
+        self.pos = 0
+    
+    @classmethod
+    def parse(cls, tokens: Tuple) -> Tuple:
+        """정규화된 토큰 → AST"""
+        parser = cls(tokens)
+        node = parser._comparison()
+        if parser.pos < len(tokens):
+            raise SyntaxError(f"Unexpected token: {tokens[parser.pos][1]!r}")
+        return node
+    
+    def _peek(self) -> Tuple:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+    
+    def _take_op(self, ops) -> Optional[str]:
+        kind, text = self._peek()
+        if kind == 'op' and text in ops:
+            self.pos += 1
+            return text
+        return None
+    
+    def _expect(self, text: str):
+        kind, value = self._peek()
+        if kind != 'punct' or value != text:
+            raise SyntaxError(f"Expected {text!r}")
+        self.pos += 1
+    
+    def _comparison(self) -> Tuple:
+        node = self._concat()
+        while True:
+            op = self._take_op(COMPARISON_OPS)
+            if op is None:
+                return node
+            node = ('binop', op, node, self._concat())
+    
+    def _concat(self) -> Tuple:
+        node = self._additive()
+        while self._take_op(('&',)):
+            node = ('binop', '&', node, self._additive())
+        return node
+    
+    def _additive(self) -> Tuple:
+        node = self._term()
+        while True:
+            op = self._take_op(('+', '-'))
+            if op is None:
+                return node
+            node = ('binop', op, node, self._term())
+    
+    def _term(self) -> Tuple:
+        node = self._power()
+        while True:
+            op = self._take_op(('*', '/'))
+            if op is None:
+                return node
+            node = ('binop', op, node, self._power())
+    
+    def _power(self) -> Tuple:
+        node = self._unary()
+        while self._take_op(('^',)):
+            node = ('binop', '^', node, self._unary())
+        return node
+    
+    def _unary(self) -> Tuple:
+        # Excel: 단항 부호가 ^ 보다 먼저 적용 (-2^2 = 4)
+        op = self._take_op(('+', '-'))
+        if op == '-':
+            return ('neg', self._unary())
+        if op == '+':
+            return self._unary()
+        node = self._primary()
+        while self._take_op(('%',)):
+            node = ('pct', node)
+        return node
+    
+    def _primary(self) -> Tuple:
+        kind, text = self._peek()
+        if kind is None:
+            raise SyntaxError("Unexpected end of formula")
+        self.pos += 1
+        
+        if kind == 'number':
+            value = float(text)
+            return ('const', int(value) if value.is_integer() and not any(c in text for c in '.eE') else value)
+        if kind == 'string':
+            return ('const', text[1:-1].replace('""', '"'))
+        if kind == 'error':
+            return ('const', text)
+        if kind == 'ref':
+            start, end = text
+            return ('range', start, end) if end else ('ref', start)
+        if kind == 'name':
+            if text in ('TRUE', 'FALSE'):
+                return ('const', text == 'TRUE')
+            return ('name', text)
+        if kind == 'func':
+            self._expect('(')
+            return ('call', text.replace('_XLFN.', '').replace('_XLWS.', ''), self._arguments())
+        if kind == 'punct' and text == '(':
+            node = self._comparison()
+            self._expect(')')
+            return node
+        raise SyntaxError(f"Unexpected token: {text!r}")
+    
+    def _arguments(self) -> List[Tuple]:
+        args = []
+        if self._peek() == ('punct', ')'):
+            self.pos += 1
+            return args
+        while True:
+            # 생략된 인자 (예: IF(A1,,1)) → 빈 값
+            if self._peek() in (('punct', ','), ('punct', ')')):
+                args.append(('const', None))
+            else:
+                args.append(self._comparison())
+            kind, text = self._peek()
+            self.pos += 1
+            if (kind, text) == ('punct', ')'):
+                return args
+            if (kind, text) != ('punct', ','):
+                raise SyntaxError("Expected ',' or ')' in function arguments")
+
+
 class FormulaEngine:
     """Excel 함수 계산 엔진"""
     
+    # 값 대신 참조 문자열을 받는 함수 인자 위치
+    REFERENCE_ARGUMENTS = {'ROW': {0}, 'OFFSET': {0}}
+    
     def __init__(self, workbook: 'ExcelWorkbook'):
         self.workbook = workbook
         self.function_registry = self._register_functions()
+        # 수식 텍스트 → 토큰, 정규화된 토큰 → 컴파일된 클로저
+        self.token_cache: Dict[str, List[Tuple[str, str]]] = {}
+        self.compiled: Dict[Tuple, Callable] = {}
+        self._coord_cache: Dict[str, Tuple[int, int]] = {}
+        self._column_letters: Dict[int, str] = {}
+        # 재계산 패스 동안 셀별 계산 결과 캐시 {(시트, 좌표): 값}
+        self.value_cache: Dict[Tuple[str, str], Any] = {}
+    
+    def clear_cache(self, cells: Optional[Set[Tuple[str, str]]] = None):
+        """계산 캐시 비우기 (cells 지정 시 해당 셀만 무효화)"""
+        if cells is None:
+            self.value_cache.clear()
+            return
+        for key in cells:
+            self.value_cache.pop(key, None)
+    
+    def evaluate_cell(self, sheet_name: str, coord: str, cell: ExcelCell) -> Any:
+        """
+        함수 셀 계산 (패스당 1회)
+        - 캐시에 있으면 재사용, 없으면 계산 후 calculated_value와 캐시에 저장
+        - 계산 중인 셀을 다시 참조하면(순환 참조) 이전 값 반환
+        """
+        key = (sheet_name, coord)
+        if key in self.value_cache:
+            return self.value_cache[key]
+        if cell.is_calculating:
+            return cell.calculated_value
+        
+        cell.is_calculating = True
+        try:
+            value = self.evaluate(cell.formula, sheet_name, coord)
+        except Exception as e:
+            value = f"#ERROR: {str(e)}"
+        finally:
+            cell.is_calculating = False
+        
+        cell.calculated_value = value
+        self.value_cache[key] = value
+        return value
     
     def _register_functions(self) -> Dict[str, callable]:
         """Excel 함수 등록"""
@@ -226,154 +479,285 @@ class FormulaEngine:
     
     def evaluate(self, formula: str, sheet_name: str, cell_coord: str) -> Any:
         """
-        함수 평가
+        함수 평가 (수식은 상대 구조별로 한 번만 컴파일)
         """
         if not formula or not formula.startswith('='):
             return formula
         
-        formula = formula[1:].strip()  # '=' 제거
-        
-        # 셀 참조 추출 및 값으로 치환
-        formula = self._replace_cell_references(formula, sheet_name, cell_coord)
-        
-        # 함수 호출 처리
         try:
-            result = self._evaluate_expression(formula, sheet_name, cell_coord)
-            return result
+            base_row, base_col = self._split_coord(cell_coord)
+            program = self.compile(formula, base_row, base_col)
+            return program(sheet_name, base_row, base_col, cell_coord)
         except Exception as e:
             return f"#ERROR: {str(e)}"
     
-    def _replace_cell_references(self, formula: str, sheet_name: str, cell_coord: str) -> str:
-        """셀 참조를 값으로 치환"""
-        # 셀 참조 패턴: Sheet!A1, A1, $A$1 등
-        pattern = r"([A-Za-z0-9_]+!)?(\$?[A-Z]+\$?\d+)"
+    def tokens(self, formula: str) -> List[Tuple[str, str]]:
+        """수식 토큰 (수식 텍스트별 캐시)"""
+        tokens = self.token_cache.get(formula)
+        if tokens is None:
+            tokens = FormulaParser.tokenize(formula[1:] if formula.startswith('=') else formula)
+            self.token_cache[formula] = tokens
+        return tokens
+    
+    def compile(self, formula: str, base_row: int, base_col: int) -> Callable:
+        """
+        수식 → 클로저 fn(sheet_name, row, col, coord)
+        기준 셀 상대 좌표로 정규화한 토큰을 키로 캐시 → 채우기 수식은 1회만 파싱
+        """
+        key = FormulaParser.normalize(self.tokens(formula), base_row, base_col)
+        program = self.compiled.get(key)
+        if program is None:
+            try:
+                program = self._compile_node(FormulaParser.parse(key))
+            except (SyntaxError, NameError) as e:
+                program = self._compile_error(e)
+            self.compiled[key] = program
+        return program
+    
+    def _split_coord(self, coord: str) -> Tuple[int, int]:
+        """'B12' → (12, 2)"""
+        cached = self._coord_cache.get(coord)
+        if cached is None:
+            ref = CellReference.parse(coord)
+            cached = (ref.row, CellReference._column_to_number(ref.column))
+            self._coord_cache[coord] = cached
+        return cached
+    
+    def _column_letter(self, col: int) -> str:
+        letter = self._column_letters.get(col)
+        if letter is None:
+            letter = CellReference._number_to_column(col)
+            self._column_letters[col] = letter
+        return letter
+    
+    # ----- 컴파일 -----
+    
+    @staticmethod
+    def _compile_error(error: Exception) -> Callable:
+        message = str(error)
         
-        def replace_ref(match):
-            sheet_ref = match.group(1)
-            cell_ref = match.group(2)
+        def run(s, r, c, k):
+            raise ValueError(message)
+        return run
+    
+    def _compile_locator(self, ref: Tuple) -> Callable:
+        """참조 → fn(sheet_name, row, col) = (시트, 좌표)"""
+        ref_sheet, col_abs, col_val, row_abs, row_val = ref
+        
+        def locate(s, r, c):
+            row = row_val if row_abs else r + row_val
+            col = col_val if col_abs else c + col_val
+            if row < 1 or col < 1:
+                raise ValueError("#REF!")
+            return (ref_sheet or s, f"{self._column_letter(col)}{row}")
+        return locate
+    
+    def _compile_node(self, node: Tuple, as_reference: bool = False) -> Callable:
+        kind = node[0]
+        
+        if kind == 'const':
+            value = node[1]
+            return lambda s, r, c, k: value
+        
+        if kind in ('ref', 'range'):
+            locate = self._compile_locator(node[1])
+            if as_reference:
+                # ROW/OFFSET 등: 값 대신 참조 문자열 전달 (범위는 시작 셀)
+                explicit_sheet = node[1][0]
+                
+                def reference(s, r, c, k):
+                    ref_sheet, coord = locate(s, r, c)
+                    return f"{ref_sheet}!{coord}" if explicit_sheet else coord
+                return reference
             
-            if sheet_ref:
-                ref_sheet = sheet_ref.rstrip('!')
-            else:
-                ref_sheet = sheet_name
+            if kind == 'ref':
+                def cell_value(s, r, c, k):
+                    return self._cell_value(*locate(s, r, c))
+                return cell_value
             
-            try:
-                ref = CellReference.parse(f"{ref_sheet}!{cell_ref}" if sheet_ref else cell_ref, sheet_name)
-                value = self._get_cell_value(ref, sheet_name, cell_coord)
-                
-                # 값이 문자열이면 따옴표로 감싸기
-                if isinstance(value, str) and not value.replace('.', '').replace('-', '').isdigit():
-                    return f'"{value}"'
-                return str(value) if value is not None else "0"
-            except:
-                return match.group(0)
+            locate_end = self._compile_locator(node[2])
+            
+            def range_value(s, r, c, k):
+                sheet_name, start = locate(s, r, c)
+                _, end = locate_end(s, r, c)
+                return self._range_values(sheet_name, start, end)
+            return range_value
         
-        return re.sub(pattern, replace_ref, formula)
-    
-    def _get_cell_value(self, ref: CellReference, current_sheet: str, current_cell: str) -> Any:
-        """셀 참조로부터 값 가져오기"""
-        sheet_name = ref.sheet or current_sheet
-        sheet = self.workbook.get_sheet(sheet_name)
+        if kind == 'name':
+            raise NameError(f"#NAME? {node[1]}")
         
-        if not sheet:
-            return None
+        if kind == 'neg':
+            operand = self._compile_node(node[1])
+            return lambda s, r, c, k: -self._number(operand(s, r, c, k))
         
-        coord = f"{ref.column}{ref.row}"
-        cell = sheet.get_cell(coord)
+        if kind == 'pct':
+            operand = self._compile_node(node[1])
+            return lambda s, r, c, k: self._number(operand(s, r, c, k)) / 100
         
-        if cell and cell.formula:
-            # 함수인 경우 재귀적으로 계산
-            return self.evaluate(cell.formula, sheet_name, coord)
+        if kind == 'binop':
+            op = BINARY_OPERATORS[node[1]]
+            left = self._compile_node(node[2])
+            right = self._compile_node(node[3])
+            return lambda s, r, c, k: op(self, left(s, r, c, k), right(s, r, c, k))
         
-        if cell:
-            return cell.get_value()
+        if kind == 'call':
+            return self._compile_call(node[1], node[2])
         
-        return None
+        raise SyntaxError(f"Unknown node: {kind}")
     
-    def _evaluate_expression(self, expr: str, sheet_name: str, cell_coord: str) -> Any:
-        """표현식 평가 (간단한 수식 및 함수 호출)"""
-        expr = expr.strip()
-        
-        # 함수 호출 찾기
-        func_pattern = r"([A-Z_]+)\s*\("
-        match = re.search(func_pattern, expr)
-        
-        if match:
-            func_name = match.group(1)
-            if func_name in self.function_registry:
-                # 함수 인자 추출
-                args_str = self._extract_function_args(expr, match.end())
-                args = self._parse_arguments(args_str, sheet_name, cell_coord)
-                return self.function_registry[func_name](args, sheet_name, cell_coord)
-        
-        # 간단한 수식 평가
-        try:
-            # 안전한 수식 평가 (숫자 연산만)
-            if re.match(r'^[\d\s\+\-\*\/\(\)\.]+$', expr):
-                return eval(expr)
-            return expr
-        except:
-            return expr
-    
-    def _extract_function_args(self, expr: str, start_pos: int) -> str:
-        """함수 인자 문자열 추출"""
-        depth = 0
-        i = start_pos
-        while i < len(expr):
-            if expr[i] == '(':
-                depth += 1
-            elif expr[i] == ')':
-                depth -= 1
-                if depth == 0:
-                    return expr[start_pos:i]
-            i += 1
-        return expr[start_pos:]
+    def _compile_call(self, name: str, arg_nodes: List[Tuple]) -> Callable:
+        reference_args = self.REFERENCE_ARGUMENTS.get(name, ())
+        args = [self._compile_node(arg, i in reference_args) for i, arg in enumerate(arg_nodes)]
+        
+        # IF / IFERROR: 필요한 인자만 계산
+        if name == 'IF' and len(args) >= 2:
+            condition, true_value = args[0], args[1]
+            false_value = args[2] if len(args) > 2 else (lambda s, r, c, k: None)
+            
+            def excel_if(s, r, c, k):
+                if condition(s, r, c, k):
+                    return true_value(s, r, c, k)
+                return false_value(s, r, c, k)
+            return excel_if
+        
+        if name == 'IFERROR' and args:
+            value_arg = args[0]
+            error_arg = args[1] if len(args) > 1 else (lambda s, r, c, k: None)
+            
+            def excel_iferror(s, r, c, k):
+                try:
+                    value = value_arg(s, r, c, k)
+                except Exception:
+                    return error_arg(s, r, c, k)
+                if self._is_error(value):
+                    return error_arg(s, r, c, k)
+                return value
+            return excel_iferror
+        
+        func = self.function_registry.get(name)
+        if func is None:
+            raise NameError(f"#NAME? Unknown function: {name}")
+        
+        def call(s, r, c, k):
+            return func([arg(s, r, c, k) for arg in args], s, k)
+        return call
     
-    def _parse_arguments(self, args_str: str, sheet_name: str, cell_coord: str) -> List[Any]:
-        """함수 인자 파싱"""
-        if not args_str.strip():
-            return []
-        
-        args = []
-        current = ""
-        depth = 0
-        in_quotes = False
-        
-        for char in args_str:
-            if char == '"' and (not current or current[-1] != '\\'):
-                in_quotes = not in_quotes
-                current += char
-            elif char == ',' and not in_quotes and depth == 0:
-                args.append(self._parse_value(current.strip(), sheet_name, cell_coord))
-                current = ""
-            elif char == '(':
-                depth += 1
-                current += char
-            elif char == ')':
-                depth -= 1
-                current += char
-            else:
-                current += char
-        
-        if current.strip():
-            args.append(self._parse_value(current.strip(), sheet_name, cell_coord))
-        
-        return args
+    # ----- 값 처리 -----
     
-    def _parse_value(self, value: str, sheet_name: str, cell_coord: str) -> Any:
-        """값 파싱 (숫자, 문자열, 불리언 등)"""
-        value = value.strip()
-        
-        if value.startswith('"') and value.endswith('"'):
-            return value[1:-1]
-        elif value.upper() == 'TRUE':
-            return True
-        elif value.upper() == 'FALSE':
-            return False
-        elif value.replace('.', '').replace('-', '').isdigit():
-            return float(value) if '.' in value else int(value)
-        else:
+    def _cell_value(self, sheet_name: str, coord: str) -> Any:
+        """셀 값 (함수 셀은 이번 패스의 계산 결과)"""
+        sheet = self.workbook.get_sheet(sheet_name)
+        if not sheet:
+            return None
+        cell = sheet.cells.get(coord)
+        if cell is None:
+            return None
+        if cell.formula:
+            return self.evaluate_cell(sheet_name, coord, cell)
+        return cell.get_value()
+    
+    def _get_cell_value(self, ref: CellReference, current_sheet: str, current_cell: str) -> Any:
+        """셀 참조로부터 값 가져오기"""
+        return self._cell_value(ref.sheet or current_sheet, f"{ref.column}{ref.row}")
+    
+    def _range_values(self, sheet_name: str, start: str, end: str) -> List[Any]:
+        """범위 값: 한 행/한 열이면 1차원, 아니면 행 목록(2차원)"""
+        row1, col1 = self._split_coord(start)
+        row2, col2 = self._split_coord(end)
+        row1, row2 = sorted((row1, row2))
+        col1, col2 = sorted((col1, col2))
+        columns = [self._column_letter(col) for col in range(col1, col2 + 1)]
+        rows = [
+            [self._cell_value(sheet_name, f"{col}{row}") for col in columns]
+            for row in range(row1, row2 + 1)
+        ]
+        if len(columns) == 1:
+            return [values[0] for values in rows]
+        if len(rows) == 1:
+            return rows[0]
+        return rows
+    
+    @staticmethod
+    def _is_error(value: Any) -> bool:
+        return isinstance(value, str) and (value.startswith('#ERROR') or value in ERROR_LITERALS)
+    
+    @staticmethod
+    def _excel_serial(value: date) -> float:
+        """날짜 → Excel 시리얼 번호 (1900 날짜 체계)"""
+        if isinstance(value, datetime):
+            delta = value - datetime(1899, 12, 30)
+            return delta.days + delta.seconds / 86400
+        return (value - date(1899, 12, 30)).days
+    
+    def _number(self, value: Any) -> Union[int, float]:
+        """산술 연산용 숫자 변환 (빈 셀 = 0)"""
+        if value is None:
+            return 0
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, (int, float)):
             return value
+        if isinstance(value, date):
+            return self._excel_serial(value)
+        if isinstance(value, str):
+            if self._is_error(value):
+                raise ValueError(value)
+            text = value.strip()
+            try:
+                return int(text)
+            except ValueError:
+                try:
+                    return float(text)
+                except ValueError:
+                    raise ValueError(f"#VALUE! {value!r}")
+        raise ValueError(f"#VALUE! {value!r}")
+    
+    @staticmethod
+    def _text(value: Any) -> str:
+        """문자열 연결(&)용 변환"""
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+    
+    def _comparable(self, value: Any, other: Any) -> Tuple[int, Any]:
+        """Excel 비교 순서: 숫자 < 문자열 < 불리언 (빈 셀은 상대 타입의 기본값)"""
+        if value is None:
+            if isinstance(other, str):
+                value = ""
+            elif isinstance(other, bool):
+                value = False
+            else:
+                value = 0
+        if isinstance(value, bool):
+            return (2, value)
+        if isinstance(value, str):
+            return (1, value.lower())
+        return (0, self._number(value))
+    
+    def _op_add(self, left: Any, right: Any) -> Any:
+        if isinstance(left, date) and not isinstance(right, date):
+            return left + timedelta(days=self._number(right))
+        if isinstance(right, date) and not isinstance(left, date):
+            return right + timedelta(days=self._number(left))
+        return self._number(left) + self._number(right)
+    
+    def _op_sub(self, left: Any, right: Any) -> Any:
+        if isinstance(left, date):
+            if isinstance(right, date):
+                delta = left - right
+                return delta.days if not (delta.seconds or delta.microseconds) else delta.total_seconds() / 86400
+            return left - timedelta(days=self._number(right))
+        return self._number(left) - self._number(right)
+    
+    def _op_div(self, left: Any, right: Any) -> Any:
+        divisor = self._number(right)
+        if divisor == 0:
+            raise ZeroDivisionError("#DIV/0!")
+        return self._number(left) / divisor
     
     # Excel 함수 구현
     def _excel_if(self, args: List[Any], sheet_name: str, cell_coord: str) -> Any:
@@ -635,7 +1019,7 @@ class FormulaEngine:
             
             new_coord = f"{new_col}{new_row}"
             return self._get_cell_value(
-                CellReference.parse(new_coord, sheet_name),
+                CellReference(sheet=ref.sheet, column=new_col, row=new_row),
                 sheet_name,
                 new_coord
             )
@@ -643,6 +1027,22 @@ class FormulaEngine:
             return None
 
 
+BINARY_OPERATORS: Dict[str, Callable] = {
+    '+': FormulaEngine._op_add,
+    '-': FormulaEngine._op_sub,
+    '*': lambda e, a, b: e._number(a) * e._number(b),
+    '/': FormulaEngine._op_div,
+    '^': lambda e, a, b: e._number(a) ** e._number(b),
+    '&': lambda e, a, b: e._text(a) + e._text(b),
+    '=': lambda e, a, b: e._comparable(a, b) == e._comparable(b, a),
+    '<>': lambda e, a, b: e._comparable(a, b) != e._comparable(b, a),
+    '<': lambda e, a, b: e._comparable(a, b) < e._comparable(b, a),
+    '>': lambda e, a, b: e._comparable(a, b) > e._comparable(b, a),
+    '<=': lambda e, a, b: e._comparable(a, b) <= e._comparable(b, a),
+    '>=': lambda e, a, b: e._comparable(a, b) >= e._comparable(b, a),
+}
+
+
 class StyleEngine:
     """포맷/스타일 재현 엔진"""
     
@@ -720,6 +1120,11 @@ class ExcelWorkbook:
     """Excel 워크북"""
     sheets: Dict[str, ExcelSheet] = field(default_factory=dict)
     formula_engine: Optional[FormulaEngine] = None
+    # 의존성 그래프 (calculate_all에서 생성, recalc에서 갱신)
+    dependents: Optional[Dict[Tuple[str, str], Set[Tuple[str, str]]]] = field(default=None, repr=False)
+    precedents: Dict[Tuple[str, str], Set[Tuple[str, str]]] = field(default_factory=dict, repr=False)
+    # 존재하는 셀만 등록한 큰 범위 (시트, 열 시작, 열 끝, 행 시작, 행 끝)
+    sparse_ranges: Set[Tuple[str, int, int, int, int]] = field(default_factory=set, repr=False)
     
     def __post_init__(self):
         self.formula_engine = FormulaEngine(self)
@@ -731,61 +1136,182 @@ class ExcelWorkbook:
     def add_sheet(self, sheet: ExcelSheet):
         """시트 추가"""
         self.sheets[sheet.name] = sheet
+        self.dependents = None  # 구조 변경 → 다음 recalc에서 전체 계산
     
     def calculate_all(self):
         """모든 함수 계산"""
         # 의존성 그래프 생성
         dependency_graph = self._build_dependency_graph()
+        self.dependents = dependency_graph
         
         # 위상 정렬로 계산 순서 결정
         calculation_order = self._topological_sort(dependency_graph)
         
-        # 순서대로 계산
-        for cell_ref in calculation_order:
-            sheet_name, coord = cell_ref
-            sheet = self.get_sheet(sheet_name)
-            if sheet:
-                cell = sheet.get_cell(coord)
-                if cell and cell.formula:
-                    try:
-                        cell.calculated_value = self.formula_engine.evaluate(
-                            cell.formula, sheet_name, coord
-                        )
-                    except Exception as e:
-                        cell.calculated_value = f"#ERROR: {str(e)}"
+        # 순서대로 계산 (참조 셀은 이미 캐시에 있으므로 셀당 1회 계산)
+        self.formula_engine.clear_cache()
+        self._evaluate_cells(calculation_order)
+    
+    def recalc(self, changed_cells: List[Union[str, Tuple[str, str]]]) -> List[Tuple[str, str]]:
+        """
+        변경된 셀에 의존하는 셀만 재계산
+        
+        changed_cells: "Sheet!A1" 문자열 또는 (시트, 좌표) 튜플 목록
+        (값/수식을 바꾼 뒤 호출). 재계산한 셀 목록을 계산 순서대로 반환.
+        """
+        if self.dependents is None:
+            self.calculate_all()
+            return [key for key in self.precedents if self._formula_cell(key)]
+        
+        changed = {self._cell_key(ref) for ref in changed_cells}
+        
+        # 큰 범위 안에 새로 생긴 셀 → 범위 확장 결과가 바뀌므로 그래프 재생성
+        new_cells = [key for key in changed
+                     if key not in self.dependents and key not in self.precedents]
+        if any(self._in_sparse_range(key) for key in new_cells):
+            self.dependents = self._build_dependency_graph()
+        else:
+            # 수식이 바뀐 셀의 참조 갱신
+            for key in changed:
+                self._update_precedents(key)
+        
+        # 변경 셀에서 도달 가능한 셀 = 재계산 대상
+        dirty = set(changed)
+        queue = deque(changed)
+        while queue:
+            node = queue.popleft()
+            for dep in self.dependents.get(node, ()):
+                if dep not in dirty:
+                    dirty.add(dep)
+                    queue.append(dep)
+        
+        subgraph = {node: self.dependents.get(node, set()) & dirty for node in dirty}
+        order = self._topological_sort(subgraph)
+        
+        self.formula_engine.clear_cache(dirty)
+        return self._evaluate_cells(order)
+    
+    def _evaluate_cells(self, order: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """계산 순서대로 함수 셀 계산"""
+        calculated = []
+        for cell_ref in order:
+            cell = self._formula_cell(cell_ref)
+            if cell is not None:
+                sheet_name, coord = cell_ref
+                self.formula_engine.evaluate_cell(sheet_name, coord, cell)
+                calculated.append(cell_ref)
+        return calculated
+    
+    def _formula_cell(self, cell_ref: Tuple[str, str]) -> Optional[ExcelCell]:
+        sheet_name, coord = cell_ref
+        sheet = self.get_sheet(sheet_name)
+        if sheet:
+            cell = sheet.get_cell(coord)
+            if cell and cell.formula:
+                return cell
+        return None
+    
+    def _cell_key(self, ref: Union[str, Tuple[str, str]]) -> Tuple[str, str]:
+        """셀 지정 정규화: 'Sheet!A1' 또는 (시트, '$A$1') → (시트, 'A1')"""
+        if isinstance(ref, tuple):
+            sheet_name, coord = ref
+        else:
+            sheet_name, _, coord = ref.rpartition('!')
+            sheet_name = sheet_name.strip("'\"")
+            if not sheet_name:
+                if len(self.sheets) != 1:
+                    raise ValueError(f"Sheet name required: {ref}")
+                sheet_name = next(iter(self.sheets))
+        return (sheet_name, coord.replace('$', '').upper())
+    
+    def _in_sparse_range(self, key: Tuple[str, str]) -> bool:
+        sheet_name, coord = key
+        ref = CellReference.parse(coord)
+        col = CellReference._column_to_number(ref.column)
+        return any(
+            rng_sheet == sheet_name and col_lo <= col <= col_hi and row_lo <= ref.row <= row_hi
+            for rng_sheet, col_lo, col_hi, row_lo, row_hi in self.sparse_ranges
+        )
+    
+    def _update_precedents(self, key: Tuple[str, str]):
+        """셀 하나의 참조 목록(그래프 간선) 갱신"""
+        cell = self._formula_cell(key)
+        new_refs = set(self._extract_cell_references(cell.formula, key[0])) if cell else set()
+        old_refs = self.precedents.get(key, set())
+        if new_refs == old_refs:
+            return
+        for ref in old_refs - new_refs:
+            self.dependents.get(ref, set()).discard(key)
+        for ref in new_refs - old_refs:
+            self.dependents.setdefault(ref, set()).add(key)
+        if cell:
+            self.precedents[key] = new_refs
+        else:
+            self.precedents.pop(key, None)
     
     def _build_dependency_graph(self) -> Dict[Tuple[str, str], Set[Tuple[str, str]]]:
-        """의존성 그래프 생성"""
+        """의존성 그래프 생성 (참조 셀 → 이를 참조하는 함수 셀)"""
         graph = defaultdict(set)
+        self.precedents = {}
+        self.sparse_ranges = set()
         
         for sheet_name, sheet in self.sheets.items():
             for coord, cell in sheet.cells.items():
                 if cell.formula:
                     # 함수에서 참조하는 셀 찾기
-                    refs = self._extract_cell_references(cell.formula, sheet_name)
-                    for ref_sheet, ref_coord in refs:
-                        graph[(ref_sheet, ref_coord)].add((sheet_name, coord))
+                    refs = set(self._extract_cell_references(cell.formula, sheet_name))
+                    self.precedents[(sheet_name, coord)] = refs
+                    for ref in refs:
+                        graph[ref].add((sheet_name, coord))
         
         return graph
     
     def _extract_cell_references(self, formula: str, current_sheet: str) -> List[Tuple[str, str]]:
-        """함수에서 셀 참조 추출"""
+        """함수에서 셀 참조 추출 (범위는 포함된 모든 셀로 확장)"""
         refs = []
-        pattern = r"([A-Za-z0-9_]+!)?(\$?[A-Z]+\$?\d+)"
+        try:
+            tokens = self.formula_engine.tokens(formula)
+        except SyntaxError:
+            return refs  # 계산 시 #ERROR
         
-        for match in re.finditer(pattern, formula):
-            sheet_ref = match.group(1)
-            cell_ref = match.group(2)
+        for kind, text in tokens:
+            if kind != 'ref':
+                continue
+            ref_sheet, start, end = FormulaParser.split_reference(text)
+            ref_sheet = ref_sheet or current_sheet
+            start = start.replace('$', '')
             
-            if sheet_ref:
-                ref_sheet = sheet_ref.rstrip('!')
+            if end is None:
+                refs.append((ref_sheet, start))
             else:
-                ref_sheet = current_sheet
-            
-            refs.append((ref_sheet, cell_ref.upper()))
+                refs.extend(self._expand_range(ref_sheet, start, end.replace('$', '')))
         
         return refs
     
+    def _expand_range(self, sheet_name: str, start: str, end: str) -> List[Tuple[str, str]]:
+        """범위 A1:B10 → 포함된 셀 좌표 목록"""
+        first = CellReference.parse(start)
+        last = CellReference.parse(end)
+        col_lo, col_hi = sorted((CellReference._column_to_number(first.column),
+                                 CellReference._column_to_number(last.column)))
+        row_lo, row_hi = sorted((first.row, last.row))
+        
+        # 시트 셀 수보다 큰 범위(A:A 수준)는 실제 존재하는 셀만 등록
+        sheet = self.get_sheet(sheet_name)
+        size = (col_hi - col_lo + 1) * (row_hi - row_lo + 1)
+        if sheet is not None and size > len(sheet.cells):
+            self.sparse_ranges.add((sheet_name, col_lo, col_hi, row_lo, row_hi))
+            refs = []
+            for coord in sheet.cells:
+                ref = CellReference.parse(coord)
+                if (row_lo <= ref.row <= row_hi
+                        and col_lo <= CellReference._column_to_number(ref.column) <= col_hi):
+                    refs.append((sheet_name, coord))
+            return refs
+        
+        columns = [CellReference._number_to_column(n) for n in range(col_lo, col_hi + 1)]
+        return [(sheet_name, f"{col}{row}")
+                for row in range(row_lo, row_hi + 1) for col in columns]
+    
     def _topological_sort(self, graph: Dict) -> List[Tuple[str, str]]:
         """위상 정렬 (순환 참조 감지)"""
         in_degree = defaultdict(int)
@@ -115,6 +115,47 @@ def test_formula_functions():
             print(f"  {desc:20} {formula:30} → ERROR: {e}")
 
 
+def test_formula_compile():
+    """수식 파서/컴파일 캐시 테스트"""
+    print("\n" + "=" * 60)
+    print("수식 컴파일 테스트")
+    print("=" * 60)
+    
+    workbook = ExcelWorkbook()
+    sheet = ExcelSheet(name="Test", rows=10, cols=10)
+    for row in range(1, 4):
+        sheet.set_cell(f"A{row}", ExcelCell(coordinate=f"A{row}", value=row * 10, data_type=CellType.VALUE))
+    sheet.set_cell("B1", ExcelCell(coordinate="B1", value="Apple", data_type=CellType.VALUE))
+    sheet.set_cell("C1", ExcelCell(coordinate="C1", value=0, data_type=CellType.VALUE))
+    workbook.add_sheet(sheet)
+    engine = workbook.formula_engine
+    
+    cases = [
+        ("=1+2*3^2", 19),
+        ("=-2^2", 4),
+        ("=UPPER(B1)&\"!\"", "APPLE!"),
+        ("=SMALL(A1:A3, 2)+1", 21),
+        ("=IF(A1>5, IF(A2>50, \"big\", \"mid\"), \"small\")", "mid"),
+        ("=IFERROR(A1/C1, \"div0\")", "div0"),
+        ("=COUNTIF(A1:A3, \">15\")", 2),
+        ("=ROW(A3)+ROW()", 4),
+        ("=TEXTJOIN(\",\", TRUE, A1:A3)", "10,20,30"),
+    ]
+    for formula, expected in cases:
+        result = engine.evaluate(formula, "Test", "D1")
+        print(f"  {formula:45} → {result}")
+        assert result == expected
+    
+    # 아래로 채운 수식은 상대 구조가 같으므로 한 번만 컴파일
+    for row in range(2, 4):
+        sheet.set_cell(f"D{row}", ExcelCell(coordinate=f"D{row}", formula=f"=A{row}-A{row - 1}",
+                                           data_type=CellType.FORMULA))
+    before = len(engine.compiled)
+    workbook.calculate_all()
+    assert len(engine.compiled) == before + 1
+    assert sheet.get_cell("D3").calculated_value == 10
+
+
 def test_dependency_graph():
     """의존성 그래프 테스트"""
     print("\n" + "=" * 60)
@@ -147,6 +188,51 @@ def test_dependency_graph():
         print(f"  {sheet_name}!{coord}")
 
 
+def test_range_dependency_and_recalc():
+    """범위 의존성 및 부분 재계산 테스트"""
+    print("\n" + "=" * 60)
+    print("범위 의존성 / 부분 재계산 테스트")
+    print("=" * 60)
+    
+    workbook = ExcelWorkbook()
+    sheet = ExcelSheet(name="Test", rows=5, cols=5)
+    
+    for row in range(1, 6):
+        sheet.set_cell(f"A{row}", ExcelCell(coordinate=f"A{row}", value=row * 10, data_type=CellType.VALUE))
+    sheet.set_cell("B1", ExcelCell(coordinate="B1", formula="=COUNTIF(A1:A5, \">25\")", data_type=CellType.FORMULA))
+    sheet.set_cell("B2", ExcelCell(coordinate="B2", formula="=$A$2*2", data_type=CellType.FORMULA))
+    sheet.set_cell("C1", ExcelCell(coordinate="C1", formula="=B2+1", data_type=CellType.FORMULA))
+    sheet.set_cell("D1", ExcelCell(coordinate="D1", formula="=A5+1", data_type=CellType.FORMULA))
+    
+    workbook.add_sheet(sheet)
+    workbook.calculate_all()
+    
+    # 범위 A1:A5 → 모든 셀이 B1의 참조로 등록
+    graph = workbook._build_dependency_graph()
+    print(f"\n  A3 → {sorted(graph[('Test', 'A3')])}")
+    assert ("Test", "B1") in graph[("Test", "A3")]
+    assert ("Test", "B2") in graph[("Test", "A2")]
+    assert sheet.get_cell("C1").calculated_value == 41
+    
+    # A2 변경 → A2에 의존하는 셀만 재계산
+    sheet.get_cell("A2").value = 50
+    recalculated = workbook.recalc(["Test!A2"])
+    print(f"  recalc(A2) → {[coord for _, coord in recalculated]}")
+    assert ("Test", "D1") not in recalculated
+    assert recalculated.index(("Test", "B2")) < recalculated.index(("Test", "C1"))
+    assert sheet.get_cell("C1").calculated_value == 101
+    
+    # 수식 변경 → 새 참조로 간선 갱신
+    sheet.get_cell("B2").formula = "=A5*2"
+    workbook.recalc([("Test", "B2")])
+    assert sheet.get_cell("C1").calculated_value == 101
+    sheet.get_cell("A5").value = 1
+    recalculated = workbook.recalc(["Test!A5"])
+    print(f"  recalc(A5) → {[coord for _, coord in recalculated]}")
+    assert sheet.get_cell("C1").calculated_value == 3
+    assert sheet.get_cell("D1").calculated_value == 2
+
+
 def main():
     """메인 함수"""
     print("\n" + "=" * 60)
@@ -159,9 +245,15 @@ def main():
     # 함수 테스트
     test_formula_functions()
     
+    # 수식 컴파일 테스트
+    test_formula_compile()
+    
     # 의존성 그래프 테스트
     test_dependency_graph()
     
+    # 범위 의존성 / 부분 재계산 테스트
+    test_range_dependency_and_recalc()
+    
     # 실제 Excel 파일 테스트
     test_basic_usage()
     
@@ -1,12 +1,32 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import re
 from pathlib import Path
 from typing import List
 
 import pandas as pd
 
+try:
+    import pyarrow as pa  # optional: Feather cache of the Excel export
+    import pyarrow.feather as feather
+except Exception:
+    pa = None
+    feather = None
+
+try:
+    import streamlit as st
+
+    _cache_resource = st.cache_resource(show_spinner="Loading emails...", max_entries=4)
+except Exception:  # outside the dashboard
+    _cache_resource = functools.lru_cache(maxsize=4)
+
+
+EXCEL_CACHE_DIR = ".dashboard_cache"
+
 
 def load_threads(path: Path) -> List[dict]:
     data = json.loads(path.read_text(encoding="utf-8"))
@@ -19,3 +39,85 @@ def load_edges(path: Path) -> pd.DataFrame:
 
 def load_search(path: Path) -> pd.DataFrame:
     return pd.read_csv(path)
+
+
+def excel_cache_path(excel_path: Path, sheet_name: str) -> Path:
+    """
+    Feather cache file for one sheet, keyed by resolved path + mtime + size + sheet.
+    """
+    stat = excel_path.stat()
+    raw_key = f"{excel_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{sheet_name}"
+    key = hashlib.sha1(raw_key.encode("utf-8")).hexdigest()[:16]
+    safe_sheet = re.sub(r"[^\w.-]+", "_", sheet_name)
+    return excel_path.parent / EXCEL_CACHE_DIR / f"{excel_path.stem}.{safe_sheet}.{key}.feather"
+
+
+def _arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Mixed-type object columns (e.g. numbers and text in one column) -> text,
+    missing values kept as missing.
+    """
+    df = df.copy(deep=False)
+    for col in df.columns[df.dtypes == object]:
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v))
+    return df
+
+
+def _write_excel_cache(df: pd.DataFrame, cache_path: Path) -> pd.DataFrame:
+    """Write the Feather cache; returns the frame as stored (mixed columns as text)."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        feather.write_feather(df, tmp_path)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df = _arrow_safe(df)
+        feather.write_feather(df, tmp_path)
+    tmp_path.replace(cache_path)
+
+    # drop caches of older versions of the same sheet
+    prefix = cache_path.name.rsplit(".", 2)[0]
+    for stale in cache_path.parent.glob(f"{prefix}.*.feather"):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+    return df
+
+
+def read_excel_cached(excel_path: str | Path, sheet_name: str) -> pd.DataFrame:
+    """
+    pd.read_excel once per file version; later reads come from a memory-mapped
+    Feather copy in <excel dir>/.dashboard_cache/. Rows keep the 0-based
+    RangeIndex used by threads.json members.
+    """
+    excel_path = Path(excel_path)
+    if feather is None:
+        return pd.read_excel(excel_path, sheet_name=sheet_name, engine="openpyxl").reset_index(drop=True)
+
+    cache_path = excel_cache_path(excel_path, sheet_name)
+    if cache_path.exists():
+        try:
+            return feather.read_table(cache_path, memory_map=True).to_pandas()
+        except Exception:
+            cache_path.unlink(missing_ok=True)
+
+    df = pd.read_excel(excel_path, sheet_name=sheet_name, engine="openpyxl").reset_index(drop=True)
+    try:
+        return _write_excel_cache(df, cache_path)
+    except OSError:
+        return df  # read-only data dir: serve from Excel this time
+
+
+@_cache_resource
+def _load_emails_shared(excel_path: str, sheet_name: str, mtime_ns: int) -> pd.DataFrame:
+    return read_excel_cached(excel_path, sheet_name)
+
+
+def load_emails(excel_path: str | Path, sheet_name: str) -> pd.DataFrame:
+    """
+    Email export shared by all pages (one in-memory copy per file version).
+    Callers must not modify the returned frame in place.
+    """
+    path = Path(excel_path)
+    return _load_emails_shared(str(path.resolve()), sheet_name, path.stat().st_mtime_ns)
@@ -37,3 +37,12 @@ def resolve_search_path(root: Path) -> Path:
     if direct.exists():
         return direct
     return root / "searches" / "search_result.csv"
+
+
+def resolve_near_dup_path(excel_path: str | Path) -> Path:
+    """
+    Near-duplicate clusters written next to the merged workbook
+    (outlook_hvdc_merge.py --near-duplicates → <stem>_near_duplicates.csv).
+    """
+    p = Path(excel_path)
+    return p.with_name(f"{p.stem}_near_duplicates.csv")
@@ -18,7 +18,7 @@ except ImportError:
     st.error("Cannot import OutlookAqsSearcher. Please check the scripts directory.")
     st.stop()
 
-from lib.io import load_threads, load_search
+from lib.io import load_threads, load_search, load_emails
 from lib.contracts import assert_threads_contract, assert_search_contract
 from lib.formatters import normalize_body_text
 from lib.paths import resolve_data_root, resolve_thread_paths, resolve_search_path
@@ -50,6 +50,18 @@ def _build_thread_maps(threads: list) -> tuple[dict, dict]:
     return thread_members, row_to_thread
 
 
+@st.cache_resource(show_spinner="Indexing emails...", max_entries=2)
+def _searcher_for(excel_path: str, sheet: str, mtime_ns: int) -> OutlookAqsSearcher:
+    return OutlookAqsSearcher(
+        excel_path, sheet, auto_normalize=True, df=load_emails(excel_path, sheet)
+    )
+
+
+def _get_searcher(excel_path: str, sheet: str) -> OutlookAqsSearcher:
+    path = Path(excel_path)
+    return _searcher_for(str(path.resolve()), sheet, path.stat().st_mtime_ns)
+
+
 def _render_result_card(row, idx, query_terms=None, is_context=False):
     subject = str(row.get("Subject", "(No Subject)"))
     sender = f"{row.get('SenderName', '')} <{row.get('SenderEmail', '')}>"
@@ -174,7 +186,7 @@ with st.container():
         with c3:
             context_expand = st.checkbox("Expand Context (Threads)", value=True, help="Include other emails from the same thread")
         with c4:
-            fuzzy_enabled = st.checkbox("Fuzzy Matching", value=False, help="Enable typo tolerance (slower)")
+            fuzzy_enabled = st.checkbox("Fuzzy Matching", value=False, help="Enable typo tolerance")
         with c5:
             limit = st.number_input("Max Results", min_value=10, max_value=1000, value=50, step=10)
 
@@ -184,7 +196,7 @@ if submitted:
 
     if use_excel:
         with st.spinner("Searching..."):
-            searcher = OutlookAqsSearcher(st.session_state.excel_path, st.session_state.excel_sheet, auto_normalize=True)
+            searcher = _get_searcher(st.session_state.excel_path, st.session_state.excel_sheet)
             results = searcher.search(q, max_results=int(limit), fuzzy=fuzzy_enabled)
             
             results["_delivery_local"] = _to_local_iso(results["DeliveryTime"], tz=tz)
@@ -249,11 +261,7 @@ if st.session_state.get("_last_results") is not None:
                 st.info("No additional context found.")
             else:
                 if use_excel:
-                    @st.cache_data
-                    def load_full_df(path, sheet):
-                        return pd.read_excel(path, sheet_name=sheet, engine="openpyxl")
-                    
-                    full_df = load_full_df(st.session_state.excel_path, st.session_state.excel_sheet)
+                    full_df = load_emails(st.session_state.excel_path, st.session_state.excel_sheet)
                     context_rows = full_df.loc[context_ids].copy()
                     context_rows["_delivery_local"] = _to_local_iso(context_rows["DeliveryTime"], tz=tz)
                     
@@ -268,7 +276,7 @@ if st.session_state.get("_last_results") is not None:
 if st.session_state.get("_selected_row_idx") is not None:
     sel_idx = st.session_state["_selected_row_idx"]
     if use_excel:
-        full_df = pd.read_excel(st.session_state.excel_path, sheet_name=st.session_state.excel_sheet, engine="openpyxl")
+        full_df = load_emails(st.session_state.excel_path, st.session_state.excel_sheet)
         row = full_df.loc[sel_idx]
         
         with st.sidebar:
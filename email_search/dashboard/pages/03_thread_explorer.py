@@ -5,7 +5,7 @@ from pathlib import Path
 import pandas as pd
 import streamlit as st
 
-from lib.io import load_threads, load_edges
+from lib.io import load_threads, load_edges, load_emails
 from lib.contracts import assert_threads_contract, assert_edges_contract
 from lib.formatters import normalize_body_text
 from lib.paths import resolve_data_root, resolve_thread_paths
@@ -23,11 +23,9 @@ except Exception:
     nx = None
 
 
-@st.cache_data
 def _load_emails_excel(excel_path: str, sheet_name: str) -> pd.DataFrame:
-    df = pd.read_excel(excel_path, sheet_name=sheet_name, engine="openpyxl")
-    df = df.reset_index(drop=True)
-    return df
+    # shared across pages (Feather cache + st.cache_resource); do not modify in place
+    return load_emails(excel_path, sheet_name)
 
 
 def _ensure_cols(df: pd.DataFrame) -> pd.DataFrame:
@@ -38,8 +36,10 @@ def _ensure_cols(df: pd.DataFrame) -> pd.DataFrame:
         "sites", "primary_site", "site",
         "lpo", "lpo_numbers",
     ]
-    for c in must:
-        if c not in df.columns:
+    missing = [c for c in must if c not in df.columns]
+    if missing:
+        df = df.copy(deep=False)  # keep the shared frame untouched
+        for c in missing:
             df[c] = ""
     return df
 
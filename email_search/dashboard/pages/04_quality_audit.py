@@ -5,9 +5,9 @@ from pathlib import Path
 import pandas as pd
 import streamlit as st
 
-from lib.io import load_threads, load_edges
+from lib.io import load_threads, load_edges, load_emails
 from lib.contracts import assert_threads_contract, assert_edges_contract
-from lib.paths import resolve_data_root, resolve_thread_paths
+from lib.paths import resolve_data_root, resolve_thread_paths, resolve_near_dup_path
 
 try:
     import plotly.express as px
@@ -20,11 +20,9 @@ except Exception:
     nx = None
 
 
-@st.cache_data
 def _load_emails_excel(excel_path: str, sheet_name: str) -> pd.DataFrame:
-    df = pd.read_excel(excel_path, sheet_name=sheet_name, engine="openpyxl")
-    df = df.reset_index(drop=True)
-    return df
+    # shared across pages (Feather cache + st.cache_resource); do not modify in place
+    return load_emails(excel_path, sheet_name)
 
 
 def _ensure_cols(df: pd.DataFrame) -> pd.DataFrame:
@@ -35,8 +33,10 @@ def _ensure_cols(df: pd.DataFrame) -> pd.DataFrame:
         "sites", "primary_site", "site",
         "lpo", "lpo_numbers",
     ]
-    for c in must:
-        if c not in df.columns:
+    missing = [c for c in must if c not in df.columns]
+    if missing:
+        df = df.copy(deep=False)  # keep the shared frame untouched
+        for c in missing:
             df[c] = ""
     return df
 
@@ -237,6 +237,34 @@ else:
 
 st.divider()
 
+st.markdown("### Near-duplicate Clusters")
+st.caption("MinHash/LSH clusters over subject + body (outlook_hvdc_merge.py --near-duplicates). Similarity is the estimated Jaccard to the cluster representative.")
+
+near_dup_path = resolve_near_dup_path(st.session_state.excel_path)
+if near_dup_path.exists():
+    nd = pd.read_csv(near_dup_path, encoding="utf-8-sig")
+    min_sim = st.slider("Minimum Similarity", 0.0, 1.0, 0.0, 0.01, key="near_dup_min_sim")
+    nd_view = nd[nd["is_representative"] | (nd["similarity"] >= float(min_sim))]
+    nd_view = nd_view[nd_view.groupby("cluster_id")["row"].transform("size") > 1]
+
+    n1, n2, n3 = st.columns(3)
+    n1.metric("Clusters", f"{nd_view['cluster_id'].nunique():,}")
+    n2.metric("Redundant Emails", f"{int((~nd_view['is_representative']).sum()):,}")
+    n3.metric("Largest Cluster", f"{int(nd_view.groupby('cluster_id').size().max()) if not nd_view.empty else 0:,}")
+
+    if px is not None and not nd_view.empty:
+        fig3 = px.histogram(nd_view[~nd_view["is_representative"]], x="similarity", nbins=20,
+                            title="Similarity to Representative", color_discrete_sequence=["#f59e0b"])
+        fig3.update_layout(plot_bgcolor="white", paper_bgcolor="white", margin=dict(t=30, l=10, r=10, b=10))
+        st.plotly_chart(fig3, use_container_width=True)
+
+    st.dataframe(nd_view.head(500), use_container_width=True)
+    _download_df("Download Near-duplicate Clusters CSV", nd_view, "near_duplicate_clusters.csv")
+else:
+    st.info(f"No near-duplicate clusters found ({near_dup_path.name}). Run outlook_hvdc_merge.py --near-duplicates.")
+
+st.divider()
+
 st.markdown("### False-merge Suspects (Split Candidates)")
 st.caption("Conservative rule: Diverse subjects + No intersection in Case/Site/LPO")
 
@@ -5,14 +5,13 @@ from pathlib import Path
 import pandas as pd
 import streamlit as st
 
+from lib.io import load_emails
+
 # Reuse logic from other pages if possible, or reimplement simply
 def _load_emails_excel(excel_path: str, sheet_name: str) -> pd.DataFrame:
-    df = pd.read_excel(excel_path, sheet_name=sheet_name, engine="openpyxl")
-    # Ensure we have an index that matches the row numbers used in threads.json
-    # threads.json uses 0-based index of the dataframe.
-    # We must ensure the dataframe is loaded exactly the same way.
-    df = df.reset_index(drop=True)
-    return df
+    # Shared loader keeps the 0-based index used by threads.json members
+    # (same frame as the other pages; do not modify in place).
+    return load_emails(excel_path, sheet_name)
 
 def _load_existing_labels(path: Path) -> list:
     if path.exists():
@@ -66,7 +65,6 @@ if not st.session_state.excel_path or not Path(st.session_state.excel_path).exis
     st.warning("Please configure and load the Excel file in the sidebar.")
     st.stop()
 
-@st.cache_data
 def get_data(path, sheet):
     return _load_emails_excel(path, sheet)
 
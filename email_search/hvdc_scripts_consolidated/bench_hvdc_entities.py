@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HVDC 엔티티 추출 벤치마크 (행 단위 추출 vs outlook_hvdc_entities 일괄 추출)
+
+합성 제목/본문 데이터로
+- 일괄 엔진(EntityEngine.extract / extract_legacy)을 전체 행(기본 500,000)에 실행
+- 기존 행 단위 함수(v2: _extract_* / _classify_stage, v1: extract_*)는 표본 행에만 실행 후 외삽
+- 표본 구간에서 두 결과가 완전히 같은지 확인
+
+사용:
+  python bench_hvdc_entities.py
+  python bench_hvdc_entities.py --rows 500000 --ref-rows 20000
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+
+import outlook_hvdc_analyzer as v1
+import outlook_hvdc_analyzer_v2 as v2
+from outlook_hvdc_entities import EntityEngine, extract_legacy
+
+SUBJECT_PARTS = [
+    "RE: [HVDC-AGI] JPTW-71 / GRM-123 Transformer delivery",
+    "FW: HVDC-ADOPT-HE-0012 customs clearance BOE",
+    "LPO-4512 supplier quotation for DAS site",
+    "Vessel ETA Mina Zayed (HE-0456) gate pass",
+    "Al Ghallan Island lolo berth plan",
+    "MIR / MIRFA warehouse GRN update",
+    "Load test report : HVDC-AGI-JPTW71-GRM123",
+    "P.O. 77881 proforma invoice",
+    "ADOPT SIM 0034-01 method statement approval",
+    "weekly meeting minutes",
+    "Container CNTR pickup at jetty",
+    "FAT / SAT schedule certificate",
+]
+BODY_PARTS = [
+    "Please find attached the booking confirmation and AWB.",
+    "The vessel will sail tomorrow, ETD 08:00.",
+    "Customs duty and VAT paid, declaration attached.",
+    "Installation and erection at site work area.",
+    "Dear all, kindly note the following.",
+    "PO 55123-A issued to supplier.",
+    "ghallan jetty trailer plan attached.",
+    "",
+]
+
+
+def make_frame(rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = random.Random(seed)
+    subjects = [f"{rng.choice(SUBJECT_PARTS)} #{i % 997}" for i in range(rows)]
+    bodies = [" ".join(rng.sample(BODY_PARTS, 3)) for _ in range(rows)]
+    return pd.DataFrame({"subject": subjects, "body": bodies})
+
+
+def reference_v2(df: pd.DataFrame, rules, aliases) -> pd.DataFrame:
+    rows = []
+    for subj, body in zip(df["subject"], df["body"]):
+        cases = list(dict.fromkeys(v2._extract_cases(subj) + v2._extract_cases(body)))
+        sites = list(dict.fromkeys(v2._extract_sites(subj, aliases) + v2._extract_sites(body, aliases)))
+        lpos = list(dict.fromkeys(v2._extract_lpos(subj) + v2._extract_lpos(body)))
+        stage, stage_hits = v2._classify_stage(subj, body, rules)
+        rows.append({
+            "hvdc_cases": "; ".join(cases),
+            "primary_case": cases[0] if cases else "",
+            "sites": "; ".join(sites),
+            "primary_site": sites[0] if sites else "",
+            "lpo_numbers": "; ".join(lpos),
+            "stage": stage,
+            "stage_hits": "; ".join(stage_hits),
+        })
+    return pd.DataFrame(rows, index=df.index)
+
+
+def reference_v1(subject: pd.Series) -> pd.DataFrame:
+    return pd.DataFrame({
+        "case_numbers": subject.apply(v1.extract_case_numbers_enhanced),
+        "site": subject.apply(v1.extract_site),
+        "lpo": subject.apply(v1.extract_lpo),
+        "phase": subject.apply(v1.extract_phase),
+    })
+
+
+def _normalized(df: pd.DataFrame) -> pd.DataFrame:
+    """None/NaN, object/str dtype 차이는 무시하고 값만 비교"""
+    return df.astype(object).where(df.notna(), None)
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HVDC 엔티티 추출 벤치마크")
+    parser.add_argument("--rows", type=int, default=500_000, help="일괄 엔진 행 수 (기본: 500,000)")
+    parser.add_argument("--ref-rows", type=int, default=20_000, help="행 단위 기준 표본 (기본: 20,000)")
+    args = parser.parse_args()
+
+    rules = v2.load_rules(None)
+    aliases = v2.load_site_alias(None)
+    engine = EntityEngine(rules, aliases)
+
+    df = make_frame(args.rows)
+    sample = df.head(args.ref_rows)
+    print("=" * 64)
+    print(f"HVDC 엔티티 추출 벤치마크: {args.rows:,}행 (기준 표본 {len(sample):,}행)")
+    print("=" * 64)
+
+    # 정합성 (표본)
+    same_v2 = engine.extract(sample["subject"], sample["body"]).equals(reference_v2(sample, rules, aliases))
+    same_v1 = _normalized(extract_legacy(sample["subject"])).equals(
+        _normalized(reference_v1(sample["subject"])))
+
+    # 속도
+    _, ref2 = timed(reference_v2, sample, rules, aliases)
+    _, ref1 = timed(reference_v1, sample["subject"])
+    _, new2 = timed(engine.extract, df["subject"], df["body"])
+    _, new1 = timed(extract_legacy, df["subject"])
+
+    scale = args.rows / max(len(sample), 1)
+    print(f"\n{'구분':<8} {'행 단위(추정)':>14} {'일괄 엔진':>12} {'행/초':>14} {'배속':>7} {'동일':>5}")
+    print("-" * 64)
+    for name, ref, new, same in (("V2", ref2, new2, same_v2), ("V1", ref1, new1, same_v1)):
+        est = ref * scale
+        print(f"{name:<8} {est:>13.1f}s {new:>11.1f}s {args.rows / new:>14,.0f} "
+              f"{est / new:>6.1f}x {'✓' if same else '✗':>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PST 스캐너 병렬 벤치마크 (합성 PST 구조 사용)
+
+실제 PST 없이 pypff와 같은 인터페이스의 합성 폴더/메시지 트리를 만들어
+outlook_pst_scanner의 순차/병렬 스캔 속도(메시지/초)를 워커 수별로 비교한다.
+- 메시지 본문은 zlib 압축 상태로 보관 → 접근 시 해제 (PST 본문 디코딩 비용 모사)
+- 병렬 결과가 순차 결과와 같은 순서/내용인지도 함께 확인
+
+사용:
+  python bench_pst_scanner.py
+  python bench_pst_scanner.py --folders 6 --messages 20000 --workers 1 2 4 8
+"""
+
+import argparse
+import tempfile
+import time
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from outlook_pst_scanner import FolderSelectPSTScanner
+from outlook_pst_sink import create_sink
+
+
+# ===== 합성 PST (pypff 인터페이스 모사) =====
+
+_WORDS = ("HVDC ADOPT AGI DAS MIR LPO shipment customs clearance vessel "
+          "delivery container material inspection gate pass BOE duty").split()
+
+
+class SyntheticAttachment:
+    def __init__(self, name):
+        self.name = name
+
+
+class SyntheticMessage:
+    def __init__(self, folder_seed, index):
+        seed = folder_seed * 1_000_003 + index
+        words = [_WORDS[(seed * (k + 7)) % len(_WORDS)] for k in range(400)]
+        self._body = zlib.compress(' '.join(words).encode('utf-8'))
+        self._html = zlib.compress(('<p>' + ' '.join(words[:200]) + '</p>').encode('utf-8'))
+        self.subject = f"RE: [HVDC-AGI] {_WORDS[seed % len(_WORDS)]} LPO-{seed % 9000 + 1000}"
+        self.sender_name = f"Sender {seed % 97}"
+        self.transport_headers = (f"From: sender{seed % 97}@example.com\r\n"
+                                  f"To: team{seed % 13}@example.com\r\n"
+                                  f"Subject: {self.subject}\r\n")
+        self.delivery_time = datetime(2025, 1, 1) + timedelta(minutes=seed % 500_000)
+        self.creation_time = self.delivery_time
+        self.size = 2048 + seed % 4096
+        self.number_of_attachments = seed % 3
+
+    @property
+    def plain_text_body(self):
+        return zlib.decompress(self._body)
+
+    @property
+    def html_body(self):
+        return zlib.decompress(self._html)
+
+    def get_attachment(self, i):
+        return SyntheticAttachment(f"doc_{i}.pdf")
+
+
+class SyntheticFolder:
+    def __init__(self, name, seed, num_messages, subfolders=()):
+        self.name = name
+        self._seed = seed
+        self._num_messages = num_messages
+        self._subfolders = list(subfolders)
+
+    def get_number_of_sub_messages(self):
+        return self._num_messages
+
+    def get_sub_message(self, i):
+        return SyntheticMessage(self._seed, i)
+
+    def get_number_of_sub_folders(self):
+        return len(self._subfolders)
+
+    def get_sub_folder(self, i):
+        return self._subfolders[i]
+
+
+class SyntheticPST:
+    def __init__(self, num_folders, num_messages):
+        per_folder = num_messages // num_folders
+        subfolders = [SyntheticFolder(f"Folder_{i:02d}", i + 1, per_folder)
+                      for i in range(num_folders)]
+        self._root = SyntheticFolder("Root", 0, 0, subfolders)
+
+    def get_root_folder(self):
+        return self._root
+
+    def close(self):
+        pass
+
+
+def synthetic_open(pst_path):
+    """'synthetic:<folders>:<messages>' 경로 → 합성 PST (워커에서도 동일하게 생성)"""
+    _, folders, messages = pst_path.split(':')
+    return SyntheticPST(int(folders), int(messages))
+
+
+# ===== 벤치마크 =====
+
+def run_once(pst_path, workers, batch_size, sink_kind, work_dir):
+    scanner = FolderSelectPSTScanner(batch_size=batch_size, sink_kind=sink_kind,
+                                     workers=workers, opener=synthetic_open)
+    scanner.pst_files = [synthetic_open(pst_path)]
+    scanner.pst_file = scanner.pst_files[0]
+    scanner.load_folder_list([pst_path])
+    selected = list(range(len(scanner.folder_list)))
+
+    output_file = Path(work_dir) / f"bench_w{workers}.xlsx"
+    scanner.start_time = time.time()
+    scanner.last_report_time = scanner.start_time
+    scanner.sink = create_sink(sink_kind, output_file, reset=True)
+
+    t0 = time.perf_counter()
+    scanner.scan_selected(selected, output_file)
+    elapsed = time.perf_counter() - t0
+
+    df = scanner.sink.read_all(columns=['Subject', 'FolderPath', 'DeliveryTime'])
+    scanner.sink.close()
+    return scanner.total_scanned, elapsed, df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PST 스캐너 병렬 벤치마크 (합성 PST)')
+    parser.add_argument('--folders', type=int, default=4, help='폴더 수 (기본: 4)')
+    parser.add_argument('--messages', type=int, default=20000, help='총 메시지 수 (기본: 20,000)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4],
+                        help='비교할 워커 수 목록 (기본: 1 2 4)')
+    parser.add_argument('--batch-size', type=int, default=1000, help='배치 크기 (기본: 1000)')
+    parser.add_argument('--sink', choices=['parquet', 'sqlite'], default=None,
+                        help='배치 저장소 (기본: 자동)')
+    args = parser.parse_args()
+
+    pst_path = f"synthetic:{args.folders}:{args.messages}"
+    print("=" * 60)
+    print(f"PST 스캐너 벤치마크: 폴더 {args.folders}개, 메시지 {args.messages:,}개")
+    print("=" * 60)
+
+    results = []
+    baseline = None
+    with tempfile.TemporaryDirectory() as work_dir:
+        for workers in args.workers:
+            scanned, elapsed, df = run_once(pst_path, workers, args.batch_size,
+                                            args.sink, work_dir)
+            if baseline is None:
+                baseline = df
+                same = True
+            else:
+                same = df.equals(baseline)
+            results.append((workers, scanned, elapsed, same))
+
+    print(f"\n{'워커':>6} {'메시지':>10} {'시간(초)':>10} {'메시지/초':>12} {'배속':>6} {'동일':>6}")
+    print("-" * 60)
+    base_rate = None
+    for workers, scanned, elapsed, same in results:
+        rate = scanned / elapsed if elapsed > 0 else 0
+        base_rate = base_rate or rate
+        print(f"{workers:>6} {scanned:>10,} {elapsed:>10.2f} {rate:>12,.0f} "
+              f"{rate / base_rate:>5.1f}x {'✓' if same else '✗':>6}")
+
+
+if __name__ == "__main__":
+    main()
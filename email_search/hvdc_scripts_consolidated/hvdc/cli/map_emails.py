@@ -3,23 +3,60 @@
 """
 from __future__ import annotations
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 import logging
-from ..scanner.fs_scanner import scan_folder
-from ..scanner.email_reader import read_email_file
+from ..scanner.fs_scanner import iter_email_files
+from ..scanner.email_reader import read_emails
 from ..parser.subject_parser import parse_subject
 from ..report.excel import create_excel_report
 from ..report.timeline import create_timeline_data, create_network_data, create_summary_stats
-from ..core.config import EMAIL_ROOT
+from ..core.config import EMAIL_ROOT, SCAN_WORKERS
 from ..core.errors import ScanError, IoError
 
 
-def map_emails_to_ontology(email_root: Path = None) -> Dict[str, Any]:
+def iter_email_items(email_root: Path, workers: int = SCAN_WORKERS,
+                     counter: Dict[str, int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    폴더 순회 → 헤더 읽기(스레드 풀) → 제목 추출을 파일 단위로 흘려 보내는 제너레이터
+
+    Args:
+        email_root: 이메일 루트 폴더
+        workers: 파일 읽기 스레드 수
+        counter: 지정 시 'files'(스캔된 파일 수)를 누적
+
+    Yields:
+        Dict[str, Any]: 이메일 항목 (읽기 실패 파일은 경고 후 건너뜀)
+    """
+    files = iter_email_files(email_root)
+    # 제목/발신자/날짜만 필요 → 본문은 읽지 않음
+    for file_path, email_content, error in read_emails(files, headers_only=True, workers=workers):
+        if counter is not None:
+            counter['files'] = counter.get('files', 0) + 1
+        if error is not None:
+            logging.warning(f"파일 처리 실패: {file_path} - {error}")
+            continue
+
+        parsed_data = parse_subject(email_content['subject'])
+        yield {
+            'file_path': str(file_path),
+            'subject': email_content['subject'],
+            'sender': email_content['sender'],
+            'date': email_content['date'],
+            'folder': str(file_path.parent),
+            'cases': parsed_data['cases'],
+            'sites': parsed_data['sites'],
+            'lpos': parsed_data['lpos'],
+            'phases': parsed_data['phases']
+        }
+
+
+def map_emails_to_ontology(email_root: Path = None, workers: int = SCAN_WORKERS) -> Dict[str, Any]:
     """
     이메일을 온톨로지에 매핑하는 메인 함수
     
     Args:
         email_root: 이메일 루트 폴더 (기본값: EMAIL_ROOT)
+        workers: 파일 읽기 스레드 수 (기본값: SCAN_WORKERS)
         
     Returns:
         Dict[str, Any]: 매핑 결과
@@ -30,33 +67,10 @@ def map_emails_to_ontology(email_root: Path = None) -> Dict[str, Any]:
     logging.info(f"이메일 폴더 스캔 시작: {email_root}")
     
     try:
-        # 1. 폴더 스캔
-        files = scan_folder(email_root)
-        logging.info(f"스캔된 파일 수: {len(files)}")
-        
-        # 2. 이메일 데이터 추출
-        email_data = []
-        for file_path in files:
-            try:
-                email_content = read_email_file(file_path)
-                parsed_data = parse_subject(email_content['subject'])
-                
-                email_item = {
-                    'file_path': str(file_path),
-                    'subject': email_content['subject'],
-                    'sender': email_content['sender'],
-                    'date': email_content['date'],
-                    'folder': str(file_path.parent),
-                    'cases': parsed_data['cases'],
-                    'sites': parsed_data['sites'],
-                    'lpos': parsed_data['lpos'],
-                    'phases': parsed_data['phases']
-                }
-                email_data.append(email_item)
-                
-            except Exception as e:
-                logging.warning(f"파일 처리 실패: {file_path} - {e}")
-                continue
+        # 1-2. 폴더 스캔 + 이메일 데이터 추출 (스트리밍)
+        counter = {'files': 0}
+        email_data = list(iter_email_items(email_root, workers=workers, counter=counter))
+        logging.info(f"스캔된 파일 수: {counter['files']}")
         
         # 3. 보고서 생성
         excel_path = create_excel_report(email_data)
@@ -65,7 +79,7 @@ def map_emails_to_ontology(email_root: Path = None) -> Dict[str, Any]:
         summary_stats = create_summary_stats(email_data)
         
         result = {
-            'total_files': len(files),
+            'total_files': counter['files'],
             'processed_emails': len(email_data),
             'excel_path': str(excel_path),
             'timeline_data': timeline_df,
@@ -7,7 +7,7 @@ from typing import List, Dict, Any
 import logging
 import json
 from datetime import datetime
-from ..scanner.fs_scanner import scan_folder
+from ..scanner.fs_scanner import iter_email_files
 from ..parser.subject_parser import parse_folder_title
 from ..core.config import EMAIL_ROOT
 from ..core.errors import ScanError
@@ -29,13 +29,11 @@ def scan_email_folders(email_root: Path = None) -> Dict[str, Any]:
     logging.info(f"이메일 폴더 스캔 시작: {email_root}")
     
     try:
-        # 1. 폴더 스캔
-        files = scan_folder(email_root)
-        logging.info(f"스캔된 파일 수: {len(files)}")
-        
-        # 2. 폴더별 분석
+        # 1-2. 폴더 스캔 + 폴더별 분석 (파일 목록을 만들지 않고 순회)
         folder_analysis = {}
-        for file_path in files:
+        total_files = 0
+        for file_path in iter_email_files(email_root):
+            total_files += 1
             folder_name = str(file_path.parent)
             
             if folder_name not in folder_analysis:
@@ -65,7 +63,7 @@ def scan_email_folders(email_root: Path = None) -> Dict[str, Any]:
         
         # 4. 통계 생성
         total_folders = len(folder_analysis)
-        total_files = len(files)
+        logging.info(f"스캔된 파일 수: {total_files}")
         
         all_cases = []
         all_sites = []
@@ -10,6 +10,8 @@ EXCEL_FILENAME = "hvdc_email_report.xlsx"
 # 실행 파라미터(샘플 제한 등)
 MAX_FILES = None  # None = 제한 없음
 ENCODING_FALLBACKS = ["utf-8", "cp1252", "latin-1"]
+SCAN_WORKERS = 8  # 파일 읽기 스레드 수 (I/O 대기 위주)
+HEADER_READ_LIMIT = 64 * 1024  # 헤더만 읽을 때 최대 바이트 (헤더 끝 빈 줄까지)
 
 # 로깅(단순 프리셋; 실제 로거는 각 엔트리에서 구성)
 LOG_LEVEL = "INFO"
@@ -2,15 +2,29 @@ from __future__ import annotations
 from pathlib import Path
 from .errors import IoError
 
-def read_text(path: Path, encodings: list[str]) -> str:
+def read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except Exception as e:
+        raise IoError(f"failed to read {path}") from e
+
+def normalize_newlines(text: str) -> str:
+    """CRLF/CR 줄바꿈 → LF (Path.read_text의 universal newlines와 동일)"""
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+def decode_bytes(raw: bytes, encodings: list[str], path: Path | None = None) -> str:
+    """메모리에서 인코딩 후보를 순서대로 시도 (파일 재읽기 없음, 줄바꿈은 LF로 통일)"""
     last_err = None
     for enc in encodings:
         try:
-            return path.read_text(encoding=enc, errors="strict")
+            return normalize_newlines(raw.decode(enc, errors="strict"))
         except Exception as e:
             last_err = e
     # 최종 실패 시
-    raise IoError(f"failed to read {path}") from last_err
+    raise IoError(f"failed to decode {path or 'bytes'}") from last_err
+
+def read_text(path: Path, encodings: list[str]) -> str:
+    return decode_bytes(read_bytes(path), encodings, path)
 
 def ensure_dir(path: Path) -> None:
     try:
@@ -1,15 +1,33 @@
 """
 엑셀 보고서 생성기 - 기존 5시트 구성 유지
+
+- 리스트 컬럼(sites, lpos, cases, phases)은 한 번만 펼쳐(explode) 단일 groupby로 사이트/LPO별 행 위치 계산
+- 셀 값은 한 번만 변환하고 모든 시트가 같은 행 목록을 위치로 참조 (시트별 DataFrame 복사 없음)
+- xlsxwriter constant_memory 모드로 행 단위 기록 → 행 수와 무관하게 메모리 일정
+  (xlsxwriter가 없으면 openpyxl write_only 모드로 같은 구성 기록)
 """
 from __future__ import annotations
+import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from ..core.config import EXCEL_OUTDIR, EXCEL_FILENAME
 from ..core.io import ensure_dir
 from ..core.errors import IoError
 
+try:
+    import xlsxwriter
+except ImportError:  # openpyxl write_only 모드로 대체
+    xlsxwriter = None
+
+EXCEL_MAX_ROWS = 1_048_576
+SHEET_NAME_MAX = 31
+URGENT_KEYWORDS = ['urgent', '긴급', 'emergency', 'asap']
+DELIVERY_KEYWORDS = ['delivery', '배송', 'shipping', 'transport']
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
 
 def create_excel_report(data: List[Dict[str, Any]], output_path: Path = None) -> Path:
     """
@@ -34,82 +52,138 @@ def create_excel_report(data: List[Dict[str, Any]], output_path: Path = None) ->
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = EXCEL_OUTDIR / f"hvdc_email_report_{timestamp}.xlsx"
         
-        # 데이터프레임 생성
+        # 데이터프레임 생성 + 셀 값 변환 (1회)
         df = pd.DataFrame(data)
+        header, rows = _sheet_rows(df)
+        
+        # 시트 구성 (5시트): (시트명, 행 위치)
+        # 1. 전체 데이터
+        sheets = [('전체_데이터', np.arange(len(rows)))]
+        
+        # 2. 사이트별 데이터
+        if 'sites' in df.columns:
+            sheets += [(f'사이트_{site}', pos) for site, pos in _group_positions(df['sites']).items()]
+        
+        # 3. LPO별 데이터
+        if 'lpos' in df.columns:
+            sheets += [(f'LPO_{lpo}', pos) for lpo, pos in _group_positions(df['lpos']).items()]
         
-        # 엑셀 파일 생성 (5시트 구성)
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            # 1. 전체 데이터
-            df.to_excel(writer, sheet_name='전체_데이터', index=False)
-            
-            # 2. 사이트별 데이터
-            if 'sites' in df.columns:
-                site_data = _create_site_sheets(df)
-                for site, site_df in site_data.items():
-                    site_df.to_excel(writer, sheet_name=f'사이트_{site}', index=False)
-            
-            # 3. LPO별 데이터
-            if 'lpos' in df.columns:
-                lpo_data = _create_lpo_sheets(df)
-                for lpo, lpo_df in lpo_data.items():
-                    lpo_df.to_excel(writer, sheet_name=f'LPO_{lpo}', index=False)
-            
-            # 4. 긴급 데이터
-            urgent_data = _create_urgent_sheets(df)
-            if not urgent_data.empty:
-                urgent_data.to_excel(writer, sheet_name='긴급_데이터', index=False)
-            
-            # 5. 배송 데이터
-            delivery_data = _create_delivery_sheets(df)
-            if not delivery_data.empty:
-                delivery_data.to_excel(writer, sheet_name='배송_데이터', index=False)
+        # 4. 긴급 데이터
+        urgent_pos = np.flatnonzero(_subject_mask(df, URGENT_KEYWORDS))
+        if len(urgent_pos):
+            sheets.append(('긴급_데이터', urgent_pos))
         
+        # 5. 배송 데이터
+        delivery_pos = np.flatnonzero(_subject_mask(df, DELIVERY_KEYWORDS))
+        if len(delivery_pos):
+            sheets.append(('배송_데이터', delivery_pos))
+        
+        _write_workbook(output_path, header, rows, sheets)
         return output_path
         
     except Exception as e:
         raise IoError(f"엑셀 보고서 생성 실패: {output_path}") from e
 
 
-def _create_site_sheets(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
-    """사이트별 데이터 시트 생성"""
-    site_data = {}
-    
-    if 'sites' in df.columns:
-        for site in df['sites'].dropna().unique():
-            if site:
-                site_df = df[df['sites'].str.contains(site, na=False)]
-                site_data[site] = site_df
-    
-    return site_data
+def _cell_value(value: Any) -> Any:
+    """엑셀 셀 값으로 변환 (리스트 → ', ' 연결, 케이스 dict → value, 결측 → None)"""
+    if isinstance(value, (list, tuple, set, np.ndarray)):
+        return ', '.join(str(_item_key(v)) for v in value) or None
+    if isinstance(value, dict):
+        return str(_item_key(value))
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, datetime):
+        # 엑셀은 시간대를 지원하지 않음
+        return value.replace(tzinfo=None) if value.tzinfo else value
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
 
 
-def _create_lpo_sheets(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
-    """LPO별 데이터 시트 생성"""
-    lpo_data = {}
-    
-    if 'lpos' in df.columns:
-        for lpo in df['lpos'].dropna().unique():
-            if lpo:
-                lpo_df = df[df['lpos'].str.contains(lpo, na=False)]
-                lpo_data[lpo] = lpo_df
-    
-    return lpo_data
+def _item_key(item: Any) -> Any:
+    """리스트 원소의 그룹 키 (케이스 dict는 'value')"""
+    if isinstance(item, dict):
+        return item.get('value', '')
+    return item
 
 
-def _create_urgent_sheets(df: pd.DataFrame) -> pd.DataFrame:
-    """긴급 데이터 시트 생성"""
-    urgent_keywords = ['urgent', '긴급', 'emergency', 'asap']
-    
-    urgent_mask = df['subject'].str.contains('|'.join(urgent_keywords), case=False, na=False)
-    return df[urgent_mask]
+def _sheet_rows(df: pd.DataFrame) -> Tuple[List[str], List[tuple]]:
+    """DataFrame → (헤더, 셀 값 행 목록) - 모든 시트가 공유"""
+    header = [str(c) for c in df.columns]
+    columns = [[_cell_value(v) for v in df[c].tolist()] for c in df.columns]
+    return header, list(zip(*columns))
 
 
-def _create_delivery_sheets(df: pd.DataFrame) -> pd.DataFrame:
-    """배송 데이터 시트 생성"""
-    delivery_keywords = ['delivery', '배송', 'shipping', 'transport']
+def _group_positions(column: pd.Series) -> Dict[Any, np.ndarray]:
+    """
+    리스트 컬럼을 펼쳐 값별 행 위치 계산 (등장 순서 유지, 빈 값 제외)
     
-    delivery_mask = df['subject'].str.contains('|'.join(delivery_keywords), case=False, na=False)
-    return df[delivery_mask]
+    한 행에 같은 값이 여러 번 있어도 해당 시트에는 한 번만 기록한다.
+    """
+    exploded = pd.Series(column.to_numpy(), index=np.arange(len(column))).explode()
+    keys = exploded.map(_item_key, na_action='ignore')
+    keys = keys[keys.notna() & (keys != '')]
+    pairs = pd.DataFrame({'row': keys.index, 'key': keys.to_numpy()}).drop_duplicates()
+    rows = pairs['row'].to_numpy()
+    return {key: rows[idx] for key, idx in pairs.groupby('key', sort=False)['row'].indices.items()}
+
+
+def _subject_mask(df: pd.DataFrame, keywords: Sequence[str]) -> np.ndarray:
+    """제목에 키워드가 포함된 행 마스크 (대소문자 무시)"""
+    if 'subject' not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    pattern = '|'.join(re.escape(k) for k in keywords)
+    return df['subject'].astype('string').str.contains(pattern, case=False, na=False).to_numpy(dtype=bool)
+
+
+def _sheet_name(name: str, used: set) -> str:
+    """엑셀 시트명 규칙 적용 (금지 문자 제거, 31자 제한, 대소문자 무시 중복 회피)"""
+    name = _INVALID_SHEET_CHARS.sub('_', name).strip("'")[:SHEET_NAME_MAX] or 'Sheet'
+    candidate, n = name, 2
+    while candidate.lower() in used:
+        suffix = f'~{n}'
+        candidate = name[:SHEET_NAME_MAX - len(suffix)] + suffix
+        n += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def _write_workbook(output_path: Path, header: List[str], rows: List[tuple],
+                    sheets: List[Tuple[str, np.ndarray]]) -> None:
+    """시트별 행 위치대로 기록 (시트 하나씩, 행 순서대로 → constant_memory 조건 충족)"""
+    for name, positions in sheets:
+        if len(positions) + 1 > EXCEL_MAX_ROWS:
+            raise ValueError(f"엑셀 최대 행 수 초과: {name} ({len(positions)}행)")
+
+    used = set()
+    if xlsxwriter is not None:
+        workbook = xlsxwriter.Workbook(str(output_path), {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        })
+        try:
+            for name, positions in sheets:
+                worksheet = workbook.add_worksheet(_sheet_name(name, used))
+                worksheet.write_row(0, 0, header)
+                for r, pos in enumerate(positions, start=1):
+                    worksheet.write_row(r, 0, rows[pos])
+        finally:
+            workbook.close()
+    else:
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+        for name, positions in sheets:
+            worksheet = workbook.create_sheet(_sheet_name(name, used))
+            worksheet.append(header)
+            for pos in positions:
+                worksheet.append(rows[pos])
+        workbook.save(output_path)
 
 
 def create_outlook_excel_report(emails: List[Dict[str, Any]], output_path: Path = None) -> Path:
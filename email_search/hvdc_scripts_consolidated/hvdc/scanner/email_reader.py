@@ -1,78 +1,261 @@
 """
 이메일 파일 리더 - .eml/.txt/.html 파일 읽기
+
+- 파일은 바이트로 한 번만 읽음 (인코딩 후보는 메모리에서 시도)
+- 문자셋: BOM → Content-Type/HTML meta의 charset → ENCODING_FALLBACKS 순
+- 헤더는 email.parser.BytesHeaderParser로 파싱 (본문은 파싱하지 않음)
+- read_emails: 스레드 풀로 여러 파일을 동시에 읽고 입력 순서대로 반환하는 제너레이터
 """
 from __future__ import annotations
+import codecs
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email import policy
+from email.header import decode_header, make_header
+from email.parser import BytesHeaderParser, HeaderParser
 from pathlib import Path
-from typing import Dict, Optional
-from ..core.io import read_text
-from ..core.config import ENCODING_FALLBACKS
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from ..core.io import read_bytes, decode_bytes, normalize_newlines
+from ..core.config import ENCODING_FALLBACKS, HEADER_READ_LIMIT, SCAN_WORKERS
 from ..core.errors import IoError
 
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),  # UTF-16 LE BOM보다 먼저 확인
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_CHARSET_RE = re.compile(rb"""charset\s*=\s*["']?([A-Za-z0-9_.:\-]+)""", re.IGNORECASE)
+_HEADER_END_RE = re.compile(r"\r?\n\r?\n")
+_FOLD_RE = re.compile(r"\r?\n(?=[ \t])")
+_HEADER_NAMES = {'subject': 'subject', 'from': 'sender', 'date': 'date'}
+
+
+def detect_charset(raw: bytes) -> Optional[str]:
+    """
+    바이트의 문자셋 추정 (BOM, 헤더/HTML meta의 charset 선언)
+
+    Returns:
+        Optional[str]: 코덱 이름 (선언이 없거나 알 수 없는 문자셋이면 None)
+    """
+    for bom, name in _BOMS:
+        if raw.startswith(bom):
+            return name
+    match = _CHARSET_RE.search(raw, 0, HEADER_READ_LIMIT)
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except (LookupError, UnicodeDecodeError):
+            return None
+    return None
+
+
+def decode_email_bytes(raw: bytes, path: Optional[Path] = None) -> Tuple[str, Optional[str]]:
+    """
+    문자셋 선언 우선, 실패 시 ENCODING_FALLBACKS로 디코딩 (줄바꿈은 LF로 통일)
+
+    Returns:
+        Tuple[str, Optional[str]]: (텍스트, 사용한 선언 문자셋 또는 None)
+    """
+    charset = detect_charset(raw)
+    if charset:
+        try:
+            return normalize_newlines(raw.decode(charset, errors="strict")), charset
+        except UnicodeDecodeError:
+            pass
+    return decode_bytes(raw, ENCODING_FALLBACKS, path), None
+
+
+def _header_text(value: str, charset: Optional[str]) -> str:
+    """원본 헤더 값 → 텍스트 (8-bit 바이트는 문자셋으로, RFC 2047 인코딩 단어는 디코딩)"""
+    try:
+        value.encode("utf-8")
+    except UnicodeEncodeError:
+        # BytesHeaderParser는 ASCII 외 바이트를 surrogateescape로 보존
+        data = value.encode("ascii", "surrogateescape")
+        for enc in ([charset] if charset else []) + ENCODING_FALLBACKS:
+            try:
+                value = data.decode(enc)
+                break
+            except UnicodeDecodeError:
+                continue
+    if "=?" in value:
+        try:
+            value = str(make_header(decode_header(value)))
+        except Exception:
+            pass
+    return _FOLD_RE.sub("", value).strip()
+
+
+def _parse_headers(raw: bytes) -> Tuple[Dict[str, str], Optional[str]]:
+    """헤더 블록만 파싱 → ({'subject','sender','date'}, 문자셋)"""
+    charset = detect_charset(raw)
+    if charset in ("utf-16", "utf-32"):
+        # 바이트 파서는 ASCII 호환 인코딩만 처리 → 텍스트로 디코딩 후 파싱
+        msg = HeaderParser(policy=policy.default).parsestr(raw.decode(charset, errors="replace"))
+    else:
+        if charset == "utf-8-sig":
+            raw = raw[len(codecs.BOM_UTF8):]
+        msg = BytesHeaderParser(policy=policy.default).parsebytes(raw)
+
+    headers = {'subject': '', 'sender': '', 'date': ''}
+    for name, value in msg.raw_items():
+        key = _HEADER_NAMES.get(name.lower())
+        if key and not headers[key]:
+            headers[key] = _header_text(value, charset)
+    return headers, charset
+
+
+def _legacy_parse(content: str) -> Dict[str, str]:
+    """RFC 822 형식이 아닌 파일용 줄 단위 파싱 (기존 방식)"""
+    lines = content.split('\n')
+
+    subject = ""
+    sender = ""
+    date = ""
+    body_start = 0
+
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if line.startswith('Subject:'):
+            subject = line[8:].strip()
+        elif line.startswith('From:'):
+            sender = line[5:].strip()
+        elif line.startswith('Date:'):
+            date = line[5:].strip()
+        elif line == '' and subject:  # 헤더 끝
+            body_start = i + 1
+            break
+
+    return {
+        'subject': subject,
+        'body': '\n'.join(lines[body_start:]).strip(),
+        'sender': sender,
+        'date': date
+    }
+
+
+def parse_email_bytes(raw: bytes, headers_only: bool = False, path: Optional[Path] = None) -> Dict[str, str]:
+    """
+    이메일 바이트에서 헤더와 본문 추출
+
+    Args:
+        raw: 파일 바이트 (headers_only면 앞부분만 있어도 됨)
+        headers_only: True면 본문을 디코딩하지 않음 (body = '')
+
+    Returns:
+        Dict[str, str]: {'subject': str, 'body': str, 'sender': str, 'date': str}
+    """
+    headers, _ = _parse_headers(raw)
+    if not any(headers.values()):
+        # 헤더 블록이 없는 파일: 디코딩 후 기존 줄 단위 파싱
+        result = _legacy_parse(decode_email_bytes(raw, path)[0])
+        if headers_only:
+            result['body'] = ''
+        return result
+
+    body = ''
+    if not headers_only:
+        content = decode_email_bytes(raw, path)[0]
+        match = _HEADER_END_RE.search(content)
+        body = content[match.end():].strip() if match else ''
+    return {
+        'subject': headers['subject'],
+        'body': body,
+        'sender': headers['sender'],
+        'date': headers['date']
+    }
+
 
 def read_email_file(file_path: Path) -> Dict[str, str]:
     """
     이메일 파일을 읽어서 헤더와 본문 추출
-    
+
     Args:
         file_path: 이메일 파일 경로
-        
+
     Returns:
         Dict[str, str]: {'subject': str, 'body': str, 'sender': str, 'date': str}
-        
+
     Raises:
         IoError: 파일 읽기 실패 시
     """
     try:
-        content = read_text(file_path, ENCODING_FALLBACKS)
-        
-        # 간단한 파싱 (실제로는 email.parser 사용 권장)
-        lines = content.split('\n')
-        
-        subject = ""
-        sender = ""
-        date = ""
-        body_start = 0
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if line.startswith('Subject:'):
-                subject = line[8:].strip()
-            elif line.startswith('From:'):
-                sender = line[5:].strip()
-            elif line.startswith('Date:'):
-                date = line[5:].strip()
-            elif line == '' and subject:  # 헤더 끝
-                body_start = i + 1
-                break
-        
-        # 본문 추출
-        body = '\n'.join(lines[body_start:]).strip()
-        
-        return {
-            'subject': subject,
-            'body': body,
-            'sender': sender,
-            'date': date
-        }
-        
+        return parse_email_bytes(read_bytes(file_path), path=file_path)
     except Exception as e:
         raise IoError(f"이메일 파일 읽기 실패: {file_path}") from e
 
 
+def read_email_headers(file_path: Path) -> Dict[str, str]:
+    """
+    이메일 파일의 앞부분(HEADER_READ_LIMIT)만 읽어 제목/발신자/날짜 추출 (body = '')
+
+    Raises:
+        IoError: 파일 읽기 실패 시
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read(HEADER_READ_LIMIT)
+        return parse_email_bytes(raw, headers_only=True, path=file_path)
+    except Exception as e:
+        raise IoError(f"이메일 헤더 읽기 실패: {file_path}") from e
+
+
+def read_emails(
+    paths: Iterable[Path],
+    headers_only: bool = False,
+    workers: int = SCAN_WORKERS,
+) -> Iterator[Tuple[Path, Optional[Dict[str, str]], Optional[Exception]]]:
+    """
+    여러 이메일 파일을 스레드 풀로 읽어 입력 순서대로 반환
+
+    paths는 제너레이터여도 됨 (폴더 순회와 파일 읽기가 겹쳐 진행).
+    동시에 대기하는 파일은 workers * 4개 이내로 제한한다.
+
+    Yields:
+        (파일 경로, 결과 dict 또는 None, 예외 또는 None)
+    """
+    reader = read_email_headers if headers_only else read_email_file
+    if workers <= 1:
+        for path in paths:
+            try:
+                yield path, reader(path), None
+            except Exception as e:
+                yield path, None, e
+        return
+
+    def result(path, future):
+        try:
+            return path, future.result(), None
+        except Exception as e:
+            return path, None, e
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        pending = deque()
+        for path in paths:
+            pending.append((path, ex.submit(reader, path)))
+            if len(pending) >= workers * 4:
+                yield result(*pending.popleft())
+        while pending:
+            yield result(*pending.popleft())
+
+
 def read_text_file(file_path: Path) -> str:
     """
     텍스트 파일 읽기
-    
+
     Args:
         file_path: 텍스트 파일 경로
-        
+
     Returns:
         str: 파일 내용
-        
+
     Raises:
         IoError: 파일 읽기 실패 시
     """
     try:
-        return read_text(file_path, ENCODING_FALLBACKS)
+        return decode_email_bytes(read_bytes(file_path), file_path)[0]
     except Exception as e:
         raise IoError(f"텍스트 파일 읽기 실패: {file_path}") from e
@@ -2,8 +2,9 @@
 파일 시스템 스캐너 - 폴더 순회 및 파일 필터링
 """
 from __future__ import annotations
+import os
 from pathlib import Path
-from typing import List, Iterator
+from typing import List, Iterator, Optional
 from ..core.config import EMAIL_ROOT, ALLOWED_EXT, MAX_FILES
 from ..core.errors import ScanError
 
@@ -11,51 +12,80 @@ from ..core.errors import ScanError
 def scan_folder(root: Path = None) -> List[Path]:
     """
     폴더를 스캔하여 허용된 확장자의 파일 목록 반환
-    
+
     Args:
         root: 스캔할 루트 폴더 (기본값: EMAIL_ROOT)
-        
+
     Returns:
         List[Path]: 스캔된 파일 경로 목록
-        
+
     Raises:
         ScanError: 스캔 실패 시
     """
+    return list(iter_email_files(root))
+
+
+def iter_email_files(root: Path = None, max_files: Optional[int] = MAX_FILES) -> Iterator[Path]:
+    """
+    허용된 확장자의 파일을 찾는 대로 반환 (scan_folder의 제너레이터 버전)
+
+    Args:
+        root: 스캔할 루트 폴더 (기본값: EMAIL_ROOT)
+        max_files: 최대 파일 수 (None = 제한 없음)
+
+    Yields:
+        Path: 스캔된 파일 경로 (scan_folder와 같은 순서)
+
+    Raises:
+        ScanError: 루트 폴더 스캔 실패 시
+    """
     if root is None:
         root = EMAIL_ROOT
-    
+
     try:
-        files = []
         count = 0
-        
-        for file_path in _walk_files(root):
+        for file_path in _walk_files(Path(root), top=True):
             if _is_allowed_file(file_path):
-                files.append(file_path)
+                yield file_path
                 count += 1
-                
+
                 # 샘플 제한이 있는 경우
-                if MAX_FILES and count >= MAX_FILES:
+                if max_files and count >= max_files:
                     break
-                    
-        return files
-        
+
     except OSError as e:
         raise ScanError(f"폴더 스캔 실패: {root}") from e
 
 
-def _walk_files(root: Path) -> Iterator[Path]:
-    """폴더를 재귀적으로 순회하여 파일 반환"""
+def _walk_files(root: Path, top: bool = False) -> Iterator[Path]:
+    """
+    폴더를 재귀적으로 순회하여 파일 반환
+
+    os.scandir의 DirEntry는 디렉토리 목록에서 얻은 파일 종류를 캐시하므로
+    항목마다 stat 호출이 필요 없다. 목록은 바로 읽고 닫아 하위 폴더 순회 중
+    디렉토리 핸들이 쌓이지 않게 한다.
+    """
     try:
-        for item in root.iterdir():
-            if item.is_file():
-                yield item
-            elif item.is_dir():
-                # Outlook 파일 제외
-                if not _is_outlook_file(item):
-                    yield from _walk_files(item)
+        with os.scandir(root) as it:
+            entries = list(it)
     except PermissionError:
         # 권한이 없는 폴더는 스킵
-        pass
+        return
+    except OSError:
+        if top:
+            raise
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_file():
+                yield Path(entry.path)
+            elif entry.is_dir():
+                # Outlook 파일 제외
+                if not _is_outlook_file(Path(entry.name)):
+                    yield from _walk_files(Path(entry.path))
+        except OSError:
+            continue
 
 
 def _is_allowed_file(file_path: Path) -> bool:
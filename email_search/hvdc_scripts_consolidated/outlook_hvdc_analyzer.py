@@ -14,6 +14,7 @@ Legacy 패턴 + HVDC 케이스/사이트/LPO/단계 추출
 입력:
 - OUTLOOK_YYYYMM.xlsx (outlook_pst_scanner.py 출력)
 - 시트: 전체_이메일
+- 또는 스캐너 배치 저장소: OUTLOOK_YYYYMM.parquet / OUTLOOK_YYYYMM.sqlite
 
 출력:
 - OUTLOOK_HVDC_YYYYMM_rev.xlsx (표준 포맷)
@@ -24,6 +25,7 @@ Legacy 패턴 + HVDC 케이스/사이트/LPO/단계 추출
   python outlook_hvdc_analyzer.py                    # 기본 (중복 제거 활성화)
   python outlook_hvdc_analyzer.py --use-body        # Body도 비교
   python outlook_hvdc_analyzer.py --no-deduplicate  # 중복 제거 비활성화
+  python outlook_hvdc_analyzer.py --warehouse results/hvdc_warehouse --no-excel  # 웨어하우스에만 기록 (엑셀은 필요 시 export)
   
 자동으로 results/ 폴더에서 최신 OUTLOOK_*.xlsx 파일을 찾아 분석합니다
 """
@@ -36,93 +38,9 @@ from pathlib import Path
 import sys
 from typing import Tuple, Dict
 
-# ===== 중복 제거 함수 =====
-
-def remove_duplicates(df: pd.DataFrame, keep='last', use_body=False) -> Tuple[pd.DataFrame, Dict]:
-    """
-    중복 메시지 제거 (강화된 로직)
-    
-    Args:
-        df: 입력 데이터프레임
-        keep: 'first' (첫 번째), 'last' (최신), False (모두 제거)
-        use_body: True면 Body 일부도 비교에 사용 (기본: False, Subject+Sender+Date만)
-    
-    Returns:
-        (정리된 데이터프레임, 중복 통계)
-    """
-    df_work = df.copy()
-    
-    # Subject 정규화 강화 (공백, 대소문자, 특수문자, RE: FWD: 등 접두사 제거)
-    df_work['subject_norm'] = (
-        df_work['Subject'].fillna('')
-        .str.lower()
-        .str.strip()
-        .str.replace(r'^(re:|fwd?:|fw:|reply:|답변:)\s*', '', regex=True)  # 접두사 제거
-        .str.replace(r'\s+', ' ', regex=True)  # 연속 공백 통일
-        .str.replace(r'[^\w\s\-]', '', regex=True)  # 특수문자 제거 (하이픈 제외)
-        .str.strip()
-    )
-    
-    # Sender 정규화 (이메일 주소만 추출, 도메인 정규화)
-    df_work['sender_norm'] = df_work['SenderEmail'].fillna('').str.lower().str.strip()
-    
-    # 날짜 정규화 (날짜만 사용, 시간 제외)
-    if 'DeliveryTime' in df_work.columns:
-        df_work['date_str'] = pd.to_datetime(df_work['DeliveryTime'], errors='coerce').dt.date.astype(str)
-    elif 'CreationTime' in df_work.columns:
-        df_work['date_str'] = pd.to_datetime(df_work['CreationTime'], errors='coerce').dt.date.astype(str)
-    else:
-        df_work['date_str'] = ''
-    
-    # Body 일부 비교 (옵션)
-    if use_body and 'PlainTextBody' in df_work.columns:
-        df_work['body_snippet'] = (
-            df_work['PlainTextBody'].fillna('')
-            .str[:100]  # 첫 100자만
-            .str.lower()
-            .str.strip()
-            .str.replace(r'\s+', ' ', regex=True)
-        )
-    else:
-        df_work['body_snippet'] = ''
-    
-    # 중복 키 생성 (Subject + Sender + Date + Body(옵션))
-    if use_body and 'body_snippet' in df_work.columns:
-        df_work['duplicate_key'] = (
-            df_work['subject_norm'] + '|' + 
-            df_work['sender_norm'] + '|' + 
-            df_work['date_str'] + '|' +
-            df_work['body_snippet'].astype(str)
-        )
-    else:
-        df_work['duplicate_key'] = (
-            df_work['subject_norm'] + '|' + 
-            df_work['sender_norm'] + '|' + 
-            df_work['date_str']
-        )
-    
-    # 중복 제거
-    df_clean = df_work.drop_duplicates(subset=['duplicate_key'], keep=keep)
-    
-    # 중복 패턴 분석
-    duplicate_counts = df_work.groupby('duplicate_key').size()
-    duplicates_only = duplicate_counts[duplicate_counts > 1]
-    
-    # 통계
-    stats = {
-        'original': len(df),
-        'deduplicated': len(df_clean),
-        'removed': len(df) - len(df_clean),
-        'ratio': (len(df) - len(df_clean)) / len(df) * 100 if len(df) > 0 else 0,
-        'duplicate_groups': len(duplicates_only),
-        'max_duplicates': int(duplicates_only.max()) if len(duplicates_only) > 0 else 1
-    }
-    
-    # 임시 컬럼 제거
-    cols_to_remove = ['subject_norm', 'sender_norm', 'date_str', 'duplicate_key', 'body_snippet']
-    df_clean = df_clean[[col for col in df_clean.columns if col not in cols_to_remove]]
-    
-    return df_clean, stats
+from outlook_pst_sink import is_store_path, open_store
+from outlook_hvdc_entities import extract_legacy
+from outlook_hvdc_dedup import remove_duplicates  # 청크 단위 64-bit 해시 중복 제거
 
 # ===== Legacy 패턴 통합 =====
 
@@ -296,17 +214,29 @@ def detect_data_sheet(xl_file):
             return candidate
     return sheet_names[0]
 
-def analyze_and_create_hvdc_report(pst_file, deduplicate=True, keep='last', use_body=False):
-    """PST 파일 분석 및 HVDC 온톨로지 통합 보고서 생성"""
+def analyze_and_create_hvdc_report(pst_file, deduplicate=True, keep='last', use_body=False,
+                                   warehouse=None, excel=True):
+    """
+    PST 파일 분석 및 HVDC 온톨로지 통합 보고서 생성
+
+    warehouse: 결과를 기록할 이메일 웨어하우스 경로 (outlook_hvdc_warehouse, year_month 파티션)
+    excel: False면 _rev.xlsx 생성 생략 (웨어하우스만 기록)
+    """
     print(f"\n[HVDC 온톨로지 분석 시작: {pst_file}]")
     
-    xl = pd.ExcelFile(pst_file, engine='openpyxl')
-    print(f"   시트: {xl.sheet_names}")
-    
-    data_sheet = detect_data_sheet(xl)
-    print(f"   데이터 시트: '{data_sheet}'")
-    
-    df = pd.read_excel(pst_file, sheet_name=data_sheet, engine='openpyxl')
+    if is_store_path(pst_file):
+        # 스캐너 배치 저장소 직접 읽기 (엑셀 파싱 생략)
+        with open_store(pst_file) as store:
+            print(f"   저장소: {store.kind}")
+            df = store.read_all()
+    else:
+        xl = pd.ExcelFile(pst_file, engine='openpyxl')
+        print(f"   시트: {xl.sheet_names}")
+        
+        data_sheet = detect_data_sheet(xl)
+        print(f"   데이터 시트: '{data_sheet}'")
+        
+        df = pd.read_excel(pst_file, sheet_name=data_sheet, engine='openpyxl')
     print(f"   총 이메일: {len(df):,}개")
     
     # 중복 제거 (기본값: 활성화)
@@ -325,11 +255,12 @@ def analyze_and_create_hvdc_report(pst_file, deduplicate=True, keep='last', use_
     # HVDC 온톨로지 메타데이터 추출
     print(f"\n[HVDC 온톨로지 메타데이터 추출 중...]")
     
-    # V1 형식 추출
-    df['case_numbers'] = df['Subject'].apply(extract_case_numbers_enhanced)
-    df['site'] = df['Subject'].apply(extract_site)
-    df['lpo'] = df['Subject'].apply(extract_lpo)
-    df['phase'] = df['Subject'].apply(extract_phase)
+    # V1 형식 추출 (컬럼 일괄 처리 - extract_* 함수와 동일 결과)
+    legacy = extract_legacy(df['Subject'])
+    df['case_numbers'] = legacy['case_numbers']
+    df['site'] = legacy['site']
+    df['lpo'] = legacy['lpo']
+    df['phase'] = legacy['phase']
     
     # V2 형식 컬럼 추가 (OUTLOOK_HVDC_rev 포맷)
     df['hvdc_cases'] = df['case_numbers']  # 동일
@@ -414,12 +345,29 @@ def analyze_and_create_hvdc_report(pst_file, deduplicate=True, keep='last', use_
         year_month = datetime.now().strftime("%Y%m")  # fallback (이미 처리되어야 하지만 안전장치)
     
     base_name = f"OUTLOOK_HVDC_{year_month}_rev"
+    
+    # 증분 스캔 델타(OUTLOOK_YYYYMM_delta_YYYYMMDD_HHMMSS)는 별도 파티션으로 저장
+    delta_match = re.search(r'_delta_(\d{8}_\d{6})', Path(pst_file).name)
+    if delta_match:
+        base_name = f"OUTLOOK_HVDC_{year_month}_delta_{delta_match.group(1)}_rev"
+    
+    output_path = None
+    if warehouse:
+        # 웨어하우스: year_month 파티션에 기록 (델타는 delta_* part, 재실행 시 같은 part 교체)
+        from outlook_hvdc_warehouse import EmailWarehouse, BASE_LABEL
+        label = f"delta_{delta_match.group(1)}" if delta_match else BASE_LABEL
+        output_path = EmailWarehouse(warehouse).append_month(df, year_month, label=label)
+        print(f"\n[웨어하우스] {output_path} ({len(df):,}행)")
+    
+    if not excel:
+        return output_path
+    
     output_path = Path("results") / f"{base_name}.xlsx"
     
     # 충돌 방지: 기존 파일이 있으면 타임스탬프 추가
     if output_path.exists():
         timestamp = datetime.now().strftime("%Y%m%d")
-        output_path = Path("results") / f"OUTLOOK_HVDC_{year_month}_rev_{timestamp}.xlsx"
+        output_path = Path("results") / f"{base_name}_{timestamp}.xlsx"
     
     with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
         # 시트 1: 전체 데이터 (확장된 컬럼)
@@ -473,9 +421,15 @@ if __name__ == "__main__":
                        help='Body 일부도 중복 판별에 사용 (기본값: Subject+Sender+Date만)')
     parser.add_argument('--keep', choices=['first', 'last'], default='last',
                        help='중복 시 유지할 메시지 (first=첫번째, last=최신, 기본=last)')
+    parser.add_argument('--warehouse', metavar='DIR', default=None,
+                       help='결과를 이메일 웨어하우스(year_month 파티션 Parquet)에도 기록, 예) results/hvdc_warehouse')
+    parser.add_argument('--no-excel', action='store_true',
+                       help='OUTLOOK_HVDC_YYYYMM_rev.xlsx 생성 생략 (--warehouse와 함께 사용)')
     parser.add_argument('file', nargs='?', help='분석할 파일 경로 (선택, 없으면 대화형 모드)')
     
     args = parser.parse_args()
+    if args.no_excel and not args.warehouse:
+        parser.error('--no-excel은 --warehouse와 함께 사용해야 합니다')
     
     # 중복 제거 기본값: True (--no-deduplicate가 있으면 False)
     deduplicate = not args.no_deduplicate
@@ -505,7 +459,9 @@ if __name__ == "__main__":
         report = analyze_and_create_hvdc_report(pst_file, 
                                                 deduplicate=deduplicate,
                                                 keep=args.keep,
-                                                use_body=args.use_body)
+                                                use_body=args.use_body,
+                                                warehouse=args.warehouse,
+                                                excel=not args.no_excel)
         print(f"\n[완료]")
     else:
         print("\n[오류] 파일이 선택되지 않았습니다")
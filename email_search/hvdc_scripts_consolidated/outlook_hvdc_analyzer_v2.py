@@ -32,6 +32,8 @@ from typing import List, Dict, Any, Optional, Tuple
 
 import pandas as pd
 
+from outlook_hvdc_entities import EntityEngine
+
 try:
     import yaml  # optional
 except Exception:  # pragma: no cover
@@ -261,31 +263,18 @@ def analyze(df: pd.DataFrame, rules: Dict[str, List[str]], site_alias: Dict[str,
     if not subj_col:
         raise ValueError("필수 헤더(Subject)를 찾을 수 없습니다. 헤더 별칭을 확인하세요.")
 
-    out_rows = []
-    for _, row in df.iterrows():
-        subj = str(row.get(subj_col, "") or "")
-        body = str(row.get(body_col, "") or "")
-        sender = str(row.get(from_col, "") or "")
-        date = row.get(date_col)
-
-        cases = list(dict.fromkeys(_extract_cases(subj) + _extract_cases(body)))
-        sites = list(dict.fromkeys(_extract_sites(subj, site_alias) + _extract_sites(body, site_alias)))
-        lpos  = list(dict.fromkeys(_extract_lpos(subj) + _extract_lpos(body)))
-        stage, stage_hits = _classify_stage(subj, body, rules)
-
-        out_rows.append({
-            "date": date,
-            "from": sender,
-            "subject": subj,
-            "hvdc_cases": "; ".join(cases),
-            "primary_case": cases[0] if cases else "",
-            "sites": "; ".join(sites),
-            "primary_site": sites[0] if sites else "",
-            "lpo_numbers": "; ".join(lpos),
-            "stage": stage,
-            "stage_hits": "; ".join(stage_hits),
-        })
-    return pd.DataFrame(out_rows)
+    # 컬럼 전체 일괄 추출 (행 단위 _extract_*/_classify_stage 와 동일 결과)
+    engine = EntityEngine(rules, site_alias)
+    subj = df[subj_col].fillna("").astype(str)
+    body = df[body_col] if body_col else None
+    entities = engine.extract(subj, body)
+
+    out = pd.DataFrame({
+        "date": df[date_col] if date_col else None,
+        "from": df[from_col].fillna("").astype(str) if from_col else "",
+        "subject": subj,
+    }, index=df.index)
+    return pd.concat([out, entities], axis=1).reset_index(drop=True)
 
 def summaries(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
     s1 = (df.groupby("stage")["subject"].count()
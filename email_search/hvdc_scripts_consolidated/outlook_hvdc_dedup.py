@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Outlook HVDC 중복 제거 엔진 (청크 단위 64-bit 해시)
+
+outlook_hvdc_analyzer.py / outlook_hvdc_merge.py 공용 remove_duplicates.
+- 중복 키(Subject+Sender+Date[+Body 100자])는 기존과 동일하게 정규화하되 청크 단위로만 문자열 생성
+- 키 문자열 대신 64-bit 해시(uint64)만 보관 → 행당 8바이트 (전체 키 문자열/복사본 없음)
+- 전체 해시를 정렬해 그룹 계산 → keep='first'|'last'|False, 중복 그룹 통계는 기존 drop_duplicates/groupby와 동일
+  (서로 다른 키의 64-bit 해시 충돌 확률은 1억 행 기준 약 3e-4, 실사용 데이터에서는 무시 가능)
+- 입력이 한 번에 메모리에 올라오지 않아도 됨: HashDeduplicator.add(chunk)로 키 컬럼만 흘려 넣고 finish()로 마스크 계산
+- 결과는 청크 크기와 무관: 문자열이 아닌 값(숫자 제목 등)은 str로 변환, 날짜 형식은 첫 유효 값으로 한 번만 추정
+
+사용:
+  df_clean, stats = remove_duplicates(df, keep='last', use_body=False)
+
+  dedup = HashDeduplicator(keep='last')
+  for chunk in chunks:            # 키 컬럼만 있는 청크 (dedup_key_columns 참고)
+      dedup.add(chunk)
+  mask, stats = dedup.finish()    # 입력 순서 기준 bool 마스크
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+DEFAULT_CHUNK_ROWS = 200_000
+BODY_SNIPPET_CHARS = 100
+NULL_KEY_HASH = np.uint64(0)
+
+
+def dedup_key_columns(use_body: bool = False) -> List[str]:
+    """중복 키 계산에 필요한 입력 컬럼"""
+    columns = ['Subject', 'SenderEmail', 'DeliveryTime', 'CreationTime']
+    if use_body:
+        columns.append('PlainTextBody')
+    return columns
+
+
+def _text(values: pd.Series) -> pd.Series:
+    """결측은 '', 나머지는 str (청크의 값이 모두 숫자여도 .str 사용 가능)"""
+    values = values.astype(object)
+    return values.where(values.isna(), values.astype(str)).fillna('').astype(str)
+
+
+def date_column(chunk: pd.DataFrame) -> Optional[str]:
+    """날짜 키에 쓰는 컬럼 (DeliveryTime 우선)"""
+    for col in ('DeliveryTime', 'CreationTime'):
+        if col in chunk.columns:
+            return col
+    return None
+
+
+def infer_date_format(values: pd.Series) -> Optional[str]:
+    """
+    날짜 형식 추정 - 전체 컬럼을 pd.to_datetime에 넘길 때와 같이 첫 유효 값 기준
+    
+    Returns:
+        strftime 형식, 값마다 파싱해야 하면 'mixed', 아직 정할 수 없으면(모두 결측, datetime 컬럼) None
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return None
+    valid = values.dropna()
+    if len(valid) == 0:
+        return None
+    first = valid.iloc[0]
+    if isinstance(first, str):
+        return guess_datetime_format(first) or 'mixed'
+    return 'mixed'
+
+
+def duplicate_keys(chunk: pd.DataFrame, use_body: bool = False,
+                   date_format: Optional[str] = None) -> pd.Series:
+    """
+    중복 키 문자열 (Subject + Sender + Date + Body(옵션)) - 청크 단위로만 호출
+    
+    date_format: 모든 청크에 같은 형식을 쓰도록 infer_date_format 결과 전달 (생략 시 이 청크에서 추정)
+    """
+    # Subject 정규화 강화 (공백, 대소문자, 특수문자, RE: FWD: 등 접두사 제거)
+    subject_norm = (
+        _text(chunk['Subject'])
+        .str.lower()
+        .str.strip()
+        .str.replace(r'^(re:|fwd?:|fw:|reply:|답변:)\s*', '', regex=True)  # 접두사 제거
+        .str.replace(r'\s+', ' ', regex=True)  # 연속 공백 통일
+        .str.replace(r'[^\w\s\-]', '', regex=True)  # 특수문자 제거 (하이픈 제외)
+        .str.strip()
+    )
+
+    # Sender 정규화
+    sender_norm = _text(chunk['SenderEmail']).str.lower().str.strip()
+
+    # 날짜 정규화 (날짜만 사용, 시간 제외)
+    col = date_column(chunk)
+    if col is not None:
+        dates = chunk[col]
+        if date_format is None:
+            date_format = infer_date_format(dates)
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            parsed = pd.to_datetime(dates, errors='coerce')
+        else:
+            parsed = pd.to_datetime(dates.astype(object), errors='coerce', format=date_format)
+        date_str = parsed.dt.date.astype(str)
+    else:
+        date_str = pd.Series('', index=chunk.index)
+
+    key = subject_norm + '|' + sender_norm + '|' + date_str
+
+    # Body 일부 비교 (옵션)
+    if use_body:
+        if 'PlainTextBody' in chunk.columns:
+            body_snippet = (
+                _text(chunk['PlainTextBody'])
+                .str[:BODY_SNIPPET_CHARS]
+                .str.lower()
+                .str.strip()
+                .str.replace(r'\s+', ' ', regex=True)
+            )
+            key = key + '|' + body_snippet
+        else:
+            key = key + '|'
+    return key
+
+
+def hash_keys(chunk: pd.DataFrame, use_body: bool = False,
+              date_format: Optional[str] = None) -> np.ndarray:
+    """청크의 중복 키 → uint64 해시 배열"""
+    if len(chunk) == 0:
+        return np.empty(0, dtype=np.uint64)
+    key = duplicate_keys(chunk, use_body=use_body, date_format=date_format)
+    hashes = pd.util.hash_pandas_object(key, index=False).to_numpy(dtype=np.uint64, copy=True)
+    # 키가 결측(NaN)인 행: drop_duplicates는 한 그룹으로 묶고 groupby 통계에서는 제외 → 예약 해시로 표시
+    hashes[key.isna().to_numpy()] = NULL_KEY_HASH
+    return hashes
+
+
+class HashDeduplicator:
+    """
+    청크 단위 해시 중복 제거
+
+    add()로 청크를 순서대로 넣으면 행당 uint64 해시 하나만 보관하고,
+    finish()에서 해시를 안정 정렬해 그룹별 첫/마지막 행과 중복 통계를 계산한다.
+    """
+
+    def __init__(self, keep='last', use_body: bool = False):
+        if keep not in ('first', 'last', False):
+            raise ValueError(f"keep은 'first', 'last', False 중 하나여야 합니다: {keep!r}")
+        self.keep = keep
+        self.use_body = use_body
+        self._hashes: List[np.ndarray] = []
+        self.rows = 0
+        # 첫 유효 날짜 값으로 한 번 정한 형식을 이후 모든 청크에 사용
+        self.date_format: Optional[str] = None
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        if self.date_format is None:
+            col = date_column(chunk)
+            if col is not None:
+                self.date_format = infer_date_format(chunk[col])
+        hashes = hash_keys(chunk, use_body=self.use_body, date_format=self.date_format)
+        self._hashes.append(hashes)
+        self.rows += len(hashes)
+
+    def finish(self) -> Tuple[np.ndarray, Dict]:
+        """(입력 순서 기준 유지 마스크, 중복 통계)"""
+        hashes = np.concatenate(self._hashes) if self._hashes else np.empty(0, dtype=np.uint64)
+        self._hashes = []
+        n = len(hashes)
+        mask = np.zeros(n, dtype=bool)
+        if n == 0:
+            return mask, _stats(0, 0, np.empty(0, dtype=np.int64))
+        has_null = bool((hashes == NULL_KEY_HASH).any())
+
+        # 안정 정렬: 같은 해시 안에서는 입력 순서 유지 → 그룹의 처음/끝 = first/last
+        order = np.argsort(hashes, kind='stable')
+        sorted_hashes = hashes[order]
+        del hashes
+        boundary = sorted_hashes[1:] != sorted_hashes[:-1]
+        starts = np.concatenate(([True], boundary))
+        ends = np.concatenate((boundary, [True]))
+        del sorted_hashes, boundary
+
+        start_idx = np.flatnonzero(starts)
+        counts = np.diff(np.append(start_idx, n))
+        # 정렬 후 첫 그룹 = 최소 해시 = 결측 키 그룹
+        group_counts = counts[1:] if has_null else counts
+
+        if self.keep == 'first':
+            mask[order[starts]] = True
+        elif self.keep == 'last':
+            mask[order[ends]] = True
+        else:
+            mask[order[start_idx[counts == 1]]] = True
+        return mask, _stats(n, int(mask.sum()), group_counts)
+
+
+def _stats(original: int, deduplicated: int, counts: np.ndarray) -> Dict:
+    """기존 remove_duplicates와 같은 형식의 통계"""
+    duplicates_only = counts[counts > 1]
+    return {
+        'original': original,
+        'deduplicated': deduplicated,
+        'removed': original - deduplicated,
+        'ratio': (original - deduplicated) / original * 100 if original > 0 else 0,
+        'duplicate_groups': len(duplicates_only),
+        'max_duplicates': int(duplicates_only.max()) if len(duplicates_only) > 0 else 1
+    }
+
+
+def dedup_chunks(chunks: Iterable[pd.DataFrame], keep='last', use_body: bool = False) -> Tuple[np.ndarray, Dict]:
+    """키 컬럼 청크 스트림 → (유지 마스크, 통계)"""
+    dedup = HashDeduplicator(keep=keep, use_body=use_body)
+    for chunk in chunks:
+        dedup.add(chunk)
+    return dedup.finish()
+
+
+def remove_duplicates(df: pd.DataFrame, keep='last', use_body=False,
+                      chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Tuple[pd.DataFrame, Dict]:
+    """
+    중복 메시지 제거 (강화된 로직)
+
+    Args:
+        df: 입력 데이터프레임
+        keep: 'first' (첫 번째), 'last' (최신), False (모두 제거)
+        use_body: True면 Body 일부도 비교에 사용 (기본: False, Subject+Sender+Date만)
+        chunk_rows: 키 문자열을 만드는 청크 크기
+
+    Returns:
+        (정리된 데이터프레임, 중복 통계)
+    """
+    key_columns = [c for c in dedup_key_columns(use_body) if c in df.columns]
+    chunks = (df.iloc[start:start + chunk_rows][key_columns] for start in range(0, len(df), chunk_rows))
+    mask, stats = dedup_chunks(chunks, keep=keep, use_body=use_body)
+    return df[mask], stats
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HVDC 엔티티 일괄 추출 엔진 (케이스/사이트/LPO/단계)
+
+outlook_hvdc_analyzer.py(V1 컬럼)와 outlook_hvdc_analyzer_v2.py(V2 컬럼)가 공유한다.
+행 단위 iterrows/apply 대신 DataFrame 컬럼 전체에 대해 한 번에 처리:
+- 사이트 별칭/단계 키워드 → 미리 컴파일한 단일 alternation 정규식 1개 (긴 별칭 우선)
+- 겹치는 매칭은 lookahead 스캔 + 별칭 포함관계 closure로 행 단위 결과와 동일하게 보정
+- 케이스/LPO → Series.str.extractall 로 (행, 매칭) 단위 벡터 연산 후 행별 순서 유지 병합
+- 행별 후처리(정렬/조인)는 고유 조합 단위로 1회만 계산 (dict 캐시)
+
+규칙 파일: site_alias_default.json / stage_rules_default.json (같은 폴더)
+
+사용:
+  engine = EntityEngine.from_files()
+  cols = engine.extract(df['subject'], df['body'])      # V2 컬럼
+  legacy = extract_legacy(df['Subject'])                 # V1 컬럼 (case_numbers/site/lpo/phase)
+
+벤치마크: python bench_hvdc_entities.py --rows 500000
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+RULES_DIR = Path(__file__).resolve().parent
+SITE_ALIAS_FILE = RULES_DIR / "site_alias_default.json"
+STAGE_RULES_FILE = RULES_DIR / "stage_rules_default.json"
+
+# V2 추출 정규식 (outlook_hvdc_analyzer_v2.CASE_REGEXES / LPO_REGEXES 와 동일)
+CASE_REGEXES = [
+    r"(HVDC[-\s]?ADOPT[-\s]?[A-Z0-9]+[-\s]?[A-Z0-9-]+)",
+    r"\(([A-Z]{2,5})-([A-Z0-9-]{2,})\)",
+    r"ADOPT[\s:_-]*([A-Z]{2,5})[\s:_-]*([A-Z0-9-]{2,})",
+]
+LPO_REGEXES = [
+    r"\bLPO[:\s\-]*([A-Z0-9\-\/]{4,})\b",
+    r"\bP\.?O\.?[:\s\-]*([A-Z0-9\-\/]{4,})\b",
+]
+# 각 정규식이 매칭되려면 반드시 포함되어야 하는 소문자 리터럴 (사전 필터)
+CASE_REQUIRES = ["adopt", "(", "adopt"]
+LPO_REQUIRES = ["lpo", "p"]
+SITE_PRIORITY = ["AGI", "DAS", "MIR", "MIRFA", "GHALLAN"]
+UNCATEGORIZED = "uncategorized"
+
+
+# -------------------------
+# 공통 헬퍼
+# -------------------------
+
+def _as_text(series: Optional[pd.Series], index: pd.Index) -> pd.Series:
+    """None/NaN → '' 문자열 컬럼 (object dtype 고정)"""
+    if series is None:
+        return pd.Series("", index=index, dtype=object)
+    return series.fillna("").astype(str).astype(object)
+
+
+def _empty_tuples(index: pd.Index) -> pd.Series:
+    return pd.Series([()] * len(index), index=index, dtype=object)
+
+
+def _extract_all(text: pd.Series, pattern: str, build: Callable[[pd.DataFrame], pd.Series],
+                 flags: int = 0, require: Optional[str] = None,
+                 lower: Optional[pd.Series] = None) -> pd.Series:
+    """
+    extractall → (행, 매칭) 단위 문자열 생성 → 행별 튜플 (매칭 순서 유지)
+    - require: 매칭에 반드시 필요한 소문자 리터럴 → 포함된 행에만 정규식 실행
+    - 매칭 없는 행은 빈 튜플
+    """
+    result = _empty_tuples(text.index)
+    if require is not None:
+        lower = text.str.lower() if lower is None else lower
+        text = text[lower.str.contains(require, regex=False)]
+    if text.empty:
+        return result
+    found = text.str.extractall(pattern, flags=flags)
+    if found.empty:
+        return result
+    values = build(found)
+
+    # extractall 결과는 (행, 매칭) 순서로 정렬되어 있음 → 연속 구간을 행별 튜플로
+    positions = result.index.get_indexer(found.index.get_level_values(0))
+    grouped = {}
+    for pos, value in zip(positions, values.tolist()):
+        grouped.setdefault(pos, []).append(value)
+    tuples = result.tolist()
+    for pos, vals in grouped.items():
+        tuples[pos] = tuple(vals)
+    return pd.Series(tuples, index=result.index, dtype=object)
+
+
+def _merge_ordered(*columns: pd.Series) -> pd.Series:
+    """행별로 여러 튜플 컬럼을 순서 유지 + 중복 제거하여 병합"""
+    merged = []
+    for parts in zip(*columns):
+        merged.append(tuple(dict.fromkeys(v for part in parts for v in part)))
+    return pd.Series(merged, index=columns[0].index, dtype=object)
+
+
+def _alternation(words: Iterable[str]) -> str:
+    """긴 단어 우선 alternation (같은 위치에서 가장 긴 별칭/키워드가 선택되도록)"""
+    return "|".join(re.escape(w) for w in sorted(set(words), key=lambda w: (-len(w), w)))
+
+
+# -------------------------
+# V2 엔진
+# -------------------------
+
+class EntityEngine:
+    """
+    사이트 별칭/단계 규칙을 미리 컴파일한 일괄 추출기
+    - extract(subject, body) → hvdc_cases, primary_case, sites, primary_site, lpo_numbers, stage, stage_hits
+    - 결과는 outlook_hvdc_analyzer_v2 의 행 단위 추출(_extract_*/_classify_stage)과 동일
+    """
+
+    def __init__(self, stage_rules: Dict[str, List[str]], site_alias: Dict[str, Iterable[str]]):
+        self.stage_rules = {stage: list(kws) for stage, kws in stage_rules.items()}
+        self.site_alias = {site: set(aliases) for site, aliases in site_alias.items()}
+        self._compile_sites()
+        self._compile_stages()
+
+    @classmethod
+    def from_files(cls, stage_rules_path: Optional[Path] = STAGE_RULES_FILE,
+                   site_alias_path: Optional[Path] = SITE_ALIAS_FILE) -> "EntityEngine":
+        """JSON 규칙 파일로 엔진 생성"""
+        rules = json.loads(Path(stage_rules_path).read_text(encoding="utf-8"))
+        aliases = json.loads(Path(site_alias_path).read_text(encoding="utf-8"))
+        aliases = {site: {str(a).lower() for a in vals} for site, vals in aliases.items()}
+        return cls(rules, aliases)
+
+    # ----- 컴파일 -----
+
+    def _compile_sites(self):
+        # 별칭 → 사이트 집합 (사이트명 자체도 별칭)
+        alias_sites: Dict[str, set] = {}
+        for site, aliases in self.site_alias.items():
+            for alias in aliases | {site.lower()}:
+                alias_sites.setdefault(alias, set()).add(site)
+        # 별칭 안에 단어 경계로 포함된 다른 별칭의 사이트도 함께 (예: 'al ghallan island' ⊃ 'ghallan')
+        for alias, sites in alias_sites.items():
+            for other, other_sites in alias_sites.items():
+                if other != alias and re.search(rf"\b{re.escape(other)}\b", alias):
+                    sites |= other_sites
+        self._alias_sites = alias_sites
+        self._site_regex = re.compile(rf"(?=\b({_alternation(alias_sites)})\b)")
+
+        # 정렬 순서: 프로젝트 우선순위 → 규칙 파일 순서
+        order = [s for s in SITE_PRIORITY if s in self.site_alias]
+        order += [s for s in self.site_alias if s not in order]
+        self._site_rank = {site: i for i, site in enumerate(order)}
+        self._site_cache: Dict[tuple, tuple] = {}
+
+    def _compile_stages(self):
+        # 키워드 → (단계, 키워드) 히트 집합, 포함된 짧은 키워드도 closure로 추가 (부분 문자열 매칭)
+        keyword_hits: Dict[str, set] = {}
+        for stage, kws in self.stage_rules.items():
+            for kw in kws:
+                keyword_hits.setdefault(kw, set()).add((stage, kw))
+        for kw, hits in keyword_hits.items():
+            for other, other_hits in keyword_hits.items():
+                if other != kw and other in kw:
+                    hits |= other_hits
+        self._keyword_hits = keyword_hits
+        self._stage_regex = re.compile(f"(?=({_alternation(keyword_hits)}))") if keyword_hits else None
+        self._stage_order = {stage: i for i, stage in enumerate(self.stage_rules)}
+        self._stage_cache: Dict[frozenset, Tuple[str, str]] = {}
+
+    # ----- 사이트 -----
+
+    def _sites_for(self, aliases: tuple) -> tuple:
+        cached = self._site_cache.get(aliases)
+        if cached is None:
+            sites = set()
+            for alias in aliases:
+                sites |= self._alias_sites[alias]
+            cached = tuple(sorted(sites, key=self._site_rank.__getitem__))
+            self._site_cache[aliases] = cached
+        return cached
+
+    def sites(self, text: pd.Series, lower: Optional[pd.Series] = None) -> pd.Series:
+        """행별 사이트 튜플 (우선순위 정렬)"""
+        lower = text.str.lower() if lower is None else lower
+        found = lower.str.findall(self._site_regex)
+        return found.map(lambda hits: self._sites_for(tuple(dict.fromkeys(hits))) if hits else ())
+
+    # ----- 케이스 / LPO -----
+
+    def cases(self, text: pd.Series, lower: Optional[pd.Series] = None) -> pd.Series:
+        """행별 HVDC 케이스 튜플 (정규식 순서 → 매칭 순서)"""
+        lower = text.str.lower() if lower is None else lower
+        def build_strict(m: pd.DataFrame) -> pd.Series:
+            value = m[0].str.upper().str.replace(r"\s+", "-", regex=True)
+            return value.str.replace(r"HVDC[-\s]?ADOPT[-\s]?", "HVDC-ADOPT-", regex=True, flags=re.IGNORECASE)
+
+        def build_paren(m: pd.DataFrame) -> pd.Series:
+            # 괄호 포함 매칭은 첫 그룹만 사용 (행 단위 구현과 동일)
+            return m[0].str.upper()
+
+        def build_loose(m: pd.DataFrame) -> pd.Series:
+            return "HVDC-ADOPT-" + m[0].str.upper() + "-" + m[1].str.upper()
+
+        builders = [build_strict, build_paren, build_loose]
+        parts = [_extract_all(text, rx, build, flags=re.IGNORECASE, require=req, lower=lower)
+                 for rx, build, req in zip(CASE_REGEXES, builders, CASE_REQUIRES)]
+        return _merge_ordered(*parts)
+
+    def lpos(self, text: pd.Series, lower: Optional[pd.Series] = None) -> pd.Series:
+        """행별 LPO/PO 번호 튜플"""
+        lower = text.str.lower() if lower is None else lower
+        parts = [_extract_all(text, rx, lambda m: m[0].str.upper(), flags=re.IGNORECASE,
+                              require=req, lower=lower)
+                 for rx, req in zip(LPO_REGEXES, LPO_REQUIRES)]
+        return _merge_ordered(*parts)
+
+    # ----- 단계 -----
+
+    def _stage_for(self, keywords: frozenset) -> Tuple[str, str]:
+        cached = self._stage_cache.get(keywords)
+        if cached is None:
+            hits = set()
+            for kw in keywords:
+                hits |= self._keyword_hits[kw]
+            stages = {stage for stage, _ in hits}
+            chosen = min(stages, key=self._stage_order.__getitem__) if stages else UNCATEGORIZED
+            cached = (chosen, "; ".join(sorted(f"{stage}:{kw}" for stage, kw in hits)))
+            self._stage_cache[keywords] = cached
+        return cached
+
+    def stages(self, subject: pd.Series, body: pd.Series,
+               lower: Optional[pd.Series] = None) -> pd.DataFrame:
+        """행별 (stage, stage_hits) - 제목+본문 소문자 부분 문자열 기준"""
+        if self._stage_regex is None:
+            return pd.DataFrame({"stage": UNCATEGORIZED, "stage_hits": ""}, index=subject.index)
+        text = (subject + "\n" + body).str.lower() if lower is None else lower
+        found = text.str.findall(self._stage_regex)
+        pairs = found.map(lambda kws: self._stage_for(frozenset(kws)))
+        return pd.DataFrame(pairs.tolist(), columns=["stage", "stage_hits"], index=subject.index)
+
+    # ----- 전체 -----
+
+    def extract(self, subject: pd.Series, body: Optional[pd.Series] = None) -> pd.DataFrame:
+        """제목/본문 컬럼 → V2 엔티티 컬럼 (입력과 같은 index)"""
+        subject = _as_text(subject, subject.index)
+        body = _as_text(body, subject.index)
+
+        subj_lower = subject.str.lower()
+        body_lower = body.str.lower()
+
+        # 제목은 스레드(RE:/FW:)로 반복되는 경우가 많음 → 고유 제목 기준으로 추출 후 펼침
+        codes, uniques = pd.factorize(subject)
+        uniq_subject = pd.Series(uniques, dtype=object)
+        uniq_lower = uniq_subject.str.lower()
+
+        def per_subject(fn) -> pd.Series:
+            values = fn(uniq_subject, uniq_lower).to_numpy()
+            return pd.Series(values[codes], index=subject.index, dtype=object)
+
+        cases = _merge_ordered(per_subject(self.cases), self.cases(body, body_lower))
+        sites = _merge_ordered(per_subject(self.sites), self.sites(body, body_lower))
+        lpos = _merge_ordered(per_subject(self.lpos), self.lpos(body, body_lower))
+        stages = self.stages(subject, body, subj_lower + "\n" + body_lower)
+
+        return pd.DataFrame({
+            "hvdc_cases": cases.map("; ".join),
+            "primary_case": cases.map(lambda c: c[0] if c else ""),
+            "sites": sites.map("; ".join),
+            "primary_site": sites.map(lambda s: s[0] if s else ""),
+            "lpo_numbers": lpos.map("; ".join),
+            "stage": stages["stage"],
+            "stage_hits": stages["stage_hits"],
+        }, index=subject.index)
+
+
+# -------------------------
+# V1 (outlook_hvdc_analyzer.py) 컬럼
+# -------------------------
+
+LEGACY_SITE_REGEX = r"\b(DAS|AGI|MIR|MIRFA|GHALLAN)\b"
+LEGACY_LPO_REGEX = r"LPO[-\s]?(\d+)"
+LEGACY_PHASES = {
+    'procurement': r'\b(?:LPO|PO|Purchase Order|Procurement|Order)\b',
+    'shipping': r'\b(?:Shipping|Delivery|Container|CNTR|LCT|Vessel)\b',
+    'customs': r'\b(?:Customs|Clearance|Import|Export|Duty)\b',
+    'logistics': r'\b(?:Logistics|Transport|Freight|Cargo|Material)\b',
+    'installation': r'\b(?:Installation|Install|Mounting|Assembly)\b',
+    'testing': r'\b(?:Test|Testing|Commissioning|Startup)\b',
+    'certification': r'\b(?:Certificate|Cert|MTC|COC|Quality)\b',
+}
+
+
+def _join_or_none(values: tuple) -> Optional[str]:
+    return ', '.join(values) if values else None
+
+
+def legacy_case_numbers(subject: pd.Series) -> pd.Series:
+    """extract_case_numbers_enhanced 와 동일한 결과 (패턴 1~5)"""
+    I = re.IGNORECASE
+    lower = subject.str.lower()
+    p1 = _extract_all(subject, r'HVDC-ADOPT-([A-Z]+)-([A-Z0-9\-]+)',
+                      lambda m: ("HVDC-ADOPT-" + m[0] + "-" + m[1]).str.upper(), flags=I,
+                      require='hvdc-adopt-', lower=lower)
+    p2 = _extract_all(subject, r'HVDC-([A-Z]+)-([A-Z]+)-([A-Z0-9\-]+)',
+                      lambda m: ("HVDC-" + m[0] + "-" + m[1] + "-" + m[2]).str.upper(), flags=I,
+                      require='hvdc-', lower=lower)
+
+    # 패턴 3: 괄호 안의 약식 (HE-XXXX) → 괄호 내용 1개당 내부 패턴을 모두 추출 (괄호 순서 유지)
+    def build_paren(m: pd.DataFrame) -> pd.Series:
+        inner = m[0].str.findall(r'([A-Z]+)-([0-9]+(?:-[0-9A-Z]+)?)', flags=I).explode().dropna()
+        return inner.map(lambda g: f"HVDC-ADOPT-{g[0].upper()}-{g[1]}")
+
+    p3 = _extract_all(subject, r'\(([^\)]+)\)', build_paren, require='(', lower=lower)
+    p4 = _extract_all(subject, r'\[HVDC-AGI\].*?(JPTW-(\d+))\s*/\s*(GRM-(\d+))',
+                      lambda m: ("HVDC-AGI-JPTW" + m[1] + "-GRM" + m[3]).str.upper(), flags=I,
+                      require='[hvdc-agi]', lower=lower)
+    p5 = _extract_all(subject, r':\s*([A-Z]+-[A-Z]+-[A-Z]+\d+-[A-Z]+\d+)',
+                      lambda m: m[0].str.replace(r'\(.*?\)', '', regex=True).str.strip().str.upper(),
+                      flags=I, require=':', lower=lower)
+
+    out = []
+    for first, *rest in zip(p1, p2, p3, p4, p5):
+        if not (first or any(rest)):
+            out.append(None)
+            continue
+        cases = list(first)  # 패턴 1은 중복 검사 없이 추가 (원본 동작)
+        for group in rest:
+            for case in group:
+                if case not in cases:
+                    cases.append(case)
+        out.append(', '.join(cases) if cases else None)
+    return pd.Series(out, index=subject.index, dtype=object)
+
+
+def legacy_phase(subject: pd.Series) -> pd.Series:
+    """extract_phase 와 동일 (단계별 정규식 1회씩 컬럼 전체 검사)"""
+    flags = pd.DataFrame({
+        phase: subject.str.contains(pattern, case=False, regex=True)
+        for phase, pattern in LEGACY_PHASES.items()
+    }, index=subject.index)
+    phases = list(LEGACY_PHASES)
+    # 단계 히트를 비트마스크로 묶어 고유 조합만 문자열로 변환
+    codes = flags.to_numpy().astype('int64') @ (1 << np.arange(len(phases), dtype='int64'))
+    lookup = {}
+    for code in np.unique(codes):
+        detected = [p for bit, p in enumerate(phases) if code >> bit & 1]
+        lookup[code] = ', '.join(detected) if detected else None
+    return pd.Series(codes, index=subject.index).map(lookup)
+
+
+def extract_legacy(subject: pd.Series) -> pd.DataFrame:
+    """V1 컬럼 일괄 추출: case_numbers, site, lpo, phase"""
+    subject = _as_text(subject, subject.index)
+    # RE:/FW: 스레드로 같은 제목이 반복됨 → 고유 제목만 추출 후 행으로 펼침
+    codes, uniques = pd.factorize(subject)
+    if len(uniques) < len(subject):
+        result = _extract_legacy_unique(pd.Series(uniques, dtype=object))
+        result = result.take(codes)
+        result.index = subject.index
+        return result
+    return _extract_legacy_unique(subject)
+
+
+def _extract_legacy_unique(subject: pd.Series) -> pd.DataFrame:
+    site = subject.str.extract(LEGACY_SITE_REGEX, flags=re.IGNORECASE)[0].str.upper()
+    lpo = _extract_all(subject, LEGACY_LPO_REGEX, lambda m: "LPO-" + m[0], flags=re.IGNORECASE,
+                       require='lpo')
+    return pd.DataFrame({
+        'case_numbers': legacy_case_numbers(subject),
+        'site': site.astype(object).where(site.notna(), None),
+        'lpo': lpo.map(_join_or_none),
+        'phase': legacy_phase(subject),
+    }, index=subject.index)
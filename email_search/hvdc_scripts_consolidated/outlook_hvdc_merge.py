@@ -5,18 +5,26 @@ Outlook HVDC 통합 스크립트
 모든 월별 OUTLOOK_HVDC_*_rev.xlsx 파일을 하나의 통합 파일로 합치기
 
 기능:
-- 모든 월별 _rev 파일 자동 탐색
+- 모든 월별 _rev 파일 자동 탐색 (증분 스캔 델타 파티션 OUTLOOK_HVDC_YYYYMM_delta_*_rev.xlsx 포함)
 - 데이터 결합 및 전체 중복 제거
 - 통합 통계 생성 (월별 요약, 케이스별, 사이트별, LPO별, 단계별)
 
+웨어하우스 모드 (--warehouse, outlook_hvdc_warehouse.py):
+- 지정한 year_month 파티션(--months)과 필요한 컬럼만 읽음 (본문 컬럼은 읽지 않음,
+  --use-body면 중복 키 계산용으로만 PlainTextBody를 배치 단위로 읽음)
+
 출력:
 - OUTLOOK_HVDC_ALL_rev.xlsx (통합 파일)
 - 시트: 전체_데이터, 월별_요약, 케이스별_통계, 사이트별_통계, LPO별_통계, 단계별_통계
+- --near-duplicates: 근접중복 시트 + <출력파일명>_near_duplicates.csv (outlook_hvdc_near_dup.py, MinHash/LSH)
+  row = 전체_데이터 시트의 0부터 시작하는 행 위치 (대시보드 Quality/Audit 페이지에서 사용)
 
 빠른 실행:
   python outlook_hvdc_merge.py
+  python outlook_hvdc_merge.py --warehouse results/hvdc_warehouse --months 202505 202506
 """
 
+import numpy as np
 import pandas as pd
 import glob
 from pathlib import Path
@@ -24,84 +32,7 @@ from datetime import datetime
 from typing import List, Tuple
 import re
 
-# 중복 제거 함수 (outlook_hvdc_analyzer.py와 동일)
-def remove_duplicates(df: pd.DataFrame, keep='last', use_body=False) -> Tuple[pd.DataFrame, dict]:
-    """
-    중복 메시지 제거 (강화된 로직)
-    """
-    df_work = df.copy()
-    
-    # Subject 정규화 강화
-    df_work['subject_norm'] = (
-        df_work['Subject'].fillna('')
-        .str.lower()
-        .str.strip()
-        .str.replace(r'^(re:|fwd?:|fw:|reply:|답변:)\s*', '', regex=True)
-        .str.replace(r'\s+', ' ', regex=True)
-        .str.replace(r'[^\w\s\-]', '', regex=True)
-        .str.strip()
-    )
-    
-    # Sender 정규화
-    df_work['sender_norm'] = df_work['SenderEmail'].fillna('').str.lower().str.strip()
-    
-    # 날짜 정규화
-    if 'DeliveryTime' in df_work.columns:
-        df_work['date_str'] = pd.to_datetime(df_work['DeliveryTime'], errors='coerce').dt.date.astype(str)
-    elif 'CreationTime' in df_work.columns:
-        df_work['date_str'] = pd.to_datetime(df_work['CreationTime'], errors='coerce').dt.date.astype(str)
-    else:
-        df_work['date_str'] = ''
-    
-    # Body 일부 비교 (옵션)
-    if use_body and 'PlainTextBody' in df_work.columns:
-        df_work['body_snippet'] = (
-            df_work['PlainTextBody'].fillna('')
-            .str[:100]
-            .str.lower()
-            .str.strip()
-            .str.replace(r'\s+', ' ', regex=True)
-        )
-    else:
-        df_work['body_snippet'] = ''
-    
-    # 중복 키 생성
-    if use_body and 'body_snippet' in df_work.columns:
-        df_work['duplicate_key'] = (
-            df_work['subject_norm'] + '|' + 
-            df_work['sender_norm'] + '|' + 
-            df_work['date_str'] + '|' +
-            df_work['body_snippet'].astype(str)
-        )
-    else:
-        df_work['duplicate_key'] = (
-            df_work['subject_norm'] + '|' + 
-            df_work['sender_norm'] + '|' + 
-            df_work['date_str']
-        )
-    
-    # 중복 제거
-    df_clean = df_work.drop_duplicates(subset=['duplicate_key'], keep=keep)
-    
-    # 중복 패턴 분석
-    duplicate_counts = df_work.groupby('duplicate_key').size()
-    duplicates_only = duplicate_counts[duplicate_counts > 1]
-    
-    # 통계
-    stats = {
-        'original': len(df),
-        'deduplicated': len(df_clean),
-        'removed': len(df) - len(df_clean),
-        'ratio': (len(df) - len(df_clean)) / len(df) * 100 if len(df) > 0 else 0,
-        'duplicate_groups': len(duplicates_only),
-        'max_duplicates': int(duplicates_only.max()) if len(duplicates_only) > 0 else 1
-    }
-    
-    # 임시 컬럼 제거
-    cols_to_remove = ['subject_norm', 'sender_norm', 'date_str', 'duplicate_key', 'body_snippet']
-    df_clean = df_clean[[col for col in df_clean.columns if col not in cols_to_remove]]
-    
-    return df_clean, stats
+from outlook_hvdc_dedup import dedup_chunks, dedup_key_columns, remove_duplicates
 
 def find_all_hvdc_rev_files() -> List[Path]:
     """모든 OUTLOOK_HVDC_*_rev.xlsx 파일 찾기"""
@@ -120,7 +51,7 @@ def find_all_hvdc_rev_files() -> List[Path]:
 
 def extract_year_month_from_filename(filename: str) -> str:
     """파일명에서 YYYYMM 형식 추출"""
-    match = re.search(r'OUTLOOK_HVDC_(\d{6})_rev', filename)
+    match = re.search(r'OUTLOOK_HVDC_(\d{6})(?:_delta_\d{8}_\d{6})?_rev', filename)
     if match:
         return match.group(1)
     return None
@@ -186,8 +117,48 @@ def load_monthly_data(file_path: Path) -> Tuple[pd.DataFrame, dict]:
     
     return df, stats
 
-def merge_all_monthly_data(use_body=False) -> Tuple[pd.DataFrame, List[dict]]:
-    """모든 월별 데이터 결합"""
+def load_warehouse_data(warehouse, months=None) -> Tuple[pd.DataFrame, List[dict]]:
+    """웨어하우스에서 필요한 파티션/컬럼만 로드 (본문 컬럼 제외)"""
+    from outlook_hvdc_warehouse import EmailWarehouse, PARTITION_KEY
+
+    df = EmailWarehouse(warehouse).read(months=months, with_partition=True)
+    if df.empty:
+        return df, []
+
+    monthly_stats = []
+    for year_month, part in df.groupby(PARTITION_KEY, sort=True):
+        monthly_stats.append({
+            'file': f"{PARTITION_KEY}={year_month}",
+            'year_month': year_month,
+            'rows': len(part),
+            'has_cases': part['case_numbers'].notna().sum() if 'case_numbers' in part.columns else 0,
+            'has_sites': part['site'].notna().sum() if 'site' in part.columns else 0,
+            'has_lpo': part['lpo'].notna().sum() if 'lpo' in part.columns else 0,
+            'has_phase': part['phase'].notna().sum() if 'phase' in part.columns else 0
+        })
+    if 'Month' not in df.columns:
+        df['Month'] = df[PARTITION_KEY]
+    df = df.drop(columns=[PARTITION_KEY])
+    return df, monthly_stats
+
+def merge_all_monthly_data(use_body=False, warehouse=None, months=None) -> Tuple[pd.DataFrame, List[dict]]:
+    """모든 월별 데이터 결합 (warehouse 지정 시 _rev 엑셀 대신 웨어하우스 파티션 사용)"""
+    if warehouse:
+        print(f"\n[웨어하우스 로드 중...] {warehouse}")
+        df_combined, monthly_stats = load_warehouse_data(warehouse, months=months)
+        if df_combined.empty:
+            print("❌ 웨어하우스에 해당 파티션이 없습니다")
+            return None, []
+        for stats in monthly_stats:
+            print(f"    ✓ {stats['year_month']}: {stats['rows']:,}행")
+        key_chunks = None
+        if use_body:
+            # Body는 결합 데이터에 싣지 않고 키 컬럼 배치로만 읽어 해시 계산
+            from outlook_hvdc_warehouse import EmailWarehouse
+            key_chunks = EmailWarehouse(warehouse).iter_batches(columns=dedup_key_columns(use_body=True),
+                                                                months=months)
+        return _dedup_combined(df_combined, monthly_stats, use_body, key_chunks)
+
     print("\n[월별 파일 탐색 중...]")
     files = find_all_hvdc_rev_files()
     
@@ -217,11 +188,26 @@ def merge_all_monthly_data(use_body=False) -> Tuple[pd.DataFrame, List[dict]]:
     
     print(f"\n[데이터 결합 중...]")
     df_combined = pd.concat(all_dataframes, ignore_index=True)
+    return _dedup_combined(df_combined, monthly_stats, use_body)
+
+def _dedup_combined(df_combined: pd.DataFrame, monthly_stats: List[dict], use_body=False,
+                    key_chunks=None) -> Tuple[pd.DataFrame, List[dict]]:
+    """
+    결합된 데이터 전체 중복 제거 및 no 재부여
+
+    key_chunks: df_combined와 같은 행 순서의 키 컬럼 청크 (지정 시 이 청크로 해시 계산)
+    """
     print(f"  결합 전: {len(df_combined):,}행")
     
-    # 전체 중복 제거
+    # 전체 중복 제거 (청크 단위 64-bit 해시)
     print(f"\n[전체 중복 제거 중...] (기준: Subject+Sender+Date{'+Body' if use_body else ''})")
-    df_clean, dup_stats = remove_duplicates(df_combined, keep='last', use_body=use_body)
+    if key_chunks is None:
+        df_clean, dup_stats = remove_duplicates(df_combined, keep='last', use_body=use_body)
+    else:
+        mask, dup_stats = dedup_chunks(key_chunks, keep='last', use_body=use_body)
+        if len(mask) != len(df_combined):
+            raise ValueError(f"키 청크 행 수({len(mask):,})가 결합 데이터({len(df_combined):,})와 다릅니다")
+        df_clean = df_combined[mask]
     print(f"  원본: {dup_stats['original']:,}개")
     print(f"  정리: {dup_stats['deduplicated']:,}개")
     print(f"  제거: {dup_stats['removed']:,}개 ({dup_stats['ratio']:.1f}%)")
@@ -283,7 +269,38 @@ def standardize_column_order(df: pd.DataFrame) -> pd.DataFrame:
     
     return df[final_columns]
 
-def save_merged_report(df: pd.DataFrame, monthly_stats: List[dict], output_path: Path):
+def find_merged_near_duplicates(df_merged: pd.DataFrame, threshold: float, warehouse=None,
+                                months=None) -> pd.DataFrame:
+    """
+    통합 데이터의 근접 중복 클러스터 (row = 통합 데이터 행 위치)
+
+    웨어하우스 모드에서는 통합 데이터에 본문이 없으므로 본문을 배치 단위로 읽어 색인한다.
+    """
+    from outlook_hvdc_near_dup import NearDuplicateIndex, attach_email_columns, find_near_duplicates
+
+    df_pos = df_merged.reset_index(drop=True)
+    print(f"\n[근접 중복 탐지 중...] (MinHash/LSH, threshold={threshold})")
+    if not warehouse or 'PlainTextBody' in df_merged.columns:
+        return find_near_duplicates(df_pos, threshold=threshold)
+
+    from outlook_hvdc_warehouse import EmailWarehouse
+
+    # 웨어하우스 읽기 순서 위치 → 통합 데이터 행 위치 (중복 제거로 빠진 행은 -1)
+    position = np.full(int(df_merged.index.max()) + 1, -1, dtype=np.int64)
+    position[df_merged.index.to_numpy()] = np.arange(len(df_merged))
+    index = NearDuplicateIndex(threshold=threshold)
+    offset = 0
+    for batch in EmailWarehouse(warehouse).iter_batches(columns=['Subject', 'PlainTextBody'], months=months):
+        rows = position[offset:offset + len(batch)]
+        keep = rows >= 0
+        batch = batch[keep]
+        index.add(rows[keep], batch['Subject'].tolist(),
+                  batch['PlainTextBody'].tolist() if 'PlainTextBody' in batch.columns else None)
+        offset += len(keep)
+    return attach_email_columns(index.clusters(), df_pos)
+
+def save_merged_report(df: pd.DataFrame, monthly_stats: List[dict], output_path: Path,
+                       near_duplicates: pd.DataFrame = None):
     """통합 보고서 저장"""
     print(f"\n[통합 보고서 저장 중...]")
     print(f"  출력 파일: {output_path}")
@@ -328,6 +345,16 @@ def save_merged_report(df: pd.DataFrame, monthly_stats: List[dict], output_path:
             phase_stats = phase_stats.sort_values('count', ascending=False)
             phase_stats.to_excel(writer, sheet_name='단계별_통계', index=False)
             print(f"  ✓ 단계별_통계: {len(phase_stats)}행")
+        
+        # 시트 7: 근접중복 (옵션)
+        if near_duplicates is not None:
+            near_duplicates.to_excel(writer, sheet_name='근접중복', index=False)
+            print(f"  ✓ 근접중복: {len(near_duplicates)}행 ({near_duplicates['cluster_id'].nunique()}개 클러스터)")
+    
+    if near_duplicates is not None:
+        csv_path = output_path.with_name(f"{output_path.stem}_near_duplicates.csv")
+        near_duplicates.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        print(f"  ✓ 근접중복 CSV: {csv_path}")
     
     print(f"\n[완료] 통합 보고서 저장 완료: {output_path}")
 
@@ -343,6 +370,14 @@ def main():
                        help='Body 일부도 중복 판별에 사용 (기본값: Subject+Sender+Date만)')
     parser.add_argument('--output', type=str, default=None,
                        help='출력 파일명 (기본값: OUTLOOK_HVDC_ALL_rev.xlsx)')
+    parser.add_argument('--warehouse', metavar='DIR', default=None,
+                       help='_rev 엑셀 대신 이메일 웨어하우스에서 읽기, 예) results/hvdc_warehouse')
+    parser.add_argument('--months', nargs='+', default=None,
+                       help='통합할 YYYYMM 목록 (--warehouse 사용 시, 기본값: 전체)')
+    parser.add_argument('--near-duplicates', action='store_true',
+                       help='MinHash/LSH 근접 중복 클러스터를 시트/CSV로 추가 (행은 제거하지 않음)')
+    parser.add_argument('--near-dup-threshold', type=float, default=0.8,
+                       help='근접 중복 최소 추정 Jaccard (기본값: 0.8)')
     
     args = parser.parse_args()
     
@@ -354,7 +389,9 @@ def main():
     print("="*70)
     
     # 데이터 결합
-    df_merged, monthly_stats = merge_all_monthly_data(use_body=args.use_body)
+    df_merged, monthly_stats = merge_all_monthly_data(use_body=args.use_body,
+                                                      warehouse=args.warehouse,
+                                                      months=args.months)
     
     if df_merged is None:
         print("\n❌ 통합 실패")
@@ -371,8 +408,14 @@ def main():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = Path("results") / f"OUTLOOK_HVDC_ALL_rev_{timestamp}.xlsx"
     
+    # 근접 중복 클러스터 (옵션)
+    near_duplicates = None
+    if args.near_duplicates:
+        near_duplicates = find_merged_near_duplicates(df_merged, args.near_dup_threshold,
+                                                      warehouse=args.warehouse, months=args.months)
+    
     # 통합 보고서 저장
-    save_merged_report(df_merged, monthly_stats, output_path)
+    save_merged_report(df_merged, monthly_stats, output_path, near_duplicates=near_duplicates)
     
     print("\n" + "="*70)
     print(f"통합 완료!")
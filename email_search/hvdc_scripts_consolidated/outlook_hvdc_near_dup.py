@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Outlook HVDC 근접 중복(near-duplicate) 탐지 (MinHash + LSH)
+
+정확 키 중복 제거(outlook_hvdc_dedup)가 놓치는 전달본/제목 일부 변경/인용 본문 포함 메일을 묶는다.
+- 제목: outlook_thread_tracker_v3.normalize_subject 정규화 후 문자 5-gram
+- 본문: 소문자/공백 정리 후 앞 2,000자의 단어 3-gram
+- MinHash 서명(기본 64개) → LSH 밴딩(16 밴드 x 4행)으로 후보 쌍만 생성 (전체 쌍 비교 없음, 정렬 기반 O(n log n))
+- 후보 쌍은 서명 일치율(추정 Jaccard)로 검증 후 threshold 이상만 클러스터로 연결
+- 서명은 행당 256바이트, 본문은 청크 단위로만 처리 (NearDuplicateIndex.add)
+
+출력 (클러스터 구성원 1행씩):
+- cluster_id, row, is_representative, similarity(대표 메일과의 추정 Jaccard), cluster_size
+- 대표 메일 = 클러스터에서 가장 앞 행
+- 클러스터는 검증된 쌍의 연쇄 연결이므로 대표와의 similarity는 threshold보다 낮을 수 있음 (검토 시 참고)
+
+사용:
+  python outlook_hvdc_near_dup.py results/OUTLOOK_HVDC_ALL_rev.xlsx
+  python outlook_hvdc_near_dup.py --warehouse results/hvdc_warehouse --months 202505 202506 --threshold 0.85
+  python outlook_hvdc_merge.py --near-duplicates   # 통합 보고서에 근접중복 시트 + CSV 추가
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    from outlook_thread_tracker_v3 import normalize_subject
+except ImportError:
+    scripts_dir = Path(__file__).resolve().parents[1] / "scripts"
+    if str(scripts_dir) not in sys.path:
+        sys.path.append(str(scripts_dir))
+    from outlook_thread_tracker_v3 import normalize_subject
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_CHUNK_ROWS = 50_000
+SUBJECT_SHINGLE_CHARS = 5
+BODY_SHINGLE_WORDS = 3
+BODY_CHARS = 2000
+DEFAULT_OUTPUT = Path("results") / "OUTLOOK_HVDC_NEAR_DUPLICATES.csv"
+
+_NON_WORD_RE = re.compile(r'[^\w\s\-@.]')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def _normalize_body(body) -> str:
+    if body is None or (not isinstance(body, str) and pd.isna(body)):
+        return ''
+    text = str(body).replace('_x000D_', ' ')
+    text = _NON_WORD_RE.sub(' ', text.lower())
+    return _SPACE_RE.sub(' ', text).strip()[:BODY_CHARS]
+
+
+def shingles(subject, body=None) -> np.ndarray:
+    """제목 문자 5-gram + 본문 단어 3-gram → uint64 해시 배열 (중복 제거)"""
+    items = set()
+    subject_norm = normalize_subject(subject)
+    if subject_norm:
+        if len(subject_norm) <= SUBJECT_SHINGLE_CHARS:
+            items.add('s:' + subject_norm)
+        else:
+            for i in range(len(subject_norm) - SUBJECT_SHINGLE_CHARS + 1):
+                items.add('s:' + subject_norm[i:i + SUBJECT_SHINGLE_CHARS])
+    words = _normalize_body(body).split()
+    if words:
+        if len(words) <= BODY_SHINGLE_WORDS:
+            items.add('b:' + ' '.join(words))
+        else:
+            for i in range(len(words) - BODY_SHINGLE_WORDS + 1):
+                items.add('b:' + ' '.join(words[i:i + BODY_SHINGLE_WORDS]))
+    return np.fromiter((zlib.crc32(s.encode('utf-8')) for s in items), dtype=np.uint64, count=len(items))
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH 근접 중복 인덱스
+
+    add()로 (행, 제목, 본문)을 청크 단위로 넣고 clusters()로 클러스터를 얻는다.
+    행당 서명 num_perm개(uint32)만 보관한다.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM,
+                 bands: int = DEFAULT_BANDS, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        rng = np.random.default_rng(seed)
+        # 곱셈-시프트 해시 h(x) = (a*x + b) mod 2^64 >> 32 (a는 홀수)
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        self._rows: List = []
+        self._signatures: List[np.ndarray] = []
+        self.skipped = 0  # 제목/본문이 모두 비어 있어 제외된 행
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        with np.errstate(over='ignore'):
+            mixed = hashes[:, None] * self._a[None, :] + self._b[None, :]
+        return (mixed >> np.uint64(32)).min(axis=0).astype(np.uint32)
+
+    def add(self, rows: Sequence, subjects: Sequence, bodies: Optional[Sequence] = None) -> None:
+        if bodies is None:
+            bodies = [None] * len(rows)
+        sigs = []
+        for row, subject, body in zip(rows, subjects, bodies):
+            hashes = shingles(subject, body)
+            if len(hashes) == 0:
+                self.skipped += 1
+                continue
+            self._rows.append(row)
+            sigs.append(self.signature(hashes))
+        if sigs:
+            self._signatures.append(np.vstack(sigs))
+
+    def _candidate_pairs(self, sig: np.ndarray) -> np.ndarray:
+        """밴드별 버킷 정렬 → (버킷 첫 행, 행) + (이전 행, 행) 쌍, 중복 제거"""
+        n = len(sig)
+        rows_per_band = self.num_perm // self.bands
+        pairs = []
+        for band in range(self.bands):
+            block = np.ascontiguousarray(sig[:, band * rows_per_band:(band + 1) * rows_per_band])
+            keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows_per_band))).ravel()
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            starts = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+            members = np.flatnonzero(~starts)
+            if len(members) == 0:
+                continue
+            first = np.flatnonzero(starts)[np.cumsum(starts)[members] - 1]
+            pairs.append(np.stack([order[first], order[members]], axis=1))
+            pairs.append(np.stack([order[members - 1], order[members]], axis=1))
+        if not pairs:
+            return np.empty((0, 2), dtype=np.int64)
+        pairs = np.sort(np.concatenate(pairs).astype(np.int64), axis=1)
+        codes = np.unique(pairs[:, 0] * n + pairs[:, 1])
+        return np.stack([codes // n, codes % n], axis=1)
+
+    @staticmethod
+    def _similarity(sig: np.ndarray, u: np.ndarray, v: np.ndarray, chunk: int = 100_000) -> np.ndarray:
+        out = np.empty(len(u), dtype=np.float64)
+        for start in range(0, len(u), chunk):
+            end = start + chunk
+            out[start:end] = (sig[u[start:end]] == sig[v[start:end]]).mean(axis=1)
+        return out
+
+    def clusters(self) -> pd.DataFrame:
+        """근접 중복 클러스터 (2개 이상인 클러스터의 구성원만)"""
+        columns = ['cluster_id', 'row', 'is_representative', 'similarity', 'cluster_size']
+        if not self._signatures:
+            return pd.DataFrame(columns=columns)
+        sig = np.vstack(self._signatures)
+        n = len(sig)
+
+        pairs = self._candidate_pairs(sig)
+        if len(pairs):
+            sim = self._similarity(sig, pairs[:, 0], pairs[:, 1])
+            pairs = pairs[sim >= self.threshold]
+
+        # union-find (검증된 쌍만)
+        parent = np.arange(n)
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for u, v in pairs:
+            ru, rv = find(u), find(v)
+            if ru != rv:
+                parent[max(ru, rv)] = min(ru, rv)  # 루트 = 가장 앞 행
+        roots = np.array([find(i) for i in range(n)])
+
+        sizes = np.bincount(roots, minlength=n)
+        members = np.flatnonzero(sizes[roots] > 1)
+        if len(members) == 0:
+            return pd.DataFrame(columns=columns)
+        reps = roots[members]
+        cluster_ids = np.unique(reps, return_inverse=True)[1] + 1
+
+        row_labels = np.empty(n, dtype=object)
+        row_labels[:] = self._rows
+        return pd.DataFrame({
+            'cluster_id': cluster_ids,
+            'row': row_labels[members],
+            'is_representative': members == reps,
+            'similarity': np.round(self._similarity(sig, reps, members), 3),
+            'cluster_size': sizes[reps],
+        }).sort_values(['cluster_id', 'is_representative', 'row'], ascending=[True, False, True],
+                       kind='stable', ignore_index=True)
+
+
+def find_near_duplicates(df: pd.DataFrame, threshold: float = DEFAULT_THRESHOLD, use_body: bool = True,
+                         num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_BANDS,
+                         chunk_rows: int = DEFAULT_CHUNK_ROWS) -> pd.DataFrame:
+    """
+    데이터프레임의 근접 중복 클러스터
+
+    row는 df의 인덱스 라벨. Subject/SenderEmail/DeliveryTime이 있으면 함께 붙인다.
+    """
+    index = NearDuplicateIndex(threshold=threshold, num_perm=num_perm, bands=bands)
+    body_col = 'PlainTextBody' if use_body and 'PlainTextBody' in df.columns else None
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        index.add(chunk.index, chunk['Subject'].tolist(),
+                  chunk[body_col].tolist() if body_col else None)
+    return attach_email_columns(index.clusters(), df)
+
+
+def attach_email_columns(clusters: pd.DataFrame, df: pd.DataFrame,
+                         columns: Iterable[str] = ('no', 'Subject', 'SenderEmail', 'DeliveryTime')) -> pd.DataFrame:
+    """클러스터 표에 검토용 메일 컬럼 추가 (row = df 인덱스 라벨)"""
+    for col in columns:
+        if col in df.columns:
+            clusters[col] = df.loc[clusters['row'], col].to_numpy() if len(clusters) else []
+    return clusters
+
+
+def cluster_summary(clusters: pd.DataFrame) -> Dict:
+    """클러스터 요약 통계"""
+    if clusters.empty:
+        return {'clusters': 0, 'emails': 0, 'redundant': 0, 'max_size': 0, 'min_similarity': None}
+    non_rep = clusters[~clusters['is_representative']]
+    return {
+        'clusters': int(clusters['cluster_id'].nunique()),
+        'emails': len(clusters),
+        'redundant': len(non_rep),
+        'max_size': int(clusters['cluster_size'].max()),
+        'min_similarity': float(non_rep['similarity'].min()) if len(non_rep) else None,
+    }
+
+
+def _warehouse_clusters(warehouse, months, threshold, use_body, num_perm, bands) -> pd.DataFrame:
+    """웨어하우스 파티션을 배치 단위로 색인 (row = 읽기 순서 기준 위치)"""
+    from outlook_hvdc_warehouse import EmailWarehouse
+
+    wh = EmailWarehouse(warehouse)
+    index = NearDuplicateIndex(threshold=threshold, num_perm=num_perm, bands=bands)
+    columns = ['Subject', 'PlainTextBody'] if use_body else ['Subject']
+    offset = 0
+    for batch in wh.iter_batches(columns=columns, months=months):
+        if 'Subject' not in batch.columns:
+            batch['Subject'] = None
+        index.add(range(offset, offset + len(batch)), batch['Subject'].tolist(),
+                  batch['PlainTextBody'].tolist() if 'PlainTextBody' in batch.columns else None)
+        offset += len(batch)
+    meta = wh.read(columns=['Subject', 'SenderEmail', 'DeliveryTime'], months=months, with_partition=True)
+    return attach_email_columns(index.clusters(), meta, ('year_month', 'Subject', 'SenderEmail', 'DeliveryTime'))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Outlook HVDC 근접 중복 탐지 (MinHash/LSH)')
+    parser.add_argument('file', nargs='?', help='입력 엑셀 (기본: results/OUTLOOK_HVDC_ALL_rev.xlsx)')
+    parser.add_argument('--sheet', default='전체_데이터', help='데이터 시트 (기본: 전체_데이터)')
+    parser.add_argument('--warehouse', metavar='DIR', default=None, help='엑셀 대신 이메일 웨어하우스에서 읽기')
+    parser.add_argument('--months', nargs='+', default=None, help='YYYYMM 목록 (--warehouse 사용 시)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'클러스터로 묶을 최소 추정 Jaccard (기본: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--subject-only', action='store_true', help='본문 제외, 제목만 비교')
+    parser.add_argument('--num-perm', type=int, default=DEFAULT_NUM_PERM, help='MinHash 서명 길이')
+    parser.add_argument('--bands', type=int, default=DEFAULT_BANDS, help='LSH 밴드 수')
+    parser.add_argument('--output', '-o', default=str(DEFAULT_OUTPUT), help='출력 CSV 경로')
+    args = parser.parse_args()
+
+    use_body = not args.subject_only
+    if args.warehouse:
+        print(f"\n[웨어하우스 색인 중...] {args.warehouse}")
+        clusters = _warehouse_clusters(args.warehouse, args.months, args.threshold, use_body,
+                                       args.num_perm, args.bands)
+    else:
+        input_path = Path(args.file or Path("results") / "OUTLOOK_HVDC_ALL_rev.xlsx")
+        print(f"\n[로드 중...] {input_path}")
+        df = pd.read_excel(input_path, sheet_name=args.sheet, engine='openpyxl')
+        print(f"  {len(df):,}행")
+        clusters = find_near_duplicates(df, threshold=args.threshold, use_body=use_body,
+                                        num_perm=args.num_perm, bands=args.bands)
+
+    summary = cluster_summary(clusters)
+    print(f"\n[근접 중복] (threshold={args.threshold}{', 제목만' if args.subject_only else ''})")
+    print(f"  클러스터: {summary['clusters']:,}개")
+    print(f"  관련 메일: {summary['emails']:,}개 (대표 외 {summary['redundant']:,}개)")
+    if summary['clusters']:
+        print(f"  최대 클러스터 크기: {summary['max_size']}")
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    clusters.to_csv(output_path, index=False, encoding='utf-8-sig')
+    print(f"\n[완료] {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Outlook HVDC 이메일 웨어하우스 (year_month 파티션 Parquet)
+
+월별 OUTLOOK_HVDC_*_rev.xlsx 대신 분석 결과의 기준 저장소로 사용한다.
+- Hive 형식 파티션: <root>/year_month=YYYYMM/part-<label>.parquet
+  (label: base = 월 분석 결과, delta_YYYYMMDD_HHMMSS = 증분 스캔 델타)
+- append_month: 한 달(또는 델타) 결과를 해당 파티션에만 기록, 같은 label은 교체 (재실행 안전)
+- read: 필요한 파티션(months)과 컬럼만 읽음, 본문 컬럼(PlainTextBody/HTMLBody)은 요청할 때만
+  추가 조건은 pyarrow 식(filter)으로 row group 통계까지 내려보냄 (predicate pushdown)
+- Excel은 export_excel로 필요할 때만 생성
+
+사용:
+  wh = EmailWarehouse('results/hvdc_warehouse')
+  wh.append_month(df, '202506')
+  df = wh.read(columns=['Subject', 'site'], months=['202505', '202506'])
+
+  python outlook_hvdc_warehouse.py import results/OUTLOOK_HVDC_*_rev.xlsx   # 기존 엑셀 이관
+  python outlook_hvdc_warehouse.py list
+  python outlook_hvdc_warehouse.py export results/OUTLOOK_HVDC_202506_export.xlsx --months 202506
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa  # optional
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    ds = None
+    pq = None
+
+from outlook_pst_sink import coerce_types
+
+DEFAULT_WAREHOUSE_DIR = Path("results") / "hvdc_warehouse"
+PARTITION_KEY = 'year_month'
+BODY_COLUMNS = ('PlainTextBody', 'HTMLBody')
+# 저장하지 않는 컬럼 (no는 병합/내보내기 시 다시 매김)
+DROP_COLUMNS = ('no',)
+BASE_LABEL = 'base'
+DEFAULT_BATCH_ROWS = 100_000
+
+
+def _check_month(year_month: str) -> str:
+    year_month = str(year_month)
+    if not re.fullmatch(r'\d{6}', year_month):
+        raise ValueError(f"year_month는 YYYYMM 형식이어야 합니다: {year_month}")
+    return year_month
+
+
+def _check_label(label: str) -> str:
+    if not re.fullmatch(r'[A-Za-z0-9_\-]+', label):
+        raise ValueError(f"허용되지 않는 파티션 label: {label}")
+    return label
+
+
+class EmailWarehouse:
+    """year_month 파티션 Parquet 이메일 저장소"""
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_WAREHOUSE_DIR):
+        if pa is None:
+            raise ImportError("이메일 웨어하우스에는 pyarrow가 필요합니다: pip install pyarrow")
+        self.root = Path(root)
+
+    # ----- 쓰기 -----
+
+    def append_month(self, df: pd.DataFrame, year_month: str, label: str = BASE_LABEL) -> Path:
+        """한 달 분석 결과를 year_month 파티션에 기록 (같은 label의 기존 part는 교체)"""
+        year_month = _check_month(year_month)
+        label = _check_label(label)
+        df = df[[c for c in df.columns if c not in DROP_COLUMNS and c != PARTITION_KEY]]
+        df = coerce_types(df)
+
+        part_dir = self.root / f"{PARTITION_KEY}={year_month}"
+        part_dir.mkdir(parents=True, exist_ok=True)
+        part_path = part_dir / f"part-{label}.parquet"
+        tmp_path = part_path.with_suffix('.tmp')
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path)
+        tmp_path.replace(part_path)  # 중단 시 불완전한 part 파일이 남지 않도록
+        return part_path
+
+    def drop_month(self, year_month: str, label: Optional[str] = None) -> int:
+        """파티션(또는 그 안의 label 하나) 삭제, 삭제한 part 수 반환"""
+        parts = self.part_files([year_month])
+        if label is not None:
+            parts = [p for p in parts if p.stem == f"part-{label}"]
+        for part in parts:
+            part.unlink()
+        return len(parts)
+
+    # ----- 읽기 -----
+
+    def months(self) -> List[str]:
+        """저장된 year_month 목록 (오름차순)"""
+        if not self.root.exists():
+            return []
+        found = []
+        for d in self.root.iterdir():
+            m = re.fullmatch(rf'{PARTITION_KEY}=(\d{{6}})', d.name)
+            if d.is_dir() and m and any(d.glob('part-*.parquet')):
+                found.append(m.group(1))
+        return sorted(found)
+
+    def part_files(self, months: Optional[Iterable[str]] = None) -> List[Path]:
+        """읽을 part 파일 (파티션 가지치기: months에 없는 디렉토리는 열지 않음)"""
+        selected = self.months() if months is None else sorted({_check_month(m) for m in months})
+        files: List[Path] = []
+        for month in selected:
+            files.extend(sorted((self.root / f"{PARTITION_KEY}={month}").glob('part-*.parquet')))
+        return files
+
+    def schema(self, months: Optional[Iterable[str]] = None):
+        """part 파일 footer만 읽어 통합 스키마 생성 (월마다 컬럼이 달라도 null로 채움)"""
+        files = self.part_files(months)
+        if not files:
+            return None
+        return pa.unify_schemas([pq.read_schema(f) for f in files])
+
+    def columns(self, include_body: bool = False) -> List[str]:
+        schema = self.schema()
+        if schema is None:
+            return []
+        return [c for c in schema.names if include_body or c not in BODY_COLUMNS]
+
+    def read(
+        self,
+        columns: Optional[List[str]] = None,
+        months: Optional[Iterable[str]] = None,
+        filter=None,
+        include_body: bool = False,
+        with_partition: bool = False,
+    ) -> pd.DataFrame:
+        """
+        필요한 파티션/컬럼만 읽기
+
+        Args:
+            columns: 읽을 컬럼 (None이면 본문 제외 전체, include_body=True면 본문 포함)
+            months: 읽을 year_month 목록 (None이면 전체)
+            filter: pyarrow.dataset 식, 예) ds.field('site') == 'DAS'
+            with_partition: year_month 컬럼 포함 여부
+        """
+        files = self.part_files(months)
+        schema = self.schema(months)
+        if schema is None:
+            return pd.DataFrame(columns=columns or [])
+
+        if columns is None:
+            columns = [c for c in schema.names if include_body or c not in BODY_COLUMNS]
+        else:
+            columns = [c for c in columns if c in schema.names]
+        if with_partition:
+            columns = columns + [PARTITION_KEY]
+
+        dataset = ds.dataset(
+            [str(f) for f in files],
+            schema=schema.append(pa.field(PARTITION_KEY, pa.string())),
+            format='parquet',
+            partitioning=ds.partitioning(pa.schema([(PARTITION_KEY, pa.string())]), flavor='hive'),
+            partition_base_dir=str(self.root),
+        )
+        return dataset.to_table(columns=columns, filter=filter).to_pandas()
+
+    def iter_batches(
+        self,
+        columns: Optional[List[str]] = None,
+        months: Optional[Iterable[str]] = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+    ) -> Iterator[pd.DataFrame]:
+        """part 파일 순서대로 배치 단위 읽기 (read()와 같은 행 순서, part에 없는 컬럼은 null)"""
+        schema = self.schema(months)
+        if schema is None:
+            return
+        if columns is None:
+            columns = [c for c in schema.names if c not in BODY_COLUMNS]
+        else:
+            columns = [c for c in columns if c in schema.names]
+        for part in self.part_files(months):
+            pf = pq.ParquetFile(part)
+            present = [c for c in columns if c in pf.schema_arrow.names]
+            for batch in pf.iter_batches(batch_size=batch_rows, columns=present):
+                df = batch.to_pandas()
+                for col in columns:
+                    if col not in df.columns:
+                        df[col] = None
+                yield df[columns]
+
+    def month_counts(self) -> Dict[str, int]:
+        """year_month별 행 수 (parquet 메타데이터만 사용)"""
+        counts: Dict[str, int] = {}
+        for part in self.part_files():
+            month = part.parent.name.split('=', 1)[1]
+            counts[month] = counts.get(month, 0) + pq.read_metadata(part).num_rows
+        return counts
+
+    # ----- 내보내기 -----
+
+    def export_excel(
+        self,
+        output_path: Union[str, Path],
+        months: Optional[Iterable[str]] = None,
+        include_body: bool = True,
+        sheet_name: str = '전체_데이터',
+    ) -> Path:
+        """요청 시에만 엑셀 생성 (OUTLOOK_HVDC_rev 컬럼 순서, no 재부여)"""
+        from outlook_hvdc_merge import standardize_column_order
+
+        df = self.read(months=months, include_body=include_body)
+        df.insert(0, 'no', range(1, len(df) + 1))
+        df = standardize_column_order(df)
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+        return output_path
+
+
+def partition_for_rev_file(filename: str):
+    """OUTLOOK_HVDC_YYYYMM[_delta_YYYYMMDD_HHMMSS]_rev.xlsx → (year_month, label)"""
+    match = re.search(r'OUTLOOK_HVDC_(\d{6})(?:_(delta_\d{8}_\d{6}))?_rev', filename)
+    if not match:
+        return None, None
+    return match.group(1), match.group(2) or BASE_LABEL
+
+
+def import_rev_files(warehouse: EmailWarehouse, files: Iterable[Union[str, Path]]) -> List[Path]:
+    """기존 월별 _rev 엑셀을 웨어하우스로 이관 (파일별 1회 읽기)"""
+    from outlook_hvdc_merge import load_monthly_data
+
+    written = []
+    for file_path in files:
+        file_path = Path(file_path)
+        year_month, label = partition_for_rev_file(file_path.name)
+        if not year_month:
+            print(f"  ✗ {file_path.name}: 파일명에서 YYYYMM을 찾을 수 없음 (건너뜀)")
+            continue
+        df, _ = load_monthly_data(file_path)
+        written.append(warehouse.append_month(df, year_month, label=label))
+        print(f"    ✓ {year_month}/{label}: {len(df):,}행")
+    return written
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Outlook HVDC 이메일 웨어하우스 (year_month 파티션 Parquet)')
+    parser.add_argument('--root', default=str(DEFAULT_WAREHOUSE_DIR), help='웨어하우스 경로')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_import = sub.add_parser('import', help='OUTLOOK_HVDC_*_rev.xlsx 이관')
+    p_import.add_argument('files', nargs='*', help='이관할 파일 (기본: results/ 의 모든 월별 _rev 파일)')
+
+    sub.add_parser('list', help='파티션별 행 수')
+
+    p_export = sub.add_parser('export', help='엑셀 내보내기')
+    p_export.add_argument('output', help='출력 엑셀 경로')
+    p_export.add_argument('--months', nargs='+', default=None, help='내보낼 YYYYMM (기본: 전체)')
+    p_export.add_argument('--no-body', action='store_true', help='본문 컬럼 제외')
+
+    args = parser.parse_args()
+    wh = EmailWarehouse(args.root)
+
+    if args.command == 'import':
+        if args.files:
+            files = args.files
+        else:
+            from outlook_hvdc_merge import find_all_hvdc_rev_files
+            files = find_all_hvdc_rev_files()
+        print(f"\n[이관 중...] {len(files)}개 파일 → {wh.root}")
+        import_rev_files(wh, files)
+    elif args.command == 'list':
+        counts = wh.month_counts()
+        for month, rows in counts.items():
+            print(f"  {month}: {rows:,}행")
+        print(f"  합계: {sum(counts.values()):,}행 ({len(counts)}개월)")
+    elif args.command == 'export':
+        path = wh.export_excel(args.output, months=args.months, include_body=not args.no_body)
+        print(f"[완료] 엑셀 내보내기: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,9 +19,25 @@ Outlook PST Scanner v5.0 (libpst 기반)
 - 파일명: OUTLOOK_YYYYMM.xlsx
 - 위치: results/ 폴더
 - 시트: 전체_이메일, 폴더별_통계, 발신자별_통계
+- 배치 저장소: OUTLOOK_YYYYMM.parquet/ 또는 OUTLOOK_YYYYMM.sqlite (append-only)
+  → 배치마다 저장소에 추가만 하고, 엑셀 보고서는 스캔 종료 시 1회 생성
 
 🚀 빠른 실행:
   python outlook_pst_scanner.py --pst "경로" --start 2025-06-01 --end 2025-06-30 --folders all --auto
+
+⚡ 병렬 스캔 (--workers N):
+- 폴더/메시지 구간 단위로 워커 프로세스에 분배, 각 워커가 PST를 읽기 전용으로 별도 오픈
+- 결과는 선택 순서(폴더 → 메시지 인덱스)대로 병합되어 순차 스캔과 동일한 출력
+- --pst 를 여러 번 지정하면 여러 PST를 한 번에 스캔 (FolderPath 앞에 PST 이름 추가)
+  python outlook_pst_scanner.py --pst "a.pst" --pst "b.pst" --folders all --auto --workers 4
+- 벤치마크: python bench_pst_scanner.py --workers 1 2 4
+
+🔁 증분 스캔 (--incremental):
+- results/pst_scan_state.sqlite 에 (PST, 폴더 경로, 메시지 identifier@배송시간) 기록
+- 이미 내보낸 메시지는 건너뛰고 새 메시지만 OUTLOOK_YYYYMM_delta_<시각>.xlsx 로 출력
+- 기록은 엑셀 보고서 생성까지 성공한 경우에만 확정 (실패한 실행은 다음에 다시 스캔)
+- 강제 종료된 실행의 대기 기록 정리: --discard-pending (다른 스캔이 실행 중이 아닐 때만)
+  python outlook_pst_scanner.py --pst "경로" --start 2025-06-01 --folders all --auto --incremental
   
 📖 상세 가이드: docs/PST_SAFETY_GUIDE.md
 """
@@ -35,13 +51,99 @@ import time
 import re
 import argparse
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+from outlook_pst_sink import create_sink, write_excel_report, SINK_KINDS
+from outlook_pst_state import ScanStateStore, message_key, DEFAULT_STATE_PATH
 
 try:
     import pypff  # libpst Python 바인딩
 except ImportError:
-    print("❌ pypff 모듈이 설치되지 않았습니다")
-    print("설치 방법: pip install libpff-python")
-    sys.exit(1)
+    pypff = None  # 실행 시점에 확인 (벤치마크/워커는 opener 주입 가능)
+
+
+def open_pypff(pst_path):
+    """PST 파일 열기 (읽기 전용, Outlook 종료 없음 - 워커 프로세스용)"""
+    pst_file = pypff.file()
+    pst_file.open(pst_path)
+    return pst_file
+
+
+# ===== 병렬 스캔 워커 (프로세스별 상태) =====
+
+_WORKER = {}
+
+
+def _init_worker(opener, scanner_kwargs, state_path=None):
+    """워커 초기화: 날짜 필터/본문 길이 설정을 가진 스캐너 1개 + PST 캐시 (+ 증분 상태)"""
+    _WORKER['opener'] = opener
+    _WORKER['scanner'] = FolderSelectPSTScanner(**scanner_kwargs)
+    _WORKER['pst'] = {}
+    _WORKER['state'] = ScanStateStore(state_path, readonly=True) if state_path else None
+    _WORKER['known'] = {}
+
+
+def _worker_known_keys(pst_name, folder_path):
+    """증분 모드: 폴더별 확정 메시지 키 (워커당 폴더마다 1회 조회)"""
+    if _WORKER['state'] is None:
+        return None
+    cache_key = (pst_name, folder_path)
+    if cache_key not in _WORKER['known']:
+        _WORKER['known'][cache_key] = _WORKER['state'].known_keys(pst_name, folder_path)
+    return _WORKER['known'][cache_key]
+
+
+def _worker_folder(pst_path, pst_index):
+    """워커에서 PST를 1회만 열고, 같은 순회 순서로 만든 폴더 목록에서 폴더 조회"""
+    cached = _WORKER['pst'].get(pst_path)
+    if cached is None:
+        pst_file = _WORKER['opener'](pst_path)
+        lister = FolderSelectPSTScanner()
+        lister.list_all_folders(pst_file.get_root_folder())
+        cached = (pst_file, [f['folder_obj'] for f in lister.folder_list])
+        _WORKER['pst'][pst_path] = cached
+    return cached[1][pst_index]
+
+
+def _scan_unit(unit):
+    """
+    작업 단위 스캔: (pst_path, pst_index, folder_path, start, stop)
+    Returns: (records, scanned, skipped, known, keys)
+      - known: 증분 모드에서 이미 내보낸 메시지 수
+      - keys: records와 같은 순서의 (pst, folder_path, message_key) (증분 모드가 아니면 빈 리스트)
+    """
+    pst_path, pst_index, folder_path, start, stop = unit
+    scanner = _WORKER['scanner']
+    folder = _worker_folder(pst_path, pst_index)
+    pst_name = Path(pst_path).name
+    known_keys = _worker_known_keys(pst_name, folder_path)
+    
+    records = []
+    keys = []
+    scanned = 0
+    skipped = 0
+    known = 0
+    for i in range(start, stop):
+        try:
+            message = folder.get_sub_message(i)
+        except Exception:
+            continue
+        scanned += 1
+        key = None
+        if known_keys is not None:
+            key = message_key(message)
+            if key in known_keys:
+                known += 1
+                continue
+        data = scanner.extract_message_data(message)
+        if data:
+            data['FolderPath'] = folder_path
+            records.append(data)
+            if key is not None:
+                keys.append((pst_name, folder_path, key))
+        else:
+            skipped += 1
+    return records, scanned, skipped, known, keys
 
 
 class FolderSelectPSTScanner:
@@ -53,16 +155,27 @@ class FolderSelectPSTScanner:
     """
     
     def __init__(self, start_date=None, end_date=None, 
-                 max_body_length=500, batch_size=1000):
+                 max_body_length=500, batch_size=1000, sink_kind=None,
+                 workers=1, opener=None, incremental=False,
+                 state_path=DEFAULT_STATE_PATH, discard_pending=False):
         """
         Args:
             start_date: 시작 날짜 (datetime 객체)
             end_date: 종료 날짜 (datetime 객체)
             max_body_length: 본문 최대 길이
             batch_size: 배치 저장 크기
+            sink_kind: 배치 저장소 ('parquet' | 'sqlite' | None=자동)
+            workers: 병렬 스캔 프로세스 수 (1=순차)
+            opener: PST 열기 함수 (기본: open_pypff, 피클 가능한 최상위 함수)
+            incremental: True면 이미 내보낸 메시지 건너뜀 (상태 파일 기준)
+            state_path: 증분 스캔 상태 파일 (SQLite)
+            discard_pending: True면 시작 전에 이전 실행의 미확정 기록 폐기
         """
         self.pst_file = None
+        self.pst_files = []  # 다중 PST (pst_file은 첫 번째)
         self.email_data = []
+        self.sink_kind = sink_kind
+        self.sink = None
         self.folder_list = []  # 전체 폴더 목록
         
         # 날짜 필터링
@@ -74,11 +187,22 @@ class FolderSelectPSTScanner:
         # 최적화 설정
         self.max_body_length = max_body_length
         self.batch_size = batch_size
+        self.workers = max(1, int(workers or 1))
+        self.opener = opener or open_pypff
+        
+        # 증분 스캔
+        self.incremental = incremental
+        self.state_path = Path(state_path)
+        self.discard_pending = discard_pending
+        self.state = None
+        self.run_id = None
+        self.pending_keys = []  # email_data와 같은 순서의 (pst, folder_path, message_key)
         
         # 통계
         self.total_scanned = 0
         self.total_matched = 0
         self.total_skipped = 0
+        self.total_known = 0
         self.start_time = None
         self.last_report_time = None
     
@@ -106,12 +230,14 @@ class FolderSelectPSTScanner:
         print(f"\n📂 PST 파일 열기: {pst_path}")
         
         try:
-            self.pst_file = pypff.file()
-            self.pst_file.open(pst_path)
+            pst_file = self.opener(pst_path)
+            self.pst_files.append(pst_file)
+            if self.pst_file is None:
+                self.pst_file = pst_file
             
             print(f"✅ PST 파일 열림")
             try:
-                root_folder = self.pst_file.get_root_folder()
+                root_folder = pst_file.get_root_folder()
                 print(f"   루트 폴더: {root_folder.name if root_folder else '(알 수 없음)'}")
             except:
                 print(f"   루트 폴더: (접근 불가)")
@@ -145,7 +271,7 @@ class FolderSelectPSTScanner:
         }
         self.folder_list.append(folder_info)
         
-        # 하위 폴더 재귀 탐색
+        # 하위 폴더 재귀 탐색 (순회 순서 = 워커의 폴더 인덱스 기준, 변경 금지)
         try:
             num_subfolders = folder.get_number_of_sub_folders()
             for i in range(num_subfolders):
@@ -157,6 +283,36 @@ class FolderSelectPSTScanner:
         except Exception as e:
             pass
     
+    def load_folder_list(self, pst_paths):
+        """
+        PST별 폴더 목록 생성 (열린 순서대로)
+        - 각 항목에 pst_path, pst_index(해당 PST 내 인덱스) 기록 → 워커가 폴더를 다시 찾는 키
+        - PST가 2개 이상이면 폴더 경로 앞에 PST 이름을 붙여 구분
+        """
+        multi = len(pst_paths) > 1
+        for pst_path, pst_file in zip(pst_paths, self.pst_files):
+            offset = len(self.folder_list)
+            prefix = Path(pst_path).stem if multi else ""
+            self.list_all_folders(pst_file.get_root_folder(), prefix)
+            for folder in self.folder_list[offset:]:
+                folder['pst_path'] = pst_path
+                folder['pst_index'] = folder['index'] - offset
+    
+    def build_scan_units(self, selected_indices):
+        """
+        선택 폴더 → 작업 단위 [(pst_path, pst_index, folder_path, start, stop)]
+        큰 폴더는 batch_size 단위 메시지 구간으로 분할 (선택 순서 유지)
+        """
+        units = []
+        chunk = max(1, self.batch_size)
+        for idx in selected_indices:
+            folder = self.folder_list[idx]
+            for start in range(0, folder['messages'], chunk):
+                stop = min(start + chunk, folder['messages'])
+                units.append((folder['pst_path'], folder['pst_index'],
+                              folder['path'], start, stop))
+        return units
+    
     def display_folder_menu(self):
         """폴더 목록을 보기 좋게 표시"""
         print("\n" + "="*70)
@@ -417,62 +573,45 @@ class FolderSelectPSTScanner:
         print(f"   스캔: {self.total_scanned:,}개")
         print(f"   매칭: {self.total_matched:,}개")
         print(f"   스킵: {self.total_skipped:,}개")
+        if self.incremental:
+            print(f"   기존: {self.total_known:,}개 (이미 내보냄)")
         print(f"   속도: {speed:.1f} 메시지/초")
         print(f"   경과: {elapsed/60:.1f}분")
         print(f"   메모리: {len(self.email_data):,}개")
     
     def save_batch(self, output_file, mode='a'):
-        """배치 저장"""
+        """배치 저장 (저장소에 추가만 함, O(batch))"""
         if not self.email_data:
             return
         
         try:
-            df = pd.DataFrame(self.email_data)
-            
-            # 컬럼 순서 표준화 (HVDC Analyzer 호환)
-            column_order = [
-                'Subject', 'SenderName', 'SenderEmail', 'RecipientTo',
-                'DeliveryTime', 'CreationTime',
-                'Size', 'HasAttachments', 'AttachmentCount', 'AttachmentNames',
-                'FolderPath', 'PlainTextBody', 'HTMLBody'
-            ]
-            
-            # 존재하는 컬럼만 순서대로 선택
-            ordered_columns = [col for col in column_order if col in df.columns]
-            # 순서에 없는 추가 컬럼도 포함
-            extra_columns = [col for col in df.columns if col not in column_order]
-            final_columns = ordered_columns + extra_columns
+            if self.sink is None:
+                self.sink = create_sink(self.sink_kind, output_file, reset=(mode == 'w'))
             
-            df = df[final_columns]
-            
-            file_exists = os.path.exists(output_file)
-            
-            if mode == 'a' and file_exists:
-                existing_df = pd.read_excel(output_file, sheet_name='전체_이메일')
-                df = pd.concat([existing_df, df], ignore_index=True)
-            
-            with pd.ExcelWriter(output_file, engine='openpyxl', mode='w') as writer:
-                df.to_excel(writer, sheet_name='전체_이메일', index=False)
-                
-                # 폴더별 통계
-                if 'FolderPath' in df.columns:
-                    folder_stats = df.groupby('FolderPath').size().reset_index(name='Count')
-                    folder_stats = folder_stats.sort_values('Count', ascending=False)
-                    folder_stats.to_excel(writer, sheet_name='폴더별_통계', index=False)
-                
-                # 발신자별 통계
-                if 'SenderEmail' in df.columns:
-                    sender_stats = df.groupby('SenderEmail').size().reset_index(name='Count')
-                    sender_stats = sender_stats.sort_values('Count', ascending=False)
-                    sender_stats.to_excel(writer, sheet_name='발신자별_통계', index=False)
-            
-            print(f"💾 배치 저장: {len(self.email_data)}개 → {output_file}")
+            written = self.sink.append(self.email_data)
+            print(f"💾 배치 저장: {written}개 → {self.sink.path}")
             self.email_data = []
             
+            # 증분 상태: 저장된 배치만 기록 (확정은 실행 성공 후)
+            if self.state is not None and self.pending_keys:
+                self.state.record(self.run_id, self.pending_keys)
+            self.pending_keys = []
+            
         except Exception as e:
             print(f"⚠️ 배치 저장 실패: {e}")
     
-    def scan_folder_only(self, folder, folder_path, output_file):
+    def write_report(self, output_file):
+        """저장소 → 엑셀 보고서 (스캔 종료 시 1회)"""
+        if self.sink is None:
+            print("ℹ️ 저장된 메시지가 없어 엑셀 보고서를 생성하지 않습니다")
+            return
+        
+        print(f"\n📝 엑셀 보고서 생성 중: {output_file}")
+        df = self.sink.read_all()
+        write_excel_report(df, output_file)
+        print(f"✅ 엑셀 보고서: {len(df):,}개 → {output_file}")
+    
+    def scan_folder_only(self, folder, folder_path, output_file, pst_name=''):
         """단일 폴더만 스캔 (하위 폴더 제외)"""
         print(f"\n📁 스캔: {folder_path}")
         
@@ -480,16 +619,30 @@ class FolderSelectPSTScanner:
             num_messages = folder.get_number_of_sub_messages()
             print(f"   📧 메시지 수: {num_messages}")
             
+            known_keys = None
+            if self.state is not None:
+                known_keys = self.state.known_keys(pst_name, folder_path)
+                print(f"   🔁 기존 메시지: {len(known_keys):,}개 (건너뜀)")
+            
             for i in range(num_messages):
                 try:
                     message = folder.get_sub_message(i)
                     self.total_scanned += 1
                     
+                    key = None
+                    if known_keys is not None:
+                        key = message_key(message)
+                        if key in known_keys:
+                            self.total_known += 1
+                            continue
+                    
                     data = self.extract_message_data(message)
                     
                     if data:
                         data['FolderPath'] = folder_path
                         self.email_data.append(data)
+                        if key is not None:
+                            self.pending_keys.append((pst_name, folder_path, key))
                         self.total_matched += 1
                         
                         if len(self.email_data) >= self.batch_size:
@@ -505,6 +658,55 @@ class FolderSelectPSTScanner:
         except Exception as e:
             print(f"   ❌ 폴더 스캔 오류: {e}")
     
+    def scan_parallel(self, selected_indices, output_file):
+        """
+        선택 폴더를 작업 단위로 나눠 워커 프로세스에서 스캔
+        - executor.map은 제출 순서대로 결과를 반환 → 순차 스캔과 동일한 행 순서
+        """
+        units = self.build_scan_units(selected_indices)
+        scanner_kwargs = {
+            'start_date': self.start_date,
+            'end_date': self.end_date,
+            'max_body_length': self.max_body_length,
+        }
+        print(f"\n⚡ 병렬 스캔: 워커 {self.workers}개, 작업 단위 {len(units):,}개")
+        
+        state_path = str(self.state_path) if self.state is not None else None
+        
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 initializer=_init_worker,
+                                 initargs=(self.opener, scanner_kwargs, state_path)) as executor:
+            for records, scanned, skipped, known, keys in executor.map(_scan_unit, units):
+                self.total_scanned += scanned
+                self.total_matched += len(records)
+                self.total_skipped += skipped
+                self.total_known += known
+                self.email_data.extend(records)
+                self.pending_keys.extend(keys)
+                
+                if len(self.email_data) >= self.batch_size:
+                    self.save_batch(output_file, mode='a')
+                
+                self.print_progress()
+    
+    def scan_selected(self, selected_indices, output_file):
+        """선택된 폴더 스캔 + 마지막 배치 저장 (workers > 1 이면 병렬)"""
+        if self.workers > 1:
+            self.scan_parallel(selected_indices, output_file)
+        else:
+            for idx in selected_indices:
+                folder_info = self.folder_list[idx]
+                self.scan_folder_only(
+                    folder_info['folder_obj'],
+                    folder_info['path'],
+                    output_file,
+                    pst_name=Path(folder_info.get('pst_path', '')).name
+                )
+        
+        # 마지막 배치 저장
+        if self.email_data:
+            self.save_batch(output_file, mode='a')
+    
     def analyze_selected(self, pst_path, selected_indices, output_excel):
         """선택된 폴더만 분석"""
         print("\n" + "="*70)
@@ -516,24 +718,35 @@ class FolderSelectPSTScanner:
             print(f"   종료: {self.end_date.strftime('%Y-%m-%d')}")
         
         print(f"   선택 폴더: {len(selected_indices)}개")
+        if self.workers > 1:
+            print(f"   워커: {self.workers}개")
         print("="*70)
         
         self.start_time = time.time()
         self.last_report_time = self.start_time
         
+        # 새 스캔: 같은 이름의 기존 저장소는 비우고 시작
+        self.sink = create_sink(self.sink_kind, output_excel, reset=True)
+        print(f"   배치 저장소: {self.sink.path} ({self.sink.kind})")
+        
+        if self.incremental:
+            self.state = ScanStateStore(self.state_path)
+            if self.discard_pending:
+                discarded = self.state.discard_pending()
+                print(f"   증분 상태: 미확정 기록 {discarded:,}개 폐기")
+            self.run_id = self.state.begin_run(output_excel)
+            print(f"   증분 상태: {self.state_path} (run {self.run_id})")
+        
         try:
-            # 선택된 폴더만 스캔
-            for idx in selected_indices:
-                folder_info = self.folder_list[idx]
-                self.scan_folder_only(
-                    folder_info['folder_obj'],
-                    folder_info['path'],
-                    output_excel
-                )
+            self.scan_selected(selected_indices, output_excel)
+            
+            # 엑셀 보고서 생성 (1회)
+            self.write_report(output_excel)
             
-            # 마지막 배치 저장
-            if self.email_data:
-                self.save_batch(output_excel, mode='a')
+            # 증분 상태 확정 (보고서까지 성공한 경우에만)
+            if self.state is not None:
+                committed = self.state.commit_run(self.run_id)
+                print(f"\n🔁 증분 상태 확정: {committed:,}개 메시지 기록")
             
             # 최종 결과
             self.print_progress(force=True)
@@ -543,12 +756,15 @@ class FolderSelectPSTScanner:
             print(f"   총 스캔: {self.total_scanned:,}개")
             print(f"   날짜 매칭: {self.total_matched:,}개")
             print(f"   날짜 스킵: {self.total_skipped:,}개")
+            if self.incremental:
+                print(f"   기존 메시지: {self.total_known:,}개 (증분 스캔으로 건너뜀)")
             
             elapsed = time.time() - self.start_time
             print(f"   소요 시간: {elapsed/60:.1f}분")
             print("="*70)
             
             print(f"\n📊 결과 파일: {output_excel}")
+            print(f"   배치 저장소: {self.sink.path}")
             
             return True
             
@@ -556,26 +772,39 @@ class FolderSelectPSTScanner:
             print(f"\n❌ 분석 중 오류: {e}")
             import traceback
             traceback.print_exc()
+            # 이 실행의 미확정 기록만 폐기 (다음 실행에서 다시 스캔)
+            if self.state is not None:
+                self.state.abort_run(self.run_id)
             return False
+        
+        finally:
+            if self.sink is not None:
+                self.sink.close()
+            if self.state is not None:
+                self.state.close()
+                self.state = None
     
     def run(self, pst_path, output_excel, auto_folders=None, auto_confirm=False):
         """전체 실행 흐름
         
         Args:
-            pst_path: PST 파일 경로
+            pst_path: PST 파일 경로 (또는 경로 리스트 - 다중 PST)
             output_excel: 출력 엑셀 파일명
             auto_folders: 자동 폴더 선택 ('all' 또는 None)
             auto_confirm: 자동 확인 (True/False)
         """
+        pst_paths = [pst_path] if isinstance(pst_path, str) else list(pst_path)
+        
         # PST 열기
-        if not self.open_pst_readonly(pst_path):
-            return False
+        for path in pst_paths:
+            if not self.open_pst_readonly(path):
+                self.close_all()
+                return False
         
         try:
             # 폴더 목록 생성
             print("\n⏳ 폴더 목록 생성 중...")
-            root = self.pst_file.get_root_folder()
-            self.list_all_folders(root)
+            self.load_folder_list(pst_paths)
             
             # 폴더 선택
             if auto_folders == 'all':
@@ -601,9 +830,19 @@ class FolderSelectPSTScanner:
             return self.analyze_selected(pst_path, selected_indices, output_excel)
             
         finally:
-            if self.pst_file:
-                self.pst_file.close()
-                print("\n✅ PST 파일 닫힘")
+            self.close_all()
+    
+    def close_all(self):
+        """열린 PST 파일 모두 닫기"""
+        for pst_file in self.pst_files:
+            try:
+                pst_file.close()
+            except Exception:
+                pass
+        if self.pst_files:
+            print("\n✅ PST 파일 닫힘")
+        self.pst_files = []
+        self.pst_file = None
 
 
 # 메인 실행
@@ -636,21 +875,36 @@ if __name__ == "__main__":
   python LIBPST_FOLDER_SELECT_v5.py --pst "경로" --start 2025-07-01 --end 2025-07-30 --folders all --auto
         """
     )
-    parser.add_argument('--pst', help='PST 파일 경로')
+    parser.add_argument('--pst', action='append', help='PST 파일 경로 (여러 번 지정 가능)')
     parser.add_argument('--start', help='시작 날짜 (YYYY-MM-DD)')
     parser.add_argument('--end', help='종료 날짜 (YYYY-MM-DD)')
     parser.add_argument('--folders', default=None, help='폴더 선택 (all 또는 번호)')
     parser.add_argument('--auto', action='store_true', help='확인 없이 자동 실행')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='병렬 스캔 프로세스 수 (기본: 1=순차)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='이미 내보낸 메시지는 건너뛰고 새 메시지만 출력')
+    parser.add_argument('--state', default=str(DEFAULT_STATE_PATH),
+                        help=f'증분 스캔 상태 파일 (기본: {DEFAULT_STATE_PATH})')
+    parser.add_argument('--discard-pending', action='store_true',
+                        help='강제 종료된 실행의 미확정 증분 기록 폐기 (다른 스캔이 실행 중이 아닐 때만)')
+    parser.add_argument('--sink', choices=SINK_KINDS, default=None,
+                        help='배치 저장소 (parquet/sqlite, 기본: pyarrow 있으면 parquet)')
     
     args = parser.parse_args()
     
+    if pypff is None:
+        print("❌ pypff 모듈이 설치되지 않았습니다")
+        print("설치 방법: pip install libpff-python")
+        sys.exit(1)
+    
     # PST 파일 경로
     if args.pst:
-        pst_path = args.pst.strip('"')
+        pst_paths = [p.strip('"') for p in args.pst]
     else:
-        pst_path = input("\n📁 PST 파일 경로: ").strip('"')
+        pst_paths = [input("\n📁 PST 파일 경로: ").strip('"')]
     
-    if not pst_path:
+    if not all(pst_paths):
         print("❌ 경로가 입력되지 않았습니다")
         sys.exit(1)
     
@@ -699,19 +953,30 @@ if __name__ == "__main__":
             output_file = f"{base_name}_{timestamp}.xlsx"
     else:
         # 날짜 지정 안 된 경우 타임스탬프 사용
+        base_name = "OUTLOOK_ALL"
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"OUTLOOK_ALL_{timestamp}.xlsx"
     
+    # 증분 스캔: 델타 파티션은 항상 별도 파일 (OUTLOOK_YYYYMM_delta_YYYYMMDD_HHMMSS.xlsx)
+    if args.incremental:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = f"{base_name}_delta_{timestamp}.xlsx"
+    
     # 스캐너 실행
     scanner = FolderSelectPSTScanner(
         start_date=start_date,
         end_date=end_date,
         max_body_length=500,
-        batch_size=1000
+        batch_size=1000,
+        sink_kind=args.sink,
+        workers=args.workers,
+        incremental=args.incremental,
+        state_path=args.state,
+        discard_pending=args.discard_pending
     )
     
     success = scanner.run(
-        pst_path, 
+        pst_paths, 
         output_file,
         auto_folders=args.folders,
         auto_confirm=args.auto
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Outlook PST Scanner 저장소 (append-only sink)
+
+배치마다 전체 엑셀을 다시 읽고 쓰던 방식(O(n²))을 대체한다.
+- 각 배치는 저장소에 O(batch)로 추가만 된다
+- 엑셀 보고서(전체_이메일, 폴더별_통계, 발신자별_통계)는 스캔 종료 시 1회 생성
+
+지원 저장소:
+- parquet: <출력>.parquet/ 디렉토리에 part-NNNNN.parquet 파일 추가 (pyarrow 필요)
+- sqlite : <출력>.sqlite 단일 파일의 emails 테이블에 INSERT (표준 라이브러리)
+
+두 저장소 모두 outlook_hvdc_analyzer.py가 기대하는 컬럼 순서(PST_COLUMN_ORDER)로 읽힌다.
+
+사용:
+  sink = create_sink('parquet', 'OUTLOOK_202506.xlsx')
+  sink.append(records)          # 배치마다
+  write_excel_report(sink.read_all(), 'OUTLOOK_202506.xlsx')
+"""
+
+from __future__ import annotations
+
+import re
+import shutil
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa  # optional
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+
+# 컬럼 순서 표준화 (HVDC Analyzer 호환)
+PST_COLUMN_ORDER = [
+    'Subject', 'SenderName', 'SenderEmail', 'RecipientTo',
+    'DeliveryTime', 'CreationTime',
+    'Size', 'HasAttachments', 'AttachmentCount', 'AttachmentNames',
+    'FolderPath', 'PlainTextBody', 'HTMLBody'
+]
+
+# 컬럼별 저장 타입 (배치마다 타입이 흔들리지 않도록 고정)
+PST_COLUMN_TYPES = {
+    'Subject': 'string',
+    'SenderName': 'string',
+    'SenderEmail': 'string',
+    'RecipientTo': 'string',
+    'DeliveryTime': 'datetime',
+    'CreationTime': 'datetime',
+    'Size': 'int',
+    'HasAttachments': 'bool',
+    'AttachmentCount': 'int',
+    'AttachmentNames': 'string',
+    'FolderPath': 'string',
+    'PlainTextBody': 'string',
+    'HTMLBody': 'string',
+}
+
+SINK_KINDS = ('parquet', 'sqlite')
+PART_FILE_PATTERN = re.compile(r'part-(\d+)\.parquet')
+
+
+def order_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """PST_COLUMN_ORDER 순서로 정렬 (순서에 없는 추가 컬럼은 뒤에 유지)"""
+    ordered_columns = [col for col in PST_COLUMN_ORDER if col in df.columns]
+    extra_columns = [col for col in df.columns if col not in PST_COLUMN_ORDER]
+    return df[ordered_columns + extra_columns]
+
+
+def coerce_types(df: pd.DataFrame) -> pd.DataFrame:
+    """PST_COLUMN_TYPES 기준으로 타입 고정 (추가 컬럼은 문자열)"""
+    df = df.copy()
+    for col in df.columns:
+        kind = PST_COLUMN_TYPES.get(col, 'string')
+        if kind == 'datetime':
+            df[col] = pd.to_datetime(df[col], errors='coerce').astype('datetime64[ns]')
+        elif kind == 'int':
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype('int64')
+        elif kind == 'bool':
+            df[col] = df[col].fillna(False).astype(bool)
+        else:
+            df[col] = df[col].astype(object).where(df[col].notna(), None)
+            df[col] = df[col].map(lambda v: v if v is None or isinstance(v, str) else str(v))
+    return df
+
+
+class PSTSink(ABC):
+    """append-only 저장소 기본 클래스 (_write/read_all을 구현하지 않은 저장소는 생성 시 오류)"""
+
+    kind = ''
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.rows_written = 0
+
+    def append(self, records: List[Dict]) -> int:
+        """배치 추가 (추가된 행 수 반환)"""
+        if not records:
+            return 0
+        df = coerce_types(order_columns(pd.DataFrame(records)))
+        self._write(df)
+        self.rows_written += len(df)
+        return len(df)
+
+    @abstractmethod
+    def _write(self, df: pd.DataFrame):
+        """타입이 고정된 배치 1개 저장"""
+
+    @abstractmethod
+    def read_all(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """저장된 전체 데이터 (PST_COLUMN_ORDER 순서)"""
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ParquetSink(PSTSink):
+    """
+    Parquet part 파일 디렉토리 저장소
+    - 배치마다 part-NNNNN.parquet 1개 생성 (기존 파일은 건드리지 않음)
+    """
+
+    kind = 'parquet'
+
+    def __init__(self, path: Union[str, Path]):
+        if pa is None:
+            raise ImportError("parquet 저장소에는 pyarrow가 필요합니다: pip install pyarrow")
+        super().__init__(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        # 번호에 빈 곳이 있어도 기존 part를 덮어쓰지 않도록 가장 큰 번호 + 1
+        matches = (PART_FILE_PATTERN.fullmatch(p.name) for p in self._part_files())
+        numbers = [int(m.group(1)) for m in matches if m]
+        self._next_part = max(numbers) + 1 if numbers else 0
+
+    def _part_files(self) -> List[Path]:
+        return sorted(self.path.glob('part-*.parquet'))
+
+    def _write(self, df: pd.DataFrame):
+        part_path = self.path / f"part-{self._next_part:05d}.parquet"
+        tmp_path = part_path.with_suffix('.tmp')
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, tmp_path)
+        tmp_path.replace(part_path)  # 중단 시 불완전한 part 파일이 남지 않도록
+        self._next_part += 1
+
+    def read_all(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        parts = self._part_files()
+        if not parts:
+            return pd.DataFrame(columns=columns or PST_COLUMN_ORDER)
+        frames = []
+        for part in parts:
+            table = pq.read_table(part)
+            if columns:
+                table = table.select([c for c in columns if c in table.column_names])
+            frames.append(table.to_pandas())
+        return order_columns(pd.concat(frames, ignore_index=True))
+
+
+class SQLiteSink(PSTSink):
+    """
+    SQLite 단일 파일 저장소
+    - emails 테이블에 INSERT만 수행, 날짜는 ISO 문자열로 저장
+    """
+
+    kind = 'sqlite'
+    table = 'emails'
+
+    def __init__(self, path: Union[str, Path]):
+        super().__init__(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._columns = self._existing_columns()
+
+    def _existing_columns(self) -> List[str]:
+        cur = self.conn.execute(f"PRAGMA table_info({self.table})")
+        return [row[1] for row in cur.fetchall()]
+
+    def _ensure_columns(self, columns: List[str]):
+        if not self._columns:
+            col_defs = ', '.join(f'"{c}"' for c in columns)
+            self.conn.execute(f"CREATE TABLE {self.table} ({col_defs})")
+            self._columns = list(columns)
+            return
+        for col in columns:
+            if col not in self._columns:
+                self.conn.execute(f'ALTER TABLE {self.table} ADD COLUMN "{col}"')
+                self._columns.append(col)
+
+    def _write(self, df: pd.DataFrame):
+        self._ensure_columns(list(df.columns))
+        for col in df.columns:
+            if PST_COLUMN_TYPES.get(col) == 'datetime':
+                df[col] = df[col].map(lambda v: v.isoformat() if pd.notna(v) else None)
+            elif PST_COLUMN_TYPES.get(col) == 'bool':
+                df[col] = df[col].astype(int)
+        col_names = ', '.join(f'"{c}"' for c in df.columns)
+        placeholders = ', '.join('?' for _ in df.columns)
+        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO {self.table} ({col_names}) VALUES ({placeholders})", rows
+            )
+
+    def read_all(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        if not self._columns:
+            return pd.DataFrame(columns=columns or PST_COLUMN_ORDER)
+        select = [c for c in (columns or self._columns) if c in self._columns]
+        col_names = ', '.join(f'"{c}"' for c in select)
+        df = pd.read_sql_query(f"SELECT {col_names} FROM {self.table} ORDER BY rowid", self.conn)
+        for col in df.columns:
+            if PST_COLUMN_TYPES.get(col) == 'datetime':
+                df[col] = pd.to_datetime(df[col], errors='coerce')
+            elif PST_COLUMN_TYPES.get(col) == 'bool':
+                df[col] = df[col].fillna(0).astype(bool)
+        return order_columns(df)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def default_sink_kind() -> str:
+    """pyarrow가 있으면 parquet, 없으면 sqlite"""
+    return 'parquet' if pa is not None else 'sqlite'
+
+
+def store_path_for(output_file: Union[str, Path], kind: str) -> Path:
+    """엑셀 출력 경로 → 저장소 경로 (OUTLOOK_202506.xlsx → OUTLOOK_202506.parquet)"""
+    return Path(output_file).with_suffix('.parquet' if kind == 'parquet' else '.sqlite')
+
+
+def create_sink(kind: Optional[str], output_file: Union[str, Path], reset: bool = False) -> PSTSink:
+    """저장소 생성 (kind: 'parquet' | 'sqlite' | None=자동, reset=True면 기존 저장소 삭제)"""
+    kind = kind or default_sink_kind()
+    if kind not in SINK_KINDS:
+        raise ValueError(f"알 수 없는 저장소 종류: {kind} (허용: {', '.join(SINK_KINDS)})")
+    path = store_path_for(output_file, kind)
+    if reset and path.exists():
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+    if kind == 'parquet':
+        return ParquetSink(path)
+    return SQLiteSink(path)
+
+
+def open_store(path: Union[str, Path]) -> PSTSink:
+    """기존 저장소 열기 (.parquet 디렉토리 또는 .sqlite 파일)"""
+    path = Path(path)
+    if path.suffix == '.sqlite':
+        return SQLiteSink(path)
+    if path.suffix == '.parquet' or path.is_dir():
+        return ParquetSink(path)
+    raise ValueError(f"저장소 형식을 알 수 없습니다: {path}")
+
+
+def is_store_path(path: Union[str, Path]) -> bool:
+    """analyzer 입력이 엑셀이 아니라 저장소인지 확인"""
+    return Path(path).suffix in ('.parquet', '.sqlite')
+
+
+def write_excel_report(df: pd.DataFrame, output_file: Union[str, Path]):
+    """스캔 종료 시 1회: 전체_이메일 + 폴더별_통계 + 발신자별_통계"""
+    df = order_columns(df)
+    with pd.ExcelWriter(output_file, engine='openpyxl', mode='w') as writer:
+        df.to_excel(writer, sheet_name='전체_이메일', index=False)
+
+        # 폴더별 통계
+        if 'FolderPath' in df.columns:
+            folder_stats = df.groupby('FolderPath').size().reset_index(name='Count')
+            folder_stats = folder_stats.sort_values('Count', ascending=False)
+            folder_stats.to_excel(writer, sheet_name='폴더별_통계', index=False)
+
+        # 발신자별 통계
+        if 'SenderEmail' in df.columns:
+            sender_stats = df.groupby('SenderEmail').size().reset_index(name='Count')
+            sender_stats = sender_stats.sort_values('Count', ascending=False)
+            sender_stats.to_excel(writer, sheet_name='발신자별_통계', index=False)
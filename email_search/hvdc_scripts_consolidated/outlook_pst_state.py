@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Outlook PST 증분 스캔 상태 저장소 (SQLite)
+
+이미 내보낸 메시지를 (PST, 폴더 경로, 메시지 키)로 기록해 두고,
+--incremental 실행 시 알려진 메시지는 건너뛰어 새 메시지(델타)만 출력한다.
+
+- 메시지 키: pypff 메시지 identifier + 배송 시간 (identifier가 없으면 제목/크기로 대체)
+- 배치 저장 시 run_id로 '대기' 기록 → 엑셀 보고서까지 성공하면 commit_run()으로 확정
+  (실패한 실행은 abort_run()으로 자기 기록만 폐기 → 누락 없이 재스캔.
+   저장소를 열 때는 다른 실행의 대기 기록을 지우지 않으므로 겹쳐 실행해도 안전,
+   강제 종료로 남은 대기 기록은 다음 실행이 같은 메시지를 기록할 때 넘겨받거나
+   discard_pending()으로 명시적으로 정리)
+
+기본 위치: results/pst_scan_state.sqlite
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Set, Tuple, Union
+
+DEFAULT_STATE_PATH = Path("results") / "pst_scan_state.sqlite"
+
+
+def message_key(message) -> str:
+    """메시지 식별 키 (identifier@delivery_time)"""
+    identifier = None
+    try:
+        identifier = message.identifier
+    except Exception:
+        pass
+
+    delivery_time = None
+    try:
+        delivery_time = message.delivery_time or message.creation_time
+    except Exception:
+        pass
+    time_part = delivery_time.isoformat() if delivery_time else ''
+
+    if identifier is None:
+        # identifier를 읽을 수 없는 경우: 제목 + 크기로 대체
+        subject = ''
+        size = 0
+        try:
+            subject = message.subject or ''
+            size = message.size or 0
+        except Exception:
+            pass
+        return f"{subject}|{size}@{time_part}"
+
+    return f"{identifier}@{time_part}"
+
+
+class ScanStateStore:
+    """PST 메시지 내보내기 기록 (증분 스캔 워터마크)"""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_STATE_PATH, readonly: bool = False):
+        self.path = Path(path)
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS exported (
+                    pst TEXT NOT NULL,
+                    folder_path TEXT NOT NULL,
+                    message_key TEXT NOT NULL,
+                    run_id TEXT NOT NULL,
+                    committed INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (pst, folder_path, message_key)
+                ) WITHOUT ROWID
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    started_at TEXT NOT NULL,
+                    finished_at TEXT,
+                    output_file TEXT,
+                    exported INTEGER DEFAULT 0
+                )
+            """)
+
+    def begin_run(self, output_file: Optional[str] = None) -> str:
+        """새 실행 등록 → run_id 반환"""
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO runs (run_id, started_at, output_file) VALUES (?, ?, ?)",
+                (run_id, datetime.now().isoformat(timespec='seconds'), str(output_file or '')),
+            )
+        return run_id
+
+    def known_keys(self, pst: str, folder_path: str) -> Set[str]:
+        """폴더의 확정된 메시지 키 집합 (폴더 스캔 시작 시 1회 조회)"""
+        cur = self.conn.execute(
+            "SELECT message_key FROM exported WHERE pst = ? AND folder_path = ? AND committed = 1",
+            (pst, folder_path),
+        )
+        return {row[0] for row in cur}
+
+    def record(self, run_id: str, entries: Iterable[Tuple[str, str, str]]):
+        """
+        배치 기록 (pst, folder_path, message_key) - commit_run 전까지는 미확정
+        (다른 실행의 미확정 기록은 이 실행으로 넘겨받음, 확정된 기록은 그대로)
+        """
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO exported (pst, folder_path, message_key, run_id) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (pst, folder_path, message_key) "
+                "DO UPDATE SET run_id = excluded.run_id WHERE committed = 0",
+                ((pst, folder, key, run_id) for pst, folder, key in entries),
+            )
+
+    def commit_run(self, run_id: str) -> int:
+        """실행 성공 시 기록 확정 → 확정된 메시지 수 반환"""
+        with self.conn:
+            cur = self.conn.execute(
+                "UPDATE exported SET committed = 1 WHERE run_id = ?", (run_id,)
+            )
+            self.conn.execute(
+                "UPDATE runs SET finished_at = ?, exported = ? WHERE run_id = ?",
+                (datetime.now().isoformat(timespec='seconds'), cur.rowcount, run_id),
+            )
+        return cur.rowcount
+
+    def abort_run(self, run_id: str) -> int:
+        """실행 실패 시 이 실행의 미확정 기록만 폐기 → 폐기된 메시지 수 반환"""
+        with self.conn:
+            cur = self.conn.execute(
+                "DELETE FROM exported WHERE run_id = ? AND committed = 0", (run_id,)
+            )
+        return cur.rowcount
+
+    def discard_pending(self) -> int:
+        """
+        모든 미확정 기록 폐기 (강제 종료된 실행 정리) → 폐기된 메시지 수 반환
+        다른 스캔이 실행 중이 아닐 때만 사용 (실행 중인 스캔의 대기 기록도 지워짐)
+        """
+        with self.conn:
+            cur = self.conn.execute("DELETE FROM exported WHERE committed = 0")
+        return cur.rowcount
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -12,6 +12,8 @@
 사용:
   python outlook_trend_analyzer.py
   python outlook_trend_analyzer.py --output HVDC_TREND_REPORT.xlsx
+  python outlook_trend_analyzer.py --warehouse results/hvdc_warehouse --months 202505 202506
+  (웨어하우스 모드: 지정 파티션의 트렌드 컬럼만 읽음, 본문 컬럼은 읽지 않음)
 """
 
 import pandas as pd
@@ -29,8 +31,34 @@ def extract_month_from_filename(filename: str) -> str:
         return match.group(1)
     return None
 
-def load_all_monthly_data() -> pd.DataFrame:
-    """모든 월별 분석 파일 로드"""
+# 트렌드/품질 분석에 필요한 컬럼 (웨어하우스 모드에서 이 컬럼만 읽음)
+TREND_COLUMNS = ['Subject', 'SenderEmail', 'case_numbers', 'site', 'lpo', 'phase']
+
+def load_warehouse_data(warehouse, months=None) -> pd.DataFrame:
+    """웨어하우스에서 필요한 파티션의 트렌드 컬럼만 로드"""
+    from outlook_hvdc_warehouse import EmailWarehouse, PARTITION_KEY
+    
+    df = EmailWarehouse(warehouse).read(columns=TREND_COLUMNS, months=months, with_partition=True)
+    if df.empty:
+        print(f"오류: 웨어하우스에 데이터가 없습니다: {warehouse}")
+        sys.exit(1)
+    
+    for col in TREND_COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+    df['Month'] = df.pop(PARTITION_KEY)
+    df['YearMonth'] = df['Month'].str[:4] + '-' + df['Month'].str[4:]
+    for year_month, rows in df.groupby('YearMonth', sort=True).size().items():
+        print(f"  ✅ {year_month}: {rows:,}개")
+    
+    print(f"\n총 {len(df):,}개 이메일 로드 완료")
+    return df
+
+def load_all_monthly_data(warehouse=None, months=None) -> pd.DataFrame:
+    """모든 월별 분석 파일 로드 (warehouse 지정 시 웨어하우스 파티션 사용)"""
+    if warehouse:
+        return load_warehouse_data(warehouse, months=months)
+    
     pattern = "results/OUTLOOK_HVDC_ONTOLOGY_*.xlsx"
     files = sorted(glob.glob(pattern))
     
@@ -273,6 +301,10 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='월별 HVDC 트렌드 분석 및 통합 보고서')
     parser.add_argument('--output', '-o', default=None, 
                        help='출력 파일 경로 (기본: HVDC_TREND_REPORT_YYYYMMDD.xlsx)')
+    parser.add_argument('--warehouse', metavar='DIR', default=None,
+                       help='엑셀 대신 이메일 웨어하우스에서 읽기, 예) results/hvdc_warehouse')
+    parser.add_argument('--months', nargs='+', default=None,
+                       help='분석할 YYYYMM 목록 (--warehouse 사용 시, 기본: 전체)')
     
     args = parser.parse_args()
     
@@ -281,7 +313,7 @@ if __name__ == "__main__":
     print("="*70)
     
     # 모든 월 데이터 로드
-    all_data = load_all_monthly_data()
+    all_data = load_all_monthly_data(warehouse=args.warehouse, months=args.months)
     
     # 출력 파일명
     if args.output:
@@ -0,0 +1,73 @@
+"""
+outlook_hvdc_dedup 단위 테스트
+청크 크기와 무관한 중복 제거 결과 검증
+"""
+
+import unittest
+import sys
+import random
+from pathlib import Path
+
+import pandas as pd
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from outlook_hvdc_dedup import remove_duplicates, duplicate_keys
+
+
+def make_emails(seed: int, rows: int = 60) -> pd.DataFrame:
+    """숫자 제목/발신자/본문과 날짜 형식이 섞인 메일 목록"""
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'Subject': [rng.choice(['RE: Hello', 'hello', 'Fw: Hello!', 123, 45.0, None]) for _ in range(rows)],
+        'SenderEmail': [rng.choice(['A@b.com', 'a@b.com ', 7, None]) for _ in range(rows)],
+        'DeliveryTime': [rng.choice(['2025-06-01 10:00', '2025-06-01 11:00', '06/02/2025', None])
+                         for _ in range(rows)],
+        'PlainTextBody': [rng.choice(['x  y', 'X y', 3, None]) for _ in range(rows)],
+    })
+
+
+class TestRemoveDuplicates(unittest.TestCase):
+    """remove_duplicates 테스트"""
+
+    def test_result_independent_of_chunk_rows(self):
+        """chunk_rows가 달라도 남는 행과 통계가 같음"""
+        for seed in range(24):
+            df = make_emails(seed)
+            for use_body in (False, True):
+                for keep in ('last', False):
+                    expected, expected_stats = remove_duplicates(df, keep=keep, use_body=use_body)
+                    for chunk_rows in (7, 25):
+                        result, stats = remove_duplicates(
+                            df, keep=keep, use_body=use_body, chunk_rows=chunk_rows
+                        )
+                        self.assertEqual(list(result.index), list(expected.index))
+                        self.assertEqual(stats, expected_stats)
+
+    def test_numeric_only_chunk(self):
+        """값이 모두 숫자인 청크도 문자열로 정규화"""
+        chunk = pd.DataFrame({
+            'Subject': [123, 456],
+            'SenderEmail': [7, 7],
+            'DeliveryTime': ['2025-06-01', '2025-06-01'],
+            'PlainTextBody': [3, 3],
+        })
+        keys = duplicate_keys(chunk, use_body=True)
+        self.assertEqual(list(keys), ['123|7|2025-06-01|3', '456|7|2025-06-01|3'])
+
+    def test_duplicates_removed(self):
+        """접두사/대소문자/시간이 달라도 같은 날짜의 같은 메일은 1건"""
+        df = pd.DataFrame({
+            'Subject': ['RE: Hello', 'hello', 'Other'],
+            'SenderEmail': ['A@b.com', 'a@b.com', 'a@b.com'],
+            'DeliveryTime': ['2025-06-01 10:00', '2025-06-01 11:00', '2025-06-01 12:00'],
+        })
+        result, stats = remove_duplicates(df, keep='last')
+        self.assertEqual(list(result.index), [1, 2])
+        self.assertEqual(stats['removed'], 1)
+        self.assertEqual(stats['duplicate_groups'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Token -> posting-list index for the AQS-lite searcher.
+
+Normalized search columns are lowercase with single spaces, so a query term
+without whitespace occurs in a row exactly when it occurs inside one of the
+row's space-separated tokens. Each column is therefore indexed as:
+
+- vocab: distinct tokens, stored as one newline-joined string
+- postings (CSR): token id -> sorted int32 row positions
+
+Term lookup scans the vocabulary (not the rows) for tokens containing the
+term, then unions their postings. Phrases narrow candidates with their
+words and are verified with str.contains on the candidate rows only, so
+results are identical to a full-column str.contains.
+
+Fuzzy lookup works on the same vocabulary: each distinct token is compared
+with the term once (difflib cutoff, like get_close_matches per row token),
+after exact length and character-histogram upper bounds discard tokens that
+cannot reach the cutoff. The close tokens then go through the posting lists.
+
+Indexes are persisted per column under <excel>.aqs_index/ and reused while
+the source file, sheet and column mapping are unchanged.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+INDEX_VERSION = 1
+# Above this many vocabulary hits, a vectorized vocab scan beats str.find stepping
+FIND_LOOP_LIMIT = 20_000
+TERM_CACHE_SIZE = 256
+# Character histogram buckets for the fuzzy upper bound (codepoint % buckets)
+CHAR_BUCKETS = 32
+
+
+class ColumnIndex:
+    def __init__(self, vocab_text: str, offsets: np.ndarray, rows: np.ndarray, n_rows: int) -> None:
+        self.vocab_text = vocab_text
+        self.offsets = offsets  # CSR offsets into rows, len = n_tokens + 1
+        self.rows = rows
+        self.n_rows = n_rows
+        # start of each token inside vocab_text (tokens end with "\n")
+        lengths = np.fromiter(
+            (len(tok) + 1 for tok in vocab_text.split("\n")[:-1]), dtype=np.int64
+        )
+        self.starts = np.concatenate([[0], np.cumsum(lengths)])
+        self._entry_token: Optional[np.ndarray] = None
+        self._vocab: Optional[pd.Series] = None
+        self._char_hist: Optional[np.ndarray] = None
+        self._term_cache: Dict[str, np.ndarray] = {}
+        self._fuzzy_cache: Dict[tuple, np.ndarray] = {}
+
+    @property
+    def n_tokens(self) -> int:
+        return len(self.offsets) - 1
+
+    @classmethod
+    def build(cls, series: pd.Series) -> "ColumnIndex":
+        vocab: Dict[str, int] = {}
+        token_ids: List[int] = []
+        counts = np.zeros(len(series), dtype=np.int64)
+        for pos, text in enumerate(series.fillna("").astype(str).tolist()):
+            row_tokens = set(text.split(" "))
+            counts[pos] = len(row_tokens)
+            token_ids.extend(vocab.setdefault(tok, len(vocab)) for tok in row_tokens)
+
+        # group (token, row) entries by token; stable sort keeps rows ascending
+        entry_token = np.asarray(token_ids, dtype=np.int32)
+        order = np.argsort(entry_token, kind="stable")
+        rows = np.repeat(np.arange(len(series), dtype=np.int32), counts)[order]
+        offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(entry_token, minlength=len(vocab)), out=offsets[1:])
+        vocab_text = "".join(f"{tok}\n" for tok in vocab)
+        return cls(vocab_text, offsets, rows, len(series))
+
+    # ----- persistence -----
+
+    def save(self, path: Path, signature: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp_path,
+            signature=np.array(signature),
+            n_rows=np.array(self.n_rows),
+            vocab=np.frombuffer(self.vocab_text.encode("utf-8"), dtype=np.uint8),
+            offsets=self.offsets,
+            rows=self.rows,
+        )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, signature: str) -> Optional["ColumnIndex"]:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["signature"]) != signature:
+                    return None
+                return cls(
+                    data["vocab"].tobytes().decode("utf-8"),
+                    data["offsets"],
+                    data["rows"],
+                    int(data["n_rows"]),
+                )
+        except (OSError, KeyError, ValueError):
+            return None
+
+    # ----- lookup -----
+
+    def _token_ids_containing(self, term: str) -> np.ndarray:
+        cached = self._term_cache.get(term)
+        if cached is not None:
+            return cached
+
+        text = self.vocab_text
+        if text.count(term) > FIND_LOOP_LIMIT:
+            vocab = self._vocab_list()
+            ids = np.flatnonzero(vocab.str.contains(term, regex=False).to_numpy())
+        else:
+            found: List[int] = []
+            pos = text.find(term)
+            while pos != -1:
+                tid = int(np.searchsorted(self.starts, pos, side="right")) - 1
+                found.append(tid)
+                pos = text.find(term, int(self.starts[tid + 1]))
+            ids = np.asarray(found, dtype=np.int64)
+
+        if len(self._term_cache) >= TERM_CACHE_SIZE:
+            self._term_cache.pop(next(iter(self._term_cache)))
+        self._term_cache[term] = ids
+        return ids
+
+    def _vocab_list(self) -> pd.Series:
+        if self._vocab is None:
+            self._vocab = pd.Series(self.vocab_text.split("\n")[:-1], dtype=object)
+        return self._vocab
+
+    def _char_histograms(self) -> np.ndarray:
+        """(n_tokens, CHAR_BUCKETS) character counts; merged buckets only over-count."""
+        if self._char_hist is None:
+            codes = np.frombuffer(self.vocab_text.encode("utf-32-le"), dtype=np.uint32)
+            token_of_char = np.repeat(
+                np.arange(self.n_tokens, dtype=np.int64), np.diff(self.starts)
+            )
+            keep = codes != ord("\n")
+            flat = token_of_char[keep] * CHAR_BUCKETS + (codes[keep] % CHAR_BUCKETS)
+            counts = np.bincount(flat, minlength=self.n_tokens * CHAR_BUCKETS)
+            self._char_hist = (
+                np.minimum(counts, np.iinfo(np.uint16).max)
+                .astype(np.uint16)
+                .reshape(self.n_tokens, CHAR_BUCKETS)
+            )
+        return self._char_hist
+
+    def close_token_ids(self, term: str, cutoff: float = 0.8) -> np.ndarray:
+        """Tokens t with difflib ratio(t, term) >= cutoff (get_close_matches test)."""
+        key = (term, cutoff)
+        cached = self._fuzzy_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # upper bounds of ratio = 2*M/(len_t + len_q): M <= min length, M <= histogram overlap
+        lengths = np.diff(self.starts) - 1
+        total = lengths + len(term)
+        total[total == 0] = 1
+        possible = 2.0 * np.minimum(lengths, len(term)) / total >= cutoff
+        if possible.any():
+            term_hist = np.bincount(
+                [ord(ch) % CHAR_BUCKETS for ch in term], minlength=CHAR_BUCKETS
+            )
+            candidates = np.flatnonzero(possible)
+            overlap = np.minimum(self._char_histograms()[candidates], term_hist).sum(axis=1)
+            candidates = candidates[2.0 * overlap / total[candidates] >= cutoff]
+        else:
+            candidates = np.empty(0, dtype=np.int64)
+
+        vocab = self._vocab_list()
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(term)
+        close: List[int] = []
+        for tid in candidates.tolist():
+            matcher.set_seq1(vocab.iat[tid])
+            if (
+                matcher.real_quick_ratio() >= cutoff
+                and matcher.quick_ratio() >= cutoff
+                and matcher.ratio() >= cutoff
+            ):
+                close.append(tid)
+        ids = np.asarray(close, dtype=np.int64)
+
+        if len(self._fuzzy_cache) >= TERM_CACHE_SIZE:
+            self._fuzzy_cache.pop(next(iter(self._fuzzy_cache)))
+        self._fuzzy_cache[key] = ids
+        return ids
+
+    def rows_for_tokens(self, token_ids: np.ndarray) -> np.ndarray:
+        """Boolean row mask for the union of the given tokens' postings."""
+        mask = np.zeros(self.n_rows, dtype=bool)
+        if len(token_ids) == 0:
+            return mask
+        if len(token_ids) <= 1024:
+            for tid in token_ids.tolist():
+                mask[self.rows[self.offsets[tid] : self.offsets[tid + 1]]] = True
+            return mask
+        if self._entry_token is None:
+            self._entry_token = np.repeat(
+                np.arange(self.n_tokens, dtype=np.int32), np.diff(self.offsets)
+            )
+        token_mask = np.zeros(self.n_tokens, dtype=bool)
+        token_mask[token_ids] = True
+        mask[self.rows[token_mask[self._entry_token]]] = True
+        return mask
+
+    def contains(self, term: str, series: pd.Series) -> np.ndarray:
+        """Same result as series.str.contains(term, regex=False), via the index."""
+        if term == "":
+            return np.ones(self.n_rows, dtype=bool)
+        if "\n" in term:
+            # normalized text has no newlines (and vocab entries are newline-separated)
+            return np.zeros(self.n_rows, dtype=bool)
+        words = term.split(" ")
+        if len(words) == 1:
+            return self.rows_for_tokens(self._token_ids_containing(term))
+
+        # phrase: every non-empty word must occur inside some token of the row
+        candidates = np.ones(self.n_rows, dtype=bool)
+        for word in words:
+            if word:
+                candidates &= self.rows_for_tokens(self._token_ids_containing(word))
+        positions = np.flatnonzero(candidates)
+        if len(positions):
+            subset = series.iloc[positions]
+            candidates[positions] = subset.str.contains(term, na=False, regex=False).to_numpy()
+        return candidates
+
+    def fuzzy_contains(self, term: str, series: pd.Series, cutoff: float = 0.8) -> np.ndarray:
+        """Substring match, or any row token within the difflib cutoff of term."""
+        mask = self.contains(term, series)
+        mask |= self.rows_for_tokens(self.close_token_ids(term, cutoff))
+        return mask
+
+
+class TextIndex:
+    """Lazily built, persisted ColumnIndex per normalized column."""
+
+    def __init__(self, df: pd.DataFrame, cache_dir: Optional[Path], signature: str) -> None:
+        self.df = df
+        self.cache_dir = cache_dir
+        self.signature = signature
+        self._columns: Dict[str, ColumnIndex] = {}
+        self.warnings: List[str] = []
+
+    @staticmethod
+    def make_signature(source: Path, sheet: str, mapping: Dict[str, List[str]], n_rows: int) -> str:
+        stat = source.stat()
+        payload = json.dumps(
+            {
+                "version": INDEX_VERSION,
+                "file": source.name,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sheet": sheet,
+                "mapping": mapping,
+                "rows": n_rows,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def column(self, name: str) -> ColumnIndex:
+        index = self._columns.get(name)
+        if index is not None:
+            return index
+
+        path = self.cache_dir / f"{name.strip('_')}.npz" if self.cache_dir else None
+        if path is not None and path.exists():
+            index = ColumnIndex.load(path, self.signature)
+        if index is None:
+            index = ColumnIndex.build(self.df[name])
+            if path is not None:
+                try:
+                    index.save(path, self.signature)
+                except OSError as exc:
+                    self.warnings.append(f"Could not persist search index: {exc}")
+        self._columns[name] = index
+        return index
+
+    def contains(self, name: str, term: str) -> pd.Series:
+        mask = self.column(name).contains(term, self.df[name])
+        return pd.Series(mask, index=self.df.index)
+
+    def fuzzy_contains(self, name: str, term: str, cutoff: float = 0.8) -> pd.Series:
+        mask = self.column(name).fuzzy_contains(term, self.df[name], cutoff)
+        return pd.Series(mask, index=self.df.index)
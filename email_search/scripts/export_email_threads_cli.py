@@ -15,6 +15,7 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 
@@ -82,6 +83,50 @@ def _export_threads_json(tracker, output_path: Path, tz: str) -> None:
     output_path.write_text(json.dumps(threads, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
+NS_PER_DAY = 86_400 * 10**9
+
+
+def _epoch_ns(df: pd.DataFrame, assume_local_time: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """DeliveryTime -> (int64 epoch ns, valid mask), parsed once for all rows."""
+    if "DeliveryTime" in df.columns:
+        dt = pd.to_datetime(df["DeliveryTime"], errors="coerce", utc=not assume_local_time)
+    else:
+        dt = pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    if getattr(dt.dt, "tz", None) is not None:
+        dt = dt.dt.tz_convert("UTC").dt.tz_localize(None)
+    valid = dt.notna().to_numpy()
+    ns = dt.to_numpy(dtype="datetime64[ns]").view("int64").copy()
+    ns[~valid] = 0
+    return ns, valid
+
+
+def _order_by_time(positions: np.ndarray, ns: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Ascending DeliveryTime order with NaT last (same as sort_values on the members)."""
+    has_time = valid[positions]
+    timed = positions[has_time]
+    timed = timed[np.argsort(ns[timed], kind="quicksort")]
+    return np.concatenate([timed, positions[~has_time]])
+
+
+def _pair_scorer(tracker):
+    """Batch pair scorer; falls back to per-pair calls for trackers without one."""
+    if hasattr(tracker, "pair_confidence_batch"):
+        return tracker.pair_confidence_batch
+
+    single = getattr(tracker, "get_pair_confidence", None) or tracker._pair_confidence
+
+    def score(parents, children) -> np.ndarray:
+        out = []
+        for p, c in zip(parents, children):
+            try:
+                out.append(float(single(p, c)))
+            except Exception:
+                out.append(0.0)
+        return np.asarray(out, dtype=float)
+
+    return score
+
+
 def _build_edges(
     tracker,
     tz: str = "Asia/Dubai",
@@ -94,107 +139,90 @@ def _build_edges(
 ) -> pd.DataFrame:
     rows: List[Dict] = []
     df = tracker.df
-
+    labels = df.index
+    ns, valid = _epoch_ns(df, assume_local_time)
+
+    # 1) candidate pairs: each child vs. up to lookback_k earlier members of its thread
+    children: List[Tuple[str, int, int, int]] = []  # (thread_id, child_pos, pair_start, pair_stop)
+    pair_parent: List[np.ndarray] = []
+    pair_child: List[np.ndarray] = []
+    n_pairs = 0
     for tid, meta in tracker.thread_meta.items():
         members = list(meta.members)
         if len(members) <= 1:
             continue
-
-        temp = df.loc[members].copy()
-        if assume_local_time:
-            temp["_dt"] = pd.to_datetime(temp.get("DeliveryTime", None), errors="coerce")
-        else:
-            temp["_dt"] = pd.to_datetime(temp.get("DeliveryTime", None), errors="coerce", utc=True)
-        temp = temp.sort_values(["_dt"], ascending=True)
-        ordered = list(temp.index)
-
+        ordered = _order_by_time(labels.get_indexer(members), ns, valid)
         for pos in range(1, len(ordered)):
-            child = ordered[pos]
-            if assume_local_time:
-                child_dt = pd.to_datetime(
-                    df.loc[child].get("DeliveryTime", None), errors="coerce"
-                )
-            else:
-                child_dt = pd.to_datetime(
-                    df.loc[child].get("DeliveryTime", None), errors="coerce", utc=True
-                )
-
-            start = max(0, pos - lookback_k)
-            candidates = ordered[start:pos]
-
-            best_parent = candidates[-1]
+            candidates = ordered[max(0, pos - lookback_k) : pos]
+            pair_parent.append(candidates)
+            pair_child.append(np.full(len(candidates), ordered[pos]))
+            children.append((tid, int(ordered[pos]), n_pairs, n_pairs + len(candidates)))
+            n_pairs += len(candidates)
+
+    if not children:
+        return pd.DataFrame(rows)
+
+    parents_all = np.concatenate(pair_parent)
+    children_all = np.concatenate(pair_child)
+
+    # 2) one batched scoring call + time-window mask for every candidate pair
+    conf_all = _pair_scorer(tracker)(labels[parents_all], labels[children_all])
+    both_timed = valid[parents_all] & valid[children_all]
+    gap_days = np.abs(np.floor_divide(ns[children_all] - ns[parents_all], NS_PER_DAY))
+    in_window = ~both_timed | (gap_days <= window_days)
+
+    no_values = df["no"].tolist() if "no" in df.columns else [""] * len(df)
+    subject_norm = (
+        df["_subject_norm"].tolist() if "_subject_norm" in df.columns else [""] * len(df)
+    )
+    raw_times = df["DeliveryTime"].tolist() if "DeliveryTime" in df.columns else [None] * len(df)
+    time_text: Dict[int, str] = {}
+
+    def delivery_text(position: int) -> str:
+        if position not in time_text:
+            time_text[position] = _safe_tz_convert(
+                pd.to_datetime(raw_times[position], errors="coerce", utc=not assume_local_time),
+                tz,
+                assume_local=assume_local_time,
+            )
+        return time_text[position]
+
+    # 3) best parent per child: highest confidence in window, earliest on ties
+    for tid, child, start, stop in children:
+        eligible = np.flatnonzero(in_window[start:stop])
+        last = stop - 1
+        if len(eligible):
+            confs = conf_all[start:stop][eligible]
+            best = start + eligible[int(np.argmax(confs))]
+            best_conf = float(conf_all[best])
+        else:
+            best = last
             best_conf = 0.0
 
-            for p in reversed(candidates):
-                if assume_local_time:
-                    p_dt = pd.to_datetime(
-                        df.loc[p].get("DeliveryTime", None), errors="coerce"
-                    )
-                else:
-                    p_dt = pd.to_datetime(
-                        df.loc[p].get("DeliveryTime", None), errors="coerce", utc=True
-                    )
-                if pd.notna(child_dt) and pd.notna(p_dt):
-                    if abs((child_dt - p_dt).days) > window_days:
-                        continue
-
-                try:
-                    if hasattr(tracker, "get_pair_confidence"):
-                        conf = float(tracker.get_pair_confidence(p, child))
-                    else:
-                        conf = float(tracker._pair_confidence(p, child))
-                except Exception:
-                    conf = 0.0
-
-                if conf >= best_conf:
-                    best_conf = conf
-                    best_parent = p
-
-            below_threshold = best_conf < parent_min_conf
-            if below_threshold:
-                best_parent = candidates[-1]
-                try:
-                    if hasattr(tracker, "get_pair_confidence"):
-                        best_conf = float(tracker.get_pair_confidence(best_parent, child))
-                    else:
-                        best_conf = float(tracker._pair_confidence(best_parent, child))
-                except Exception:
-                    best_conf = 0.0
-            if filter_below_threshold and below_threshold:
-                continue
-
-            rows.append(
-                {
-                    "thread_id": tid,
-                    "relation_type": "heuristic",
-                    "confidence": round(best_conf, 2),
-                    "parent_row": int(best_parent),
-                    "child_row": int(child),
-                    "parent_no": str(df.loc[best_parent].get("no", "")),
-                    "child_no": str(df.loc[child].get("no", "")),
-                    "parent_delivery_time": _safe_tz_convert(
-                        pd.to_datetime(
-                            df.loc[best_parent].get("DeliveryTime", None),
-                            errors="coerce",
-                            utc=not assume_local_time,
-                        ),
-                        tz,
-                        assume_local=assume_local_time,
-                    ),
-                    "child_delivery_time": _safe_tz_convert(
-                        pd.to_datetime(
-                            df.loc[child].get("DeliveryTime", None),
-                            errors="coerce",
-                            utc=not assume_local_time,
-                        ),
-                        tz,
-                        assume_local=assume_local_time,
-                    ),
-                    "subject_norm": str(df.loc[child].get("_subject_norm", "")),
-                }
-            )
-            if flag_below_threshold:
-                rows[-1]["below_threshold"] = below_threshold
+        below_threshold = best_conf < parent_min_conf
+        if below_threshold:
+            best = last
+            best_conf = float(conf_all[last])
+        if filter_below_threshold and below_threshold:
+            continue
+
+        best_parent = int(parents_all[best])
+        rows.append(
+            {
+                "thread_id": tid,
+                "relation_type": "heuristic",
+                "confidence": round(best_conf, 2),
+                "parent_row": int(labels[best_parent]),
+                "child_row": int(labels[child]),
+                "parent_no": str(no_values[best_parent]),
+                "child_no": str(no_values[child]),
+                "parent_delivery_time": delivery_text(best_parent),
+                "child_delivery_time": delivery_text(child),
+                "subject_norm": str(subject_norm[child]),
+            }
+        )
+        if flag_below_threshold:
+            rows[-1]["below_threshold"] = below_threshold
 
     return pd.DataFrame(rows)
 
@@ -27,6 +27,8 @@ import difflib
 import re
 import pandas as pd
 
+from aqs_text_index import TextIndex
+
 
 # Windows console encoding safety
 if sys.platform == "win32":
@@ -467,6 +469,8 @@ class OutlookAqsSearcher:
         sheet: Optional[str] = None,
         auto_normalize: bool = True,
         config_path: Optional[str] = None,
+        use_index: bool = True,
+        df: Optional[pd.DataFrame] = None,
     ):
         self.excel_path = Path(excel_path)
         self.sheet = sheet
@@ -477,16 +481,22 @@ class OutlookAqsSearcher:
         self.alias_source_map: Dict[str, str] = {}
         self.custom_aliases_used: Optional[Dict[str, List[str]]] = None
         self.config_path: Optional[str] = config_path
+        self.text_index: Optional[TextIndex] = None
 
         if not self.excel_path.exists():
             raise FileNotFoundError(f"Excel file not found: {self.excel_path}")
 
-        excel_file = pd.ExcelFile(self.excel_path)
-        sheet_name = sheet or excel_file.sheet_names[0]
-        if sheet_name not in excel_file.sheet_names:
-            raise ValueError(f"Sheet not found: {sheet_name}")
+        if df is not None and sheet:
+            # already-loaded sheet (e.g. the dashboard's shared cache)
+            sheet_name = sheet
+            self.df = df
+        else:
+            excel_file = pd.ExcelFile(self.excel_path)
+            sheet_name = sheet or excel_file.sheet_names[0]
+            if sheet_name not in excel_file.sheet_names:
+                raise ValueError(f"Sheet not found: {sheet_name}")
 
-        self.df = pd.read_excel(excel_file, sheet_name=sheet_name)
+            self.df = pd.read_excel(excel_file, sheet_name=sheet_name)
         custom_aliases = None
         if config_path:
             custom_aliases = SchemaValidator.load_custom_aliases(
@@ -500,6 +510,8 @@ class OutlookAqsSearcher:
 
         if auto_normalize:
             self.df_normalized = EmailNormalizer.create_normalized_columns(self.df, self.schema)
+            if use_index:
+                self._init_text_index(sheet_name)
 
         # Load synonyms
         self.synonyms = {}
@@ -545,6 +557,27 @@ class OutlookAqsSearcher:
                 else:
                     self.alias_source_map[canonical] = "built-in"
 
+    def _init_text_index(self, sheet_name: str) -> None:
+        """Token index over the normalized columns, persisted in <excel>.aqs_index/<sheet>/."""
+        signature = TextIndex.make_signature(
+            self.excel_path, sheet_name, self.schema.mapping, len(self.df_normalized)
+        )
+        safe_sheet = re.sub(r"[^\w.-]+", "_", sheet_name)
+        cache_dir = self.excel_path.with_name(f"{self.excel_path.name}.aqs_index") / safe_sheet
+        self.text_index = TextIndex(self.df_normalized, cache_dir, signature)
+        if "__blob_lc" in self.df_normalized:
+            self.text_index.column("__blob_lc")
+        for warning in self.text_index.warnings:
+            print(f"Warning: {warning}")
+
+    def _column_contains(self, column: str, value: str, fuzzy: bool = False) -> pd.Series:
+        if self.text_index is None:
+            return self._apply_text_search(self.df_normalized[column], value, fuzzy=fuzzy)
+        if fuzzy:
+            # vocabulary-level fuzzy expansion, then the posting lists
+            return self.text_index.fuzzy_contains(column, value.lower(), cutoff=0.8)
+        return self.text_index.contains(column, value.lower())
+
     def _apply_text_search(self, series: pd.Series, value: str, fuzzy: bool = False) -> pd.Series:
         val_lower = value.lower()
         if not fuzzy:
@@ -576,7 +609,7 @@ class OutlookAqsSearcher:
             if blob is None:
                 warnings.append("No searchable text columns found.")
                 return pd.Series([False] * len(self.df_normalized))
-            return self._apply_text_search(blob, token["value"], fuzzy=fuzzy)
+            return self._column_contains("__blob_lc", token["value"], fuzzy=fuzzy)
 
         if token["kind"] == "field":
             field = token["field"]
@@ -584,7 +617,7 @@ class OutlookAqsSearcher:
             if not column or column not in self.df_normalized:
                 warnings.append(f"Missing column for field '{field}'.")
                 return pd.Series([False] * len(self.df_normalized))
-            return self._apply_text_search(self.df_normalized[column], token["value"], fuzzy=fuzzy)
+            return self._column_contains(column, token["value"], fuzzy=fuzzy)
 
         if token["kind"] == "flag":
             field = token["field"]
@@ -694,6 +727,19 @@ class OutlookAqsSearcher:
                     scoring_terms.add(s.lower())
         
         scores = pd.Series(0.0, index=df.index)
+
+        # Rows of df inside the indexed frame -> contains() via the token index
+        positions = None
+        if self.text_index is not None and self.df_normalized is not None:
+            positions = self.df_normalized.index.get_indexer(df.index)
+            if (positions < 0).any() or not self.df_normalized.index.is_unique:
+                positions = None
+
+        def contains(column: str, term: str) -> pd.Series:
+            if positions is None:
+                return df[column].str.contains(term, regex=False, na=False)
+            mask = self.text_index.contains(column, term).to_numpy()
+            return pd.Series(mask[positions], index=df.index)
         
         # Weights
         W_SUBJECT_EXACT = 20.0
@@ -724,17 +770,17 @@ class OutlookAqsSearcher:
                 scores[mask_exact] += W_SUBJECT_EXACT * term_weight_mult
                 
                 # Contains
-                mask = df["__subject_lc"].str.contains(re.escape(term), regex=True, na=False)
+                mask = contains("__subject_lc", term)
                 scores[mask] += W_SUBJECT * term_weight_mult
             
             # Sender
             if "__from_lc" in df.columns:
-                mask = df["__from_lc"].str.contains(re.escape(term), regex=True, na=False)
+                mask = contains("__from_lc", term)
                 scores[mask] += W_SENDER * term_weight_mult
                 
             # Body
             if "__body_lc" in df.columns:
-                mask = df["__body_lc"].str.contains(re.escape(term), regex=True, na=False)
+                mask = contains("__body_lc", term)
                 scores[mask] += W_BODY * term_weight_mult
                 
         df = df.copy()
@@ -855,12 +901,17 @@ def main() -> int:
         "--query", "-q", required=True, help="AQS query (supports parentheses and NOT)"
     )
     parser.add_argument("--max-results", "-n", type=int, default=50, help="Max results (default: 50)")
-    parser.add_argument("--fuzzy", action="store_true", help="Enable fuzzy matching (slower)")
+    parser.add_argument("--fuzzy", action="store_true", help="Enable fuzzy matching (typo tolerance)")
     parser.add_argument("--show-body", action="store_true", help="Show body preview")
     parser.add_argument("--export", help="Export results (.xlsx or .csv)")
     parser.add_argument("--schema-report", help="Write schema report JSON with resolved aliases")
     parser.add_argument("--report", help="Write run report JSON")
     parser.add_argument("--config", help="Path to column aliases config JSON file")
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Scan columns with str.contains instead of the persisted token index",
+    )
     parser.add_argument(
         "--auto-schema",
         action="store_true",
@@ -875,6 +926,7 @@ def main() -> int:
         sheet=args.sheet,
         auto_normalize=True,
         config_path=args.config,
+        use_index=not args.no_index,
     )
 
     if args.auto_schema:
@@ -7,11 +7,12 @@ Thread tracker v3 (Excel-only, heuristic).
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 import re
 import difflib
 
+import numpy as np
 import pandas as pd
 
 
@@ -35,6 +36,15 @@ LPO_PATTERN = re.compile(r"\bLPO[-_ ]?\d+\b", re.IGNORECASE)
 
 BLOCKED_SUBJECTS = {"", "RE", "FW", "FWD", "RECALL", "REMINDER"}
 
+PAIR_ENTITY_COLUMNS = [
+    "case_numbers", "hvdc_cases", "_entity_cases",
+    "site", "sites", "_entity_sites",
+    "lpo", "lpo_numbers", "_entity_lpos",
+]
+PAIR_WEIGHTS = (0.45, 0.25, 0.15, 0.15)  # subject, entity, time, reply
+PAIR_TIME_WINDOW_DAYS = 14
+NS_PER_DAY = 86_400 * 10**9
+
 
 def _clean_text(value: Optional[str]) -> str:
     if value is None or pd.isna(value):
@@ -130,6 +140,183 @@ def extract_entities(text: Optional[str]) -> Dict[str, List[str]]:
     return entities
 
 
+def to_epoch_ns(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Datetime series -> (int64 epoch ns, valid mask); NaT -> (0, False)."""
+    if getattr(values.dt, "tz", None) is not None:
+        values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+    valid = values.notna().to_numpy()
+    ns = values.to_numpy(dtype="datetime64[ns]").view("int64").copy()
+    ns[~valid] = 0
+    return ns, valid
+
+
+def floor_day_gap(a_ns: np.ndarray, b_ns: np.ndarray) -> np.ndarray:
+    """abs((a - b).days) with Timedelta.days floor semantics."""
+    return np.abs(np.floor_divide(a_ns - b_ns, NS_PER_DAY))
+
+
+def _column_text(df: pd.DataFrame, col: str) -> pd.Series:
+    """str(value) per row, like str(row.get(col, "")) in the row-wise code."""
+    if col not in df.columns:
+        return pd.Series([""] * len(df), index=df.index, dtype=object)
+    return df[col].astype(object).map(str)
+
+
+def _parse_delivery(df: pd.DataFrame) -> pd.Series:
+    if "DeliveryTime" not in df.columns:
+        return pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    try:
+        return pd.to_datetime(df["DeliveryTime"], errors="coerce")
+    except (TypeError, ValueError):
+        # mixed naive/aware values: compare on the UTC timeline
+        return pd.to_datetime(df["DeliveryTime"], errors="coerce", utc=True)
+
+
+@dataclass
+class PairFeatures:
+    """
+    Per-row features for pair confidence, aligned to row positions.
+
+    Built once per tracker so scoring candidate pairs never touches the
+    DataFrame: subjects and entity sets are interned to integer ids and
+    the expensive comparisons (difflib ratio, Jaccard) are memoized per
+    distinct id pair.
+    """
+
+    delivery_ns: np.ndarray
+    has_time: np.ndarray
+    subject_id: np.ndarray  # -1 = empty subject
+    subjects: List[str]
+    entity_id: np.ndarray  # -1 = no entities
+    entity_sets: List[FrozenSet[int]]
+    reply_hint: np.ndarray
+    _subject_sim: Dict[Tuple[int, int], float] = field(default_factory=dict, repr=False)
+    _entity_sim: Dict[Tuple[int, int], float] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "PairFeatures":
+        n = len(df)
+        delivery_ns, has_time = to_epoch_ns(_parse_delivery(df))
+
+        subject_norm = _column_text(df, "_subject_norm").str.upper()
+        subject_id, subjects = pd.factorize(subject_norm)
+        subject_id = subject_id.astype(np.int64)
+        subject_id[(subject_norm == "").to_numpy()] = -1
+
+        # entity tokens per row (same split as the row-wise scorer), interned to ids
+        entity_columns = [
+            _column_text(df, col).str.upper().tolist()
+            for col in PAIR_ENTITY_COLUMNS
+            if col in df.columns
+        ]
+        token_ids: Dict[str, int] = {}
+        row_sets: List[FrozenSet[int]] = []
+        for values in (zip(*entity_columns) if entity_columns else [()] * n):
+            tokens = {
+                token_ids.setdefault(x, len(token_ids))
+                for value in values
+                for x in (part.strip() for part in value.split(","))
+                if x
+            }
+            row_sets.append(frozenset(tokens))
+        set_ids: Dict[FrozenSet[int], int] = {}
+        entity_id = np.fromiter(
+            (set_ids.setdefault(ents, len(set_ids)) if ents else -1 for ents in row_sets),
+            dtype=np.int64,
+            count=n,
+        )
+        entity_sets = list(set_ids)
+
+        orig_subject = _column_text(df, "Subject").str.upper()
+        body = _column_text(df, "PlainTextBody")
+        reply_hint = (
+            orig_subject.str.startswith("RE:")
+            | orig_subject.str.startswith("FW:")
+            | body.str.contains("From:", regex=False)
+            | body.str.contains("Sent:", regex=False)
+        ).to_numpy(dtype=bool)
+
+        return cls(
+            delivery_ns=delivery_ns,
+            has_time=has_time,
+            subject_id=subject_id,
+            subjects=[str(x) for x in subjects],
+            entity_id=entity_id,
+            entity_sets=entity_sets,
+            reply_hint=reply_hint,
+        )
+
+    def _memo_sim(
+        self,
+        left: np.ndarray,
+        right: np.ndarray,
+        cache: Dict[Tuple[int, int], float],
+        compute_many,
+    ) -> np.ndarray:
+        """Similarity for id pairs: 1.0 on equal ids, 0.0 if either is -1, memoized otherwise."""
+        out = np.zeros(len(left), dtype=float)
+        both = (left >= 0) & (right >= 0)
+        out[both & (left == right)] = 1.0
+        todo = np.flatnonzero(both & (left != right))
+        if len(todo):
+            width = max(int(left.max()), int(right.max())) + 1
+            codes, inverse = np.unique(left[todo] * width + right[todo], return_inverse=True)
+            keys = [divmod(code, width) for code in codes.tolist()]
+            missing = [key for key in keys if key not in cache]
+            if missing:
+                cache.update(compute_many(missing))
+            values = np.fromiter((cache[key] for key in keys), dtype=float, count=len(keys))
+            out[todo] = values[inverse]
+        return out
+
+    def _subject_ratios(self, keys: List[Tuple[int, int]]) -> Dict[Tuple[int, int], float]:
+        # SequenceMatcher caches its index on seq2 -> set it once per right-hand subject
+        matcher = difflib.SequenceMatcher(None)
+        result: Dict[Tuple[int, int], float] = {}
+        current = None
+        for a, b in sorted(keys, key=lambda key: key[1]):
+            if b != current:
+                matcher.set_seq2(self.subjects[b])
+                current = b
+            matcher.set_seq1(self.subjects[a])
+            result[(a, b)] = matcher.ratio()
+        return result
+
+    def _entity_jaccards(self, keys: List[Tuple[int, int]]) -> Dict[Tuple[int, int], float]:
+        result: Dict[Tuple[int, int], float] = {}
+        for a, b in keys:
+            ents1, ents2 = self.entity_sets[a], self.entity_sets[b]
+            result[(a, b)] = len(ents1 & ents2) / len(ents1 | ents2)
+        return result
+
+    def score(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """Pair confidence for row positions left[k] vs right[k]."""
+        left = np.asarray(left, dtype=np.int64)
+        right = np.asarray(right, dtype=np.int64)
+
+        # 1. Subject similarity (exact match = 1.0, otherwise difflib ratio)
+        sim_subject = self._memo_sim(
+            self.subject_id[left], self.subject_id[right], self._subject_sim, self._subject_ratios
+        )
+        # 2. Entity overlap (Jaccard)
+        sim_entity = self._memo_sim(
+            self.entity_id[left], self.entity_id[right], self._entity_sim, self._entity_jaccards
+        )
+        # 3. Time decay over PAIR_TIME_WINDOW_DAYS
+        days = floor_day_gap(self.delivery_ns[left], self.delivery_ns[right])
+        in_window = self.has_time[left] & self.has_time[right] & (days <= PAIR_TIME_WINDOW_DAYS)
+        time_decay = np.where(in_window, 1.0 - days / float(PAIR_TIME_WINDOW_DAYS), 0.0)
+        # 4. Reply hint (RE/FW prefix or quoted header on either side)
+        hint_reply = (self.reply_hint[left] | self.reply_hint[right]).astype(float)
+
+        W_S, W_E, W_T, W_R = PAIR_WEIGHTS
+        score = (W_S * sim_subject) + (W_E * sim_entity) + (W_T * time_decay) + (W_R * hint_reply)
+        # python round() per value (np.round rounds some halves differently)
+        return np.fromiter(
+            (round(x, 4) for x in np.minimum(score, 1.0).tolist()), dtype=float, count=len(score)
+        )
+
+
 @dataclass
 class ThreadMeta:
     members: Set[int]
@@ -151,6 +338,7 @@ class EmailThreadTrackerV3:
         self.by_site: Dict[str, Set[int]] = defaultdict(set)
         self.by_lpo: Dict[str, Set[int]] = defaultdict(set)
         self._build_derived_fields()
+        self.features = PairFeatures.from_frame(self.df)
         self._build_indexes()
         self._build_threads()
 
@@ -365,84 +553,24 @@ class EmailThreadTrackerV3:
         if len(members) <= 1:
             return 0.0
         base = members[0]
-        scores = [self._pair_confidence(base, other) for other in members[1:]]
+        scores = self.pair_confidence_batch([base] * (len(members) - 1), members[1:]).tolist()
         return round(sum(scores) / max(len(scores), 1), 4)
 
     def _pair_confidence(self, i: int, j: int) -> float:
-        row1 = self.df.loc[i]
-        row2 = self.df.loc[j]
-
-        # 1. Subject Similarity (Weight: 0.45)
-        subj1 = str(row1.get("_subject_norm", "")).upper()
-        subj2 = str(row2.get("_subject_norm", "")).upper()
-        
-        sim_subject = 0.0
-        if subj1 and subj2:
-            # Use difflib for similarity ratio (0.0 to 1.0)
-            sim_subject = difflib.SequenceMatcher(None, subj1, subj2).ratio()
-            # Boost exact match slightly to handle short subjects better
-            if subj1 == subj2:
-                sim_subject = 1.0
-        
-        # 2. Entity Overlap (Weight: 0.25)
-        # Collect entities from both rows
-        ents1 = set()
-        ents2 = set()
-        
-        for col in ["case_numbers", "hvdc_cases", "_entity_cases", "site", "sites", "_entity_sites", "lpo", "lpo_numbers", "_entity_lpos"]:
-            v1 = str(row1.get(col, "")).upper()
-            v2 = str(row2.get(col, "")).upper()
-            if v1: ents1.update([x.strip() for x in v1.split(",") if x.strip()])
-            if v2: ents2.update([x.strip() for x in v2.split(",") if x.strip()])
-            
-        sim_entity = 0.0
-        if ents1 and ents2:
-            intersection = len(ents1.intersection(ents2))
-            union = len(ents1.union(ents2))
-            if union > 0:
-                sim_entity = intersection / union
-
-        # 3. Time Decay (Weight: 0.15)
-        time_decay = 0.0
-        try:
-            dt1 = pd.to_datetime(row1.get("DeliveryTime"))
-            dt2 = pd.to_datetime(row2.get("DeliveryTime"))
-            if pd.notna(dt1) and pd.notna(dt2):
-                days_diff = abs((dt1 - dt2).days)
-                if days_diff <= 14:
-                    time_decay = 1.0 - (days_diff / 14.0)
-                else:
-                    time_decay = 0.0
-        except Exception:
-            pass
-
-        # 4. Reply Hint (Weight: 0.15)
-        hint_reply = 0.0
-        # Check for RE/FW prefixes in original subject (before normalization)
-        orig_subj1 = str(row1.get("Subject", "")).upper()
-        orig_subj2 = str(row2.get("Subject", "")).upper()
-        
-        has_prefix = (
-            orig_subj1.startswith("RE:") or orig_subj1.startswith("FW:") or
-            orig_subj2.startswith("RE:") or orig_subj2.startswith("FW:")
-        )
-        
-        # Check for In-Reply-To patterns in body (simple heuristic)
-        # e.g., "From: ... Sent: ..." block
-        body1 = str(row1.get("PlainTextBody", ""))
-        body2 = str(row2.get("PlainTextBody", ""))
-        has_quote = "From:" in body1 or "From:" in body2 or "Sent:" in body1 or "Sent:" in body2
-        
-        if has_prefix or has_quote:
-            hint_reply = 1.0
-
-        # Calculate Total Score
-        # Weights: Subject(0.45) + Entity(0.25) + Time(0.15) + Reply(0.15)
-        W_S, W_E, W_T, W_R = 0.45, 0.25, 0.15, 0.15
-        
-        score = (W_S * sim_subject) + (W_E * sim_entity) + (W_T * time_decay) + (W_R * hint_reply)
-        
-        return round(min(score, 1.0), 4)
+        return float(self.pair_confidence_batch([i], [j])[0])
+
+    def pair_confidence_batch(self, parents: Sequence[int], children: Sequence[int]) -> np.ndarray:
+        """
+        Confidence for many (parent, child) row labels at once.
+
+        Score = 0.45 subject similarity + 0.25 entity Jaccard
+              + 0.15 time decay (14 days) + 0.15 reply hint, capped at 1.0.
+        """
+        left = self.df.index.get_indexer(parents)
+        right = self.df.index.get_indexer(children)
+        if (left < 0).any() or (right < 0).any():
+            raise KeyError("unknown row label in pair_confidence_batch")
+        return self.features.score(left, right)
 
     def get_pair_confidence(self, i: int, j: int) -> float:
         return self._pair_confidence(i, j)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark DOCX→PDF throughput: one soffice process per file vs. SofficePool sizes.
+
+    python benchmarks/bench_soffice_pool.py --files 40 --sizes 1 2 4 8
+    python benchmarks/bench_soffice_pool.py --input ./docx_samples --sizes 2 4
+
+Without --input, N synthetic documents (headings, paragraphs, a table) are
+generated with python-docx. Prints files/min per configuration.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mrconvert import bidirectional  # noqa: E402
+from mrconvert.soffice_pool import SofficePool, find_soffice  # noqa: E402
+
+
+def make_docs(folder: Path, n: int) -> List[Path]:
+    from docx import Document  # python-docx
+
+    paths = []
+    for i in range(n):
+        doc = Document()
+        doc.add_heading(f"Voyage report {i}", level=1)
+        for p in range(20):
+            doc.add_paragraph(f"Paragraph {p}: cargo lashing and ballast status for leg {i}. " * 4)
+        table = doc.add_table(rows=10, cols=4)
+        for r, row in enumerate(table.rows):
+            for c, cell in enumerate(row.cells):
+                cell.text = f"{r}.{c}"
+        path = folder / f"report_{i:03d}.docx"
+        doc.save(str(path))
+        paths.append(path)
+    return paths
+
+
+def bench_oneshot(docs: List[Path], out_dir: Path) -> float:
+    t0 = time.perf_counter()
+    for src in docs:
+        bidirectional.docx_to_pdf(src, out_dir / f"{src.stem}.pdf")
+    return time.perf_counter() - t0
+
+
+def bench_pool(docs: List[Path], out_dir: Path, size: int) -> float:
+    t0 = time.perf_counter()
+    with SofficePool(size=size) as pool:
+        for src, result in pool.convert_many((d, out_dir / f"{d.stem}.pdf") for d in docs):
+            if isinstance(result, Exception):
+                print(f"  ! {src.name}: {result}")
+    return time.perf_counter() - t0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--input", help="Folder of .docx files (default: generate --files documents)")
+    ap.add_argument("--files", type=int, default=20)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--skip-oneshot", action="store_true", help="Do not run the per-file soffice baseline")
+    args = ap.parse_args()
+
+    if find_soffice() is None:
+        print("LibreOffice (soffice) not found in PATH.")
+        return 1
+
+    with tempfile.TemporaryDirectory(prefix="bench-soffice-") as tmp:
+        tmp_dir = Path(tmp)
+        if args.input:
+            docs = sorted(Path(args.input).glob("*.docx"))
+        else:
+            docs = make_docs(tmp_dir, args.files)
+        print(f"{len(docs)} documents, {os.cpu_count()} CPUs\n")
+        print(f"{'mode':<16}{'seconds':>10}{'files/min':>12}")
+
+        runs = [] if args.skip_oneshot else [("oneshot", None)]
+        runs += [(f"pool x{size}", size) for size in args.sizes]
+        for label, size in runs:
+            out_dir = tmp_dir / f"out-{label.replace(' ', '')}"
+            out_dir.mkdir()
+            if size is None:
+                seconds = bench_oneshot(docs, out_dir)
+            else:
+                seconds = bench_pool(docs, out_dir, size)
+            print(f"{label:<16}{seconds:>10.1f}{len(docs) / seconds * 60:>12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
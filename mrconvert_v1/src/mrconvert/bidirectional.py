@@ -4,7 +4,7 @@ import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .types import (
     ConversionResult,
@@ -13,6 +13,9 @@ from .types import (
     EngineNotFoundError,
 )
 
+if TYPE_CHECKING:
+    from .soffice_pool import SofficePool
+
 
 def convert_file(
     in_path: str | Path,
@@ -62,8 +65,11 @@ def pdf_to_docx(src: Path, dst: Path) -> ConversionResult:
     return ConversionResult(src, dst, "pdf2docx")
 
 
-def docx_to_pdf(src: Path, dst: Path) -> ConversionResult:
-    """Convert DOCX to PDF using docx2pdf (Windows/macOS) or soffice (Linux)"""
+def docx_to_pdf(src: Path, dst: Path, pool: SofficePool | None = None) -> ConversionResult:
+    """Convert DOCX to PDF using docx2pdf (Windows/macOS) or soffice (Linux).
+
+    pool: 배치 변환 시 상주 LibreOffice 워커 풀 (soffice_pool.SofficePool)
+    """
     # 1) Word가 있는 Windows/macOS면 docx2pdf 우선
     try:
         from docx2pdf import convert as d2p_convert  # type: ignore
@@ -77,7 +83,11 @@ def docx_to_pdf(src: Path, dst: Path) -> ConversionResult:
         # Linux 등 환경에선 예외가 날 수 있음 → 폴백
         pass
 
-    # 2) 리눅스/서버 폴백: LibreOffice 'soffice'
+    # 2) 배치: 상주 LibreOffice 풀 (프로필 분리, 헬스체크/재시작)
+    if pool is not None:
+        return pool.convert(src, dst)
+
+    # 3) 리눅스/서버 폴백: LibreOffice 'soffice'
     soffice = shutil.which("soffice") or shutil.which("libreoffice")
     if not soffice:
         raise EngineNotFoundError(
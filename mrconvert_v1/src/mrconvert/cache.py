@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .utils import slugify
+
+# Bump when the stored layout or the conversion output changes
+CACHE_SCHEMA = 1
+DEFAULT_CACHE_DIRNAME = ".mrconvert_cache"
+OCR_CACHE_DIRNAME = "ocr"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+try:
+    CONVERTER_VERSION = metadata.version("mrconvert")
+except metadata.PackageNotFoundError:  # running from a source checkout
+    CONVERTER_VERSION = "0"
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def output_template(name: str, stem: str) -> str:
+    """Output file name with the input stem replaced by {slug}/{stem} (see utils.write_text)."""
+    slug = slugify(stem)
+    if name.startswith(slug + "."):
+        return "{slug}" + name[len(slug):]
+    if name.startswith(stem + "."):
+        return "{stem}" + name[len(stem):]
+    return name
+
+
+def render_template(template: str, stem: str) -> str:
+    if template.startswith("{slug}"):
+        return slugify(stem) + template[len("{slug}"):]
+    if template.startswith("{stem}"):
+        return stem + template[len("{stem}"):]
+    return template
+
+
+class ConversionCache:
+    """
+    Content-addressed store of conversion outputs.
+
+    Key = SHA-256 of the input bytes + converter version + conversion options.
+    Each entry keeps the files one conversion produced (extraction JSON, TXT/MD,
+    table CSVs, DOCX/PDF, ...) under objects/<key[:2]>/<key>/, with names stored
+    as templates so an identical file under another name reuses the entry.
+    Outputs are restored by hard link (copy across filesystems).
+
+    manifest.json holds the entries (files, size, last use) and a
+    path -> (size, mtime_ns, sha256) memo so unchanged inputs are not re-hashed.
+    The least recently used entries, together with the page OCR texts under
+    ocr/ (see PageOCRCache; last use = file mtime), are evicted above max_bytes.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.manifest_path = cache_dir / "manifest.json"
+        self.manifest: Dict[str, Any] = {"schema": CACHE_SCHEMA, "entries": {}, "inputs": {}}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            if data.get("schema") == CACHE_SCHEMA:
+                self.manifest = data
+        except (OSError, ValueError):
+            pass
+
+    # ----- keys -----
+
+    def input_hash(self, path: Path) -> str:
+        stat = path.stat()
+        memo_key = str(path.resolve())
+        memo = self.manifest["inputs"].get(memo_key)
+        if memo and memo[0] == stat.st_size and memo[1] == stat.st_mtime_ns:
+            return memo[2]
+        digest = file_sha256(path)
+        self.manifest["inputs"][memo_key] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def key(self, path: Path, options: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {
+                "schema": CACHE_SCHEMA,
+                "version": CONVERTER_VERSION,
+                "input": self.input_hash(path),
+                "suffix": path.suffix.lower(),
+                "options": options,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / "objects" / key[:2] / key
+
+    # ----- lookup / store -----
+
+    def restore(self, key: str, stem: str, out_dir: Path) -> Dict[str, Any] | None:
+        """Link the cached outputs of `key` into out_dir; returns the entry or None on a miss."""
+        entry = self.manifest["entries"].get(key)
+        entry_dir = self._entry_dir(key)
+        if entry is None or not all((entry_dir / str(i)).exists() for i in range(len(entry["files"]))):
+            if self.manifest["entries"].pop(key, None) is not None:
+                self._dirty = True
+            self.misses += 1
+            return None
+
+        for i, template in enumerate(entry["files"]):
+            _link(entry_dir / str(i), out_dir / render_template(template, stem))
+        entry["last_used"] = time.time()
+        self.hits += 1
+        self._dirty = True
+        return entry
+
+    def store(self, key: str, stem: str, outputs: Iterable[Path], **info: Any) -> None:
+        """Keep the outputs of one successful conversion (files are linked, not copied)."""
+        entry_dir = self._entry_dir(key)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        files: List[str] = []
+        size = 0
+        for i, output in enumerate(outputs):
+            _link(output, entry_dir / str(i))
+            files.append(output_template(output.name, stem))
+            size += output.stat().st_size
+        now = time.time()
+        self.manifest["entries"][key] = {
+            "files": files,
+            "size": size,
+            "created": now,
+            "last_used": now,
+            **info,
+        }
+        self._dirty = True
+
+    # ----- maintenance -----
+
+    def _ocr_files(self) -> List[Tuple[float, int, Path]]:
+        """(last use, size, path) of the page OCR texts under ocr/."""
+        files = []
+        try:
+            with os.scandir(self.cache_dir / OCR_CACHE_DIRNAME) as shards:
+                for shard in shards:
+                    if not shard.is_dir():
+                        continue
+                    with os.scandir(shard.path) as it:
+                        for entry in it:
+                            if entry.name.endswith(".txt"):
+                                stat = entry.stat()
+                                files.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        except OSError:
+            pass
+        return files
+
+    def evict(self) -> int:
+        """
+        Drop least recently used entries and OCR texts until the cache fits max_bytes;
+        returns the count.
+        """
+        entries = self.manifest["entries"]
+        items: List[Tuple[float, int, Any]] = [(e["last_used"], e["size"], key) for key, e in entries.items()]
+        items += self._ocr_files()
+        total = sum(size for _, size, _ in items)
+        removed = 0
+        for _, size, item in sorted(items, key=lambda x: x[0]):
+            if total <= self.max_bytes:
+                break
+            total -= size
+            if isinstance(item, Path):
+                item.unlink(missing_ok=True)
+            else:
+                shutil.rmtree(self._entry_dir(item), ignore_errors=True)
+                del entries[item]
+                self._dirty = True
+            removed += 1
+        return removed
+
+    def save(self) -> None:
+        """Evict and write the manifest (no-op when no entry was used or added)."""
+        self.evict()
+        if not self._dirty:
+            return
+        # forget inputs that no longer exist
+        inputs = self.manifest["inputs"]
+        for path in [p for p in inputs if not os.path.exists(p)]:
+            del inputs[path]
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.manifest, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.manifest_path)
+        self._dirty = False
+
+
+def _link(src: Path, dst: Path) -> None:
+    """Hard-link src to dst (skip when already the same file, copy across filesystems)."""
+    if dst.exists():
+        if os.path.samefile(src, dst):
+            return
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class PageOCRCache:
+    """
+    OCR text of rendered page images, keyed by SHA-256 of the pixels + size + language + dpi.
+
+    A scanned page seen before (re-run of a changed file, or a cover/form page shared
+    by many documents) is not OCRed again. Texts are kept in memory and, with
+    cache_dir, as <cache_dir>/<key[:2]>/<key>.txt so worker processes and later runs
+    share them. The file mtime marks the last use; ConversionCache.evict counts these
+    files toward --cache-max-mb and drops the least recently used ones.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir
+        self._memory: Dict[str, str] = {}
+
+    @staticmethod
+    def key(samples: bytes, width: int, height: int, lang: str | None, dpi: int) -> str:
+        digest = hashlib.sha256(samples)
+        digest.update(f"|{width}x{height}|{lang or ''}|{dpi}|{CACHE_SCHEMA}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> str | None:
+        if key in self._memory:
+            return self._memory[key]
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            os.utime(path)  # last use for eviction
+        except OSError:
+            pass
+        self._memory[key] = text
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        self._memory[key] = text
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(path)
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import os
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Callable, List
 
 from rich.console import Console
 from rich.progress import track
 
 from . import pdf_converter, docx_converter, bidirectional, markdown_to_docx, docx_to_msg, markdown_to_xlsx
-from .utils import ensure_dir, write_text, write_json, walk_inputs, OCRConfig
+from . import stream as streaming
+from .cache import ConversionCache, DEFAULT_CACHE_DIRNAME, OCR_CACHE_DIRNAME
+from .soffice_pool import SofficePool, default_pool_size, find_soffice
+from .utils import ensure_dir, write_text, write_json, write_table, walk_inputs, OCRConfig
 
 console = Console()
 
@@ -22,48 +30,86 @@ def _process_file(
     keep_layout: bool,
     ocr_mode: str,
     lang: str | None,
-):
+    jobs: int = 1,
+    ocr_cache_dir: Path | None = None,
+    stream: bool = False,
+) -> List[Path]:
+    """Extract one file into out_dir; returns the files written."""
+    if stream and path.suffix.lower() == ".pdf":
+        outputs, _ = streaming.stream_pdf(
+            path,
+            out_dir,
+            formats,
+            tables=tables,
+            keep_layout=keep_layout,
+            ocr=OCRConfig(mode=ocr_mode, lang=lang, cache_dir=ocr_cache_dir),
+        )
+        return outputs
     if path.suffix.lower() == ".pdf":
         data = pdf_converter.extract_pdf(
-            path, keep_layout=keep_layout, ocr=OCRConfig(mode=ocr_mode, lang=lang)
+            path,
+            keep_layout=keep_layout,
+            ocr=OCRConfig(mode=ocr_mode, lang=lang, cache_dir=ocr_cache_dir),
+            jobs=jobs,
         )
     elif path.suffix.lower() == ".docx":
         data = docx_converter.extract_docx(path)
     else:
         console.print(f"[yellow]Skip unsupported file:[/] {path}")
-        return
+        return []
 
     stem = path.stem
+    outputs: List[Path] = []
     # Write formats
     if "txt" in formats:
-        write_text(out_dir, stem, data.get("text") or "", "txt")
+        outputs.append(write_text(out_dir, stem, data.get("text") or "", "txt"))
     if "md" in formats:
         md = data.get("markdown")
         if md is None:
             # fallback to text if no markdown available (e.g., PDF)
             md = data.get("text") or ""
-        write_text(out_dir, stem, md, "md")
+        outputs.append(write_text(out_dir, stem, md, "md"))
     if "json" in formats:
-        write_json(out_dir, stem, data)
+        outputs.append(write_json(out_dir, stem, data))
 
     # Tables
     if tables in {"csv", "json"} and data.get("tables"):
-        import csv, json as _json
-
         for t in data["tables"]:
-            page = t.get("page")
-            idx = t.get("index")
-            rows = t.get("rows") or []
-            if tables == "csv":
-                csv_path = out_dir / f"{stem}.table-{page or 'NA'}-{idx or 0}.csv"
-                with csv_path.open("w", newline="", encoding="utf-8") as f:
-                    w = csv.writer(f)
-                    w.writerows(rows)
-            else:
-                json_path = out_dir / f"{stem}.table-{page or 'NA'}-{idx or 0}.json"
-                json_path.write_text(
-                    _json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8"
-                )
+            outputs.append(write_table(out_dir, stem, t, tables))
+    return outputs
+
+
+def _convert_staged(out_dir: Path, convert: Callable[[Path], object]) -> List[Path]:
+    """
+    Run convert(staging_dir), then move what it produced into out_dir.
+    Outputs replace (never overwrite in place) existing files, which may be
+    hard links into the conversion cache.
+    """
+    staging = Path(tempfile.mkdtemp(prefix=".mrconvert_staging-", dir=out_dir))
+    try:
+        convert(staging)
+        moved: List[Path] = []
+        for produced in sorted(staging.iterdir()):
+            dst = out_dir / produced.name
+            os.replace(produced, dst)
+            moved.append(dst)
+        return moved
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _open_cache(args, out_dir: Path) -> ConversionCache | None:
+    if args.no_cache:
+        return None
+    cache_dir = Path(args.cache_dir).expanduser().resolve() if args.cache_dir else out_dir / DEFAULT_CACHE_DIRNAME
+    return ConversionCache(cache_dir, max_bytes=args.cache_max_mb * 1024**2)
+
+
+def _close_cache(cache: ConversionCache | None) -> None:
+    if cache is None:
+        return
+    cache.save()
+    console.print(f"[dim]Cache: {cache.hits} reused, {cache.misses} converted ({cache.cache_dir})[/]")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -110,6 +156,19 @@ def build_parser() -> argparse.ArgumentParser:
     text_group.add_argument(
         "--lang", default=None, help="OCR language (e.g., 'kor+eng')"
     )
+    text_group.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker processes for PDF pages (default: 1, 0 = all CPUs)",
+    )
+    text_group.add_argument(
+        "--stream",
+        action="store_true",
+        help="Bounded-memory PDF extraction: write each page as it is read "
+        "(json output becomes .jsonl; --jobs is ignored)",
+    )
 
     # Bidirectional conversion mode (new)
     convert_group = p.add_argument_group("Bidirectional conversion mode")
@@ -125,6 +184,32 @@ def build_parser() -> argparse.ArgumentParser:
     convert_group.add_argument(
         "--to-xlsx", action="store_true", help="Convert MD to Excel XLSX format"
     )
+    convert_group.add_argument(
+        "--soffice-workers",
+        type=int,
+        default=None,
+        help="LibreOffice instances for batch --to-pdf on Linux "
+        "(default: min(4, CPUs); 0 = one soffice process per file)",
+    )
+
+    # Conversion cache (both modes)
+    cache_group = p.add_argument_group("Conversion cache")
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Convert every file, without reading or updating the cache",
+    )
+    cache_group.add_argument(
+        "--cache-dir",
+        default=None,
+        help=f"Cache directory (default: OUT_DIR/{DEFAULT_CACHE_DIRNAME}; same filesystem allows hard links)",
+    )
+    cache_group.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=2048,
+        help="Evict least recently used cache entries and OCR page texts above this size (default: 2048)",
+    )
 
     return p
 
@@ -160,64 +245,121 @@ def run(argv: list[str] | None = None) -> int:
 
     # Check if we're in bidirectional conversion mode
     if args.to_docx or args.to_pdf or args.to_msg or args.to_xlsx:
-        return _run_bidirectional_conversion(files, out_dir, args.to_docx, args.to_pdf, args.to_msg, args.to_xlsx)
+        return _run_bidirectional_conversion(
+            files,
+            out_dir,
+            args.to_docx,
+            args.to_pdf,
+            args.to_msg,
+            args.to_xlsx,
+            cache=_open_cache(args, out_dir),
+            soffice_workers=args.soffice_workers,
+        )
     else:
         return _run_text_extraction(files, out_dir, args)
 
 
+def _bidirectional_target(
+    f: Path, to_docx: bool, to_pdf: bool, to_msg: bool, to_xlsx: bool, pool: SofficePool | None = None
+):
+    """(output extension, converter) for a file in bidirectional mode, or None to skip."""
+    suffix = f.suffix.lower()
+    if to_docx and suffix == ".pdf":
+        return "docx", bidirectional.pdf_to_docx
+    if to_docx and suffix == ".md":
+        return "docx", markdown_to_docx.markdown_to_docx
+    if to_pdf and suffix == ".docx":
+        if pool is not None:
+            return "pdf", functools.partial(bidirectional.docx_to_pdf, pool=pool)
+        return "pdf", bidirectional.docx_to_pdf
+    if to_msg and suffix == ".md":
+        return "msg", docx_to_msg.markdown_to_msg
+    if to_msg and suffix == ".docx":
+        return "msg", docx_to_msg.docx_to_msg
+    if to_xlsx and suffix == ".md":
+        return "xlsx", markdown_to_xlsx.markdown_to_xlsx
+    return None
+
+
+def _open_soffice_pool(files: List[Path], to_pdf: bool, workers: int | None) -> SofficePool | None:
+    """LibreOffice worker pool for batch DOCX→PDF on Linux (Windows/macOS use docx2pdf)."""
+    if not to_pdf or workers == 0 or sys.platform in {"win32", "darwin"}:
+        return None
+    n_docx = sum(1 for f in files if f.suffix.lower() == ".docx")
+    if n_docx < 2 or find_soffice() is None:
+        return None
+    return SofficePool(size=min(workers or default_pool_size(), n_docx))
+
+
 def _run_bidirectional_conversion(
-    files: List[Path], out_dir: Path, to_docx: bool, to_pdf: bool, to_msg: bool, to_xlsx: bool
+    files: List[Path],
+    out_dir: Path,
+    to_docx: bool,
+    to_pdf: bool,
+    to_msg: bool,
+    to_xlsx: bool,
+    cache: ConversionCache | None = None,
+    soffice_workers: int | None = None,
 ) -> int:
     """Run bidirectional PDF↔DOCX conversion, MD→DOCX, MD/DOCX→MSG, or MD→XLSX"""
     console.print(
         f"[bold]mrconvert[/] · Bidirectional conversion · {len(files)} file(s) → {out_dir}"
     )
 
-    for f in track(files, description="Converting"):
-        try:
-            if to_docx and f.suffix.lower() == ".pdf":
-                dst = out_dir / f"{f.stem}.docx"
-                result = bidirectional.pdf_to_docx(f, dst)
-                console.print(
-                    f"[green][{result.engine}][/] {f.name} → {result.output.name}"
-                )
-            elif to_docx and f.suffix.lower() == ".md":
-                dst = out_dir / f"{f.stem}.docx"
-                result = markdown_to_docx.markdown_to_docx(f, dst)
-                console.print(
-                    f"[green][{result.engine}][/] {f.name} → {result.output.name}"
-                )
-            elif to_pdf and f.suffix.lower() == ".docx":
-                dst = out_dir / f"{f.stem}.pdf"
-                result = bidirectional.docx_to_pdf(f, dst)
-                console.print(
-                    f"[green][{result.engine}][/] {f.name} → {result.output.name}"
-                )
-            elif to_msg and f.suffix.lower() == ".md":
-                dst = out_dir / f"{f.stem}.msg"
-                result = docx_to_msg.markdown_to_msg(f, dst)
-                console.print(
-                    f"[green][{result.engine}][/] {f.name} → {result.output.name}"
-                )
-            elif to_msg and f.suffix.lower() == ".docx":
-                dst = out_dir / f"{f.stem}.msg"
-                result = docx_to_msg.docx_to_msg(f, dst)
-                console.print(
-                    f"[green][{result.engine}][/] {f.name} → {result.output.name}"
-                )
-            elif to_xlsx and f.suffix.lower() == ".md":
-                dst = out_dir / f"{f.stem}.xlsx"
-                result = markdown_to_xlsx.markdown_to_xlsx(f, dst)
-                console.print(
-                    f"[green][{result.engine}][/] {f.name} → {result.output.name}"
-                )
-            else:
-                console.print(
-                    f"[yellow]Skip:[/] {f.name} (wrong file type for conversion)"
-                )
-        except Exception as e:
-            console.print(f"[red]Error:[/] {f} — {e}")
+    pool = _open_soffice_pool(files, to_pdf, soffice_workers)
+    try:
+        # Pass 1: pick converters and serve cache hits
+        jobs = []  # (file, ext, converter, cache key)
+        for f in files:
+            try:
+                target = _bidirectional_target(f, to_docx, to_pdf, to_msg, to_xlsx, pool)
+                if target is None:
+                    console.print(
+                        f"[yellow]Skip:[/] {f.name} (wrong file type for conversion)"
+                    )
+                    continue
+                ext, convert = target
+                key = None
+                if cache is not None:
+                    key = cache.key(f, {"mode": "convert", "to": ext})
+                    entry = cache.restore(key, f.stem, out_dir)
+                    if entry is not None:
+                        console.print(f"[green][cache:{entry.get('engine')}][/] {f.name} → {f.stem}.{ext}")
+                        continue
+                jobs.append((f, ext, convert, key))
+            except Exception as e:
+                console.print(f"[red]Error:[/] {f} — {e}")
+
+        def run_job(job):
+            f, ext, convert, key = job
+            if cache is None:
+                return convert(f, out_dir / f"{f.stem}.{ext}"), []
+            results = []
+            outputs = _convert_staged(
+                out_dir, lambda d: results.append(convert(f, d / f"{f.stem}.{ext}"))
+            )
+            return results[0], outputs
+
+        # Pass 2: convert (queued across the LibreOffice pool when there is one)
+        workers = pool.size if pool is not None else 1
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {ex.submit(run_job, job): job for job in jobs}
+            for fut in track(as_completed(futures), total=len(futures), description="Converting"):
+                f, ext, _, key = futures[fut]
+                try:
+                    result, outputs = fut.result()
+                    if cache is not None and outputs:
+                        cache.store(key, f.stem, outputs, source=str(f), engine=result.engine)
+                    console.print(
+                        f"[green][{result.engine}][/] {f.name} → {result.output.name}"
+                    )
+                except Exception as e:
+                    console.print(f"[red]Error:[/] {f} — {e}")
+    finally:
+        if pool is not None:
+            pool.close()
 
+    _close_cache(cache)
     console.print("[green]Done.[/]")
     return 0
 
@@ -228,20 +370,45 @@ def _run_text_extraction(files: List[Path], out_dir: Path, args) -> int:
         f"[bold]mrconvert[/] · Text extraction · {len(files)} file(s) → {out_dir}"
     )
 
+    cache = _open_cache(args, out_dir)
+    options = {
+        "mode": "text",
+        "formats": sorted(args.formats),
+        "tables": args.tables,
+        "keep_layout": args.keep_layout,
+        "ocr": args.ocr,
+        "lang": args.lang,
+        "stream": args.stream,
+    }
+
     for f in track(files, description="Converting"):
         try:
-            _process_file(
-                f,
-                out_dir,
-                formats=args.formats,
-                tables=args.tables,
-                keep_layout=args.keep_layout,
-                ocr_mode=args.ocr,
-                lang=args.lang,
-            )
+            def convert(dst_dir: Path) -> List[Path]:
+                return _process_file(
+                    f,
+                    dst_dir,
+                    formats=args.formats,
+                    tables=args.tables,
+                    keep_layout=args.keep_layout,
+                    ocr_mode=args.ocr,
+                    lang=args.lang,
+                    jobs=args.jobs or os.cpu_count() or 1,
+                    ocr_cache_dir=cache.cache_dir / OCR_CACHE_DIRNAME if cache is not None else None,
+                    stream=args.stream,
+                )
+
+            if cache is None:
+                convert(out_dir)
+                continue
+            key = cache.key(f, options)
+            if cache.restore(key, f.stem, out_dir) is None:
+                outputs = _convert_staged(out_dir, convert)
+                if outputs:
+                    cache.store(key, f.stem, outputs, source=str(f))
         except Exception as e:
             console.print(f"[red]Error:[/] {f} — {e}")
 
+    _close_cache(cache)
     console.print("[green]Done.[/]")
     return 0
 
@@ -4,8 +4,12 @@ import io
 import os
 import shutil
 import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Set, Tuple
 
 import pdfplumber
 
@@ -21,8 +25,15 @@ except Exception:  # pragma: no cover
     pytesseract = None
     Image = None
 
+from .cache import PageOCRCache
 from .utils import OCRConfig, now_iso
 
+# Pages with fewer text-layer characters than this are OCR candidates
+OCR_MIN_CHARS = 8
+# ...and are OCRed when images cover at least this share of the page (or vector art is drawn)
+OCR_MIN_IMAGE_COVERAGE = 0.05
+OCR_DPI = 300
+
 
 def _ensure_tessdata_prefix() -> None:
     """Set TESSDATA_PREFIX to CONVERT/out/tessdata if unset and eng.traineddata exists."""
@@ -46,7 +57,56 @@ def _needs_ocr(text: str | None, force: bool) -> bool:
     if text is None:
         return True
     t = text.strip()
-    return len(t) < 8  # too little text → probably scanned
+    return len(t) < OCR_MIN_CHARS  # too little text → probably scanned
+
+
+@dataclass
+class PageProfile:
+    page: int  # 1-based
+    chars: int  # non-blank characters in the text layer
+    image_coverage: float  # share of the page area covered by images (0..1)
+    needs_ocr: bool
+
+
+def _image_coverage(page) -> float:
+    area = page.rect.width * page.rect.height
+    if area <= 0:
+        return 0.0
+    covered = 0.0
+    for info in page.get_image_info():
+        r = fitz.Rect(info["bbox"]) & page.rect
+        if not r.is_empty:
+            covered += r.width * r.height
+    return min(1.0, covered / area)
+
+
+def classify_pages(path: Path, force: bool = False) -> List[PageProfile]:
+    """
+    Decide per page, without rendering, whether OCR is needed (requires PyMuPDF).
+
+    A page is OCRed when its text layer has fewer than OCR_MIN_CHARS characters and
+    it shows something that may carry text: images covering OCR_MIN_IMAGE_COVERAGE
+    of the page, or vector drawings (outlined fonts). Blank pages are skipped.
+    """
+    profiles: List[PageProfile] = []
+    doc = fitz.open(str(path))
+    try:
+        for i, page in enumerate(doc, start=1):
+            chars = len("".join(page.get_text("text").split()))
+            coverage = _image_coverage(page)
+            if force:
+                needs = True
+            elif chars >= OCR_MIN_CHARS:
+                needs = False
+            elif coverage >= OCR_MIN_IMAGE_COVERAGE:
+                needs = True
+            else:
+                needs = bool(page.get_drawings())
+            profiles.append(PageProfile(i, chars, round(coverage, 4), needs))
+    finally:
+        doc.close()
+    return profiles
+
 
 def _ocr_with_ocrmypdf(pdf_path: Path, tmp_dir: Path, lang: str | None) -> Path | None:
     if shutil.which("ocrmypdf") is None:
@@ -62,98 +122,343 @@ def _ocr_with_ocrmypdf(pdf_path: Path, tmp_dir: Path, lang: str | None) -> Path
     except Exception:
         return None
 
-def _ocr_page_with_pymupdf(page, lang: str | None) -> str | None:
-    # Render page to image then OCR with pytesseract
+def _ocr_page_with_pymupdf(
+    page, lang: str | None, cache: PageOCRCache | None = None
+) -> Tuple[str | None, bool]:
+    """Render page to image then OCR with pytesseract; returns (text, served from cache)."""
     if (fitz is None) or (pytesseract is None) or (Image is None):
-        return None
+        return None, False
     _ensure_tessdata_prefix()
-    pix = page.to_pixmap(dpi=300)
+    pix = page.get_pixmap(dpi=OCR_DPI)
+    key = None
+    if cache is not None:
+        key = PageOCRCache.key(pix.samples, pix.width, pix.height, lang, OCR_DPI)
+        text = cache.get(key)
+        if text is not None:
+            return text, True
     img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
     conf = {}
     if lang:
         conf["lang"] = lang
     try:
-        return pytesseract.image_to_string(img, **conf)
+        text = pytesseract.image_to_string(img, **conf)
     except Exception:
-        return None
+        return None, False
+    if cache is not None:
+        cache.put(key, text)
+    return text, False
 
-def extract_pdf(path: Path, keep_layout: bool = False, ocr: OCRConfig | None = None) -> Dict[str, Any]:
-    ocr = ocr or OCRConfig()
-    meta: Dict[str, Any] = {
+
+def _ocr_pages(path: Path, pages: List[int], ocr: OCRConfig) -> Dict[int, Dict[str, Any]]:
+    """
+    OCR a batch of pages with one PyMuPDF handle and one page cache.
+    Returns {page: {"text", "seconds", "cached"}}.
+    """
+    results: Dict[int, Dict[str, Any]] = {}
+    if not pages or fitz is None or pytesseract is None:
+        return results
+    cache = PageOCRCache(ocr.cache_dir)
+    doc = fitz.open(str(path))
+    try:
+        for i in pages:
+            t0 = time.perf_counter()
+            try:
+                text, cached = _ocr_page_with_pymupdf(doc.load_page(i - 1), ocr.lang, cache)
+            except Exception:
+                text, cached = None, False
+            results[i] = {"text": text or "", "seconds": round(time.perf_counter() - t0, 3), "cached": cached}
+    finally:
+        doc.close()
+    return results
+
+
+# Smallest page shard worth sending to a worker process
+MIN_PAGES_PER_SHARD = 8
+# Shards per worker, so a slow (OCR-heavy) range does not leave other workers idle
+SHARDS_PER_JOB = 4
+
+
+def _page_ranges(n_pages: int, jobs: int) -> List[Tuple[int, int]]:
+    """Contiguous 1-based [start, stop) page ranges for `jobs` workers."""
+    n_shards = min(jobs * SHARDS_PER_JOB, max(1, n_pages // MIN_PAGES_PER_SHARD))
+    bounds = [1 + (n_pages * k) // n_shards for k in range(n_shards + 1)]
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _iter_pages(
+    path: Path,
+    pdf_to_open: Path,
+    start: int,
+    stop: int,
+    keep_layout: bool,
+    ocr: OCRConfig,
+    ocr_pages: Set[int] | None = None,
+    fallback_dir: Path | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield pages [start, stop) (1-based) one record at a time from one pdfplumber
+    handle; each page's layout cache is flushed once its record is built.
+
+    ocr_pages are the pages classify_pages() selected for OCR; they are OCRed up
+    front as one batch (pytesseract on the original PDF). None means no
+    classification was possible and low-text pages are only flagged.
+    With fallback_dir (auto mode), pages still empty after that are read from one
+    whole-document ocrmypdf pass, run the first time such a page comes up.
+    Records: {"page", "text", "tables", "ocr_engine", "needs_ocr", "ocr_seconds",
+    "ocr_cached", "ocrmypdf_seconds"}.
+    """
+    ocr_results: Dict[int, Dict[str, Any]] = {}
+    if ocr_pages and str(pdf_to_open) == str(path):
+        # (an already OCRed PDF is read as-is)
+        ocr_results = _ocr_pages(path, sorted(p for p in ocr_pages if start <= p < stop), ocr)
+
+    fallback_pdf = None  # pdfplumber handle on the ocrmypdf output
+    fallback_tried = fallback_dir is None or ocr.mode != "auto"
+    try:
+        with pdfplumber.open(pdf_to_open) as pdf:
+            for i in range(start, stop):
+                page = pdf.pages[i - 1]
+                engine = None
+                ocrmypdf_seconds = 0.0
+                raw = _page_text(page, keep_layout=keep_layout)
+                if ocr_pages is not None:
+                    needs = i in ocr_pages
+                else:
+                    needs = ocr.mode in {"auto", "force"} and _needs_ocr(raw, force=(ocr.mode == "force"))
+                result = ocr_results.get(i)
+                if needs and str(pdf_to_open) != str(path):
+                    engine = "ocrmypdf"  # text comes from the pre-OCRed PDF
+                elif result and result["text"].strip():
+                    raw = (raw or "") + "\n" + result["text"]
+                    engine = "pytesseract"
+
+                if needs and not (raw or "").strip() and not fallback_tried:
+                    fallback_tried = True
+                    t0 = time.perf_counter()
+                    ocr_pdf = _ocr_with_ocrmypdf(path, fallback_dir, ocr.lang)
+                    ocrmypdf_seconds = round(time.perf_counter() - t0, 3)
+                    if ocr_pdf:
+                        try:
+                            fallback_pdf = pdfplumber.open(ocr_pdf)
+                        except Exception:
+                            fallback_pdf = None
+                if needs and not (raw or "").strip() and fallback_pdf is not None:
+                    try:
+                        page2 = fallback_pdf.pages[i - 1]
+                        raw = _page_text(page2, keep_layout=keep_layout) or ""
+                        page2.close()
+                        engine = "ocrmypdf"
+                    except Exception:
+                        pass
+
+                # Tables (best-effort)
+                tables: List[Dict[str, Any]] = []
+                try:
+                    tbs = page.extract_tables()
+                    for ti, tbl in enumerate(tbs or []):
+                        tables.append({"page": i, "index": ti, "rows": tbl})
+                except Exception:
+                    # graceful degrade
+                    pass
+                page.close()  # flush pdfplumber's per-page object/layout caches
+
+                yield {
+                    "page": i,
+                    "text": raw or "",
+                    "tables": tables,
+                    "ocr_engine": engine,
+                    "needs_ocr": needs,
+                    "ocr_seconds": result["seconds"] if result else 0.0,
+                    "ocr_cached": result["cached"] if result else False,
+                    "ocrmypdf_seconds": ocrmypdf_seconds,
+                }
+    finally:
+        if fallback_pdf is not None:
+            fallback_pdf.close()
+
+
+def _extract_shard(args: tuple) -> List[Dict[str, Any]]:
+    """Process-pool entry point: one page range (no ocrmypdf fallback, see extract_pdf)."""
+    return list(_iter_pages(*args))
+
+
+def _ocr_remaining_with_ocrmypdf(
+    path: Path, records: List[Dict[str, Any]], keep_layout: bool, ocr: OCRConfig, tmp_dir: Path
+) -> None:
+    """
+    Fill pages that needed OCR but are still empty from ONE whole-document ocrmypdf
+    pass (auto mode fallback after page-parallel extraction).
+    """
+    pending = [rec for rec in records if rec["needs_ocr"] and not rec["text"].strip()]
+    if not pending:
+        return
+    t0 = time.perf_counter()
+    ocr_pdf = _ocr_with_ocrmypdf(path, tmp_dir, ocr.lang)
+    if ocr_pdf:
+        try:
+            with pdfplumber.open(ocr_pdf) as pdf2:
+                for rec in pending:
+                    rec["text"] = _page_text(pdf2.pages[rec["page"] - 1], keep_layout=keep_layout) or ""
+                    rec["ocr_engine"] = "ocrmypdf"
+        except Exception:
+            pass
+    pending[0]["ocrmypdf_seconds"] = round(time.perf_counter() - t0, 3)
+
+
+def _make_tmp_dir(path: Path) -> Path:
+    """Private scratch dir next to the input (ocrmypdf output); one per extraction."""
+    return Path(tempfile.mkdtemp(prefix=".mrconvert_tmp-", dir=path.parent))
+
+
+def _new_meta(path: Path, ocr: OCRConfig) -> Dict[str, Any]:
+    return {
         "source": str(path),
         "type": "pdf",
         "pages": 0,
         "parsed_at": now_iso(),
         "ocr": {"used": False, "engine": "none", "lang": ocr.lang},
     }
-    text_parts: List[str] = []
-    tables: List[Dict[str, Any]] = []
 
-    tmp_dir = path.parent / ".mrconvert_tmp"
-    tmp_dir.mkdir(exist_ok=True)
 
+def _prepare(
+    path: Path, ocr: OCRConfig, tmp_dir: Path, meta: Dict[str, Any]
+) -> Tuple[Path, Dict[int, PageProfile], Set[int] | None]:
+    """Force-mode ocrmypdf pre-pass and OCR page classification; returns (pdf_to_open, profiles, ocr_pages)."""
     pdf_to_open = path
 
     # Pass 0: if user forced OCR and ocrmypdf exists, pre-OCR the whole file for better text flow.
     if ocr.mode == "force":
+        t0 = time.perf_counter()
         ocr_pdf = _ocr_with_ocrmypdf(path, tmp_dir, ocr.lang)
+        _add_ocrmypdf_seconds(meta, round(time.perf_counter() - t0, 3))
         if ocr_pdf:
             pdf_to_open = ocr_pdf
             meta["ocr"].update({"used": True, "engine": "ocrmypdf"})
 
+    # Pre-classify pages (text layer + image coverage) so OCR runs only where needed
+    profiles: Dict[int, PageProfile] = {}
+    ocr_pages: Set[int] | None = set() if ocr.mode not in {"auto", "force"} else None
+    if ocr_pages is None and fitz is not None:
+        try:
+            profiles = {p.page: p for p in classify_pages(path, force=(ocr.mode == "force"))}
+            ocr_pages = {p.page for p in profiles.values() if p.needs_ocr}
+        except Exception:
+            profiles = {}
+
     with pdfplumber.open(pdf_to_open) as pdf:
         meta["pages"] = len(pdf.pages)
-        for i, page in enumerate(pdf.pages, start=1):
-            raw = _page_text(page, keep_layout=keep_layout)
-            # If text is empty and OCR mode allows, try OCR per-page
-            if _needs_ocr(raw, force=(ocr.mode == "force")) and ocr.mode in {"auto", "force"}:
-                # Try per-page OCR with PyMuPDF+pytesseract for this page
-                if fitz and pytesseract:
-                    # Render with PyMuPDF if original PDF specified
-                    try:
-                        if str(pdf_to_open) != str(path):
-                            # We already opened an OCRed PDF — try text again before OCRing image
-                            raw = raw or ""
-                        else:
-                            # Render page with PyMuPDF
-                            with fitz.open(str(path)) as doc2:
-                                page2 = doc2.load_page(i - 1)
-                                ocr_text = _ocr_page_with_pymupdf(page2, ocr.lang)
-                                if ocr_text and len(ocr_text.strip()) > 0:
-                                    raw = (raw or "") + "\n" + ocr_text
-                                    meta["ocr"].update({"used": True, "engine": "pytesseract"})
-                    except Exception:
-                        pass
-                # If still empty and ocrmypdf available, as a fallback OCR the whole pdf once (auto case)
-                if (not raw or len(raw.strip()) == 0) and ocr.mode == "auto":
-                    ocr_pdf = _ocr_with_ocrmypdf(path, tmp_dir, ocr.lang)
-                    if ocr_pdf:
-                        try:
-                            with pdfplumber.open(ocr_pdf) as pdf2:
-                                page2 = pdf2.pages[i - 1]
-                                raw = _page_text(page2, keep_layout=keep_layout) or ""
-                                meta["ocr"].update({"used": True, "engine": "ocrmypdf"})
-                        except Exception:
-                            pass
-            text_parts.append(raw or "")
+    return pdf_to_open, profiles, ocr_pages
 
-            # Tables (best-effort)
-            try:
-                tbs = page.extract_tables()
-                for ti, tbl in enumerate(tbs or []):
-                    tables.append({"page": i, "index": ti, "rows": tbl})
-            except Exception:
-                # graceful degrade
-                pass
 
-    # Cleanup temp dir
+def _add_ocrmypdf_seconds(meta: Dict[str, Any], seconds: float) -> None:
+    if seconds:
+        info = meta["ocr"]
+        info["ocrmypdf_seconds"] = round(info.get("ocrmypdf_seconds", 0.0) + seconds, 3)
+        info["seconds"] = round(info.get("seconds", 0.0) + seconds, 3)
+
+
+def _account_page(meta: Dict[str, Any], rec: Dict[str, Any], profiles: Dict[int, PageProfile]) -> None:
+    """Fold one page record into meta["ocr"] (engine used, per-page OCR report, timings)."""
+    info = meta["ocr"]
+    if rec["ocr_engine"]:
+        info.update({"used": True, "engine": rec["ocr_engine"]})
+    _add_ocrmypdf_seconds(meta, rec["ocrmypdf_seconds"])
+    if rec["needs_ocr"]:
+        profile = profiles.get(rec["page"])
+        info.setdefault("pages", []).append(
+            {
+                "page": rec["page"],
+                "engine": rec["ocr_engine"] or "none",
+                "seconds": rec["ocr_seconds"],
+                "cached": rec["ocr_cached"],
+                "text_chars": profile.chars if profile else None,
+                "image_coverage": profile.image_coverage if profile else None,
+            }
+        )
+        info["seconds"] = round(info.get("seconds", 0.0) + rec["ocr_seconds"], 3)
+        info.setdefault("ocrmypdf_seconds", 0.0)
+
+
+def iter_pdf_pages(
+    path: Path,
+    keep_layout: bool = False,
+    ocr: OCRConfig | None = None,
+    meta: Dict[str, Any] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream page records ({"page", "text", "tables", ...}) in page order.
+
+    Only one page's text, tables and layout objects are alive at a time, so
+    memory stays flat on 1000+ page documents. Pass a dict as `meta` to have it
+    filled with the same metadata extract_pdf() returns (complete once the
+    generator is exhausted).
+    """
+    ocr = ocr or OCRConfig()
+    if meta is None:
+        meta = {}
+    meta.update(_new_meta(path, ocr))
+
+    tmp_dir = _make_tmp_dir(path)
     try:
-        if tmp_dir.exists():
-            for p in tmp_dir.glob("*"):
-                p.unlink(missing_ok=True)
-            tmp_dir.rmdir()
-    except Exception:
-        pass
+        pdf_to_open, profiles, ocr_pages = _prepare(path, ocr, tmp_dir, meta)
+        for rec in _iter_pages(
+            path, pdf_to_open, 1, meta["pages"] + 1, keep_layout, ocr, ocr_pages, fallback_dir=tmp_dir
+        ):
+            _account_page(meta, rec, profiles)
+            yield rec
+    finally:
+        # Cleanup temp dir
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def extract_pdf(
+    path: Path, keep_layout: bool = False, ocr: OCRConfig | None = None, jobs: int = 1
+) -> Dict[str, Any]:
+    """
+    Extract text and tables from a PDF.
+
+    With jobs > 1, page ranges are processed by up to `jobs` worker processes
+    (each with its own pdfplumber/PyMuPDF handles) and reassembled in page order;
+    the result is the same as jobs=1.
+
+    OCR pages are chosen up front by classify_pages(); meta["ocr"]["pages"] reports
+    per OCRed page the engine, seconds and whether the text came from the page cache
+    (OCRConfig.cache_dir). ocrmypdf runs at most once per document.
+
+    For very large documents use iter_pdf_pages() (bounded memory) instead.
+    """
+    ocr = ocr or OCRConfig()
+    text_parts: List[str] = []
+    tables: List[Dict[str, Any]] = []
+
+    if jobs > 1:
+        meta = _new_meta(path, ocr)
+        tmp_dir = _make_tmp_dir(path)
+        try:
+            pdf_to_open, profiles, ocr_pages = _prepare(path, ocr, tmp_dir, meta)
+            ranges = _page_ranges(meta["pages"], jobs) if meta["pages"] else []
+            if len(ranges) > 1:
+                shards = [(path, pdf_to_open, a, b, keep_layout, ocr, ocr_pages) for a, b in ranges]
+                with ProcessPoolExecutor(max_workers=min(jobs, len(ranges))) as pool:
+                    records = [rec for shard in pool.map(_extract_shard, shards) for rec in shard]
+                if ocr.mode == "auto":
+                    _ocr_remaining_with_ocrmypdf(path, records, keep_layout, ocr, tmp_dir)
+            else:
+                records = list(
+                    _iter_pages(path, pdf_to_open, 1, meta["pages"] + 1, keep_layout, ocr, ocr_pages, tmp_dir)
+                )
+        finally:
+            # Cleanup temp dir
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        for rec in records:
+            _account_page(meta, rec, profiles)
+    else:
+        meta = {}
+        records = iter_pdf_pages(path, keep_layout=keep_layout, ocr=ocr, meta=meta)
+
+    for rec in records:
+        text_parts.append(rec["text"])
+        tables.extend(rec["tables"])
 
     return {
         "meta": meta,
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import os
+import queue
+import shutil
+import signal
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+try:
+    import uno  # LibreOffice's Python bridge (python3-uno), optional
+    from com.sun.star.beans import PropertyValue  # type: ignore
+except Exception:  # pragma: no cover
+    uno = None
+    PropertyValue = None
+
+from .types import ConversionError, ConversionResult, EngineNotFoundError
+
+DEFAULT_TIMEOUT = 120.0  # seconds per document before the instance counts as hung
+STARTUP_TIMEOUT = 60.0
+HEALTH_TIMEOUT = 5.0
+
+
+def default_pool_size() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def find_soffice() -> str | None:
+    return shutil.which("soffice") or shutil.which("libreoffice")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _call_with_timeout(fn: Callable[[], Any], timeout: float) -> Any:
+    """Run fn in a daemon thread; raises TimeoutError if it does not return in time."""
+    box: dict = {}
+
+    def target() -> None:
+        try:
+            box["value"] = fn()
+        except BaseException as e:  # re-raised in the caller
+            box["error"] = e
+
+    t = threading.Thread(target=target, daemon=True)
+    t.start()
+    t.join(timeout)
+    if t.is_alive():
+        raise TimeoutError(f"no answer within {timeout:.0f}s")
+    if "error" in box:
+        raise box["error"]
+    return box.get("value")
+
+
+def _kill_group(proc: subprocess.Popen) -> None:
+    """Kill soffice and the soffice.bin it spawned (own process group)."""
+    if proc.poll() is not None:
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (AttributeError, OSError):
+        proc.kill()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:  # pragma: no cover
+        pass
+
+
+class SofficeWorker:
+    """
+    One headless LibreOffice with its own profile (-env:UserInstallation).
+
+    With the UNO bridge available the instance is long-lived: started once with a
+    socket listener and driven over UNO (load hidden, store with writer_pdf_Export),
+    so only the first document pays the cold start. Without it every document runs
+    `soffice --convert-to pdf` against the same private, already initialised profile.
+    """
+
+    def __init__(self, soffice: str, base_dir: Path, index: int, timeout: float = DEFAULT_TIMEOUT) -> None:
+        self.soffice = soffice
+        self.index = index
+        self.timeout = timeout
+        self.profile_dir = base_dir / f"profile-{index}"
+        self.out_dir = base_dir / f"out-{index}"
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.use_uno = uno is not None
+        self.proc: subprocess.Popen | None = None
+        self.desktop = None
+        self.restarts = 0
+        self.converted = 0
+
+    @property
+    def engine(self) -> str:
+        return "soffice-uno" if self.use_uno else "soffice"
+
+    def _base_cmd(self) -> List[str]:
+        return [
+            self.soffice,
+            f"-env:UserInstallation={self.profile_dir.resolve().as_uri()}",
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--norestore",
+            "--nodefault",
+            "--nolockcheck",
+        ]
+
+    # ----- lifecycle -----
+
+    def start(self) -> None:
+        if not self.use_uno:
+            return
+        port = _free_port()
+        self.proc = subprocess.Popen(
+            self._base_cmd() + [f"--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext("com.sun.star.bridge.UnoUrlResolver", local)
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                ctx = resolver.resolve(f"uno:socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext")
+                self.desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+                return
+            except Exception:
+                if self.proc.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise ConversionError(f"LibreOffice worker {self.index} failed to start")
+                time.sleep(0.25)
+
+    def stop(self) -> None:
+        if self.desktop is not None:
+            try:
+                _call_with_timeout(self.desktop.terminate, HEALTH_TIMEOUT)
+            except Exception:
+                pass
+            self.desktop = None
+        if self.proc is not None:
+            try:
+                self.proc.wait(timeout=HEALTH_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                pass
+            _kill_group(self.proc)
+            self.proc = None
+
+    def restart(self) -> None:
+        self.stop()
+        self.restarts += 1
+        self.start()
+
+    def healthy(self) -> bool:
+        """Process alive and answering a trivial UNO call."""
+        if not self.use_uno:
+            return True
+        if self.proc is None or self.proc.poll() is not None or self.desktop is None:
+            return False
+        try:
+            _call_with_timeout(lambda: self.desktop.getFrames().getCount(), HEALTH_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    def ensure_healthy(self) -> None:
+        if not self.use_uno:
+            return
+        if self.proc is None:
+            self.start()  # first use (or a previous start failed)
+        elif not self.healthy():
+            self.restart()
+
+    # ----- conversion -----
+
+    def convert(self, src: Path, dst: Path) -> ConversionResult:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        if self.use_uno:
+            self._convert_uno(src, dst)
+        else:
+            self._convert_cli(src, dst)
+        if not dst.exists():
+            raise ConversionError(f"Expected {dst} but not found after conversion.")
+        self.converted += 1
+        return ConversionResult(src, dst, self.engine)
+
+    def _convert_uno(self, src: Path, dst: Path) -> None:
+        def run() -> None:
+            doc = self.desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(str(src.resolve())), "_blank", 0, (_prop("Hidden", True),)
+            )
+            if doc is None:
+                raise ConversionError(f"LibreOffice could not open {src}")
+            try:
+                doc.storeToURL(
+                    uno.systemPathToFileUrl(str(dst.resolve())), (_prop("FilterName", "writer_pdf_Export"),)
+                )
+            finally:
+                doc.close(True)
+
+        try:
+            _call_with_timeout(run, self.timeout)
+        except TimeoutError:
+            self.restart()
+            raise ConversionError(f"LibreOffice hung on {src.name} (>{self.timeout:.0f}s); worker restarted")
+
+    def _convert_cli(self, src: Path, dst: Path) -> None:
+        proc = subprocess.Popen(
+            self._base_cmd() + ["--convert-to", "pdf", "--outdir", str(self.out_dir), str(src)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            start_new_session=True,
+        )
+        try:
+            stdout, stderr = proc.communicate(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            _kill_group(proc)
+            self.restarts += 1
+            raise ConversionError(f"LibreOffice hung on {src.name} (>{self.timeout:.0f}s); process killed")
+        if proc.returncode != 0:
+            raise ConversionError(f"LibreOffice failed: {stderr or stdout}")
+        produced = self.out_dir / src.with_suffix(".pdf").name
+        if produced.exists():
+            os.replace(produced, dst)
+
+
+def _prop(name: str, value: Any):
+    p = PropertyValue()
+    p.Name = name
+    p.Value = value
+    return p
+
+
+class SofficePool:
+    """
+    Pool of isolated LibreOffice workers for DOCX→PDF batches.
+
+    Workers start on first use and are handed out through a queue, so up to
+    `size` documents convert concurrently without sharing a profile. Before each
+    job the worker is health-checked (restarted if dead or unresponsive); a
+    document that exceeds `timeout` gets its worker restarted and fails alone.
+
+        with SofficePool(size=4) as pool:
+            for src, result in pool.convert_many(pairs):
+                ...
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        soffice: str | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        base_dir: Path | None = None,
+    ) -> None:
+        self.soffice = soffice or find_soffice()
+        if not self.soffice:
+            raise EngineNotFoundError("LibreOffice (soffice) not found in PATH.")
+        self.size = size or default_pool_size()
+        self._own_base = base_dir is None
+        self.base_dir = Path(tempfile.mkdtemp(prefix="mrconvert-soffice-")) if base_dir is None else base_dir
+        self.workers = [self._make_worker(i, timeout) for i in range(self.size)]
+        self._idle: "queue.Queue[SofficeWorker]" = queue.Queue()
+        for w in self.workers:
+            self._idle.put(w)
+
+    def _make_worker(self, index: int, timeout: float) -> SofficeWorker:
+        return SofficeWorker(self.soffice, self.base_dir, index, timeout)
+
+    def convert(self, src: Path, dst: Path) -> ConversionResult:
+        """Convert one document on the next idle worker (thread-safe)."""
+        worker = self._idle.get()
+        try:
+            worker.ensure_healthy()
+            return worker.convert(src, dst)
+        finally:
+            self._idle.put(worker)
+
+    def convert_many(
+        self, pairs: Iterable[Tuple[Path, Path]]
+    ) -> Iterator[Tuple[Path, ConversionResult | Exception]]:
+        """Queue (src, dst) pairs across the pool; yields (src, result or error) as they finish."""
+        with ThreadPoolExecutor(max_workers=self.size) as ex:
+            futures = {ex.submit(self.convert, src, dst): src for src, dst in pairs}
+            for fut in as_completed(futures):
+                try:
+                    yield futures[fut], fut.result()
+                except Exception as e:
+                    yield futures[fut], e
+
+    def close(self) -> None:
+        for w in self.workers:
+            w.stop()
+        if self._own_base:
+            shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def __enter__(self) -> "SofficePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
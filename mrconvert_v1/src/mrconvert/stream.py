@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, IO, List, Tuple
+
+from . import pdf_converter
+from .utils import OCRConfig, slugify, write_table
+
+
+class _TextSink:
+    """Append-only text file equal to "\\n\\n".join(parts).strip(), without holding the parts."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._f: IO[str] = path.open("w", encoding="utf-8")
+        self._count = 0
+        self._started = False
+        self._pending = ""  # trailing whitespace, written only if more text follows
+
+    def add(self, part: str) -> None:
+        chunk = ("\n\n" if self._count else "") + part
+        self._count += 1
+        if not self._started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return
+            self._started = True
+        body = chunk.rstrip()
+        if body:
+            self._f.write(self._pending + body)
+            self._pending = chunk[len(body):]
+        else:
+            self._pending += chunk
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class StreamWriter:
+    """
+    Write page records (see pdf_converter.iter_pdf_pages) as they arrive.
+
+    txt/md get the same content extract_pdf() + write_text() would produce; json
+    becomes <slug>.jsonl with one line per page and a final {"meta": ...} line;
+    tables are written one CSV/JSON file each. Nothing but the current page is
+    kept in memory.
+    """
+
+    def __init__(self, out_dir: Path, stem: str, formats: List[str], tables: str = "none") -> None:
+        self.out_dir = out_dir
+        self.stem = stem
+        self.tables = tables
+        self.outputs: List[Path] = []
+        slug = slugify(stem)
+        self._sinks: List[_TextSink] = [
+            _TextSink(out_dir / f"{slug}.{ext}") for ext in ("txt", "md") if ext in formats
+        ]
+        self._jsonl: IO[str] | None = None
+        self._jsonl_path = out_dir / f"{slug}.jsonl"
+        if "json" in formats:
+            self._jsonl = self._jsonl_path.open("w", encoding="utf-8")
+
+    def write_page(self, rec: Dict[str, Any]) -> None:
+        for sink in self._sinks:
+            sink.add(rec["text"])
+        if self._jsonl is not None:
+            self._jsonl.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        if self.tables in {"csv", "json"}:
+            for t in rec["tables"]:
+                self.outputs.append(write_table(self.out_dir, self.stem, t, self.tables))
+
+    def close(self, meta: Dict[str, Any] | None = None) -> List[Path]:
+        """Finish all files (meta goes last in the JSONL); returns every file written."""
+        for sink in self._sinks:
+            sink.close()
+            self.outputs.append(sink.path)
+        self._sinks = []
+        if self._jsonl is not None:
+            if meta is not None:
+                self._jsonl.write(json.dumps({"meta": meta}, ensure_ascii=False) + "\n")
+            self._jsonl.close()
+            self._jsonl = None
+            self.outputs.append(self._jsonl_path)
+        return self.outputs
+
+    def __enter__(self) -> "StreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def stream_pdf(
+    path: Path,
+    out_dir: Path,
+    formats: List[str],
+    tables: str = "none",
+    keep_layout: bool = False,
+    ocr: OCRConfig | None = None,
+) -> Tuple[List[Path], Dict[str, Any]]:
+    """Extract a PDF page by page straight into out_dir; returns (files written, meta)."""
+    meta: Dict[str, Any] = {}
+    with StreamWriter(out_dir, path.stem, formats, tables) as writer:
+        for rec in pdf_converter.iter_pdf_pages(path, keep_layout=keep_layout, ocr=ocr, meta=meta):
+            writer.write_page(rec)
+        outputs = writer.close(meta)
+    return outputs, meta
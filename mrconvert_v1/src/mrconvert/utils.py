@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import csv
 import json
 import os
 import re
@@ -27,6 +28,19 @@ def write_json(out_dir: Path, stem: str, data: Dict[str, Any]) -> Path:
     p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     return p
 
+def write_table(out_dir: Path, stem: str, table: Dict[str, Any], fmt: str) -> Path:
+    """Write one extracted table ({"page", "index", "rows"}) as CSV or JSON."""
+    page = table.get("page")
+    idx = table.get("index")
+    rows = table.get("rows") or []
+    p = out_dir / f"{stem}.table-{page or 'NA'}-{idx or 0}.{fmt}"
+    if fmt == "csv":
+        with p.open("w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(rows)
+    else:
+        p.write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
+    return p
+
 def now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
@@ -34,6 +48,7 @@ def now_iso() -> str:
 class OCRConfig:
     mode: str = "auto"  # "off" | "auto" | "force"
     lang: str | None = None  # e.g. "kor+eng"
+    cache_dir: Path | None = None  # per-page OCR text cache (see cache.PageOCRCache)
 
 def is_pdf(path: Path) -> bool:
     return path.suffix.lower() == ".pdf"
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from mrconvert import pdf_converter
+from mrconvert.cache import ConversionCache, PageOCRCache, output_template, render_template
+from mrconvert.cli import run
+
+
+@pytest.fixture
+def counted_extract(monkeypatch):
+    """Replace extract_pdf with a fake that counts calls (output depends on the file bytes)."""
+    calls = []
+
+    def fake_extract_pdf(path, keep_layout=False, ocr=None, jobs=1):
+        calls.append(path)
+        text = Path(path).read_bytes().decode("utf-8")
+        return {
+            "source": str(path),
+            "type": "pdf",
+            "text": text,
+            "tables": [{"page": 1, "index": 0, "rows": [["a", "b"], ["1", "2"]]}],
+        }
+
+    monkeypatch.setattr(pdf_converter, "extract_pdf", fake_extract_pdf)
+    return calls
+
+
+def _run_text(src: Path, out: Path, *extra: str) -> int:
+    return run([str(src), "--out", str(out), "--format", "txt", "json", *extra])
+
+
+def test_second_run_reuses_outputs_by_hard_link(tmp_path, counted_extract):
+    src = tmp_path / "Manual.pdf"
+    src.write_bytes(b"first version")
+    out = tmp_path / "out"
+
+    assert _run_text(src, out) == 0
+    assert _run_text(src, out) == 0
+    assert len(counted_extract) == 1
+
+    txt = out / "manual.txt"
+    assert txt.read_text(encoding="utf-8") == "first version"
+    assert (out / "Manual.table-1-0.csv").exists()
+    assert txt.stat().st_nlink == 2  # out_dir + cache object
+
+    manifest = json.loads((out / ".mrconvert_cache" / "manifest.json").read_text(encoding="utf-8"))
+    (entry,) = manifest["entries"].values()
+    assert sorted(entry["files"]) == ["{slug}.json", "{slug}.txt", "{stem}.table-1-0.csv"]
+
+
+def test_changed_content_or_options_miss(tmp_path, counted_extract):
+    src = tmp_path / "a.pdf"
+    src.write_bytes(b"one")
+    out = tmp_path / "out"
+
+    _run_text(src, out)
+    _run_text(src, out, "--keep-layout")
+    assert len(counted_extract) == 2
+
+    src.write_bytes(b"two!")
+    _run_text(src, out)
+    assert len(counted_extract) == 3
+    assert (out / "a.txt").read_text(encoding="utf-8") == "two!"
+
+
+def test_identical_file_under_new_name_is_a_hit(tmp_path, counted_extract):
+    out = tmp_path / "out"
+    (tmp_path / "a.pdf").write_bytes(b"same bytes")
+    (tmp_path / "b.pdf").write_bytes(b"same bytes")
+
+    _run_text(tmp_path / "a.pdf", out)
+    _run_text(tmp_path / "b.pdf", out)
+    assert len(counted_extract) == 1
+    assert (out / "b.txt").read_text(encoding="utf-8") == "same bytes"
+    assert (out / "b.table-1-0.csv").exists()
+
+
+def test_reconversion_does_not_modify_cached_object(tmp_path, counted_extract):
+    src = tmp_path / "a.pdf"
+    src.write_bytes(b"v1")
+    out = tmp_path / "out"
+
+    _run_text(src, out)
+    cached = out / "a.txt"
+    inode = cached.stat().st_ino
+    src.write_bytes(b"v2")
+    _run_text(src, out)
+
+    assert cached.read_text(encoding="utf-8") == "v2"
+    assert cached.stat().st_ino != inode
+    src.write_bytes(b"v1")
+    _run_text(src, out)
+    assert len(counted_extract) == 2
+    assert cached.read_text(encoding="utf-8") == "v1"
+
+
+def test_no_cache_flag_always_converts(tmp_path, counted_extract):
+    src = tmp_path / "a.pdf"
+    src.write_bytes(b"x")
+    out = tmp_path / "out"
+
+    _run_text(src, out, "--no-cache")
+    _run_text(src, out, "--no-cache")
+    assert len(counted_extract) == 2
+    assert not (out / ".mrconvert_cache").exists()
+
+
+def test_lru_eviction_keeps_recent_entries(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=25)
+    keys = []
+    for i in range(3):
+        src = tmp_path / f"f{i}.pdf"
+        src.write_bytes(f"{i}".encode() * 10)
+        out = tmp_path / f"f{i}.txt"
+        out.write_bytes(b"x" * 10)
+        key = cache.key(src, {"mode": "text"})
+        cache.store(key, f"f{i}", [out])
+        keys.append(key)
+
+    # entries were just stored; make the second one the least recently used
+    cache.manifest["entries"][keys[1]]["last_used"] = 0
+    assert cache.evict() == 1
+    assert set(cache.manifest["entries"]) == {keys[0], keys[2]}
+    assert cache.restore(keys[1], "f1", tmp_path) is None
+
+
+def test_eviction_counts_ocr_page_texts(tmp_path):
+    cache = ConversionCache(tmp_path / "cache", max_bytes=25)
+    src = tmp_path / "f.pdf"
+    src.write_bytes(b"pdf")
+    out = tmp_path / "f.txt"
+    out.write_bytes(b"x" * 10)
+    key = cache.key(src, {"mode": "text"})
+    cache.store(key, "f", [out])
+
+    ocr = PageOCRCache(cache.cache_dir / "ocr")
+    ocr.put("aa" + "0" * 62, "o" * 10)
+    ocr.put("bb" + "0" * 62, "o" * 10)
+    old = ocr._path("aa" + "0" * 62)
+    os.utime(old, (0, 0))  # least recently used
+
+    assert cache.evict() == 1
+    assert not old.exists()
+    assert ocr._path("bb" + "0" * 62).exists()
+    assert key in cache.manifest["entries"]
+
+
+def test_output_templates_round_trip():
+    assert output_template("my-file.md", "My File") == "{slug}.md"
+    assert output_template("My File.table-2-0.csv", "My File") == "{stem}.table-2-0.csv"
+    assert render_template("{slug}.md", "Other Doc") == "other-doc.md"
+    assert render_template("{stem}.table-2-0.csv", "Other Doc") == "Other Doc.table-2-0.csv"
@@ -9,6 +9,12 @@ import pytest
 from mrconvert.cli import build_parser, run
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    """Keep the default ./mr_out (and its conversion cache) out of the repo."""
+    monkeypatch.chdir(tmp_path)
+
+
 def test_cli_accepts_to_docx_flag():
     """Test CLI accepts --to-docx flag"""
     parser = build_parser()
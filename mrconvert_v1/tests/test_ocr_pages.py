@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mrconvert import pdf_converter
+from mrconvert.utils import OCRConfig
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("PIL")
+
+
+def _scan_pixmap(shade: int) -> "fitz.Pixmap":
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 60, 60), False)
+    pix.set_rect(pix.irect, (shade, shade, shade))
+    return pix
+
+
+def _make_mixed_pdf(path: Path) -> None:
+    """Pages: 1 text, 2 scan (image), 3 blank, 4 vector drawing, 5 same scan as 2."""
+    doc = fitz.open()
+    page = doc.new_page(width=300, height=300)
+    page.insert_text((40, 40), "Stowage plan revision B")
+    for shade in (120, None, None, 120):
+        page = doc.new_page(width=300, height=300)
+        if shade is not None:
+            page.insert_image(fitz.Rect(0, 0, 300, 300), pixmap=_scan_pixmap(shade))
+    doc[3].draw_rect(fitz.Rect(40, 40, 200, 120), color=(0, 0, 0), width=1)
+    doc.save(str(path))
+    doc.close()
+
+
+class _FakeTesseract:
+    def __init__(self):
+        self.calls = 0
+
+    def image_to_string(self, img, lang=None):
+        self.calls += 1
+        return f"scanned text {self.calls}"
+
+
+@pytest.fixture
+def fake_tesseract(monkeypatch):
+    fake = _FakeTesseract()
+    monkeypatch.setattr(pdf_converter, "pytesseract", fake)
+    from PIL import Image
+
+    monkeypatch.setattr(pdf_converter, "Image", Image)
+    return fake
+
+
+def test_classify_pages_selects_scans_and_drawings(tmp_path):
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(src)
+
+    profiles = pdf_converter.classify_pages(src)
+    assert [p.needs_ocr for p in profiles] == [False, True, False, True, True]
+    assert profiles[0].chars >= pdf_converter.OCR_MIN_CHARS
+    assert profiles[1].image_coverage == pytest.approx(1.0)
+    assert profiles[2].image_coverage == 0.0
+    assert all(p.needs_ocr for p in pdf_converter.classify_pages(src, force=True))
+
+
+def test_auto_ocr_batches_pages_and_reuses_identical_scans(tmp_path, fake_tesseract):
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(src)
+
+    data = pdf_converter.extract_pdf(src, ocr=OCRConfig(mode="auto"))
+
+    report = {r["page"]: r for r in data["meta"]["ocr"]["pages"]}
+    assert sorted(report) == [2, 4, 5]
+    # page 5 renders to the same pixels as page 2
+    assert fake_tesseract.calls == 2
+    assert report[5]["cached"] and not report[2]["cached"]
+    assert all(r["engine"] == "pytesseract" and r["seconds"] >= 0 for r in report.values())
+    assert data["meta"]["ocr"]["engine"] == "pytesseract"
+    assert "scanned text 1" in data["text"]
+
+
+def test_page_cache_dir_is_shared_between_runs(tmp_path, fake_tesseract):
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(src)
+    ocr = OCRConfig(mode="auto", cache_dir=tmp_path / "ocr-cache")
+
+    first = pdf_converter.extract_pdf(src, ocr=ocr)
+    second = pdf_converter.extract_pdf(src, ocr=ocr)
+
+    assert fake_tesseract.calls == 2
+    assert all(r["cached"] for r in second["meta"]["ocr"]["pages"])
+    assert second["text"] == first["text"]
+
+
+def test_ocrmypdf_runs_once_for_all_remaining_pages(tmp_path, monkeypatch):
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(src)
+    monkeypatch.setattr(pdf_converter, "pytesseract", None)
+    calls = []
+
+    def fake_ocrmypdf(pdf_path, tmp_dir, lang):
+        calls.append(pdf_path)
+        out = tmp_dir / "ocr.pdf"
+        doc = fitz.open()
+        for i in range(1, 6):
+            doc.new_page(width=300, height=300).insert_text((40, 40), f"ocr page {i}")
+        doc.save(str(out))
+        doc.close()
+        return out
+
+    monkeypatch.setattr(pdf_converter, "_ocr_with_ocrmypdf", fake_ocrmypdf)
+
+    data = pdf_converter.extract_pdf(src, ocr=OCRConfig(mode="auto"))
+
+    assert len(calls) == 1
+    assert [r["page"] for r in data["meta"]["ocr"]["pages"]] == [2, 4, 5]
+    assert all(r["engine"] == "ocrmypdf" for r in data["meta"]["ocr"]["pages"])
+    assert "ocr page 3" not in data["text"]  # blank page is not OCRed
+    assert "ocr page 5" in data["text"]
+
+
+def test_ocr_off_skips_classification(tmp_path, fake_tesseract):
+    src = tmp_path / "mixed.pdf"
+    _make_mixed_pdf(src)
+
+    data = pdf_converter.extract_pdf(src, ocr=OCRConfig(mode="off"))
+    assert fake_tesseract.calls == 0
+    assert "pages" not in data["meta"]["ocr"]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mrconvert import pdf_converter
+from mrconvert.cli import build_parser
+from mrconvert.utils import OCRConfig
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_pdf(path: Path, n_pages: int) -> None:
+    """Text PDF with one line per page and a small ruled table on every 5th page."""
+    doc = fitz.open()
+    for i in range(1, n_pages + 1):
+        page = doc.new_page(width=300, height=300)
+        page.insert_text((40, 40), f"Tide table page {i}")
+        if i % 5 == 0:
+            for row in range(3):
+                for col in range(2):
+                    rect = fitz.Rect(40 + col * 80, 80 + row * 20, 120 + col * 80, 100 + row * 20)
+                    page.draw_rect(rect, color=(0, 0, 0), width=0.8)
+                    page.insert_text((rect.x0 + 4, rect.y1 - 6), f"r{row}c{col}", fontsize=8)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_page_ranges_cover_every_page_in_order():
+    for n_pages, jobs in [(1, 4), (7, 2), (40, 3), (300, 8)]:
+        ranges = pdf_converter._page_ranges(n_pages, jobs)
+        pages = [p for a, b in ranges for p in range(a, b)]
+        assert pages == list(range(1, n_pages + 1))
+
+
+def test_extract_pdf_jobs_matches_serial(tmp_path):
+    src = tmp_path / "tide.pdf"
+    _make_pdf(src, 40)
+
+    serial = pdf_converter.extract_pdf(src, ocr=OCRConfig(mode="off"))
+    parallel = pdf_converter.extract_pdf(src, ocr=OCRConfig(mode="off"), jobs=3)
+
+    assert serial["meta"]["pages"] == parallel["meta"]["pages"] == 40
+    assert parallel["text"] == serial["text"]
+    assert parallel["tables"] == serial["tables"]
+    assert [t["page"] for t in parallel["tables"]] == [5, 10, 15, 20, 25, 30, 35, 40]
+    assert parallel["text"].index("page 9") < parallel["text"].index("page 10")
+    assert not list(tmp_path.glob(".mrconvert_tmp*"))
+
+
+def test_cli_accepts_jobs():
+    args = build_parser().parse_args(["input.pdf", "--jobs", "4"])
+    assert args.jobs == 4
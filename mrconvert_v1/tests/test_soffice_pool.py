@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import stat
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from mrconvert import cli, soffice_pool
+from mrconvert.soffice_pool import SofficePool, SofficeWorker
+from mrconvert.types import ConversionError
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shell script as soffice")
+
+FAKE_SOFFICE = """#!/bin/sh
+# Minimal stand-in for `soffice --convert-to pdf --outdir DIR FILE`
+profile=""; outdir=""; src=""
+while [ $# -gt 0 ]; do
+  case "$1" in
+    -env:UserInstallation=*) profile="${1#-env:UserInstallation=}";;
+    --outdir) shift; outdir="$1";;
+    --*) ;;
+    *) src="$1";;
+  esac
+  shift
+done
+case "$src" in *hang*) sleep 30;; esac
+echo "$profile" >> "$(dirname "$0")/profiles.log"
+name=$(basename "$src"); cp "$src" "$outdir/${name%.*}.pdf"
+"""
+
+
+@pytest.fixture
+def fake_soffice(tmp_path, monkeypatch):
+    script = tmp_path / "bin" / "soffice"
+    script.parent.mkdir()
+    script.write_text(FAKE_SOFFICE)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(soffice_pool, "uno", None)
+    return script
+
+
+def _docs(folder: Path, names) -> list[Path]:
+    folder.mkdir(exist_ok=True)
+    paths = []
+    for name in names:
+        p = folder / name
+        p.write_bytes(b"docx " + name.encode())
+        paths.append(p)
+    return paths
+
+
+def test_pool_converts_batch_with_isolated_profiles(tmp_path, fake_soffice):
+    srcs = _docs(tmp_path / "in", [f"memo{i}.docx" for i in range(6)])
+    out = tmp_path / "out"
+
+    with SofficePool(size=2, soffice=str(fake_soffice)) as pool:
+        results = dict(pool.convert_many((s, out / f"{s.stem}.pdf") for s in srcs))
+        base_dir = pool.base_dir
+
+    assert sorted(r.output.name for r in results.values()) == [f"memo{i}.pdf" for i in range(6)]
+    assert all(r.engine == "soffice" for r in results.values())
+    assert (out / "memo3.pdf").read_bytes() == b"docx memo3.docx"
+    profiles = set((fake_soffice.parent / "profiles.log").read_text().split())
+    assert len(profiles) == 2 and all("profile-" in p for p in profiles)
+    assert not base_dir.exists()
+
+
+def test_hung_document_fails_alone(tmp_path, fake_soffice):
+    srcs = _docs(tmp_path / "in", ["a.docx", "hang.docx", "b.docx"])
+    out = tmp_path / "out"
+
+    t0 = time.monotonic()
+    with SofficePool(size=2, soffice=str(fake_soffice), timeout=1.0) as pool:
+        results = dict(pool.convert_many((s, out / f"{s.stem}.pdf") for s in srcs))
+        restarts = sum(w.restarts for w in pool.workers)
+
+    assert time.monotonic() - t0 < 15
+    assert isinstance(results[srcs[1]], ConversionError)
+    assert (out / "a.pdf").exists() and (out / "b.pdf").exists()
+    assert restarts == 1
+
+
+def test_unhealthy_worker_is_restarted_before_the_next_job(tmp_path):
+    class FlakyWorker(SofficeWorker):
+        def __init__(self, *a, **kw):
+            super().__init__(*a, **kw)
+            self.use_uno = True
+            self.alive = False
+            self.starts = 0
+
+        def start(self):
+            self.starts += 1
+            self.alive = True
+            self.proc = object()
+
+        def stop(self):
+            self.alive = False
+            self.proc = None
+
+        def healthy(self):
+            return self.alive
+
+        def _convert_uno(self, src, dst):
+            dst.write_bytes(b"%PDF")
+
+    worker = FlakyWorker("soffice", tmp_path, 0)
+    src = _docs(tmp_path / "in", ["x.docx"])[0]
+
+    worker.ensure_healthy()
+    worker.convert(src, tmp_path / "x.pdf")
+    assert (worker.starts, worker.restarts) == (1, 0)
+
+    worker.alive = False  # crashed or hung between jobs
+    worker.ensure_healthy()
+    assert (worker.starts, worker.restarts) == (2, 1)
+    assert worker.convert(src, tmp_path / "x2.pdf").engine == "soffice-uno"
+
+
+def test_cli_to_pdf_batch_uses_pool(tmp_path, fake_soffice, monkeypatch):
+    _docs(tmp_path / "in", ["one.docx", "two.docx", "three.docx"])
+    out = tmp_path / "out"
+    monkeypatch.setattr(cli, "find_soffice", lambda: str(fake_soffice))
+    monkeypatch.setattr(soffice_pool, "find_soffice", lambda: str(fake_soffice))
+    monkeypatch.setattr(cli.sys, "platform", "linux")
+
+    assert cli.run([str(tmp_path / "in"), "--to-pdf", "--out", str(out), "--soffice-workers", "2"]) == 0
+
+    assert sorted(p.name for p in out.glob("*.pdf")) == ["one.pdf", "three.pdf", "two.pdf"]
+    assert len((fake_soffice.parent / "profiles.log").read_text().split()) == 3
+    assert not list(out.glob(".mrconvert_staging*"))
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mrconvert import pdf_converter
+from mrconvert.cli import run
+from mrconvert.stream import StreamWriter, _TextSink, stream_pdf
+from mrconvert.utils import OCRConfig, write_text
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_pdf(path: Path, n_pages: int) -> None:
+    """Text PDF with a ruled 3x2 table on every 4th page and a blank page 3."""
+    doc = fitz.open()
+    for i in range(1, n_pages + 1):
+        page = doc.new_page(width=300, height=300)
+        if i == 3:
+            continue
+        page.insert_text((40, 40), f"Lashing report page {i}")
+        if i % 4 == 0:
+            for row in range(3):
+                for col in range(2):
+                    rect = fitz.Rect(40 + col * 80, 80 + row * 20, 120 + col * 80, 100 + row * 20)
+                    page.draw_rect(rect, color=(0, 0, 0), width=0.8)
+                    page.insert_text((rect.x0 + 4, rect.y1 - 6), f"r{row}c{col}", fontsize=8)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_iter_pdf_pages_is_lazy_and_matches_extract_pdf(tmp_path):
+    src = tmp_path / "report.pdf"
+    _make_pdf(src, 12)
+    ocr = OCRConfig(mode="off")
+
+    meta = {}
+    pages = pdf_converter.iter_pdf_pages(src, ocr=ocr, meta=meta)
+    first = next(pages)
+    assert first["page"] == 1 and meta["pages"] == 12
+    records = [first, *pages]
+
+    data = pdf_converter.extract_pdf(src, ocr=ocr)
+    assert [r["page"] for r in records] == list(range(1, 13))
+    assert "\n\n".join(r["text"] for r in records).strip() == data["text"]
+    assert [t for r in records for t in r["tables"]] == data["tables"]
+    assert not list(tmp_path.glob(".mrconvert_tmp*"))
+
+
+def test_stream_pdf_writes_same_text_and_tables(tmp_path):
+    src = tmp_path / "Report.pdf"
+    _make_pdf(src, 12)
+    ocr = OCRConfig(mode="off")
+    batch_dir, stream_dir = tmp_path / "batch", tmp_path / "stream"
+    batch_dir.mkdir()
+    stream_dir.mkdir()
+
+    data = pdf_converter.extract_pdf(src, ocr=ocr)
+    write_text(batch_dir, src.stem, data["text"], "txt")
+    outputs, meta = stream_pdf(src, stream_dir, ["txt", "md", "json"], tables="csv", ocr=ocr)
+
+    names = sorted(p.name for p in outputs)
+    assert names == [
+        "Report.table-12-0.csv",
+        "Report.table-4-0.csv",
+        "Report.table-8-0.csv",
+        "report.jsonl",
+        "report.md",
+        "report.txt",
+    ]
+    assert (stream_dir / "report.txt").read_text(encoding="utf-8") == (batch_dir / "report.txt").read_text(
+        encoding="utf-8"
+    )
+    lines = (stream_dir / "report.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 13
+    assert json.loads(lines[3])["page"] == 4
+    assert json.loads(lines[-1])["meta"]["pages"] == meta["pages"] == 12
+
+
+def test_text_sink_matches_join_strip(tmp_path):
+    parts = ["", "  ", "alpha \n", "", "beta", "\n\n", "gamma  ", " "]
+    sink = _TextSink(tmp_path / "out.txt")
+    for part in parts:
+        sink.add(part)
+    sink.close()
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8") == "\n\n".join(parts).strip()
+
+
+def test_stream_writer_closes_files_on_error(tmp_path):
+    with pytest.raises(RuntimeError):
+        with StreamWriter(tmp_path, "doc", ["txt", "json"]) as writer:
+            writer.write_page({"page": 1, "text": "one", "tables": []})
+            raise RuntimeError("boom")
+    assert (tmp_path / "doc.txt").read_text(encoding="utf-8") == "one"
+    assert len((tmp_path / "doc.jsonl").read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_cli_stream_mode(tmp_path):
+    src = tmp_path / "big.pdf"
+    _make_pdf(src, 8)
+    out = tmp_path / "out"
+
+    assert run([str(src), "--out", str(out), "--format", "txt", "json", "--ocr", "off", "--stream"]) == 0
+    assert (out / "big.txt").read_text(encoding="utf-8").startswith("Lashing report page 1")
+    assert (out / "big.jsonl").exists()
+    assert not (out / "big.json").exists()
@@ -4,12 +4,14 @@ Improved PDF to Markdown converter with cleaner table extraction.
 """
 
 import argparse
+import csv
 import json
+import shutil
 import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     import pdfplumber
@@ -634,21 +636,82 @@ def table_to_markdown_single(table_rows: List[List[str]], table_id: str) -> str:
     return "\n".join(md_lines)
 
 
-def extract_pdf_to_markdown_improved(
-    pdf_path: Path, keep_layout: bool = False, keep_layout_tables: bool = False
-) -> Dict[str, Any]:
-    meta: Dict[str, Any] = {
-        "source": str(pdf_path),
-        "type": "pdf",
-        "pages": 0,
-        "parsed_at": utc_now_iso(),
-        "ocr": {"used": False, "engine": "none", "lang": None},
+def clean_extracted_table(
+    table: List[List[Any]],
+    page_index: int,
+    table_index: int,
+    keep_layout_tables: bool,
+    metrics: Dict[str, int],
+    warnings: List[str],
+) -> Optional[Dict[str, Any]]:
+    """Clean one pdfplumber table; returns the table record or None when it is skipped."""
+    metrics["tables_found"] += 1
+    if not table:
+        metrics["tables_skipped"] += 1
+        return None
+
+    cleaned_rows, empty_cols = clean_table_rows(table)
+    cleaned_rows, merged = merge_multi_line_header(cleaned_rows)
+    if merged:
+        metrics["header_merged"] += 1
+    cleaned_rows, compacted = compact_header_and_units(cleaned_rows)
+    if compacted:
+        metrics["header_compacted"] += 1
+
+    # Fix S.No. column positioning
+    if len(cleaned_rows) > 1:
+        cleaned_rows = fix_sno_column(cleaned_rows)
+
+    # Clean data rows: remove label text and stage indices
+    if len(cleaned_rows) > 1:
+        header = cleaned_rows[0]
+        cleaned_data = [header]
+        for data_row in cleaned_rows[1:]:
+            cleaned_data_row = clean_data_row_labels(data_row, header)
+
+            # Ensure row length matches header (pad if needed)
+            while len(cleaned_data_row) < len(header):
+                cleaned_data_row.append("")
+
+            # Remove empty cells at the end (but keep structure)
+            while len(cleaned_data_row) > len(header) and cleaned_data_row[-1] == "":
+                cleaned_data_row.pop()
+
+            # Keep row if it has any non-empty cells
+            if any(cell for cell in cleaned_data_row):
+                cleaned_data.append(cleaned_data_row[:len(header)])
+        cleaned_rows = cleaned_data
+
+    # Additional pass: fill remaining merged cell values
+    # This handles cases where Allowable values need to be repeated
+    if len(cleaned_rows) > 2:
+        cleaned_rows = fill_merged_cells_final_pass(cleaned_rows)
+
+    if cleaned_rows and not keep_layout_tables and is_layout_table(cleaned_rows):
+        metrics["tables_skipped"] += 1
+        warnings.append(f"Layout-like table skipped on page {page_index} index {table_index}")
+        return None
+
+    if not cleaned_rows:
+        metrics["tables_skipped"] += 1
+        return None
+
+    metrics["tables_kept"] += 1
+    original_cols = len(table[0]) if table and table[0] else 0
+    cleaned_cols = len(cleaned_rows[0]) if cleaned_rows else 0
+    return {
+        "page": page_index,
+        "index": table_index,
+        "rows": cleaned_rows,
+        "original_cols": original_cols,
+        "cleaned_cols": cleaned_cols,
+        "removed_empty_cols": empty_cols,
+        "header_merged": merged,
     }
 
-    text_parts: List[str] = []
-    tables: List[Dict[str, Any]] = []
-    warnings: List[str] = []
-    metrics = {
+
+def new_metrics() -> Dict[str, int]:
+    return {
         "tables_found": 0,
         "tables_kept": 0,
         "tables_skipped": 0,
@@ -656,96 +719,61 @@ def extract_pdf_to_markdown_improved(
         "header_compacted": 0,
     }
 
+
+def iter_pdf_pages_improved(
+    pdf_path: Path,
+    keep_layout: bool = False,
+    keep_layout_tables: bool = False,
+    meta: Optional[Dict[str, Any]] = None,
+    metrics: Optional[Dict[str, int]] = None,
+    warnings: Optional[List[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one record per page: {"page", "parts" (Markdown blocks), "tables"}.
+
+    meta["pages"], metrics and warnings are updated in place. Each page's
+    pdfplumber caches are flushed after its record is built, so memory stays
+    bounded by one page.
+    """
+    metrics = metrics if metrics is not None else new_metrics()
+    warnings = warnings if warnings is not None else []
+
     with pdfplumber.open(pdf_path) as pdf:
-        meta["pages"] = len(pdf.pages)
+        if meta is not None:
+            meta["pages"] = len(pdf.pages)
 
         for page_index, page in enumerate(pdf.pages, start=1):
+            parts: List[str] = []
+            tables: List[Dict[str, Any]] = []
             text = page.extract_text(
                 x_tolerance=1.5 if keep_layout else 3.0,
                 y_tolerance=1.5 if keep_layout else 3.0,
             )
             if text:
-                text_parts.append(f"## Page {page_index}\n\n{text}")
+                parts.append(f"## Page {page_index}\n\n{text}")
             else:
-                text_parts.append(f"## Page {page_index}\n\n*[No text content]*")
+                parts.append(f"## Page {page_index}\n\n*[No text content]*")
 
             try:
                 page_tables = page.extract_tables() or []
             except Exception as exc:
                 warnings.append(f"Table extraction failed on page {page_index}: {exc}")
-                continue
+                page_tables = []
 
             for table_index, table in enumerate(page_tables):
-                metrics["tables_found"] += 1
-                if not table:
-                    metrics["tables_skipped"] += 1
-                    continue
+                record = clean_extracted_table(
+                    table, page_index, table_index, keep_layout_tables, metrics, warnings
+                )
+                if record is not None:
+                    tables.append(record)
+                    parts.append(table_to_markdown(record["rows"], f"Table {page_index}-{table_index}"))
 
-                cleaned_rows, empty_cols = clean_table_rows(table)
-                cleaned_rows, merged = merge_multi_line_header(cleaned_rows)
-                if merged:
-                    metrics["header_merged"] += 1
-                cleaned_rows, compacted = compact_header_and_units(cleaned_rows)
-                if compacted:
-                    metrics["header_compacted"] += 1
-                
-                # Fix S.No. column positioning
-                if len(cleaned_rows) > 1:
-                    cleaned_rows = fix_sno_column(cleaned_rows)
-                
-                # Clean data rows: remove label text and stage indices
-                if len(cleaned_rows) > 1:
-                    header = cleaned_rows[0]
-                    cleaned_data = [header]
-                    for data_row in cleaned_rows[1:]:
-                        cleaned_data_row = clean_data_row_labels(data_row, header)
-                        
-                        # Ensure row length matches header (pad if needed)
-                        while len(cleaned_data_row) < len(header):
-                            cleaned_data_row.append("")
-                        
-                        # Remove empty cells at the end (but keep structure)
-                        while len(cleaned_data_row) > len(header) and cleaned_data_row[-1] == "":
-                            cleaned_data_row.pop()
-                        
-                        # Keep row if it has any non-empty cells
-                        if any(cell for cell in cleaned_data_row):
-                            cleaned_data.append(cleaned_data_row[:len(header)])
-                    cleaned_rows = cleaned_data
-                
-                # Additional pass: fill remaining merged cell values
-                # This handles cases where Allowable values need to be repeated
-                if len(cleaned_rows) > 2:
-                    cleaned_rows = fill_merged_cells_final_pass(cleaned_rows)
-
-                if cleaned_rows and not keep_layout_tables and is_layout_table(cleaned_rows):
-                    metrics["tables_skipped"] += 1
-                    warnings.append(f"Layout-like table skipped on page {page_index} index {table_index}")
-                    continue
-
-                if cleaned_rows:
-                    metrics["tables_kept"] += 1
-                    original_cols = len(table[0]) if table and table[0] else 0
-                    cleaned_cols = len(cleaned_rows[0]) if cleaned_rows else 0
-                    tables.append(
-                        {
-                            "page": page_index,
-                            "index": table_index,
-                            "rows": cleaned_rows,
-                            "original_cols": original_cols,
-                            "cleaned_cols": cleaned_cols,
-                            "removed_empty_cols": empty_cols,
-                            "header_merged": merged,
-                        }
-                    )
-                    table_id = f"Table {page_index}-{table_index}"
-                    text_parts.append(table_to_markdown(cleaned_rows, table_id))
-                else:
-                    metrics["tables_skipped"] += 1
+            page.close()  # flush pdfplumber's per-page caches
+            yield {"page": page_index, "parts": parts, "tables": tables}
 
-    markdown_content = "\n\n".join(text_parts).strip()
 
-    metadata_header = (
+def markdown_header(pdf_path: Path, meta: Dict[str, Any], metrics: Dict[str, int]) -> str:
+    return (
         f"# {pdf_path.stem}\n\n"
         f"**Source:** `{pdf_path.name}`  \n"
         f"**Type:** PDF  \n"
@@ -755,7 +783,34 @@ def extract_pdf_to_markdown_improved(
         "---\n\n"
     )
 
-    full_markdown = metadata_header + markdown_content
+
+def new_meta(pdf_path: Path) -> Dict[str, Any]:
+    return {
+        "source": str(pdf_path),
+        "type": "pdf",
+        "pages": 0,
+        "parsed_at": utc_now_iso(),
+        "ocr": {"used": False, "engine": "none", "lang": None},
+    }
+
+
+def extract_pdf_to_markdown_improved(
+    pdf_path: Path, keep_layout: bool = False, keep_layout_tables: bool = False
+) -> Dict[str, Any]:
+    meta = new_meta(pdf_path)
+    text_parts: List[str] = []
+    tables: List[Dict[str, Any]] = []
+    warnings: List[str] = []
+    metrics = new_metrics()
+
+    for record in iter_pdf_pages_improved(
+        pdf_path, keep_layout, keep_layout_tables, meta=meta, metrics=metrics, warnings=warnings
+    ):
+        text_parts.extend(record["parts"])
+        tables.extend(record["tables"])
+
+    markdown_content = "\n\n".join(text_parts).strip()
+    full_markdown = markdown_header(pdf_path, meta, metrics) + markdown_content
 
     return {
         "meta": meta,
@@ -767,6 +822,70 @@ def extract_pdf_to_markdown_improved(
     }
 
 
+def stream_pdf_to_markdown_improved(
+    pdf_path: Path,
+    output_path: Path,
+    keep_layout: bool = False,
+    keep_layout_tables: bool = False,
+    jsonl_path: Optional[Path] = None,
+    tables_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Bounded-memory variant of extract_pdf_to_markdown_improved for very large PDFs.
+
+    Markdown is appended page by page to a temporary body file and then copied
+    behind the header (whose table count is known only at the end), so the .md is
+    identical to the non-streaming output. Optionally writes one JSONL line per
+    page (final line: meta/metrics/warnings) and one CSV per kept table.
+    Returns {"meta", "metrics", "warnings"}.
+    """
+    meta = new_meta(pdf_path)
+    metrics = new_metrics()
+    warnings: List[str] = []
+    body_path = output_path.with_name(output_path.name + ".body.tmp")
+    jsonl = jsonl_path.open("w", encoding="utf-8") if jsonl_path else None
+    if tables_dir:
+        tables_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        with body_path.open("w", encoding="utf-8") as body:
+            first = True
+            pending = ""  # trailing whitespace, written only if more content follows (= final strip)
+            for record in iter_pdf_pages_improved(
+                pdf_path, keep_layout, keep_layout_tables, meta=meta, metrics=metrics, warnings=warnings
+            ):
+                for part in record["parts"]:
+                    # the first part is always a "## Page" heading (no leading whitespace)
+                    chunk = part if first else "\n\n" + part
+                    first = False
+                    kept = chunk.rstrip()
+                    if kept:
+                        body.write(pending + kept)
+                        pending = chunk[len(kept):]
+                    else:
+                        pending += chunk
+                if jsonl:
+                    jsonl.write(json.dumps(record, ensure_ascii=False) + "\n")
+                if tables_dir:
+                    for table in record["tables"]:
+                        csv_path = tables_dir / f"{pdf_path.stem}.table-{table['page']}-{table['index']}.csv"
+                        with csv_path.open("w", newline="", encoding="utf-8") as f:
+                            csv.writer(f).writerows(table["rows"])
+
+        with output_path.open("w", encoding="utf-8") as out, body_path.open(encoding="utf-8") as body:
+            out.write(markdown_header(pdf_path, meta, metrics))
+            shutil.copyfileobj(body, out)
+        if jsonl:
+            jsonl.write(
+                json.dumps({"meta": meta, "metrics": metrics, "warnings": warnings}, ensure_ascii=False) + "\n"
+            )
+    finally:
+        if jsonl:
+            jsonl.close()
+        body_path.unlink(missing_ok=True)
+
+    return {"meta": meta, "metrics": metrics, "warnings": warnings}
+
+
 def update_run_report(report_path: Path, new_run: Dict[str, Any]) -> None:
     existing: Any = None
     if report_path.exists():
@@ -804,6 +923,12 @@ def main() -> int:
         help="Output Markdown file path (default: out/<stem>_improved.md)",
     )
     parser.add_argument("--json", dest="write_json", action="store_true", help="Write JSON output")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Bounded-memory mode for very large PDFs: write pages as they are read "
+        "(--json writes <out>.jsonl, tables go to <out>_tables/*.csv)",
+    )
     parser.add_argument(
         "--report",
         dest="report_path",
@@ -846,18 +971,32 @@ def main() -> int:
 
     print(f"Converting {pdf_path.name} to Markdown (improved table extraction)...")
     try:
-        result = extract_pdf_to_markdown_improved(
-            pdf_path, keep_layout=args.keep_layout, keep_layout_tables=args.keep_layout_tables
-        )
-        output_path.write_text(result["markdown"], encoding="utf-8")
-        print(f"[OK] Markdown saved to: {output_path}")
-
-        if args.write_json:
-            json_path = output_path.with_suffix(".json")
-            json_path.write_text(
-                json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8"
+        if args.stream:
+            jsonl_path = output_path.with_suffix(".jsonl") if args.write_json else None
+            result = stream_pdf_to_markdown_improved(
+                pdf_path,
+                output_path,
+                keep_layout=args.keep_layout,
+                keep_layout_tables=args.keep_layout_tables,
+                jsonl_path=jsonl_path,
+                tables_dir=output_path.with_name(f"{output_path.stem}_tables"),
+            )
+            print(f"[OK] Markdown saved to: {output_path}")
+            if jsonl_path:
+                print(f"[OK] JSONL saved to: {jsonl_path}")
+        else:
+            result = extract_pdf_to_markdown_improved(
+                pdf_path, keep_layout=args.keep_layout, keep_layout_tables=args.keep_layout_tables
             )
-            print(f"[OK] JSON saved to: {json_path}")
+            output_path.write_text(result["markdown"], encoding="utf-8")
+            print(f"[OK] Markdown saved to: {output_path}")
+
+            if args.write_json:
+                json_path = output_path.with_suffix(".json")
+                json_path.write_text(
+                    json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8"
+                )
+                print(f"[OK] JSON saved to: {json_path}")
     except Exception as exc:
         status = "failed"
         error_message = str(exc)
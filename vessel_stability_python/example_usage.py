@@ -5,11 +5,9 @@ Vessel Stability Calculator 사용 예제
 
 from src.vessel_stability_functions import (
     StabilityCalculator,
-    VesselParticulars,
-    load_excel_data,
-    extract_particulars_from_sheet,
-    extract_hydrostatic_from_sheet
+    VesselParticulars
 )
+from src.booklet import Booklet
 
 
 def main():
@@ -24,12 +22,12 @@ def main():
     
     try:
         file_path = "data/1.Vessel Stability Booklet.xls"
-        data = load_excel_data(file_path)
+        booklet = Booklet.open(file_path)  # 두 번째 실행부터 캐시 아티팩트 사용
         
-        particulars = extract_particulars_from_sheet(data.get('PRINCIPAL PARTICULARS'))
-        hydrostatic = extract_hydrostatic_from_sheet(data.get('Hydrostatic'))
+        particulars = booklet.particulars
+        hydrostatic = booklet.hydrostatic
         
-        calculator = StabilityCalculator(particulars)
+        calculator = booklet.calculator()
         
         # BG 계산
         bg = calculator.calculate_bg(hydrostatic.lcb, hydrostatic.lcg)
@@ -0,0 +1,306 @@
+"""
+TR 적재 단계별 발라스트 계획 최적화
+단계별 화물 위치와 Trim/List/Draft 허용 범위를 주면, 이전 단계 대비 이동량(t)이 최소인
+탱크별 발라스트 중량을 찾는다.
+
+- 조건 계산: StabilityCalculator.evaluate_conditions (현재 계획 + 탱크별 1 t 섭동을 한 번에 배치 계산)
+- 탐색: 순차 선형 계획법 (SLP) - 섭동으로 얻은 기울기로 선형화하고 scipy linprog(HiGHS)로
+  min Σ|w - w_prev| 를 풀고, 실제 조건을 다시 계산해 범위를 만족할 때까지 반복
+- 범위를 만족할 수 없으면 위반량이 가장 작은 계획을 feasible=False로 반환
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy.optimize import linprog  # 선택: 발라스트 최적화에만 필요
+except ImportError:
+    linprog = None
+
+try:
+    from .vessel_stability_functions import StabilityCalculator, LoadItem, CONDITION_DTYPE
+except ImportError:  # src/ 에서 직접 실행
+    from vessel_stability_functions import StabilityCalculator, LoadItem, CONDITION_DTYPE
+
+Window = Tuple[Optional[float], Optional[float]]
+
+# Volum 시트 열 위치 (validate_volum_calculations와 동일, 탱크명/FSM 열 포함)
+VOLUM_COLUMNS = {
+    'name': 1, 'density': 3, 'capacity': 4, 'weight': 6,
+    'lcg': 7, 'vcg': 9, 'tcg': 11, 'fsm': 14,
+}
+
+# 결과 표에 넣는 조건 값
+STAGE_TABLE_FIELDS = ('displacement', 'draft_ap', 'draft_fp', 'trim', 'list_deg', 'gm')
+
+
+@dataclass
+class BallastTank:
+    """발라스트 탱크 (Volum 시트 1행)"""
+    name: str
+    capacity: float          # 100% 중량 (t)
+    lcg: float
+    vcg: float
+    tcg: float
+    fsm: float = 0.0         # 부분 적재(slack) 시 자유표면 모멘트 (t·m)
+    min_weight: float = 0.0  # 펌프 흡입 한계 등 최소 중량 (t)
+
+
+@dataclass
+class BallastStage:
+    """
+    적재 단계 1개
+    windows: {CONDITION_DTYPE 필드: (최소, 최대)}, None은 제한 없음
+             예) {'trim': (-0.3, 0.3), 'list_deg': (-0.5, 0.5), 'draft_fp': (None, 2.6)}
+    locked: 이 단계에서 조작하지 않는 탱크 이름
+    """
+    name: str
+    loads: List[LoadItem] = field(default_factory=list)
+    windows: Dict[str, Window] = field(default_factory=dict)
+    locked: Sequence[str] = ()
+
+
+@dataclass
+class BallastPlan:
+    """단계별 발라스트 계획"""
+    weights: np.ndarray      # (단계 수, 탱크 수) 탱크 중량 (t)
+    conditions: np.ndarray   # (단계 수,) CONDITION_DTYPE
+    feasible: np.ndarray     # (단계 수,) 모든 범위 만족 여부
+    table: pd.DataFrame      # 단계 × (탱크 중량, 이동량, 조건 값, feasible)
+
+
+class BallastOptimizer:
+    """단계별 최소 이동량 발라스트 계획"""
+
+    def __init__(self,
+                 calculator: StabilityCalculator,
+                 tanks: Sequence[BallastTank],
+                 fixed_loads: Optional[List[LoadItem]] = None,
+                 max_iterations: int = 10,
+                 tolerance: float = 1e-3,
+                 step: float = 1.0):
+        """
+        Args:
+            calculator: hydrostatic_table이 지정된 StabilityCalculator
+            tanks: 조작 가능한 발라스트 탱크
+            fixed_loads: 모든 단계에 공통인 하중 (연료/청수 등)
+            max_iterations: 단계별 SLP 반복 횟수
+            tolerance: 범위 위반 허용치 (필드 단위)
+            step: 기울기 계산용 탱크 섭동 중량 (t)
+        """
+        if linprog is None:
+            raise ImportError("BallastOptimizer: scipy가 필요합니다 (pip install scipy)")
+        if calculator.hydrostatic_table is None:
+            raise ValueError("BallastOptimizer: hydrostatic_table이 필요합니다 (HydrostaticTable)")
+        if not tanks:
+            raise ValueError("BallastOptimizer: 발라스트 탱크가 없습니다")
+
+        self.calculator = calculator
+        self.tanks = list(tanks)
+        self.fixed_loads = list(fixed_loads or [])
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.step = step
+
+        self.names = [tank.name for tank in self.tanks]
+        self.capacity = np.array([tank.capacity for tank in self.tanks], dtype=np.float64)
+        self.min_weight = np.array([tank.min_weight for tank in self.tanks], dtype=np.float64)
+        self.lcg = np.array([tank.lcg for tank in self.tanks], dtype=np.float64)
+        self.vcg = np.array([tank.vcg for tank in self.tanks], dtype=np.float64)
+        self.tcg = np.array([tank.tcg for tank in self.tanks], dtype=np.float64)
+        self.fsm = np.array([tank.fsm for tank in self.tanks], dtype=np.float64)
+
+    # ============================================================
+    # 계산
+    # ============================================================
+
+    def evaluate(self, weights: np.ndarray, loads: Optional[List[LoadItem]] = None) -> np.ndarray:
+        """
+        (N, 탱크 수) 발라스트 중량 → CONDITION_DTYPE (N,)
+        FSM은 부분 적재 탱크(0 < 중량 < 용량)에만 적용
+        """
+        weights = np.atleast_2d(weights)
+        slack = (weights > 1e-6) & (weights < self.capacity - 1e-6)
+        return self.calculator.evaluate_conditions(
+            weights, self.lcg, self.vcg, self.tcg, np.where(slack, self.fsm, 0.0),
+            loads=self.fixed_loads + list(loads or []),
+        )
+
+    def optimize(self,
+                 stages: Sequence[BallastStage],
+                 initial: Optional[Sequence[float]] = None) -> BallastPlan:
+        """
+        단계 순서대로 발라스트 계획 (각 단계는 이전 단계 중량에서 출발)
+
+        Args:
+            stages: 적재 단계 목록
+            initial: 출발 탱크 중량 (기본: 모두 0)
+
+        Returns:
+            BallastPlan
+        """
+        current = np.zeros(len(self.tanks)) if initial is None else np.asarray(initial, dtype=np.float64)
+        if current.shape != self.capacity.shape:
+            raise ValueError("BallastOptimizer: initial 길이가 탱크 수와 다릅니다")
+
+        weights = np.zeros((len(stages), len(self.tanks)))
+        conditions = np.zeros(len(stages), dtype=CONDITION_DTYPE)
+        feasible = np.zeros(len(stages), dtype=bool)
+        transfer = np.zeros(len(stages))
+        for i, stage in enumerate(stages):
+            unknown = [name for name in stage.windows if name not in CONDITION_DTYPE.names]
+            if unknown:
+                raise KeyError(f"BallastStage '{stage.name}': 알 수 없는 범위 필드 {unknown}")
+            solved, condition, ok = self._solve_stage(stage, current)
+            transfer[i] = np.abs(solved - current).sum()
+            weights[i], conditions[i], feasible[i] = solved, condition, ok
+            current = solved
+
+        table = pd.DataFrame(weights, columns=self.names)
+        table.insert(0, 'stage', [stage.name for stage in stages])
+        table['transfer'] = transfer
+        for name in STAGE_TABLE_FIELDS:
+            table[name] = conditions[name]
+        table['feasible'] = feasible
+        return BallastPlan(weights=weights, conditions=conditions, feasible=feasible, table=table)
+
+    # ============================================================
+    # 단계별 SLP
+    # ============================================================
+
+    def _violation(self, conditions: np.ndarray, windows: Dict[str, Window]) -> np.ndarray:
+        """조건별 범위 위반량 합계 (N,)"""
+        total = np.zeros(len(conditions))
+        for name, (low, high) in windows.items():
+            values = np.nan_to_num(conditions[name], nan=np.inf)
+            if low is not None:
+                total += np.maximum(low - values, 0.0)
+            if high is not None:
+                total += np.maximum(values - high, 0.0)
+        return total
+
+    def _solve_stage(self,
+                     stage: BallastStage,
+                     start: np.ndarray) -> Tuple[np.ndarray, np.ndarray, bool]:
+        locked = np.isin(self.names, list(stage.locked))
+        lower = np.where(locked, start, np.minimum(self.min_weight, start))
+        upper = np.where(locked, start, self.capacity)
+        fields = list(stage.windows)
+
+        x = np.clip(start, lower, upper)
+        radius = np.inf
+        best = None
+        for _ in range(max(1, self.max_iterations)):
+            # 현재 계획 + 탱크별 섭동 (용량 끝이면 반대 방향)
+            delta = np.where(x + self.step <= upper, self.step, -self.step)
+            rows = self.evaluate(np.vstack([x, x + np.diag(delta)]), stage.loads)
+            base = rows[0]
+            violation = float(self._violation(rows[:1], stage.windows)[0])
+            score = (max(violation - self.tolerance, 0.0), float(np.abs(x - start).sum()))
+
+            if best is None or score <= best[2]:
+                best = (x, base, score, violation)
+            else:
+                # 선형화 오차로 나빠짐: 이전 최선 계획에서 이동 범위를 줄여 다시
+                radius = max(np.abs(x - best[0]).max(), self.step) / 2.0
+                x = best[0]
+                continue
+            if not fields:
+                break
+
+            gradient = np.array([(rows[1:][name] - base[name]) / delta for name in fields])
+            x_new = self._linear_program(
+                start, x, lower, upper, radius, fields, stage.windows, base, gradient
+            )
+            if x_new is None or np.allclose(x_new, x, atol=1e-6):
+                break
+            x = x_new
+
+        x, base, _, violation = best
+        return x, base, violation <= self.tolerance
+
+    def _linear_program(self,
+                        start: np.ndarray,
+                        x: np.ndarray,
+                        lower: np.ndarray,
+                        upper: np.ndarray,
+                        radius: float,
+                        fields: List[str],
+                        windows: Dict[str, Window],
+                        base: np.void,
+                        gradient: np.ndarray) -> Optional[np.ndarray]:
+        """
+        min Σd + penalty·Σs
+        변수: w (탱크 중량), d ≥ |w - start| (이동량), s ≥ 0 (범위 위반 여유)
+        제약: low - s ≤ base + gradient·(w - x) ≤ high + s
+        """
+        n_tanks, n_fields = len(start), len(fields)
+        penalty = 1e3 * max(self.capacity.sum(), 1.0)
+        c = np.concatenate([np.zeros(n_tanks), np.ones(n_tanks), np.full(n_fields, penalty)])
+
+        eye = np.eye(n_tanks)
+        a_ub = [np.hstack([eye, -eye, np.zeros((n_tanks, n_fields))]),
+                np.hstack([-eye, -eye, np.zeros((n_tanks, n_fields))])]
+        b_ub = [start, -start]
+        for k, name in enumerate(fields):
+            low, high = windows[name]
+            row_slack = np.zeros(n_fields)
+            row_slack[k] = -1.0
+            offset = float(base[name]) - gradient[k] @ x
+            if high is not None:
+                a_ub.append(np.concatenate([gradient[k], np.zeros(n_tanks), row_slack])[None, :])
+                b_ub.append([high - offset])
+            if low is not None:
+                a_ub.append(np.concatenate([-gradient[k], np.zeros(n_tanks), row_slack])[None, :])
+                b_ub.append([offset - low])
+
+        w_low = np.maximum(lower, x - radius)
+        w_high = np.minimum(upper, x + radius)
+        bounds = list(zip(w_low, w_high)) + [(0, None)] * (n_tanks + n_fields)
+        result = linprog(c, A_ub=np.vstack(a_ub), b_ub=np.concatenate(b_ub),
+                         bounds=bounds, method='highs')
+        if not result.success:
+            return None
+        return np.clip(result.x[:n_tanks], lower, upper)
+
+
+def extract_tanks_from_volum_sheet(df: pd.DataFrame,
+                                   names: Optional[Sequence[str]] = None
+                                   ) -> Tuple[List[BallastTank], np.ndarray]:
+    """
+    Volum 시트 → (발라스트 탱크 목록, 현재 중량)
+    용량(m³) × 비중 = 100% 중량, names가 주어지면 해당 탱크만
+
+    Returns:
+        (탱크 목록, (탱크 수,) 현재 중량)
+    """
+    tanks = []
+    current = []
+    cols = VOLUM_COLUMNS
+    for _, row in df.iterrows():
+        name = row.get(cols['name'])
+        if pd.isna(name):
+            continue
+        name = str(name).strip()
+        if names is not None and name not in names:
+            continue
+        numbers = {
+            key: pd.to_numeric(row.get(j), errors='coerce')
+            for key, j in cols.items() if key != 'name'
+        }
+        if pd.isna(numbers['capacity']) or pd.isna(numbers['density']) or pd.isna(numbers['lcg']):
+            continue
+        numbers = {key: 0.0 if pd.isna(value) else float(value) for key, value in numbers.items()}
+        tanks.append(BallastTank(
+            name=name,
+            capacity=numbers['capacity'] * numbers['density'],
+            lcg=numbers['lcg'],
+            vcg=numbers['vcg'],
+            tcg=numbers['tcg'],
+            fsm=numbers['fsm'],
+        ))
+        current.append(numbers['weight'])
+    return tanks, np.array(current, dtype=np.float64)
@@ -0,0 +1,335 @@
+"""
+Vessel Stability Booklet 파싱 결과 캐시
+부클릿 .xls를 한 번만 읽어 (load_excel_data → extract_* → HydrostaticTable/KNTable)
+파일 해시(SHA-256)별 아티팩트로 저장하고, 이후에는 Booklet.open(path)로 바로 로드
+
+아티팩트 (<부클릿 폴더>/.booklet_cache/):
+- <이름>.<해시>.json: 버전, 원본 해시, 시트 이름, 주요 제원, Hydrostatic 시트 값
+- <이름>.<해시>.npz: 수정 표/KN 표 배열, 모든 시트 셀 (행, 열, 종류, 숫자, 문자열)
+JSON은 open 시 읽고, npz는 수정 표/KN 표/시트를 처음 사용할 때 읽는다.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .vessel_stability_functions import (
+        StabilityCalculator, VesselParticulars, HydrostaticData,
+        load_excel_data, extract_particulars_from_sheet, extract_hydrostatic_from_sheet
+    )
+    from .hydrostatic_table import HydrostaticTable
+    from .gz_curve import KNTable
+except ImportError:  # src/ 에서 직접 실행
+    from vessel_stability_functions import (
+        StabilityCalculator, VesselParticulars, HydrostaticData,
+        load_excel_data, extract_particulars_from_sheet, extract_hydrostatic_from_sheet
+    )
+    from hydrostatic_table import HydrostaticTable
+    from gz_curve import KNTable
+
+# 파싱 로직이 바뀌면 올린다 (이전 아티팩트는 다시 생성)
+BOOKLET_CACHE_VERSION = 1
+BOOKLET_CACHE_DIR = ".booklet_cache"
+SAFE_NAME_PATTERN = re.compile(r'[^\w.-]+')
+
+# 시트 셀 종류
+CELL_FLOAT, CELL_INT, CELL_BOOL, CELL_TEXT, CELL_DATETIME = range(5)
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """파일 내용 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Booklet:
+    """파싱된 부클릿 (수정 표/KN 표/시트는 처음 사용할 때 로드)"""
+
+    def __init__(self,
+                 source: Path,
+                 manifest: Dict,
+                 arrays_path: Optional[Path] = None,
+                 arrays: Optional[Dict[str, np.ndarray]] = None):
+        self.source = source
+        self.manifest = manifest
+        self.arrays_path = arrays_path
+        self._arrays = arrays
+        self._hydrostatic_table: Optional[HydrostaticTable] = None
+        self._kn_table: Optional[KNTable] = None
+        self._sheets: Optional[Dict[str, pd.DataFrame]] = None
+
+    # ============================================================
+    # 열기 / 컴파일
+    # ============================================================
+
+    @classmethod
+    def open(cls,
+             path: Union[str, Path],
+             cache_dir: Union[str, Path, None] = None,
+             rebuild: bool = False) -> 'Booklet':
+        """
+        부클릿 열기: 같은 해시의 아티팩트가 있으면 JSON만 읽고, 없으면 컴파일 후 저장
+
+        Args:
+            path: 부클릿 Excel 파일
+            cache_dir: 아티팩트 폴더 (기본: <부클릿 폴더>/.booklet_cache)
+            rebuild: True면 아티팩트를 다시 생성
+        """
+        source = Path(path)
+        digest = file_sha256(source)
+        manifest_path, arrays_path = cls.artifact_paths(source, digest, cache_dir)
+        if not rebuild and manifest_path.exists() and arrays_path.exists():
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+                if manifest.get('version') == BOOKLET_CACHE_VERSION:
+                    return cls(source, manifest, arrays_path=arrays_path)
+            except (OSError, ValueError):
+                pass
+        return cls.compile(source, cache_dir, digest=digest)
+
+    @staticmethod
+    def artifact_paths(source: Path, digest: str, cache_dir: Union[str, Path, None] = None):
+        """(manifest JSON, 배열 npz) 경로 - 파일 해시 기준"""
+        folder = Path(cache_dir) if cache_dir is not None else source.parent / BOOKLET_CACHE_DIR
+        stem = f"{SAFE_NAME_PATTERN.sub('_', source.stem)}.{digest[:16]}"
+        return folder / f"{stem}.json", folder / f"{stem}.npz"
+
+    @classmethod
+    def compile(cls,
+                path: Union[str, Path],
+                cache_dir: Union[str, Path, None] = None,
+                digest: Optional[str] = None) -> 'Booklet':
+        """
+        부클릿 Excel을 파싱해 아티팩트 저장
+        (저장 실패 시, 또는 로드하지 못한 시트가 있으면 메모리 결과만 반환)
+        """
+        source = Path(path)
+        digest = digest or file_sha256(source)
+        failed_sheets: List[str] = []
+        data = load_excel_data(str(source), failed=failed_sheets)
+
+        particulars = extract_particulars_from_sheet(data.get('PRINCIPAL PARTICULARS', pd.DataFrame()))
+        hydrostatic = extract_hydrostatic_from_sheet(data.get('Hydrostatic', pd.DataFrame()))
+        arrays = _encode_sheets(data)
+        try:
+            arrays.update(_encode_hydrostatic_table(HydrostaticTable.from_sheets(data)))
+        except ValueError:
+            pass
+        try:
+            arrays.update(_encode_kn_table(KNTable.from_sheets(data)))
+        except ValueError:
+            pass
+
+        manifest = {
+            'version': BOOKLET_CACHE_VERSION,
+            'source': source.name,
+            'sha256': digest,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'sheet_names': list(data.keys()),
+            'particulars': asdict(particulars),
+            'hydrostatic': asdict(hydrostatic),
+        }
+        booklet = cls(source, manifest, arrays=arrays)
+        booklet._sheets = data
+        if failed_sheets:
+            return booklet  # 일부 시트만 파싱된 결과는 캐시하지 않음 (다음 open에서 다시 시도)
+
+        manifest_path, arrays_path = cls.artifact_paths(source, digest, cache_dir)
+        try:
+            _write_artifact(manifest_path, arrays_path, manifest, arrays)
+            booklet.arrays_path = arrays_path
+        except OSError:
+            pass  # 읽기 전용 폴더: 이번에는 메모리 결과 사용
+        return booklet
+
+    # ============================================================
+    # 데이터
+    # ============================================================
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self.manifest['sheet_names'])
+
+    @property
+    def particulars(self) -> VesselParticulars:
+        """PRINCIPAL PARTICULARS 시트 (extract_particulars_from_sheet 결과)"""
+        return VesselParticulars(**self.manifest['particulars'])
+
+    @property
+    def hydrostatic(self) -> HydrostaticData:
+        """Hydrostatic 시트 (extract_hydrostatic_from_sheet 결과)"""
+        return HydrostaticData(**self.manifest['hydrostatic'])
+
+    @property
+    def arrays(self) -> Dict[str, np.ndarray]:
+        if self._arrays is None:
+            with np.load(self.arrays_path, allow_pickle=False) as npz:
+                self._arrays = {key: npz[key] for key in npz.files}
+        return self._arrays
+
+    @property
+    def hydrostatic_table(self) -> Optional[HydrostaticTable]:
+        """'Trim = x' 시트 수정 표 (없으면 None)"""
+        if self._hydrostatic_table is None and 'hydro_trims' in self.arrays:
+            self._hydrostatic_table = _decode_hydrostatic_table(self.arrays)
+        return self._hydrostatic_table
+
+    @property
+    def kn_table(self) -> Optional[KNTable]:
+        """KN 표 (없으면 None)"""
+        if self._kn_table is None and 'kn_trims' in self.arrays:
+            a = self.arrays
+            self._kn_table = KNTable(
+                a['kn_trims'], [a['kn_displacements']] * len(a['kn_trims']), a['kn_heels'], list(a['kn_values'])
+            )
+        return self._kn_table
+
+    @property
+    def sheets(self) -> Dict[str, pd.DataFrame]:
+        """모든 시트 (load_excel_data 결과와 같은 형식, header=None)"""
+        if self._sheets is None:
+            self._sheets = _decode_sheets(self.arrays)
+        return self._sheets
+
+    def sheet(self, name: str) -> pd.DataFrame:
+        return self.sheets.get(name, pd.DataFrame())
+
+    def calculator(self) -> StabilityCalculator:
+        """주요 제원 + 수정 표 + KN 표가 지정된 StabilityCalculator"""
+        return StabilityCalculator(
+            self.particulars,
+            hydrostatic_table=self.hydrostatic_table,
+            kn_table=self.kn_table,
+        )
+
+
+# ============================================================
+# 아티팩트 인코딩
+# ============================================================
+
+def _write_artifact(manifest_path: Path,
+                    arrays_path: Path,
+                    manifest: Dict,
+                    arrays: Dict[str, np.ndarray]) -> None:
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_arrays = arrays_path.with_suffix('.tmp.npz')
+    np.savez(tmp_arrays, **arrays)
+    tmp_arrays.replace(arrays_path)
+    tmp_manifest = manifest_path.with_suffix('.tmp')
+    tmp_manifest.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+    tmp_manifest.replace(manifest_path)
+
+    # 같은 부클릿의 이전 버전 아티팩트 삭제 (<이름>.<해시 16자>.json/npz 및 임시 파일만)
+    prefix = manifest_path.name.rsplit('.', 2)[0]
+    pattern = re.compile(rf"{re.escape(prefix)}\.[0-9a-f]{{16}}\.(?:json|npz|tmp|tmp\.npz)")
+    for stale in manifest_path.parent.glob(f"{prefix}.*"):
+        if pattern.fullmatch(stale.name) and stale not in (manifest_path, arrays_path):
+            stale.unlink(missing_ok=True)
+
+
+def _encode_hydrostatic_table(table: HydrostaticTable) -> Dict[str, np.ndarray]:
+    lengths = [len(t['T']) for t in table.tables]
+    return {
+        'hydro_trims': table.trims,
+        'hydro_columns': np.array(table.columns),
+        'hydro_offsets': np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+        'hydro_values': np.vstack([
+            np.column_stack([t[col] for col in table.columns]) for t in table.tables
+        ]),
+    }
+
+
+def _decode_hydrostatic_table(arrays: Dict[str, np.ndarray]) -> HydrostaticTable:
+    columns = [str(c) for c in arrays['hydro_columns']]
+    offsets = arrays['hydro_offsets']
+    values = arrays['hydro_values']
+    tables = [
+        {col: values[offsets[i]:offsets[i + 1], j] for j, col in enumerate(columns)}
+        for i in range(len(offsets) - 1)
+    ]
+    return HydrostaticTable(arrays['hydro_trims'], tables)
+
+
+def _encode_kn_table(table: KNTable) -> Dict[str, np.ndarray]:
+    return {
+        'kn_trims': table.trims,
+        'kn_displacements': table.displacements,
+        'kn_heels': table.heel_angles,
+        'kn_values': table.kn,
+    }
+
+
+def _encode_sheets(data: Dict[str, pd.DataFrame]) -> Dict[str, np.ndarray]:
+    """
+    시트 → 비어 있지 않은 셀 목록 (시트, 행, 열, 종류, 숫자, 문자열)
+    숫자/불리언은 float64, 문자열/날짜는 문자열 배열
+    """
+    shapes, cell_sheet, cell_row, cell_col, kinds, numbers, texts = [], [], [], [], [], [], []
+    for s, df in enumerate(data.values()):
+        shapes.append(df.shape)
+        values = df.to_numpy(dtype=object)
+        rows, cols = np.nonzero(pd.notna(df).to_numpy())
+        for r, c in zip(rows.tolist(), cols.tolist()):
+            value = values[r, c]
+            if isinstance(value, (bool, np.bool_)):
+                kind, number, text = CELL_BOOL, float(value), ''
+            elif isinstance(value, (int, np.integer)):
+                kind, number, text = CELL_INT, float(value), ''
+            elif isinstance(value, (float, np.floating)):
+                kind, number, text = CELL_FLOAT, float(value), ''
+            elif isinstance(value, (datetime, pd.Timestamp)):
+                kind, number, text = CELL_DATETIME, np.nan, pd.Timestamp(value).isoformat()
+            else:
+                kind, number, text = CELL_TEXT, np.nan, str(value)
+            kinds.append(kind)
+            numbers.append(number)
+            texts.append(text)
+        cell_sheet.append(np.full(len(rows), s, dtype=np.int32))
+        cell_row.append(rows.astype(np.int32))
+        cell_col.append(cols.astype(np.int32))
+
+    empty = np.zeros(0, dtype=np.int32)
+    return {
+        'sheet_names': np.array(list(data.keys()), dtype=str),
+        'sheet_shapes': np.array(shapes, dtype=np.int64).reshape(-1, 2),
+        'cell_sheet': np.concatenate(cell_sheet) if cell_sheet else empty,
+        'cell_row': np.concatenate(cell_row) if cell_row else empty,
+        'cell_col': np.concatenate(cell_col) if cell_col else empty,
+        'cell_kind': np.array(kinds, dtype=np.uint8),
+        'cell_number': np.array(numbers, dtype=np.float64),
+        'cell_text': np.array(texts, dtype=str),
+    }
+
+
+def _decode_sheets(arrays: Dict[str, np.ndarray]) -> Dict[str, pd.DataFrame]:
+    sheets = {}
+    cell_sheet = arrays['cell_sheet']
+    for s, name in enumerate(arrays['sheet_names'].tolist()):
+        n_rows, n_cols = arrays['sheet_shapes'][s]
+        values = np.full((n_rows, n_cols), np.nan, dtype=object)
+        idx = np.flatnonzero(cell_sheet == s)
+        for i, r, c, kind in zip(idx.tolist(), arrays['cell_row'][idx].tolist(),
+                                 arrays['cell_col'][idx].tolist(), arrays['cell_kind'][idx].tolist()):
+            if kind == CELL_FLOAT:
+                values[r, c] = float(arrays['cell_number'][i])
+            elif kind == CELL_INT:
+                values[r, c] = int(arrays['cell_number'][i])
+            elif kind == CELL_BOOL:
+                values[r, c] = bool(arrays['cell_number'][i])
+            elif kind == CELL_DATETIME:
+                values[r, c] = pd.Timestamp(arrays['cell_text'][i])
+            else:
+                values[r, c] = str(arrays['cell_text'][i])
+        sheets[name] = pd.DataFrame(values).infer_objects()
+    return sheets
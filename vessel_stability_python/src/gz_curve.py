@@ -0,0 +1,456 @@
+"""
+GZ 곡선 및 IMO 복원성 기준 엔진
+부클릿의 KN(Cross Curves) 표를 한 번만 (Trim × 배수량 × 경사각) 3차원 배열로 변환하고
+여러 적하 상태의 GZ 곡선, 면적, 최대 GZ 각도, 복원 범위를 한 번에 계산
+
+- KN 보간: 배수량 × Trim 이중 선형 보간, 경사각 방향 선형 보간 (임의 경사각 격자)
+- GZ = KN - KG × Sin(Heel) (calculate_righting_arm과 동일)
+- 면적: Simpson's rule (짝수 개는 1/3 + 3/8, 불균일 간격도 지원)
+- 기준: StabilityCriterion 목록 → 조건 × 기준 합격/불합격 표
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+TRIM_TEXT_PATTERN = re.compile(r'Trim\s*=\s*(-?\d+(?:\.\d+)?)', re.IGNORECASE)
+HEEL_HEADER_PATTERN = re.compile(r'^\s*(?:KN\s*)?(\d+(?:\.\d+)?)\s*(?:°|DEG(?:REE)?S?)?\s*$', re.IGNORECASE)
+DISP_HEADERS = ('DISP', 'DISPL', 'DISPLACEMENT')
+
+# 기준 면적 구간 (도)
+AREA_RANGES = {
+    'area_0_30': (0.0, 30.0),
+    'area_0_40': (0.0, 40.0),
+    'area_30_40': (30.0, 40.0),
+}
+
+GZ_RESULT_DTYPE = np.dtype([
+    ('area_0_30', np.float64),
+    ('area_0_40', np.float64),
+    ('area_30_40', np.float64),
+    ('max_gz', np.float64),
+    ('max_gz_angle', np.float64),
+    ('gz_30', np.float64),
+    ('equilibrium_angle', np.float64),
+    ('vanishing_angle', np.float64),
+    ('range', np.float64),
+    ('gm', np.float64),
+])
+
+
+@dataclass(frozen=True)
+class StabilityCriterion:
+    """복원성 기준 1개: GZ_RESULT_DTYPE 필드 >= minimum"""
+    name: str
+    field: str
+    minimum: float
+
+
+# IMO IS Code 2008 Part A 2.2 일반 기준
+IMO_GENERAL_CRITERIA: Tuple[StabilityCriterion, ...] = (
+    StabilityCriterion('2.2.1 Area 0-30 (m·rad)', 'area_0_30', 0.055),
+    StabilityCriterion('2.2.1 Area 0-40 (m·rad)', 'area_0_40', 0.090),
+    StabilityCriterion('2.2.1 Area 30-40 (m·rad)', 'area_30_40', 0.030),
+    StabilityCriterion('2.2.2 GZ at 30° or more (m)', 'gz_30', 0.20),
+    StabilityCriterion('2.2.3 Max GZ angle (deg)', 'max_gz_angle', 25.0),
+    StabilityCriterion('2.2.4 GM (m)', 'gm', 0.15),
+)
+
+
+@dataclass
+class GZCurveResult:
+    """배치 GZ 계산 결과"""
+    heel_angles: np.ndarray      # (H,) 경사각 (도)
+    gz: np.ndarray               # (N, H) 복원팔 (m)
+    metrics: np.ndarray          # (N,) GZ_RESULT_DTYPE
+    criteria: pd.DataFrame       # (N, 기준 수 + 1) 합격 여부, 'all' = 모두 합격
+
+
+class KNTable:
+    """KN 표 (Trim × 배수량 × 경사각) → 벡터화 보간"""
+
+    def __init__(self,
+                 trims: Sequence[float],
+                 displacements: Sequence[np.ndarray],
+                 heel_angles: Sequence[float],
+                 kn: Sequence[np.ndarray]):
+        """
+        Args:
+            trims: 표별 Trim 값
+            displacements: 표별 배수량 배열 (표마다 달라도 됨)
+            heel_angles: 경사각 (도, 모든 표 공통)
+            kn: 표별 (배수량 수, 경사각 수) KN 값
+        """
+        if not kn or not (len(trims) == len(displacements) == len(kn)):
+            raise ValueError("KNTable: trims, displacements, kn 개수가 맞지 않습니다")
+
+        heels = np.asarray(heel_angles, dtype=np.float64)
+        heel_order = np.argsort(heels, kind='stable')
+        self.heel_angles = heels[heel_order]
+        if len(self.heel_angles) < 2 or np.any(np.diff(self.heel_angles) <= 0):
+            raise ValueError("KNTable: 서로 다른 경사각이 2개 이상 필요합니다")
+
+        order = np.argsort(np.asarray(trims, dtype=np.float64), kind='stable')
+        self.trims = np.asarray(trims, dtype=np.float64)[order]
+
+        # 모든 표의 배수량 합집합 격자로 재표본 (구간 선형이므로 원래 보간과 동일)
+        disps = [np.asarray(displacements[i], dtype=np.float64) for i in order]
+        self.displacements = np.unique(np.concatenate(disps))
+        self.kn = np.empty((len(self.trims), len(self.displacements), len(self.heel_angles)))
+        for t, i in enumerate(order):
+            values = np.asarray(kn[i], dtype=np.float64)[:, heel_order]
+            if values.shape != (len(disps[t]), len(self.heel_angles)):
+                raise ValueError("KNTable: kn 배열 모양이 (배수량 수, 경사각 수)가 아닙니다")
+            row_order = np.argsort(disps[t], kind='stable')
+            xp, fp = disps[t][row_order], values[row_order]
+            for h in range(len(self.heel_angles)):
+                self.kn[t, :, h] = np.interp(self.displacements, xp, fp[:, h])
+
+    # ============================================================
+    # 생성
+    # ============================================================
+
+    @classmethod
+    def from_sheets(cls, data: Dict[str, pd.DataFrame]) -> 'KNTable':
+        """
+        load_excel_data 결과에서 KN 표를 모두 읽어 생성
+        배수량 머리글(DISP)과 경사각 머리글(10, 20°, KN30, ...)이 같은 행에 있는 블록을 찾고,
+        Trim은 블록 위의 "Trim = x" 문구 또는 시트 이름에서 읽는다 (없으면 0).
+        """
+        blocks: Dict[float, Tuple[np.ndarray, np.ndarray]] = {}
+        heel_angles = None
+        for sheet_name, df in data.items():
+            if df is None or df.empty:
+                continue
+            for trim, heels, disp, kn in extract_kn_blocks_from_sheet(df, str(sheet_name)):
+                if heel_angles is None:
+                    heel_angles = heels
+                if not np.array_equal(heels, heel_angles) or trim in blocks:
+                    continue
+                blocks[trim] = (disp, kn)
+
+        if not blocks:
+            raise ValueError("KNTable: KN 표를 찾을 수 없습니다")
+        trims = list(blocks.keys())
+        return cls(trims, [blocks[t][0] for t in trims], heel_angles, [blocks[t][1] for t in trims])
+
+    # ============================================================
+    # 보간
+    # ============================================================
+
+    def kn_at(self,
+              displacement: ArrayLike,
+              trim: ArrayLike = 0.0,
+              heel_angles: Optional[ArrayLike] = None) -> np.ndarray:
+        """
+        배수량 × Trim (N개) → KN (N, 경사각 수)
+        표 범위 밖의 배수량/Trim은 끝값으로 고정, 경사각은 표 범위 안이어야 함
+        """
+        displacement, trim = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(displacement, dtype=np.float64)),
+            np.atleast_1d(np.asarray(trim, dtype=np.float64)),
+        )
+        d_low, d_high, d_factor = _bracket(self.displacements, displacement.ravel())
+        t_low, t_high, t_factor = _bracket(self.trims, trim.ravel())
+
+        d_factor = d_factor[:, None]
+        low_trim = self.kn[t_low, d_low] * (1.0 - d_factor) + self.kn[t_low, d_high] * d_factor
+        high_trim = self.kn[t_high, d_low] * (1.0 - d_factor) + self.kn[t_high, d_high] * d_factor
+        kn = low_trim + (high_trim - low_trim) * t_factor[:, None]
+
+        if heel_angles is None:
+            return kn
+        heels = np.asarray(heel_angles, dtype=np.float64)
+        if heels.min() < self.heel_angles[0] or heels.max() > self.heel_angles[-1]:
+            raise ValueError(
+                f"KNTable: 경사각은 {self.heel_angles[0]:g}° ~ {self.heel_angles[-1]:g}° 범위여야 합니다"
+            )
+        h_low, h_high, h_factor = _bracket(self.heel_angles, heels)
+        return kn[:, h_low] * (1.0 - h_factor) + kn[:, h_high] * h_factor
+
+    def gz_at(self,
+              displacement: ArrayLike,
+              trim: ArrayLike,
+              kg: ArrayLike,
+              heel_angles: Optional[ArrayLike] = None) -> np.ndarray:
+        """GZ = KN - KG × Sin(Heel) → (N, 경사각 수)"""
+        heels = self.heel_angles if heel_angles is None else np.asarray(heel_angles, dtype=np.float64)
+        kn = self.kn_at(displacement, trim, heels)
+        kg = np.atleast_1d(np.asarray(kg, dtype=np.float64)).reshape(-1, 1)
+        return kn - kg * np.sin(np.radians(heels))
+
+
+def _bracket(xp: np.ndarray, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """오름차순 xp에서 x의 구간 (low, high, factor), 범위 밖은 끝값"""
+    if len(xp) == 1:
+        zeros = np.zeros(len(x), dtype=np.intp)
+        return zeros, zeros, np.zeros(len(x))
+    xc = np.clip(x, xp[0], xp[-1])
+    high = np.clip(np.searchsorted(xp, xc, side='right'), 1, len(xp) - 1)
+    low = high - 1
+    return low, high, (xc - xp[low]) / (xp[high] - xp[low])
+
+
+# ============================================================
+# 면적 (Simpson's rule)
+# ============================================================
+
+def simpson_weights(x: ArrayLike) -> np.ndarray:
+    """
+    오름차순 격자 x의 Simpson 적분 가중치 (면적 = y @ weights)
+    - 균일 간격: 홀수 개는 1/3 rule, 짝수 개는 앞부분 1/3 rule + 마지막 3구간 3/8 rule
+    - 불균일 간격: 두 구간씩 2차 곡선 적분, 남는 마지막 구간은 마지막 세 점의 2차 곡선
+    - 2개: 사다리꼴 공식
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+    weights = np.zeros(n)
+    if n < 2:
+        return weights
+    h = np.diff(x)
+    if n == 2:
+        weights[:] = h[0] / 2.0
+        return weights
+
+    if np.allclose(h, h[0], rtol=1e-9, atol=0.0):
+        step = h[0]
+        simpson_end = n if n % 2 == 1 else n - 3
+        if simpson_end >= 3:
+            weights[0:simpson_end - 1:2] += step / 3.0
+            weights[1:simpson_end - 1:2] += 4.0 * step / 3.0
+            weights[2:simpson_end:2] += step / 3.0
+        if n % 2 == 0:
+            weights[n - 4:] += 3.0 * step / 8.0 * np.array([1.0, 3.0, 3.0, 1.0])
+        return weights
+
+    pairs = (n - 1) // 2
+    h0 = h[0:2 * pairs:2]
+    h1 = h[1:2 * pairs:2]
+    total = h0 + h1
+    weights[0:2 * pairs - 1:2] += total / 6.0 * (2.0 - h1 / h0)
+    weights[1:2 * pairs:2] += total / 6.0 * total ** 2 / (h0 * h1)
+    weights[2:2 * pairs + 1:2] += total / 6.0 * (2.0 - h0 / h1)
+    if (n - 1) % 2 == 1:
+        h0, h1 = h[-2], h[-1]
+        weights[-1] += (2.0 * h1 ** 2 + 3.0 * h0 * h1) / (6.0 * (h0 + h1))
+        weights[-2] += (h1 ** 2 + 3.0 * h0 * h1) / (6.0 * h0)
+        weights[-3] -= h1 ** 3 / (6.0 * h0 * (h0 + h1))
+    return weights
+
+
+def area_under_gz(heel_angles: np.ndarray,
+                  gz: np.ndarray,
+                  lower: float,
+                  upper: float) -> np.ndarray:
+    """
+    GZ 곡선 아래 면적 (m·rad), lower ~ upper (도)
+    격자에 없는 구간 끝의 GZ는 인접 두 점 사이 선형 보간
+
+    Args:
+        heel_angles: (H,) 오름차순 경사각 (도)
+        gz: (N, H) GZ 값
+    """
+    if upper <= lower:
+        return np.zeros(gz.shape[0])
+    inner = (heel_angles > lower) & (heel_angles < upper)
+    bounds = np.array([lower, upper])
+    low, high, factor = _bracket(heel_angles, bounds)
+    gz_bounds = gz[:, low] * (1.0 - factor) + gz[:, high] * factor
+
+    angles = np.concatenate([[lower], heel_angles[inner], [upper]])
+    values = np.concatenate([gz_bounds[:, :1], gz[:, inner], gz_bounds[:, 1:]], axis=1)
+    return values @ simpson_weights(np.radians(angles))
+
+
+# ============================================================
+# 배치 GZ 곡선 및 기준
+# ============================================================
+
+def evaluate_gz_curves(kn_table: KNTable,
+                       displacement: ArrayLike,
+                       trim: ArrayLike,
+                       kg: ArrayLike,
+                       gm: Optional[ArrayLike] = None,
+                       heel_angles: Optional[ArrayLike] = None,
+                       flooding_angle: Optional[ArrayLike] = None,
+                       criteria: Sequence[StabilityCriterion] = IMO_GENERAL_CRITERIA) -> GZCurveResult:
+    """
+    N개 적하 상태의 GZ 곡선과 기준 값을 한 번에 계산
+
+    Args:
+        kn_table: KN 표
+        displacement, trim, kg: (N,) 배수량, Trim (양수 = 선미), FSM 보정 KG
+        gm: (N,) GM (기준 2.2.4용, 없으면 NaN → 불합격)
+        heel_angles: 결과 GZ 경사각 격자 (기본: KN 표 경사각)
+        flooding_angle: 침수각 θf (도, 스칼라 또는 (N,)), 40°와 θf 중 작은 값까지 면적 계산
+        criteria: 판정 기준 목록
+
+    Returns:
+        GZCurveResult (heel_angles, gz, metrics, criteria)
+    """
+    heels = kn_table.heel_angles if heel_angles is None else np.asarray(heel_angles, dtype=np.float64)
+    # 기준 각도(0/30/40°)는 계산 격자에 포함
+    bounds = [a for a in (0.0, 30.0, 40.0) if kn_table.heel_angles[0] <= a <= kn_table.heel_angles[-1]]
+    grid = np.unique(np.concatenate([heels, bounds]))
+    gz_grid = kn_table.gz_at(displacement, trim, kg, grid)
+    n = gz_grid.shape[0]
+
+    metrics = np.zeros(n, dtype=GZ_RESULT_DTYPE)
+    upper_40 = np.full(n, 40.0)
+    if flooding_angle is not None:
+        upper_40 = np.minimum(upper_40, np.broadcast_to(np.asarray(flooding_angle, dtype=np.float64), (n,)))
+    for name, (lower, upper) in AREA_RANGES.items():
+        limits = upper_40 if upper == 40.0 else np.full(n, upper)
+        for limit in np.unique(limits):
+            rows = limits == limit
+            metrics[name][rows] = area_under_gz(grid, gz_grid[rows], lower, limit)
+
+    _max_gz(grid, gz_grid, metrics)
+    at_or_above_30 = grid >= 30.0
+    metrics['gz_30'] = gz_grid[:, at_or_above_30].max(axis=1) if at_or_above_30.any() else np.nan
+    _stability_range(grid, gz_grid, metrics)
+    metrics['gm'] = np.nan if gm is None else np.broadcast_to(np.asarray(gm, dtype=np.float64), (n,))
+
+    keep = np.isin(grid, heels)
+    return GZCurveResult(
+        heel_angles=grid[keep],
+        gz=gz_grid[:, keep],
+        metrics=metrics,
+        criteria=check_criteria(metrics, criteria),
+    )
+
+
+def _max_gz(heels: np.ndarray, gz: np.ndarray, metrics: np.ndarray) -> None:
+    """최대 GZ 및 각도 (격자 최대점 주변 세 점의 2차 곡선 꼭짓점으로 보정)"""
+    n, h = gz.shape
+    rows = np.arange(n)
+    peak = gz.argmax(axis=1)
+    metrics['max_gz'] = gz[rows, peak]
+    metrics['max_gz_angle'] = heels[peak]
+
+    interior = (peak > 0) & (peak < h - 1)
+    if not interior.any():
+        return
+    i = peak[interior]
+    r = rows[interior]
+    x0, x1, x2 = heels[i - 1], heels[i], heels[i + 1]
+    y0, y1, y2 = gz[r, i - 1], gz[r, i], gz[r, i + 1]
+    # 2차 곡선 y = a(x - x1)² + b(x - x1) + y1
+    d0, d2 = x0 - x1, x2 - x1
+    s0, s2 = (y0 - y1) / d0, (y2 - y1) / d2
+    a = (s2 - s0) / (d2 - d0)
+    b = s0 - a * d0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        offset = np.where(a < 0, -b / (2.0 * a), 0.0)
+    offset = np.clip(offset, d0, d2)
+    metrics['max_gz_angle'][r] = x1 + offset
+    metrics['max_gz'][r] = y1 + b * offset + a * offset ** 2
+
+
+def _crossing(heels: np.ndarray, gz: np.ndarray, mask: np.ndarray, default: float) -> np.ndarray:
+    """mask가 처음 참인 구간 [i, i+1]에서 GZ = 0 각도 (선형 보간), 없으면 default"""
+    found = mask.any(axis=1)
+    i = mask.argmax(axis=1)
+    rows = np.arange(gz.shape[0])
+    y0, y1 = gz[rows, i], gz[rows, i + 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = np.where(y1 != y0, -y0 / (y1 - y0), 0.0)
+    angle = heels[i] + (heels[i + 1] - heels[i]) * factor
+    return np.where(found, angle, default)
+
+
+def _stability_range(heels: np.ndarray, gz: np.ndarray, metrics: np.ndarray) -> None:
+    """
+    평형 경사각 (GZ가 처음 양수가 되는 각도), 복원력 소실각 (그 후 GZ가 다시 0 이하가 되는 각도),
+    복원 범위 = 소실각 - 평형각. 격자 끝까지 양수면 소실각 = 마지막 경사각
+    """
+    positive = gz > 0
+    rising = ~positive[:, :-1] & positive[:, 1:]
+    start = np.where(positive[:, 0], heels[0], _crossing(heels, gz, rising, np.nan))
+
+    falling = positive[:, :-1] & ~positive[:, 1:] & (heels[1:] > start[:, None])
+    vanishing = _crossing(heels, gz, falling, heels[-1])
+    vanishing = np.where(np.isnan(start), np.nan, vanishing)
+
+    metrics['equilibrium_angle'] = start
+    metrics['vanishing_angle'] = vanishing
+    metrics['range'] = np.where(np.isnan(start), 0.0, vanishing - start)
+
+
+def check_criteria(metrics: np.ndarray,
+                   criteria: Sequence[StabilityCriterion] = IMO_GENERAL_CRITERIA) -> pd.DataFrame:
+    """
+    조건 × 기준 합격/불합격 표 (NaN은 불합격)
+    'all' 열: 모든 기준 합격
+    """
+    table = pd.DataFrame(
+        {c.name: np.nan_to_num(metrics[c.field], nan=-np.inf) >= c.minimum for c in criteria},
+        index=pd.RangeIndex(len(metrics), name='condition'),
+    )
+    table['all'] = table.all(axis=1)
+    return table
+
+
+# ============================================================
+# 시트 추출
+# ============================================================
+
+def _heel_header(value) -> Optional[float]:
+    if isinstance(value, (int, float, np.integer, np.floating)) and not pd.isna(value):
+        angle = float(value)
+    else:
+        match = HEEL_HEADER_PATTERN.match(str(value)) if not pd.isna(value) else None
+        if not match:
+            return None
+        angle = float(match.group(1))
+    return angle if 0.0 <= angle <= 90.0 else None
+
+
+def extract_kn_blocks_from_sheet(df: pd.DataFrame,
+                                 sheet_name: str = ''
+                                 ) -> List[Tuple[float, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    시트의 KN 표 블록 → [(trim, heel_angles, displacements, kn)]
+    머리글 행: 배수량(DISP) 열 + 경사각 열 2개 이상, 그 아래 배수량이 숫자인 연속 행
+    """
+    values = df.to_numpy(dtype=object)
+    name_match = TRIM_TEXT_PATTERN.search(sheet_name)
+    trim = float(name_match.group(1)) if name_match else 0.0
+
+    blocks = []
+    row = 0
+    while row < len(values):
+        cells = values[row]
+        texts = [re.sub(r'\(.*?\)|[^A-Za-z]', '', str(v)).upper() if not pd.isna(v) else '' for v in cells]
+        trim_match = next(
+            (TRIM_TEXT_PATTERN.search(str(v)) for v in cells if isinstance(v, str) and TRIM_TEXT_PATTERN.search(v)),
+            None,
+        )
+        if trim_match:
+            trim = float(trim_match.group(1))
+
+        disp_col = next((j for j, t in enumerate(texts) if t in DISP_HEADERS), None)
+        heel_cols = [(j, _heel_header(v)) for j, v in enumerate(cells) if j != disp_col]
+        heel_cols = [(j, a) for j, a in heel_cols if a is not None]
+        if disp_col is None or len(heel_cols) < 2:
+            row += 1
+            continue
+
+        body = pd.DataFrame(values[row + 1:]).apply(pd.to_numeric, errors='coerce')
+        numeric = body[disp_col].notna().to_numpy()
+        count = int(np.argmin(numeric)) if not numeric.all() else len(numeric)
+        if count:
+            cols = [j for j, _ in heel_cols]
+            blocks.append((
+                trim,
+                np.array([a for _, a in heel_cols]),
+                body[disp_col].to_numpy(dtype=np.float64)[:count],
+                body[cols].fillna(0.0).to_numpy(dtype=np.float64)[:count],
+            ))
+        row += count + 1
+    return blocks
@@ -0,0 +1,294 @@
+"""
+수정 표(Hydrostatic Table) 벡터화 보간 엔진
+"Trim = 0", "Trim = 1.29", "Trim = 2.11" 시트의 수정 표를 한 번만 배열로 변환하고
+Draft 또는 배수량 × Trim 배열에 대해 한 번에 보간
+
+- 열 데이터: Trim별 연속된 float64 배열 (Draft 오름차순 정렬)
+- 기준 열(T 또는 DISP)에서 np.searchsorted로 구간을 찾아 모든 열을 함께 선형 보간
+- Trim 방향: 인접한 두 Trim 표 사이 선형 보간 (이중 선형 보간)
+- 표 범위 밖의 Draft/배수량/Trim은 끝값으로 고정 (Trim = 0 시트 보간과 동일)
+"""
+
+import bisect
+import re
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+# 수정 표 열 (Trim = 0 시트와 동일)
+HYDROSTATIC_COLUMNS = ('T', 'DISP', 'LCB', 'VCB', 'LCA', 'TPC', 'MCTC', 'KML', 'KMT', 'WSA')
+
+# 시트 머리글 표기 → 표준 열 이름
+HEADER_ALIASES = {
+    'DRAFT': 'T',
+    'DISPL': 'DISP',
+    'DISPLACEMENT': 'DISP',
+    'LCF': 'LCA',
+    'MTC': 'MCTC',
+    'TCP': 'TPC',
+}
+
+TRIM_SHEET_PATTERN = re.compile(r'^\s*Trim\s*=\s*(-?\d+(?:\.\d+)?)\s*$', re.IGNORECASE)
+
+
+class HydrostaticTable:
+    """Trim별 수정 표 → Draft/배수량 × Trim 벡터화 보간"""
+
+    def __init__(self, trims: Sequence[float], tables: Sequence[Dict[str, np.ndarray]]):
+        """
+        Args:
+            trims: 표별 Trim 값
+            tables: 표별 {열 이름: 값 배열} (같은 길이)
+        """
+        if not tables or len(trims) != len(tables):
+            raise ValueError("HydrostaticTable: trims와 tables 개수가 맞지 않습니다")
+
+        order = np.argsort(np.asarray(trims, dtype=np.float64), kind='stable')
+        self.trims = np.asarray(trims, dtype=np.float64)[order]
+        self.columns = tuple(
+            col for col in HYDROSTATIC_COLUMNS
+            if all(col in tables[i] for i in order)
+        )
+        if 'T' not in self.columns:
+            raise ValueError("HydrostaticTable: 'T'(Draft) 열이 필요합니다")
+
+        self.tables: List[Dict[str, np.ndarray]] = []
+        for i in order:
+            table = tables[i]
+            draft = np.asarray(table['T'], dtype=np.float64)
+            row_order = np.argsort(draft, kind='stable')
+            self.tables.append({
+                col: np.ascontiguousarray(np.asarray(table[col], dtype=np.float64)[row_order])
+                for col in self.columns
+            })
+        # 단일 조건 보간용 Python 리스트 (처음 사용할 때 생성)
+        self._row_lists: Optional[List[Dict[str, List[float]]]] = None
+        self._row_lists_trims = self.trims.tolist()
+
+    # ============================================================
+    # 생성
+    # ============================================================
+
+    @classmethod
+    def from_rows(cls, trim_tables: Dict[float, List[Dict[str, float]]]) -> 'HydrostaticTable':
+        """
+        {Trim: [행 딕셔너리]} → HydrostaticTable
+        행 딕셔너리 형식은 interpolate_hydrostatic_by_draft의 trim_zero_table과 동일
+        (없는 열은 0)
+        """
+        trims = list(trim_tables.keys())
+        tables = []
+        for trim in trims:
+            rows = trim_tables[trim]
+            tables.append({
+                col: np.fromiter((row.get(col, 0) for row in rows), dtype=np.float64, count=len(rows))
+                for col in HYDROSTATIC_COLUMNS
+            })
+        return cls(trims, tables)
+
+    @classmethod
+    def from_trim_zero(cls, trim_zero_table: List[Dict[str, float]]) -> 'HydrostaticTable':
+        """Trim = 0 시트 행 목록 → 단일 Trim 표"""
+        return cls.from_rows({0.0: trim_zero_table})
+
+    @classmethod
+    def from_sheets(cls, data: Dict[str, pd.DataFrame]) -> 'HydrostaticTable':
+        """
+        load_excel_data 결과에서 "Trim = x" 시트를 모두 읽어 생성
+        """
+        trims = []
+        tables = []
+        for sheet_name, df in data.items():
+            match = TRIM_SHEET_PATTERN.match(str(sheet_name))
+            if not match or df is None:
+                continue
+            table = extract_trim_table_from_sheet(df)
+            if table is not None:
+                trims.append(float(match.group(1)))
+                tables.append(table)
+
+        if not tables:
+            raise ValueError("HydrostaticTable: 'Trim = x' 수정 표 시트를 찾을 수 없습니다")
+        return cls(trims, tables)
+
+    # ============================================================
+    # 보간
+    # ============================================================
+
+    def by_draft(self,
+                 draft: ArrayLike,
+                 trim: ArrayLike = 0.0,
+                 columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Draft × Trim → 수정 데이터 (DISP, LCB, VCB, KMT, MCTC, TPC, ...)
+
+        Args:
+            draft: Draft 값 또는 배열
+            trim: Trim 값 또는 배열 (draft와 브로드캐스트)
+            columns: 반환할 열 (기본: T를 제외한 모든 열)
+
+        Returns:
+            {열 이름: 브로드캐스트된 모양의 배열}
+        """
+        return self._interpolate('T', draft, trim, columns)
+
+    def by_displacement(self,
+                        displacement: ArrayLike,
+                        trim: ArrayLike = 0.0,
+                        columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        배수량 × Trim → 수정 데이터 (T = Draft 포함)
+        """
+        return self._interpolate('DISP', displacement, trim, columns)
+
+    def _interpolate(self,
+                     key: str,
+                     values: ArrayLike,
+                     trim: ArrayLike,
+                     columns: Optional[Sequence[str]]) -> Dict[str, np.ndarray]:
+        if key not in self.columns:
+            raise KeyError(f"HydrostaticTable: '{key}' 열이 없습니다")
+        if columns is None:
+            columns = [col for col in self.columns if col != key]
+        missing = [col for col in columns if col not in self.columns]
+        if missing:
+            raise KeyError(f"HydrostaticTable: 없는 열 {missing}")
+
+        if np.ndim(values) == 0 and np.ndim(trim) == 0:
+            # 단일 조건: 배열 연산 대신 bisect (스칼라 헬퍼 함수 호출 비용)
+            return self._interpolate_scalar(key, float(values), float(trim), columns)
+
+        values, trim = np.broadcast_arrays(
+            np.asarray(values, dtype=np.float64),
+            np.asarray(trim, dtype=np.float64),
+        )
+        shape = values.shape
+        x = values.ravel()
+        t = trim.ravel()
+
+        # Trim 구간 (범위 밖은 끝 표로 고정)
+        if len(self.trims) == 1:
+            low = high = np.zeros(len(t), dtype=np.intp)
+            weight = np.zeros(len(t))
+        else:
+            t = np.clip(t, self.trims[0], self.trims[-1])
+            high = np.clip(np.searchsorted(self.trims, t, side='right'), 1, len(self.trims) - 1)
+            low = high - 1
+            span = self.trims[high] - self.trims[low]
+            weight = (t - self.trims[low]) / span
+
+        result = {col: np.zeros(len(x)) for col in columns}
+        for i, table in enumerate(self.tables):
+            # 표 i의 가중치: 낮은 쪽이면 1-w, 높은 쪽이면 w
+            factor = np.where(low == i, 1.0 - weight, 0.0) + np.where(high == i, weight, 0.0)
+            if not factor.any():
+                continue
+            at_trim = _interpolate_columns(table[key], x, table, columns)
+            for col in columns:
+                result[col] += factor * at_trim[col]
+
+        return {col: column.reshape(shape) for col, column in result.items()}
+
+    def _interpolate_scalar(self,
+                            key: str,
+                            value: float,
+                            trim: float,
+                            columns: Sequence[str]) -> Dict[str, np.ndarray]:
+        """_interpolate의 단일 조건 버전 (결과 동일, 0차원 배열 반환)"""
+        if self._row_lists is None:
+            self._row_lists = [{col: table[col].tolist() for col in self.columns} for table in self.tables]
+        trims = self._row_lists_trims
+
+        if len(trims) == 1:
+            weights = [(0, 1.0)]
+        else:
+            t = min(max(trim, trims[0]), trims[-1])
+            high = min(max(bisect.bisect_right(trims, t), 1), len(trims) - 1)
+            w = (t - trims[high - 1]) / (trims[high] - trims[high - 1])
+            weights = [(high - 1, 1.0 - w), (high, w)]
+
+        result = dict.fromkeys(columns, 0.0)
+        for i, factor in weights:
+            table = self._row_lists[i]
+            xp = table[key]
+            n = len(xp)
+            if n == 1:
+                low = high = 0
+                ratio = 0.0
+            else:
+                x = min(max(value, xp[0]), xp[-1])
+                high = min(max(bisect.bisect_right(xp, x), 1), n - 1)
+                low = high - 1
+                span = xp[high] - xp[low]
+                ratio = (x - xp[low]) / span if span > 0 else 0.0
+            for col in columns:
+                fp = table[col]
+                result[col] += factor * (fp[low] + (fp[high] - fp[low]) * ratio)
+        return {col: np.asarray(v) for col, v in result.items()}
+
+    def row_by_draft(self, draft: float, trim: float = 0.0) -> Dict[str, float]:
+        """단일 조건 → {열 이름: float} (interpolate_hydrostatic_by_draft 반환 형식)"""
+        return {col: float(value) for col, value in self.by_draft(draft, trim).items()}
+
+
+def _interpolate_columns(xp: np.ndarray,
+                         x: np.ndarray,
+                         table: Dict[str, np.ndarray],
+                         columns: Sequence[str]) -> Dict[str, np.ndarray]:
+    """
+    기준 열 xp(오름차순)에서 x의 구간을 한 번 찾고 모든 열을 선형 보간
+    범위 밖은 첫/마지막 행 값
+    """
+    n = len(xp)
+    if n == 1:
+        return {col: np.full(len(x), table[col][0]) for col in columns}
+
+    xc = np.clip(x, xp[0], xp[-1])
+    high = np.clip(np.searchsorted(xp, xc, side='right'), 1, n - 1)
+    low = high - 1
+    span = xp[high] - xp[low]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = np.where(span > 0, (xc - xp[low]) / span, 0.0)
+
+    result = {}
+    for col in columns:
+        fp = table[col]
+        result[col] = fp[low] + (fp[high] - fp[low]) * factor
+    return result
+
+
+def _normalize_header(value) -> Optional[str]:
+    if pd.isna(value):
+        return None
+    text = re.sub(r'\(.*?\)|[^A-Za-z]', '', str(value)).upper()
+    return HEADER_ALIASES.get(text, text) or None
+
+
+def extract_trim_table_from_sheet(df: pd.DataFrame) -> Optional[Dict[str, np.ndarray]]:
+    """
+    "Trim = x" 시트에서 수정 표 추출
+    'T'와 'DISP' 머리글이 있는 행을 찾고, 그 아래 T 값이 숫자인 행을 모두 읽는다.
+    """
+    values = df.to_numpy(dtype=object)
+    for header_idx in range(len(values)):
+        headers = [_normalize_header(v) for v in values[header_idx]]
+        if 'T' not in headers or 'DISP' not in headers:
+            continue
+
+        col_index = {}
+        for j, name in enumerate(headers):
+            if name in HYDROSTATIC_COLUMNS and name not in col_index:
+                col_index[name] = j
+
+        body = pd.DataFrame(values[header_idx + 1:]).apply(pd.to_numeric, errors='coerce')
+        body = body[body[col_index['T']].notna()]
+        if body.empty:
+            return None
+        return {
+            name: body[j].fillna(0.0).to_numpy(dtype=np.float64)
+            for name, j in col_index.items()
+        }
+    return None
@@ -5,9 +5,22 @@ Vessel Stability Booklet Excel 함수를 Python으로 완전 구현
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
 
+try:
+    from .hydrostatic_table import HydrostaticTable
+    from .gz_curve import (
+        KNTable, GZCurveResult, StabilityCriterion, IMO_GENERAL_CRITERIA,
+        evaluate_gz_curves, simpson_weights
+    )
+except ImportError:  # src/ 에서 직접 실행
+    from hydrostatic_table import HydrostaticTable
+    from gz_curve import (
+        KNTable, GZCurveResult, StabilityCriterion, IMO_GENERAL_CRITERIA,
+        evaluate_gz_curves, simpson_weights
+    )
+
 
 @dataclass
 class VesselParticulars:
@@ -20,6 +33,7 @@ class VesselParticulars:
     lightship_weight: float = 770.162
     lightship_lcg: float = 26.349
     lightship_vcg: float = 3.884
+    lightship_tcg: float = 0.0
 
 
 @dataclass
@@ -53,11 +67,50 @@ class GZData:
     gz_high_above: List[float] = field(default_factory=list)
 
 
+@dataclass
+class LoadItem:
+    """
+    탱크 외 중량 항목 (화물, SPMT 등 이동 하중)
+    각 값은 스칼라 또는 적하 상태 수(N) 길이의 배열 (SPMT 주행 단계별 위치 등)
+    """
+    name: str
+    weight: Any
+    lcg: Any
+    vcg: Any
+    tcg: Any = 0.0
+
+
+# evaluate_conditions 결과 (적하 상태별 1행)
+CONDITION_DTYPE = np.dtype([
+    ('displacement', np.float64),
+    ('lcg', np.float64),
+    ('vcg', np.float64),
+    ('tcg', np.float64),
+    ('vcg_corrected', np.float64),
+    ('draft', np.float64),
+    ('trim', np.float64),
+    ('draft_ap', np.float64),
+    ('draft_fp', np.float64),
+    ('km', np.float64),
+    ('gm', np.float64),
+    ('list_deg', np.float64),
+])
+
+
 class StabilityCalculator:
     """선박 안정성 계산기 - Excel 함수를 Python으로 구현"""
     
-    def __init__(self, particulars: VesselParticulars):
+    def __init__(self,
+                 particulars: VesselParticulars,
+                 hydrostatic_table: Optional[HydrostaticTable] = None,
+                 kn_table: Optional[KNTable] = None):
         self.particulars = particulars
+        # 부클릿에서 한 번 생성한 수정 표 (Trim = x 시트)
+        self.hydrostatic_table = hydrostatic_table
+        # 부클릿에서 한 번 생성한 KN 표 (Trim × 배수량 × 경사각)
+        self.kn_table = kn_table
+        # 행 목록 인자 → HydrostaticTable 변환 캐시 (마지막 목록 객체, 행 수, 변환 결과)
+        self._rows_table: Optional[Tuple[list, int, HydrostaticTable]] = None
     
     # ============================================================
     # 기본 계산 함수들 (Excel 함수 구현)
@@ -483,59 +536,23 @@ class StabilityCalculator:
         Returns:
             보간된 수정 데이터
         """
-        # 1단계: 배수량에 따른 보간 (Low Trim)
-        low_disp_below = low_trim_data.get('disp_below', 0)
-        low_disp_above = low_trim_data.get('disp_above', 0)
+        keys = ['draft', 'lcf', 'lcb', 'vcb', 'kmt', 'mtc', 'tcp']
         
-        if low_disp_below == low_disp_above:
-            low_factor = 0.0
-        else:
-            low_factor = self.calculate_interpolation_factor(
-                displacement, low_disp_below, low_disp_above
-            )
-        
-        # Low Trim에서 배수량 보간
-        low_draft = (low_trim_data.get('draft_below', 0) * (1 - low_factor) + 
-                    low_trim_data.get('draft_above', 0) * low_factor)
-        low_lcf = (low_trim_data.get('lcf_below', 0) * (1 - low_factor) + 
-                  low_trim_data.get('lcf_above', 0) * low_factor)
-        low_lcb = (low_trim_data.get('lcb_below', 0) * (1 - low_factor) + 
-                  low_trim_data.get('lcb_above', 0) * low_factor)
-        low_vcb = (low_trim_data.get('vcb_below', 0) * (1 - low_factor) + 
-                  low_trim_data.get('vcb_above', 0) * low_factor)
-        low_kmt = (low_trim_data.get('kmt_below', 0) * (1 - low_factor) + 
-                  low_trim_data.get('kmt_above', 0) * low_factor)
-        low_mtc = (low_trim_data.get('mtc_below', 0) * (1 - low_factor) + 
-                  low_trim_data.get('mtc_above', 0) * low_factor)
-        low_tcp = (low_trim_data.get('tcp_below', 0) * (1 - low_factor) + 
-                  low_trim_data.get('tcp_above', 0) * low_factor)
-        
-        # 2단계: 배수량에 따른 보간 (High Trim)
-        high_disp_below = high_trim_data.get('disp_below', 0)
-        high_disp_above = high_trim_data.get('disp_above', 0)
-        
-        if high_disp_below == high_disp_above:
-            high_factor = 0.0
-        else:
-            high_factor = self.calculate_interpolation_factor(
-                displacement, high_disp_below, high_disp_above
-            )
+        def interpolate_at_trim(trim_data: Dict[str, float]) -> np.ndarray:
+            # 배수량에 따른 보간 (Below/Above)
+            disp_below = trim_data.get('disp_below', 0)
+            disp_above = trim_data.get('disp_above', 0)
+            if disp_below == disp_above:
+                factor = 0.0
+            else:
+                factor = self.calculate_interpolation_factor(displacement, disp_below, disp_above)
+            below = np.array([trim_data.get(f'{key}_below', 0) for key in keys], dtype=np.float64)
+            above = np.array([trim_data.get(f'{key}_above', 0) for key in keys], dtype=np.float64)
+            return below * (1 - factor) + above * factor
         
-        # High Trim에서 배수량 보간
-        high_draft = (high_trim_data.get('draft_below', 0) * (1 - high_factor) + 
-                     high_trim_data.get('draft_above', 0) * high_factor)
-        high_lcf = (high_trim_data.get('lcf_below', 0) * (1 - high_factor) + 
-                   high_trim_data.get('lcf_above', 0) * high_factor)
-        high_lcb = (high_trim_data.get('lcb_below', 0) * (1 - high_factor) + 
-                   high_trim_data.get('lcb_above', 0) * high_factor)
-        high_vcb = (high_trim_data.get('vcb_below', 0) * (1 - high_factor) + 
-                   high_trim_data.get('vcb_above', 0) * high_factor)
-        high_kmt = (high_trim_data.get('kmt_below', 0) * (1 - high_factor) + 
-                   high_trim_data.get('kmt_above', 0) * high_factor)
-        high_mtc = (high_trim_data.get('mtc_below', 0) * (1 - high_factor) + 
-                   high_trim_data.get('mtc_above', 0) * high_factor)
-        high_tcp = (high_trim_data.get('tcp_below', 0) * (1 - high_factor) + 
-                   high_trim_data.get('tcp_above', 0) * high_factor)
+        # 1~2단계: Low/High Trim에서 배수량 보간
+        low_values = interpolate_at_trim(low_trim_data)
+        high_values = interpolate_at_trim(high_trim_data)
         
         # 3단계: 트림에 따른 보간
         low_trim = low_trim_data.get('trim_value', 0)
@@ -549,17 +566,8 @@ class StabilityCalculator:
             )
         
         # 최종 보간
-        result = {
-            'draft': low_draft * (1 - trim_factor) + high_draft * trim_factor,
-            'lcf': low_lcf * (1 - trim_factor) + high_lcf * trim_factor,
-            'lcb': low_lcb * (1 - trim_factor) + high_lcb * trim_factor,
-            'vcb': low_vcb * (1 - trim_factor) + high_vcb * trim_factor,
-            'kmt': low_kmt * (1 - trim_factor) + high_kmt * trim_factor,
-            'mtc': low_mtc * (1 - trim_factor) + high_mtc * trim_factor,
-            'tcp': low_tcp * (1 - trim_factor) + high_tcp * trim_factor
-        }
-        
-        return result
+        final = low_values * (1 - trim_factor) + high_values * trim_factor
+        return {key: float(value) for key, value in zip(keys, final)}
     
     def calculate_lost_gm(self, fsm: float, displacement: float) -> float:
         """
@@ -593,9 +601,28 @@ class StabilityCalculator:
             return 0.0
         return list_moment / (displacement * gm)
     
+    def _resolve_table(self,
+                       trim_zero_table: Union[List[Dict[str, float]], HydrostaticTable, None]
+                       ) -> Optional[HydrostaticTable]:
+        """trim_zero_table 인자 → HydrostaticTable (없으면 계산기의 수정 표)"""
+        if trim_zero_table is None:
+            return self.hydrostatic_table
+        if isinstance(trim_zero_table, HydrostaticTable):
+            return trim_zero_table
+        if not trim_zero_table:
+            return None
+        # 같은 행 목록으로 반복 호출하면 변환은 한 번만
+        cached = self._rows_table
+        if cached is not None and cached[0] is trim_zero_table and cached[1] == len(trim_zero_table):
+            return cached[2]
+        table = HydrostaticTable.from_trim_zero(trim_zero_table)
+        self._rows_table = (trim_zero_table, len(trim_zero_table), table)
+        return table
+    
     def interpolate_hydrostatic_by_draft(self,
                                           draft: float,
-                                          trim_zero_table: List[Dict[str, float]]) -> Dict[str, float]:
+                                          trim_zero_table: Union[List[Dict[str, float]], HydrostaticTable, None] = None
+                                          ) -> Dict[str, float]:
         """
         Draft에 따른 수정 데이터 보간 (Trim = 0 시트 사용)
         Excel: Draft 값으로 수정 표에서 보간
@@ -603,52 +630,20 @@ class StabilityCalculator:
         Args:
             draft: 목표 Draft
             trim_zero_table: Trim = 0 시트 데이터 (T, DISP, LCB, VCB, LCA, TPC, MCTC, KML, KMT, WSA)
+                             행 목록 또는 HydrostaticTable (생략 시 계산기의 수정 표)
         
         Returns:
-            보간된 수정 데이터
+            보간된 수정 데이터 (범위 밖이면 첫/마지막 행 값, 'T' 포함)
         """
-        if not trim_zero_table:
+        table = self._resolve_table(trim_zero_table)
+        if table is None:
             return {}
-        
-        # Draft 범위 찾기
-        sorted_table = sorted(trim_zero_table, key=lambda x: x.get('T', 0))
-        
-        low_idx = None
-        high_idx = None
-        
-        for i, row in enumerate(sorted_table):
-            t = row.get('T', 0)
-            if t <= draft:
-                low_idx = i
-            elif t > draft:
-                high_idx = i
-                break
-        
-        # 범위 밖인 경우
-        if low_idx is None:
-            return sorted_table[0] if sorted_table else {}
-        if high_idx is None:
-            return sorted_table[-1] if sorted_table else {}
-        
-        # 보간
-        low_row = sorted_table[low_idx]
-        high_row = sorted_table[high_idx]
-        
-        low_t = low_row.get('T', 0)
-        high_t = high_row.get('T', 0)
-        
-        if low_t == high_t:
-            factor = 0.0
-        else:
-            factor = (draft - low_t) / (high_t - low_t)
-        
-        result = {}
-        for key in ['DISP', 'LCB', 'VCB', 'LCA', 'TPC', 'MCTC', 'KML', 'KMT', 'WSA']:
-            low_val = low_row.get(key, 0)
-            high_val = high_row.get(key, 0)
-            result[key] = low_val * (1 - factor) + high_val * factor
-        
-        return result
+        row = table.row_by_draft(draft)
+        drafts = table.tables[0]['T']
+        if draft < drafts[0] or draft >= drafts[-1]:
+            # 범위 밖: 기존처럼 끝 행 그대로 (T 포함)
+            row = {'T': float(drafts[0] if draft < drafts[0] else drafts[-1]), **row}
+        return row
     
     # ============================================================
     # GZ Curve 시트 함수들
@@ -680,6 +675,7 @@ class StabilityCalculator:
         """
         Simpson's rule로 GZ 곡선 아래 면적 계산
         Excel: Simpson's rule 사용 (3h/8, h/3 등)
+        짝수 개는 1/3 rule + 마지막 3구간 3/8 rule, 불균일 간격은 구간별 2차 곡선 (simpson_weights)
         
         Args:
             gz_values: GZ 값 리스트
@@ -688,44 +684,11 @@ class StabilityCalculator:
         Returns:
             면적 (GZ 곡선 아래 면적)
         """
-        import math
-        
         if len(gz_values) != len(heel_angles) or len(gz_values) < 3:
             return 0.0
         
-        # 경사각을 라디안으로 변환
-        heel_rad = [math.radians(angle) for angle in heel_angles]
-        
-        # Simpson's rule 계수
-        # Excel에서 사용하는 패턴: 1, 3, 3, 1 (3h/8) 또는 1, 4, 2, 4, 1 (h/3)
-        area = 0.0
-        
-        if len(gz_values) == 4:
-            # 3h/8 rule
-            h = heel_rad[1] - heel_rad[0]
-            area = (3 * h / 8) * (
-                gz_values[0] + 3 * gz_values[1] + 
-                3 * gz_values[2] + gz_values[3]
-            )
-        elif len(gz_values) >= 5 and len(gz_values) % 2 == 1:
-            # Simpson's 1/3 rule (홀수 개)
-            h = heel_rad[1] - heel_rad[0]
-            area = gz_values[0] + gz_values[-1]  # 첫 번째와 마지막
-            
-            for i in range(1, len(gz_values) - 1):
-                if i % 2 == 1:
-                    area += 4 * gz_values[i]  # 홀수 인덱스
-                else:
-                    area += 2 * gz_values[i]  # 짝수 인덱스
-            
-            area = (h / 3) * area
-        else:
-            # 일반적인 경우: 사다리꼴 공식
-            for i in range(len(gz_values) - 1):
-                h = heel_rad[i + 1] - heel_rad[i]
-                area += (gz_values[i] + gz_values[i + 1]) * h / 2
-        
-        return area
+        weights = simpson_weights(np.radians(np.asarray(heel_angles, dtype=np.float64)))
+        return float(np.asarray(gz_values, dtype=np.float64) @ weights)
     
     def interpolate_gz_complete(self,
                                 target_displacement: float,
@@ -800,31 +763,164 @@ class StabilityCalculator:
     
     def get_displacement_by_draft(self,
                                   draft: float,
-                                  trim_zero_table: List[Dict[str, float]]) -> float:
+                                  trim_zero_table: Union[List[Dict[str, float]], HydrostaticTable, None] = None
+                                  ) -> float:
         """
         Draft로 배수량 찾기 (Trim = 0 시트 사용)
         Excel: Draft 값으로 배수량 찾기
         """
-        result = self.interpolate_hydrostatic_by_draft(draft, trim_zero_table)
-        return result.get('DISP', 0.0)
+        table = self._resolve_table(trim_zero_table)
+        if table is None:
+            return 0.0
+        return float(table.by_draft(draft, columns=['DISP'])['DISP'])
     
     def get_mtc_by_draft(self,
                          draft: float,
-                         trim_zero_table: List[Dict[str, float]]) -> float:
+                         trim_zero_table: Union[List[Dict[str, float]], HydrostaticTable, None] = None
+                         ) -> float:
         """
         Draft로 MTC 찾기 (Trim = 0 시트 사용)
         Excel: Draft 값으로 MTC 찾기
         """
-        result = self.interpolate_hydrostatic_by_draft(draft, trim_zero_table)
-        return result.get('MCTC', 0.0)
+        table = self._resolve_table(trim_zero_table)
+        if table is None:
+            return 0.0
+        return float(table.by_draft(draft, columns=['MCTC'])['MCTC'])
+    
+    # ============================================================
+    # 배치 계산 (여러 적하 상태를 한 번에)
+    # ============================================================
+    
+    def evaluate_conditions(self,
+                            weights_matrix: np.ndarray,
+                            lcg: np.ndarray,
+                            vcg: np.ndarray,
+                            tcg: np.ndarray,
+                            fsm: np.ndarray,
+                            loads: Optional[List[LoadItem]] = None,
+                            trim_iterations: int = 2) -> np.ndarray:
+        """
+        N개 적하 상태의 배수량/중심/Trim/Draft/GM/List를 한 번에 계산
+        (calculate_total_displacement → calculate_vcg_corrected → calculate_trim
+         → Draft AP/FP → GM → Tan List 를 N개 조건에 대해 배열로 수행)
+        
+        Args:
+            weights_matrix: (N, 탱크 수) 탱크 중량 (t)
+            lcg, vcg, tcg: (탱크 수,) 또는 (N, 탱크 수) 탱크 중심 (m, AP 기준)
+            fsm: (탱크 수,) 또는 (N, 탱크 수) 자유표면 모멘트 (t·m)
+            loads: 경하중량 외 화물/이동 하중 항목
+            trim_iterations: 계산된 Trim으로 수정 표를 다시 보간하는 횟수
+                             (1이면 Trim = 0 표만 사용)
+        
+        Returns:
+            CONDITION_DTYPE 구조화 배열 (N,)
+            - trim: 양수 = 선미 트림 (m), Δ × BG / (100 × MCTC), BG = LCB - LCG (calculate_bg와 동일)
+            - draft_ap/draft_fp: LCF 기준 회전
+            - gm: KMT - VCG corrected, list_deg: atan(TCG / GM)
+        """
+        table = self.hydrostatic_table
+        if table is None:
+            raise ValueError("evaluate_conditions: hydrostatic_table이 필요합니다 (HydrostaticTable)")
+        
+        weights = np.atleast_2d(np.asarray(weights_matrix, dtype=np.float64))
+        n = weights.shape[0]
+        p = self.particulars
+        
+        # 배수량 및 모멘트 (경하중량 + 탱크 + 하중 항목)
+        displacement = p.lightship_weight + weights.sum(axis=1)
+        l_moment = p.lightship_weight * p.lightship_lcg + (weights * lcg).sum(axis=1)
+        v_moment = p.lightship_weight * p.lightship_vcg + (weights * vcg).sum(axis=1)
+        t_moment = p.lightship_weight * p.lightship_tcg + (weights * tcg).sum(axis=1)
+        total_fsm = np.broadcast_to(np.asarray(fsm, dtype=np.float64), weights.shape).sum(axis=1)
+        
+        for item in loads or []:
+            item_weight = np.broadcast_to(np.asarray(item.weight, dtype=np.float64), (n,))
+            displacement = displacement + item_weight
+            l_moment = l_moment + item_weight * item.lcg
+            v_moment = v_moment + item_weight * item.vcg
+            t_moment = t_moment + item_weight * item.tcg
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            safe_disp = np.where(displacement != 0, displacement, np.nan)
+            cond_lcg = l_moment / safe_disp
+            cond_vcg = v_moment / safe_disp
+            cond_tcg = t_moment / safe_disp
+            vcg_corrected = cond_vcg + total_fsm / safe_disp
+        
+        # 수정 표 보간 → Trim (필요하면 계산된 Trim으로 재보간)
+        trim = np.zeros(n)
+        for _ in range(max(1, trim_iterations)):
+            hydro = table.by_displacement(
+                displacement, trim, columns=['T', 'LCB', 'LCA', 'MCTC', 'KMT']
+            )
+            with np.errstate(divide='ignore', invalid='ignore'):
+                trim = displacement * (hydro['LCB'] - cond_lcg) / (100.0 * hydro['MCTC'])
+            trim = np.nan_to_num(trim)
+        
+        lcf_ratio = hydro['LCA'] / p.length_bp
+        gm = hydro['KMT'] - vcg_corrected
+        
+        result = np.empty(n, dtype=CONDITION_DTYPE)
+        result['displacement'] = displacement
+        result['lcg'] = cond_lcg
+        result['vcg'] = cond_vcg
+        result['tcg'] = cond_tcg
+        result['vcg_corrected'] = vcg_corrected
+        result['draft'] = hydro['T']
+        result['trim'] = trim
+        result['draft_ap'] = hydro['T'] + trim * lcf_ratio
+        result['draft_fp'] = hydro['T'] - trim * (1.0 - lcf_ratio)
+        result['km'] = hydro['KMT']
+        result['gm'] = gm
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result['list_deg'] = np.degrees(np.arctan(cond_tcg / gm))
+        return result
+    
+    def evaluate_stability(self,
+                           conditions: np.ndarray,
+                           heel_angles: Optional[List[float]] = None,
+                           flooding_angle: Union[float, np.ndarray, None] = None,
+                           criteria: Tuple[StabilityCriterion, ...] = IMO_GENERAL_CRITERIA
+                           ) -> GZCurveResult:
+        """
+        evaluate_conditions 결과 → GZ 곡선, 면적 (0-30/0-40/30-40), 최대 GZ 각도, 복원 범위,
+        기준별 합격/불합격 표를 한 번에 계산
+        (KN 보간 → calculate_righting_arm → calculate_area_simpsons 를 N개 조건에 대해 배열로 수행)
+        
+        Args:
+            conditions: CONDITION_DTYPE 구조화 배열 (displacement, trim, vcg_corrected, gm 사용)
+            heel_angles: GZ 경사각 격자 (기본: KN 표 경사각)
+            flooding_angle: 침수각 (도), 0-40/30-40 면적의 상한
+            criteria: 판정 기준 (기본: IMO IS Code 2.2)
+        
+        Returns:
+            GZCurveResult
+        """
+        if self.kn_table is None:
+            raise ValueError("evaluate_stability: kn_table이 필요합니다 (KNTable)")
+        return evaluate_gz_curves(
+            self.kn_table,
+            conditions['displacement'],
+            conditions['trim'],
+            conditions['vcg_corrected'],
+            gm=conditions['gm'],
+            heel_angles=heel_angles,
+            flooding_angle=flooding_angle,
+            criteria=criteria,
+        )
 
 
 # ============================================================
 # Excel 파일 로드 및 데이터 추출 함수
 # ============================================================
 
-def load_excel_data(file_path: str) -> Dict[str, pd.DataFrame]:
-    """Excel 파일의 모든 시트를 로드"""
+def load_excel_data(file_path: str, failed: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Excel 파일의 모든 시트를 로드
+    
+    Args:
+        failed: 지정 시 로드에 실패해 건너뛴 시트 이름을 추가
+    """
     xls_file = pd.ExcelFile(file_path)
     data = {}
     
@@ -834,6 +930,8 @@ def load_excel_data(file_path: str) -> Dict[str, pd.DataFrame]:
             data[sheet_name] = df
         except Exception as e:
             print(f"⚠️  시트 '{sheet_name}' 로드 실패: {e}")
+            if failed is not None:
+                failed.append(sheet_name)
     
     return data
 
@@ -0,0 +1,151 @@
+"""
+BallastOptimizer 단위 테스트
+단계별 최소 이동량 발라스트 계획 검증
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.hydrostatic_table import HydrostaticTable
+from src.vessel_stability_functions import StabilityCalculator, VesselParticulars, LoadItem
+from src import ballast_optimizer
+from src.ballast_optimizer import (
+    BallastOptimizer,
+    BallastTank,
+    BallastStage,
+    extract_tanks_from_volum_sheet,
+)
+
+WINDOWS = {'trim': (-0.2, 0.2), 'list_deg': (-0.3, 0.3), 'draft_fp': (None, 2.6)}
+
+
+def make_calculator():
+    """Trim -1 ~ 2 선형 수정 표"""
+    drafts = np.linspace(0.5, 4.0, 36)
+    trims = [-1.0, 0.0, 1.0, 2.0]
+    tables = [{
+        'T': drafts, 'DISP': 900.0 * drafts + 5.0 * trim, 'LCB': 30.5 - 0.05 * drafts - 0.3 * trim,
+        'LCA': 29.5 - 0.1 * drafts, 'MCTC': 33.0 + 3.0 * drafts, 'KMT': 14.0 - 1.5 * drafts,
+    } for trim in trims]
+    return StabilityCalculator(VesselParticulars(), hydrostatic_table=HydrostaticTable(trims, tables))
+
+
+def make_tanks():
+    """선수/선미, 좌/우현 발라스트 탱크"""
+    return [
+        BallastTank('FPT', 120.0, 58.0, 2.0, 0.0, 50.0),
+        BallastTank('FWB2.P', 110.66, 50.093, 2.05, -4.33, 40.0),
+        BallastTank('FWB2.S', 110.66, 50.093, 2.05, 4.33, 40.0),
+        BallastTank('AWB.P', 100.0, 8.0, 1.0, -5.0, 30.0),
+        BallastTank('AWB.S', 100.0, 8.0, 1.0, 5.0, 30.0),
+    ]
+
+
+@unittest.skipIf(ballast_optimizer.linprog is None, "scipy 없음")
+class TestBallastOptimizer(unittest.TestCase):
+    """BallastOptimizer 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.optimizer = BallastOptimizer(make_calculator(), make_tanks())
+        self.initial = np.array([60.0, 110.66, 110.66, 0.0, 0.0])
+
+    def make_stages(self):
+        """TR 적재 단계 (화물 중량/위치 변화)"""
+        return [
+            BallastStage(f'Stage {i + 1}', [LoadItem('TR', weight, lcg, 3.5, 0.4)], WINDOWS)
+            for i, (weight, lcg) in enumerate([(60.0, 55.0), (120.0, 50.0), (240.0, 40.0), (285.0, 35.0)])
+        ]
+
+    def test_stages_within_windows(self):
+        """모든 단계가 범위 안, 결과 표 = 실제 조건 재계산"""
+        stages = self.make_stages()
+        plan = self.optimizer.optimize(stages, initial=self.initial)
+        self.assertTrue(plan.feasible.all())
+        self.assertEqual(list(plan.table['stage']), [s.name for s in stages])
+
+        for i, stage in enumerate(stages):
+            condition = self.optimizer.evaluate(plan.weights[i], stage.loads)[0]
+            for name, (low, high) in WINDOWS.items():
+                if low is not None:
+                    self.assertGreaterEqual(condition[name], low - 1e-3)
+                if high is not None:
+                    self.assertLessEqual(condition[name], high + 1e-3)
+            self.assertAlmostEqual(plan.table['trim'][i], condition['trim'])
+
+        self.assertTrue(np.all(plan.weights >= 0.0))
+        self.assertTrue(np.all(plan.weights <= self.optimizer.capacity + 1e-9))
+        previous = np.vstack([self.initial, plan.weights[:-1]])
+        np.testing.assert_allclose(plan.table['transfer'], np.abs(plan.weights - previous).sum(axis=1))
+
+    def test_feasible_stage_needs_no_transfer(self):
+        """이미 범위 안이면 이동량 0"""
+        stage = BallastStage('Stage 0', [], {'trim': (-5.0, 5.0), 'list_deg': (-5.0, 5.0)})
+        plan = self.optimizer.optimize([stage], initial=self.initial)
+        self.assertTrue(plan.feasible[0])
+        np.testing.assert_allclose(plan.weights[0], self.initial)
+
+    def test_locked_tanks(self):
+        """locked 탱크는 변경하지 않음"""
+        stages = self.make_stages()
+        for stage in stages:
+            stage.locked = ('FWB2.P', 'FWB2.S')
+        plan = self.optimizer.optimize(stages, initial=self.initial)
+        np.testing.assert_allclose(plan.weights[:, 1:3], 110.66)
+
+    def test_infeasible_window(self):
+        """만족할 수 없는 범위는 feasible=False"""
+        stage = BallastStage('Stage X', [], {'draft_ap': (None, 0.1), 'draft_fp': (None, 0.1)})
+        plan = self.optimizer.optimize([stage], initial=self.initial)
+        self.assertFalse(plan.feasible[0])
+
+    def test_stern_trim_window(self):
+        """비대칭 Trim 범위 (선미 트림 요구) → trim > 0, Draft AP > Draft FP"""
+        window = {'trim': (0.3, 0.8), 'list_deg': (-0.3, 0.3)}
+        plan = self.optimizer.optimize([BallastStage('Stage A', [], window)], initial=self.initial)
+        self.assertTrue(plan.feasible[0])
+
+        condition = self.optimizer.evaluate(plan.weights[0])[0]
+        self.assertGreaterEqual(condition['trim'], 0.3 - 1e-3)
+        self.assertLessEqual(condition['trim'], 0.8 + 1e-3)
+        self.assertGreater(condition['draft_ap'], condition['draft_fp'])
+
+    def test_fore_peak_raises_draft_fp(self):
+        """선수 탱크(FPT) 주입 → Draft FP 증가, Draft AP 감소"""
+        filled = self.initial.copy()
+        filled[0] = self.optimizer.capacity[0]
+        before = self.optimizer.evaluate(self.initial)[0]
+        after = self.optimizer.evaluate(filled)[0]
+        self.assertGreater(after['draft_fp'], before['draft_fp'])
+        self.assertLess(after['draft_ap'], before['draft_ap'])
+
+    def test_unknown_window_field(self):
+        """알 수 없는 범위 필드는 오류"""
+        with self.assertRaises(KeyError):
+            self.optimizer.optimize([BallastStage('Stage X', [], {'ramp': (0.0, 1.0)})])
+
+
+class TestVolumTanks(unittest.TestCase):
+    """Volum 시트 탱크 추출 테스트"""
+
+    def test_extract_tanks(self):
+        """용량 × 비중 = 100% 중량, 현재 중량"""
+        rows = [[None] * 15 for _ in range(3)]
+        rows[1][:15] = [1, 'FWB2.P', None, 1.025, 107.96, 53.98, 55.33, 50.093, 0, 2.05, 0, -4.33, 0, 50, 42.5]
+        rows[2][:15] = [2, 'FWB2.S', None, 1.025, 107.96, 0, 0, 50.093, 0, 2.05, 0, 4.33, 0, 0, 42.5]
+        tanks, current = extract_tanks_from_volum_sheet(pd.DataFrame(rows), names=['FWB2.P'])
+        self.assertEqual([t.name for t in tanks], ['FWB2.P'])
+        self.assertAlmostEqual(tanks[0].capacity, 107.96 * 1.025)
+        self.assertAlmostEqual(tanks[0].fsm, 42.5)
+        np.testing.assert_allclose(current, [55.33])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,124 @@
+"""
+Booklet 캐시 단위 테스트
+부클릿 Excel → 해시별 아티팩트 → Booklet.open 결과 검증
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.booklet import Booklet, BOOKLET_CACHE_DIR
+from src.vessel_stability_functions import load_excel_data
+
+
+def write_booklet(path: Path, lightship_weight: float = 770.162):
+    """PRINCIPAL PARTICULARS / Hydrostatic / Trim = 0 시트가 있는 작은 부클릿"""
+    particulars = pd.DataFrame([
+        [None, 'PRINCIPAL PARTICULARS', None, None],
+        [None, 'Length (B.P.)', 'm', 60.302],
+        [None, 'Lightship weight', 't', lightship_weight],
+        [None, 'LCG', 'm', 26.349],
+    ])
+    hydrostatic = pd.DataFrame([
+        ['Displacement', None, 1183.8462],
+        ['LCG', None, 31.816168],
+        ['Draft', None, 1.9],
+        ['Remark', None, 'checked'],
+    ])
+    header = ['T', 'DISP', 'LCB', 'VCB', 'LCA', 'TPC', 'MCTC', 'KML', 'KMT', 'WSA']
+    body = [[1.9 + 0.1 * i, 2400.0 + 100.0 * i, 33.0, 1.6, 32.5, 10.1, 38.0 + 0.5 * i, 99.0, 12.2, 1280]
+            for i in range(5)]
+    trim_zero = pd.DataFrame([['HYDROSTATIC TABLE'] + [None] * 9, header] + body)
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        particulars.to_excel(writer, sheet_name='PRINCIPAL PARTICULARS', header=False, index=False)
+        hydrostatic.to_excel(writer, sheet_name='Hydrostatic', header=False, index=False)
+        trim_zero.to_excel(writer, sheet_name='Trim = 0', header=False, index=False)
+
+
+class TestBooklet(unittest.TestCase):
+    """Booklet 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'booklet.xlsx'
+        write_booklet(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_compile_and_reopen(self):
+        """처음엔 컴파일, 다시 열면 아티팩트 사용 (같은 결과)"""
+        first = Booklet.open(self.path)
+        cache = list((self.path.parent / BOOKLET_CACHE_DIR).iterdir())
+        self.assertEqual(sorted(p.suffix for p in cache), ['.json', '.npz'])
+
+        second = Booklet.open(self.path)
+        self.assertIsNone(second._arrays)  # npz는 아직 읽지 않음
+        self.assertEqual(second.particulars, first.particulars)
+        self.assertAlmostEqual(second.particulars.length_bp, 60.302)
+        self.assertAlmostEqual(second.hydrostatic.displacement, 1183.8462)
+        self.assertEqual(second.sheet_names, ['PRINCIPAL PARTICULARS', 'Hydrostatic', 'Trim = 0'])
+
+        self.assertIsNone(second.kn_table)
+        calculator = second.calculator()
+        self.assertAlmostEqual(calculator.get_displacement_by_draft(2.05), 2550.0)
+
+    def test_sheets_round_trip(self):
+        """캐시된 시트 = load_excel_data 결과"""
+        Booklet.open(self.path)
+        cached = Booklet.open(self.path).sheets
+        original = load_excel_data(str(self.path))
+        self.assertEqual(list(cached), list(original))
+        for name, df in original.items():
+            pd.testing.assert_frame_equal(cached[name], df, check_dtype=False)
+
+    def test_changed_file_rebuilds(self):
+        """파일 내용이 바뀌면 새 아티팩트, 이전 아티팩트 삭제"""
+        Booklet.open(self.path)
+        write_booklet(self.path, lightship_weight=800.0)
+        booklet = Booklet.open(self.path)
+        self.assertAlmostEqual(booklet.particulars.lightship_weight, 800.0)
+        self.assertEqual(len(list((self.path.parent / BOOKLET_CACHE_DIR).iterdir())), 2)
+
+    def test_rebuild_keeps_other_booklets(self):
+        """이름이 같은 접두사로 시작하는 다른 부클릿(booklet.rev2)의 아티팩트는 유지"""
+        other = self.path.with_name('booklet.rev2.xlsx')
+        write_booklet(other, lightship_weight=900.0)
+        Booklet.open(other)
+        Booklet.open(self.path)
+        write_booklet(self.path, lightship_weight=800.0)
+        Booklet.open(self.path)
+
+        names = [p.name for p in (self.path.parent / BOOKLET_CACHE_DIR).iterdir()]
+        self.assertEqual(len(names), 4)
+        self.assertEqual(len([n for n in names if n.startswith('booklet.rev2.')]), 2)
+        self.assertAlmostEqual(Booklet.open(other).particulars.lightship_weight, 900.0)
+
+    def test_partial_load_not_cached(self):
+        """로드 실패한 시트가 있으면 아티팩트를 저장하지 않음"""
+        original = pd.read_excel
+
+        def read_excel(xls, sheet_name=None, **kwargs):
+            if sheet_name == 'Trim = 0':
+                raise ValueError("broken sheet")
+            return original(xls, sheet_name=sheet_name, **kwargs)
+
+        with mock.patch('pandas.read_excel', side_effect=read_excel):
+            booklet = Booklet.open(self.path)
+        self.assertNotIn('Trim = 0', booklet.sheet_names)
+        self.assertFalse((self.path.parent / BOOKLET_CACHE_DIR).exists())
+
+        self.assertIn('Trim = 0', Booklet.open(self.path).sheet_names)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
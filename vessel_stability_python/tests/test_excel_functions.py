@@ -10,11 +10,15 @@ from pathlib import Path
 # 상위 디렉토리를 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
+
 from src.vessel_stability_functions import (
     StabilityCalculator,
     VesselParticulars,
-    HydrostaticData
+    HydrostaticData,
+    LoadItem
 )
+from src.hydrostatic_table import HydrostaticTable
 
 
 class TestVolumFunctions(unittest.TestCase):
@@ -281,6 +285,26 @@ class TestTrimZeroFunctions(unittest.TestCase):
         self.assertGreaterEqual(result, 38.0)
         self.assertLessEqual(result, 39.0)
 
+    def test_row_list_out_of_range_and_cache(self):
+        """범위 밖 Draft는 끝 행 (T 포함), 같은 행 목록은 한 번만 변환"""
+        trim_zero_table = [
+            {'T': 1.9, 'DISP': 2400.0, 'MCTC': 38.0},
+            {'T': 2.1, 'DISP': 2600.0, 'MCTC': 39.0}
+        ]
+
+        low = self.calculator.interpolate_hydrostatic_by_draft(1.0, trim_zero_table)
+        high = self.calculator.interpolate_hydrostatic_by_draft(3.0, trim_zero_table)
+        self.assertEqual(low['T'], 1.9)
+        self.assertEqual(high['T'], 2.1)
+        self.assertEqual(high['DISP'], 2600.0)
+
+        table = self.calculator._resolve_table(trim_zero_table)
+        self.assertIs(self.calculator._resolve_table(trim_zero_table), table)
+
+        # 행이 추가되면 다시 변환
+        trim_zero_table.append({'T': 2.3, 'DISP': 2800.0, 'MCTC': 40.0})
+        self.assertEqual(self.calculator.get_displacement_by_draft(3.0, trim_zero_table), 2800.0)
+
 
 class TestBasicFunctions(unittest.TestCase):
     """기본 함수 테스트"""
@@ -326,6 +350,89 @@ class TestBasicFunctions(unittest.TestCase):
         self.assertAlmostEqual(draft_fp, expected_fp, places=3)
 
 
+class TestBatchConditions(unittest.TestCase):
+    """evaluate_conditions 배치 계산 테스트"""
+    
+    def setUp(self):
+        """테스트 설정: 선형 수정 표 + 탱크 3개"""
+        drafts = np.linspace(1.0, 3.0, 21)
+        table = HydrostaticTable([0.0], [{
+            'T': drafts, 'DISP': 1000.0 * drafts, 'LCB': 30.0 + 0.1 * drafts,
+            'LCA': 29.0 + 0.1 * drafts, 'MCTC': 30.0 + 2.0 * drafts, 'KMT': 12.0 - drafts,
+        }])
+        self.particulars = VesselParticulars(lightship_tcg=-0.004)
+        self.calculator = StabilityCalculator(self.particulars, hydrostatic_table=table)
+        self.weights = np.array([[10.0, 20.0, 30.0],
+                                 [50.0, 0.0, 80.0],
+                                 [0.0, 100.0, 5.0]])
+        self.lcg = np.array([11.251, 30.0, 50.0])
+        self.vcg = np.array([2.825, 1.2, 1.0])
+        self.tcg = np.array([-6.247, 6.247, 0.0])
+        self.fsm = np.array([0.34, 0.34, 10.0])
+    
+    def test_matches_scalar_functions(self):
+        """배치 결과 = 스칼라 함수 결과"""
+        cargo = LoadItem("TR", 280.0, np.array([20.0, 25.0, 30.0]), 4.5)
+        result = self.calculator.evaluate_conditions(
+            self.weights, self.lcg, self.vcg, self.tcg, self.fsm, loads=[cargo], trim_iterations=1
+        )
+        self.assertEqual(result.shape, (3,))
+        
+        p = self.particulars
+        for i, w in enumerate(self.weights):
+            total = self.calculator.calculate_total_displacement(
+                p.lightship_weight, p.lightship_lcg, p.lightship_vcg, p.lightship_tcg,
+                w.sum() + 280.0,
+                (w * self.lcg).sum() + 280.0 * cargo.lcg[i],
+                (w * self.vcg).sum() + 280.0 * 4.5,
+                (w * self.tcg).sum()
+            )
+            self.assertAlmostEqual(result['displacement'][i], total['displacement'], places=9)
+            self.assertAlmostEqual(result['lcg'][i], total['lcg'], places=9)
+            self.assertAlmostEqual(result['tcg'][i], total['tcg'], places=9)
+            
+            vcg_corrected = self.calculator.calculate_vcg_corrected(
+                total['vcg'], self.fsm.sum(), total['displacement'])
+            self.assertAlmostEqual(result['vcg_corrected'][i], vcg_corrected, places=9)
+            
+            draft = total['displacement'] / 1000.0
+            gm = self.calculator.calculate_metacentric_height(12.0 - draft, vcg_corrected)
+            self.assertAlmostEqual(result['gm'][i], gm, places=9)
+            
+            # Trim (MCTC: t·m/cm) 및 LCF 기준 Draft AP/FP
+            bg = self.calculator.calculate_bg(30.0 + 0.1 * draft, total['lcg'])
+            trim = self.calculator.calculate_trim(total['displacement'], bg, 30.0 + 2.0 * draft) / 100.0
+            self.assertAlmostEqual(abs(result['trim'][i]), trim, places=9)
+            self.assertAlmostEqual(result['draft_ap'][i] - result['draft_fp'][i], result['trim'][i], places=9)
+            
+            tan_list = self.calculator.calculate_tan_list(
+                total['displacement'] * total['tcg'], total['displacement'], gm)
+            self.assertAlmostEqual(np.tan(np.radians(result['list_deg'][i])), tan_list, places=9)
+    
+    def test_requires_table(self):
+        """수정 표 없이 호출하면 오류"""
+        calculator = StabilityCalculator(self.particulars)
+        with self.assertRaises(ValueError):
+            calculator.evaluate_conditions(self.weights, self.lcg, self.vcg, self.tcg, self.fsm)
+
+    def test_trim_direction(self):
+        """LCB보다 선미 쪽 중량 → Aft trim (trim > 0, Draft AP > Draft FP), 선수 쪽 → Forward trim"""
+        weights = np.array([[500.0, 0.0, 0.0],
+                            [0.0, 0.0, 500.0]])
+        result = self.calculator.evaluate_conditions(
+            weights, self.lcg, self.vcg, self.tcg, self.fsm, trim_iterations=1
+        )
+        for i in range(2):
+            bg = self.calculator.calculate_bg(30.0 + 0.1 * result['draft'][i], result['lcg'][i])
+            direction, _ = self.calculator.calculate_trim_forward_aft(bg)
+            self.assertEqual(direction, "Aft" if i == 0 else "Forward")
+
+        self.assertGreater(result['trim'][0], 0.0)
+        self.assertGreater(result['draft_ap'][0], result['draft_fp'][0])
+        self.assertLess(result['trim'][1], 0.0)
+        self.assertLess(result['draft_ap'][1], result['draft_fp'][1])
+
+
 def run_tests():
     """모든 테스트 실행"""
     loader = unittest.TestLoader()
@@ -337,6 +444,7 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestGZCurveFunctions))
     suite.addTests(loader.loadTestsFromTestCase(TestTrimZeroFunctions))
     suite.addTests(loader.loadTestsFromTestCase(TestBasicFunctions))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchConditions))
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -0,0 +1,184 @@
+"""
+GZ 곡선 엔진 단위 테스트
+KN 표 3차원 보간, Simpson 가중치, 면적/최대 GZ/복원 범위, 기준 판정 검증
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gz_curve import (
+    KNTable,
+    StabilityCriterion,
+    simpson_weights,
+    area_under_gz,
+    evaluate_gz_curves,
+    check_criteria,
+)
+from src.vessel_stability_functions import StabilityCalculator, VesselParticulars, CONDITION_DTYPE
+
+HEELS = [0, 10, 20, 30, 40, 50, 60]
+# GZ Curve 시트 예시 값 (Trim 1.29 / 2.11, 배수량 Below/Above)
+KN_LOW_BELOW = [0, 1.566, 2.621, 3.15, 3.31, 3.299, 3.161]
+KN_LOW_ABOVE = [0, 1.555, 2.595, 3.121, 3.282, 3.275, 3.142]
+KN_HIGH_BELOW = [0, 1.602, 2.712, 3.223, 3.415, 3.399, 3.25]
+KN_HIGH_ABOVE = [0, 1.59, 2.685, 3.195, 3.388, 3.374, 3.23]
+
+
+def make_kn_table():
+    """Trim별 배수량 격자가 다른 KN 표"""
+    return KNTable(
+        trims=[2.11, 1.29],
+        displacements=[np.array([1690.0, 1710.0]), np.array([1695.066, 1711.945])],
+        heel_angles=HEELS,
+        kn=[np.array([KN_HIGH_BELOW, KN_HIGH_ABOVE]), np.array([KN_LOW_BELOW, KN_LOW_ABOVE])],
+    )
+
+
+class TestSimpsonWeights(unittest.TestCase):
+    """Simpson 가중치 테스트"""
+
+    def test_exact_for_cubic(self):
+        """균일 간격: 홀수/짝수 개 모두 3차식까지 정확"""
+        for n in [3, 4, 5, 6, 7, 8]:
+            x = np.linspace(0.0, 1.2, n)
+            y = x ** 3 - 2.0 * x ** 2 + x
+            expected = 1.2 ** 4 / 4 - 2.0 * 1.2 ** 3 / 3 + 1.2 ** 2 / 2
+            self.assertAlmostEqual(float(y @ simpson_weights(x)), expected, places=12)
+
+    def test_nonuniform_exact_for_quadratic(self):
+        """불균일 간격: 홀수/짝수 개 모두 2차식까지 정확"""
+        for x in [np.array([0.0, 0.1, 0.35, 0.5, 0.9]), np.array([0.0, 0.2, 0.25, 0.6, 0.7, 1.0])]:
+            y = 3.0 * x ** 2 - x + 0.5
+            expected = x[-1] ** 3 - x[-1] ** 2 / 2 + 0.5 * x[-1]
+            self.assertAlmostEqual(float(y @ simpson_weights(x)), expected, places=12)
+
+    def test_calculator_even_count(self):
+        """calculate_area_simpsons: 짝수 개 (6개)도 Simpson 적용"""
+        calculator = StabilityCalculator(VesselParticulars())
+        heels = [0, 10, 20, 30, 40, 50]
+        gz = [np.sin(np.radians(a)) for a in heels]
+        result = calculator.calculate_area_simpsons(gz, heels)
+        self.assertAlmostEqual(result, 1.0 - np.cos(np.radians(50)), places=5)
+
+
+class TestKNTable(unittest.TestCase):
+    """KN 표 보간 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.table = make_kn_table()
+        self.calculator = StabilityCalculator(VesselParticulars())
+
+    def test_matches_interpolate_gz_complete(self):
+        """interpolate_gz_complete와 동일한 KN"""
+        expected = self.calculator.interpolate_gz_complete(
+            1700.0, 1.6, 1.29, 2.11,
+            KN_LOW_BELOW, KN_LOW_ABOVE, KN_HIGH_BELOW, KN_HIGH_ABOVE,
+            1695.066, 1711.945, 1690.0, 1710.0, HEELS
+        )
+        result = self.table.kn_at(1700.0, 1.6)
+        np.testing.assert_allclose(result[0], expected, atol=1e-12)
+
+    def test_heel_interpolation(self):
+        """임의 경사각 격자: 경사각 방향 선형 보간"""
+        kn = self.table.kn_at([1695.066], [1.29], heel_angles=[5.0, 35.0])
+        np.testing.assert_allclose(kn[0], [1.566 / 2, (3.15 + 3.31) / 2])
+        with self.assertRaises(ValueError):
+            self.table.kn_at(1700.0, 1.29, heel_angles=[70.0])
+
+    def test_from_sheets(self):
+        """'Trim = x' 문구 아래 KN 블록 추출"""
+        def block(trim, disps, rows):
+            header = [['Trim = %s' % trim] + [None] * 7, ['DISP (t)'] + ['%d°' % a for a in HEELS]]
+            return header + [[d] + list(r) for d, r in zip(disps, rows)] + [[None] * 8]
+        sheet = pd.DataFrame(
+            block(1.29, [1695.066, 1711.945], [KN_LOW_BELOW, KN_LOW_ABOVE])
+            + block(2.11, [1690.0, 1710.0], [KN_HIGH_BELOW, KN_HIGH_ABOVE])
+        )
+        table = KNTable.from_sheets({'KN': sheet, 'Volum': pd.DataFrame()})
+        self.assertEqual(list(table.trims), [1.29, 2.11])
+        np.testing.assert_allclose(table.kn_at(1700.0, 1.6), self.table.kn_at(1700.0, 1.6))
+
+
+class TestGZCriteria(unittest.TestCase):
+    """배치 GZ 곡선 및 기준 판정 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.table = make_kn_table()
+        self.kg = np.array([3.218307, 5.0, 1.0])
+
+    def test_gz_and_areas(self):
+        """GZ = KN - KG sin, 면적 = calculate_area_simpsons"""
+        calculator = StabilityCalculator(VesselParticulars())
+        result = evaluate_gz_curves(self.table, 1700.0, 1.6, self.kg)
+        kn = self.table.kn_at(1700.0, 1.6)[0]
+        for i, kg in enumerate(self.kg):
+            gz = [calculator.calculate_righting_arm(k, kg, a) for k, a in zip(kn, HEELS)]
+            np.testing.assert_allclose(result.gz[i], gz, atol=1e-12)
+            self.assertAlmostEqual(result.metrics['area_0_30'][i],
+                                   calculator.calculate_area_simpsons(gz[:4], HEELS[:4]), places=12)
+            self.assertAlmostEqual(result.metrics['area_0_40'][i],
+                                   calculator.calculate_area_simpsons(gz[:5], HEELS[:5]), places=12)
+            self.assertAlmostEqual(result.metrics['area_30_40'][i],
+                                   (gz[3] + gz[4]) / 2 * np.radians(10), places=12)
+
+    def test_max_gz_and_range(self):
+        """최대 GZ 각도 (2차 보정), 소실각, 복원 범위"""
+        heels = np.array([0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0])
+        gz = np.array([[0.0, 0.5, 0.8, 0.9, 0.8, 0.5, 0.0 - 0.1],
+                       [-0.2, 0.2, 0.4, 0.5, 0.6, 0.7, 0.8]])
+        table = KNTable([0.0], [np.array([1000.0])], heels, [gz[:1]])
+        result = evaluate_gz_curves(table, 1000.0, 0.0, 0.0)
+        self.assertAlmostEqual(result.metrics['max_gz_angle'][0], 30.0)
+        self.assertAlmostEqual(result.metrics['vanishing_angle'][0], 50.0 + 10.0 * 0.5 / 0.6)
+        self.assertAlmostEqual(result.metrics['range'][0], 50.0 + 10.0 * 0.5 / 0.6)
+
+        table = KNTable([0.0], [np.array([1000.0])], heels, [gz[1:]])
+        result = evaluate_gz_curves(table, 1000.0, 0.0, 0.0)
+        self.assertAlmostEqual(result.metrics['equilibrium_angle'][0], 5.0)
+        self.assertAlmostEqual(result.metrics['vanishing_angle'][0], 60.0)
+        self.assertAlmostEqual(result.metrics['range'][0], 55.0)
+
+    def test_flooding_angle(self):
+        """침수각 < 40°: 0-40/30-40 면적 상한 = 침수각"""
+        full = evaluate_gz_curves(self.table, 1700.0, 1.6, self.kg)
+        limited = evaluate_gz_curves(self.table, 1700.0, 1.6, self.kg, flooding_angle=[40.0, 30.0, 35.0])
+        self.assertAlmostEqual(limited.metrics['area_0_40'][0], full.metrics['area_0_40'][0])
+        self.assertAlmostEqual(limited.metrics['area_0_40'][1], full.metrics['area_0_30'][1])
+        self.assertEqual(limited.metrics['area_30_40'][1], 0.0)
+        self.assertLess(limited.metrics['area_30_40'][2], full.metrics['area_30_40'][2])
+
+    def test_criteria_matrix(self):
+        """조건 × 기준 합격/불합격 표"""
+        result = evaluate_gz_curves(self.table, 1700.0, 1.6, self.kg, gm=[1.0, 0.1, 2.0])
+        self.assertEqual(result.criteria.shape, (3, 7))
+        self.assertEqual(list(result.criteria['all']), [True, False, True])
+        self.assertFalse(result.criteria['2.2.4 GM (m)'][1])
+
+        custom = check_criteria(result.metrics, [StabilityCriterion('range', 'range', 50.0)])
+        self.assertEqual(list(custom.columns), ['range', 'all'])
+
+    def test_calculator_evaluate_stability(self):
+        """StabilityCalculator.evaluate_stability: evaluate_conditions 결과 사용"""
+        conditions = np.zeros(2, dtype=CONDITION_DTYPE)
+        conditions['displacement'] = [1700.0, 1705.0]
+        conditions['trim'] = [1.6, 1.8]
+        conditions['vcg_corrected'] = [3.2, 3.4]
+        conditions['gm'] = [1.0, 1.0]
+        calculator = StabilityCalculator(VesselParticulars(), kn_table=self.table)
+        result = calculator.evaluate_stability(conditions, heel_angles=np.arange(0, 61, 5))
+        self.assertEqual(result.gz.shape, (2, 13))
+        with self.assertRaises(ValueError):
+            StabilityCalculator(VesselParticulars()).evaluate_stability(conditions)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
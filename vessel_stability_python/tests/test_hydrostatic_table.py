@@ -0,0 +1,94 @@
+"""
+HydrostaticTable 단위 테스트
+Trim별 수정 표의 Draft/배수량 × Trim 벡터화 보간 검증
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.hydrostatic_table import HydrostaticTable
+from src.vessel_stability_functions import StabilityCalculator, VesselParticulars
+
+
+def make_rows(trim_offset: float):
+    """테스트용 수정 표 (Draft 1.9 ~ 2.3)"""
+    rows = []
+    for i, t in enumerate([1.9, 2.0, 2.1, 2.2, 2.3]):
+        rows.append({
+            'T': t, 'DISP': 2400.0 + 100.0 * i + trim_offset, 'LCB': 33.0 + 0.05 * i,
+            'VCB': 1.6 + 0.05 * i, 'LCA': 32.5 - 0.05 * i, 'TPC': 10.1 + 0.05 * i,
+            'MCTC': 38.0 + 0.5 * i + trim_offset / 100.0, 'KML': 99.0 - 0.5 * i,
+            'KMT': 12.2 - 0.05 * i, 'WSA': 1280 + 5 * i,
+        })
+    return rows
+
+
+class TestHydrostaticTable(unittest.TestCase):
+    """HydrostaticTable 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.rows = make_rows(0.0)
+        self.table = HydrostaticTable.from_rows({0.0: self.rows, 2.0: make_rows(100.0)})
+        self.calculator = StabilityCalculator(VesselParticulars())
+
+    def test_matches_trim_zero_interpolation(self):
+        """단일 Trim 표: interpolate_hydrostatic_by_draft와 동일"""
+        single = HydrostaticTable.from_trim_zero(list(reversed(self.rows)))
+        for draft in [1.8, 1.9, 1.95, 2.0, 2.17, 2.3, 2.5]:
+            expected = self.calculator.interpolate_hydrostatic_by_draft(draft, self.rows)
+            result = single.row_by_draft(draft)
+            for key in ['DISP', 'LCB', 'MCTC', 'KMT']:
+                self.assertAlmostEqual(result[key], expected[key], places=9)
+
+    def test_out_of_range_clamps(self):
+        """범위 밖 Draft는 첫/마지막 행 값"""
+        result = self.table.by_draft([1.0, 3.0], 0.0, columns=['DISP'])
+        np.testing.assert_allclose(result['DISP'], [2400.0, 2800.0])
+
+    def test_bilinear_draft_trim(self):
+        """Draft × Trim 이중 선형 보간"""
+        result = self.table.by_draft(np.array([1.95, 1.95, 2.25]), np.array([0.0, 1.0, 2.0]))
+        np.testing.assert_allclose(result['DISP'], [2450.0, 2500.0, 2850.0])
+        np.testing.assert_allclose(result['MCTC'], [38.25, 38.75, 40.75])
+
+    def test_broadcast_shape(self):
+        """Draft 배열 × Trim 배열 브로드캐스트"""
+        drafts = np.linspace(1.9, 2.3, 4)[:, None]
+        trims = np.array([0.0, 0.5, 1.5])[None, :]
+        result = self.table.by_draft(drafts, trims)
+        self.assertEqual(result['KMT'].shape, (4, 3))
+
+    def test_by_displacement_round_trip(self):
+        """배수량 → Draft 역보간 (표 Trim에서)"""
+        drafts = np.array([1.93, 2.04, 2.26])
+        trims = np.array([0.0, 2.0, 2.0])
+        disp = self.table.by_draft(drafts, trims, columns=['DISP'])['DISP']
+        result = self.table.by_displacement(disp, trims, columns=['T'])
+        np.testing.assert_allclose(result['T'], drafts, atol=1e-9)
+
+    def test_from_sheets(self):
+        """'Trim = x' 시트에서 수정 표 추출"""
+        header = ['T', 'DISP', 'LCB', 'VCB', 'LCA', 'TPC', 'MCTC', 'KML', 'KMT', 'WSA']
+        body = [[row[key] for key in header] for row in self.rows]
+        sheet = pd.DataFrame([['HYDROSTATIC TABLE'] + [None] * 9, header] + body)
+        table = HydrostaticTable.from_sheets({'Trim = 0': sheet, 'Volum': pd.DataFrame()})
+        self.assertEqual(list(table.trims), [0.0])
+        self.assertAlmostEqual(float(table.by_draft(2.05)['DISP']), 2550.0)
+
+    def test_calculator_uses_table(self):
+        """StabilityCalculator에 수정 표 지정"""
+        calculator = StabilityCalculator(VesselParticulars(), hydrostatic_table=self.table)
+        self.assertAlmostEqual(calculator.get_displacement_by_draft(2.0), 2500.0)
+        self.assertAlmostEqual(calculator.get_mtc_by_draft(2.0), 38.5)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -13,11 +13,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.vessel_stability_functions import (
     StabilityCalculator,
     VesselParticulars,
-    HydrostaticData,
-    load_excel_data,
-    extract_particulars_from_sheet,
-    extract_hydrostatic_from_sheet
+    HydrostaticData
 )
+from src.booklet import Booklet
 
 
 def validate_hydrostatic_detailed():
@@ -30,13 +28,13 @@ def validate_hydrostatic_detailed():
     
     # 데이터 로드
     print(f"\n📖 Excel 파일 로드: {file_path}")
-    data = load_excel_data(file_path)
+    booklet = Booklet.open(file_path)
     
     # 데이터 추출
     print("\n📊 데이터 추출 중...")
-    particulars = extract_particulars_from_sheet(data.get('PRINCIPAL PARTICULARS', pd.DataFrame()))
-    hydrostatic = extract_hydrostatic_from_sheet(data.get('Hydrostatic', pd.DataFrame()))
-    hydrostatic_df = data.get('Hydrostatic', pd.DataFrame())
+    particulars = booklet.particulars
+    hydrostatic = booklet.hydrostatic
+    hydrostatic_df = booklet.sheet('Hydrostatic')
     
     # 계산기 생성
     calculator = StabilityCalculator(particulars)
@@ -13,14 +13,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.vessel_stability_functions import (
     StabilityCalculator,
     VesselParticulars,
-    load_excel_data,
-    extract_particulars_from_sheet,
-    extract_hydrostatic_from_sheet,
     validate_volum_calculations,
     validate_hydrostatic_calculations,
     validate_gz_calculations,
     compare_with_excel
 )
+from src.booklet import Booklet
 
 
 def main():
@@ -33,13 +31,14 @@ def main():
     
     # 데이터 로드
     print(f"\n📖 Excel 파일 로드: {file_path}")
-    data = load_excel_data(file_path)
+    booklet = Booklet.open(file_path)
+    data = booklet.sheets
     print(f"  ✓ 로드된 시트: {len(data)}개")
     
     # 데이터 추출
     print("\n📊 데이터 추출 중...")
-    particulars = extract_particulars_from_sheet(data.get('PRINCIPAL PARTICULARS', pd.DataFrame()))
-    hydrostatic = extract_hydrostatic_from_sheet(data.get('Hydrostatic', pd.DataFrame()))
+    particulars = booklet.particulars
+    hydrostatic = booklet.hydrostatic
     
     # 계산기 생성
     calculator = StabilityCalculator(particulars)